@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_bank — cold-load cost of the JSON bank vs the mmap snapshot.
+
+Builds synthetic banks (75, 150 and 10k problems) in a temp dir and measures,
+for each path, the time to go from nothing to a bank that has answered one
+slug lookup and listed its topics — what a single `grind` invocation pays.
+
+    python3 benchmarks/bench_bank.py [--repeat N]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grind_data
+import grind_snapshot
+
+TOPICS       = ['arrays', 'strings', 'dp', 'graphs', 'trees', 'heap', 'intervals',
+                'linked-list', 'binary-search', 'backtracking', 'greedy', 'stack']
+DIFFICULTIES = ['easy', 'medium', 'hard']
+
+
+def synthetic_bank(n):
+    """Two tracks: 'all' has n problems, 'core' re-lists the first third."""
+    problems = [{'slug': f'problem-{i}', 'topic': TOPICS[i % len(TOPICS)],
+                 'difficulty': DIFFICULTIES[i % 3], 'number': i + 1} for i in range(n)]
+    return {'tracks': {
+        'all':  {'name': 'All', 'description': 'synthetic', 'problems': problems},
+        'core': {'name': 'Core', 'description': 'synthetic', 'problems': problems[:n // 3]},
+    }}
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'problems':>9}  {'json':>10}  {'snapshot':>10}  {'speedup':>8}  {'size':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (75, 150, 10_000):
+            path = os.path.join(tmp, f'problems_{n}.json')
+            with open(path, 'w') as f:
+                json.dump(synthetic_bank(n), f)
+            st  = os.stat(path)
+            sig = (st.st_mtime_ns, st.st_size)
+            with open(path) as f:
+                size = grind_snapshot.compile_snapshot(path, json.load(f), sig)
+            probe = f'problem-{n // 2}'
+
+            def json_path():
+                with open(path) as f:
+                    bank = grind_data.ProblemBank(json.load(f))
+                bank.get(probe)
+                bank.topics
+
+            def snapshot_path():
+                bank = grind_snapshot.open_snapshot(path, sig)
+                bank.get(probe)
+                bank.topics
+
+            t_json = best_of(json_path, args.repeat)
+            t_snap = best_of(snapshot_path, args.repeat)
+            print(f"{n:>9}  {t_json*1000:>8.3f}ms  {t_snap*1000:>8.3f}ms  "
+                  f"{t_json / t_snap:>7.1f}x  {size:>8d} B")
+
+
+if __name__ == '__main__':
+    main()
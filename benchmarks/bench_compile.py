@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+bench_compile — g++ time per solution with and without the lc_utils.h PCH.
+
+Writes a handful of typical solutions (hash map, BFS, DP, heap, string
+parsing, lc_utils' TreeNode) into a temp project that shares the real
+utils/cpp/lc_utils.h, then compiles each through grind_build with pch=False
+and pch=True. Every compile gets a unique trailing comment so the build cache
+always misses; the one-time cost of building the PCH is reported separately.
+
+    python3 benchmarks/bench_compile.py [--repeat N]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import itertools
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import grind_paths
+import grind_build
+
+HEADER = '#include "../../utils/cpp/lc_utils.h"\n\n'
+
+SAMPLES = {
+    'two-sum': '''
+class Solution {
+public:
+    vector<int> twoSum(vector<int>& nums, int target) {
+        unordered_map<int, int> seen;
+        for (int i = 0; i < (int)nums.size(); i++) {
+            auto it = seen.find(target - nums[i]);
+            if (it != seen.end()) return {it->second, i};
+            seen[nums[i]] = i;
+        }
+        return {};
+    }
+};
+int main() {
+    vector<int> nums = parse_vector<int>("[2,7,11,15]");
+    cout << Solution().twoSum(nums, 9) << endl;
+}
+''',
+    'number-of-islands': '''
+class Solution {
+public:
+    int numIslands(vector<vector<char>>& grid) {
+        int m = grid.size(), n = grid[0].size(), count = 0;
+        for (int i = 0; i < m; i++)
+            for (int j = 0; j < n; j++) {
+                if (grid[i][j] != '1') continue;
+                count++;
+                queue<pair<int, int>> q;
+                q.push({i, j});
+                grid[i][j] = '0';
+                while (!q.empty()) {
+                    auto [r, c] = q.front(); q.pop();
+                    int dr[] = {1, -1, 0, 0}, dc[] = {0, 0, 1, -1};
+                    for (int k = 0; k < 4; k++) {
+                        int nr = r + dr[k], nc = c + dc[k];
+                        if (nr < 0 || nc < 0 || nr >= m || nc >= n || grid[nr][nc] != '1') continue;
+                        grid[nr][nc] = '0';
+                        q.push({nr, nc});
+                    }
+                }
+            }
+        return count;
+    }
+};
+int main() {
+    vector<vector<char>> grid = {{'1','1','0'},{'0','1','0'},{'0','0','1'}};
+    cout << Solution().numIslands(grid) << endl;
+}
+''',
+    'coin-change': '''
+class Solution {
+public:
+    int coinChange(vector<int>& coins, int amount) {
+        vector<int> dp(amount + 1, amount + 1);
+        dp[0] = 0;
+        for (int a = 1; a <= amount; a++)
+            for (int c : coins)
+                if (c <= a) dp[a] = min(dp[a], dp[a - c] + 1);
+        return dp[amount] > amount ? -1 : dp[amount];
+    }
+};
+int main() {
+    vector<int> coins = {1, 2, 5};
+    cout << Solution().coinChange(coins, 11) << endl;
+}
+''',
+    'top-k-frequent': '''
+class Solution {
+public:
+    vector<int> topKFrequent(vector<int>& nums, int k) {
+        map<int, int> freq;
+        for (int x : nums) freq[x]++;
+        priority_queue<pair<int, int>, vector<pair<int, int>>, greater<>> heap;
+        for (auto& [x, f] : freq) {
+            heap.push({f, x});
+            if ((int)heap.size() > k) heap.pop();
+        }
+        vector<int> out;
+        while (!heap.empty()) { out.push_back(heap.top().second); heap.pop(); }
+        sort(out.begin(), out.end());
+        return out;
+    }
+};
+int main() {
+    vector<int> nums = {1, 1, 1, 2, 2, 3};
+    cout << Solution().topKFrequent(nums, 2) << endl;
+}
+''',
+    'decode-string': '''
+class Solution {
+public:
+    string decodeString(string s) {
+        stack<pair<string, int>> st;
+        string cur;
+        int num = 0;
+        for (char ch : s) {
+            if (isdigit(ch)) num = num * 10 + (ch - '0');
+            else if (ch == '[') { st.push({cur, num}); cur.clear(); num = 0; }
+            else if (ch == ']') {
+                auto [prev, times] = st.top(); st.pop();
+                ostringstream out;
+                out << prev;
+                for (int i = 0; i < times; i++) out << cur;
+                cur = out.str();
+            } else cur += ch;
+        }
+        return cur;
+    }
+};
+int main() { cout << Solution().decodeString("3[a2[c]]") << endl; }
+''',
+    'max-depth': '''
+class Solution {
+public:
+    int maxDepth(TreeNode* root) {
+        function<int(TreeNode*)> depth = [&](TreeNode* n) {
+            return n ? 1 + max(depth(n->left), depth(n->right)) : 0;
+        };
+        return depth(root);
+    }
+};
+int main() {
+    vector<string> vals = parse_vector<string>("[3,9,20,null,null,15,7]");
+    vector<TreeNode*> nodes;
+    for (auto& v : vals) nodes.push_back(v == "null" ? nullptr : new TreeNode(stoi(v)));
+    for (size_t i = 0, child = 1; i < nodes.size() && child < nodes.size(); i++) {
+        if (!nodes[i]) continue;
+        nodes[i]->left = nodes[child++];
+        if (child < nodes.size()) nodes[i]->right = nodes[child++];
+    }
+    cout << Solution().maxDepth(nodes[0]) << endl;
+}
+''',
+}
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ok = fn()
+        times.append(time.perf_counter() - start)
+        if not ok:
+            raise SystemExit('compile failed')
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    if not shutil.which(grind_build.CPP_COMPILER):
+        raise SystemExit(f'{grind_build.CPP_COMPILER} not found')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        grind_paths.PROJECT_ROOT = tmp
+        grind_paths.BUILD_DIR    = os.path.join(tmp, '.grind_build')
+        os.makedirs(os.path.join(tmp, 'utils', 'cpp'))
+        shutil.copy(os.path.join(REPO_ROOT, 'utils', 'cpp', 'lc_utils.h'), os.path.join(tmp, 'utils', 'cpp'))
+
+        start = time.perf_counter()
+        header = grind_build.cpp_pch()
+        pch_build = time.perf_counter() - start
+        if not header:
+            raise SystemExit('g++ could not build the PCH')
+        print(f"PCH build (once per compiler/flags/header): {pch_build*1000:.0f}ms, "
+              f"{os.path.getsize(header + '.gch') / 1e6:.1f} MB")
+
+        counter = itertools.count()
+
+        def compile_sample(source, pch):
+            with open(source, 'a') as f:
+                f.write(f'// {next(counter)}\n')          # new content → cache miss
+            return grind_build.compile_cpp(source, pch=pch)[0] is not None
+
+        print(f"{'solution':<20}  {'no pch':>9}  {'pch':>9}  {'speedup':>7}")
+        totals = [0.0, 0.0]
+        for slug, body in SAMPLES.items():
+            problem = os.path.join(tmp, 'problems', slug.replace('-', '_'))
+            os.makedirs(problem)
+            source = os.path.join(problem, 'solution.cpp')
+            with open(source, 'w') as f:
+                f.write(HEADER + body.lstrip())
+            plain = best_of(lambda: compile_sample(source, False), args.repeat)
+            pch   = best_of(lambda: compile_sample(source, True), args.repeat)
+            totals[0] += plain
+            totals[1] += pch
+            print(f"{slug:<20}  {plain*1000:>7.0f}ms  {pch*1000:>7.0f}ms  {plain / pch:>6.1f}x")
+        print(f"{'total':<20}  {totals[0]*1000:>7.0f}ms  {totals[1]*1000:>7.0f}ms  "
+              f"{totals[0] / totals[1]:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
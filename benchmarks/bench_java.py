@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+bench_java — cold javac + java vs the warm `grind jvm` runner for one solution.
+
+Scaffolds a Java solution in a temp project (sharing the real LcUtils.java and
+GrindRunner.java), then times, best of --repeat:
+
+  cold, compile   javac into the build cache + a fresh JVM  (edited solution)
+  cold, cached    a fresh JVM on cached classes             (unchanged solution)
+  warm, compile   in-memory compile + run on the warm JVM   (edited solution)
+  warm, cached    run only on the warm JVM                  (unchanged solution)
+
+Warm timings are client round trips, which is what `grind run` waits for.
+Needs a JDK 16+ on PATH.
+
+    python3 benchmarks/bench_java.py [--repeat N]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import itertools
+import threading
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import grind_paths
+import grind_build
+import grind_jvm
+
+CLASSNAME = 'problems.two_sum.Solution'
+SOURCE = '''package problems.two_sum;
+
+import java.util.*;
+import utils.java.LcUtils;
+
+public class Solution {
+    public int[] twoSum(int[] nums, int target) {
+        Map<Integer, Integer> seen = new HashMap<>();
+        for (int i = 0; i < nums.length; i++) {
+            Integer j = seen.get(target - nums[i]);
+            if (j != null) return new int[]{j, i};
+            seen.put(nums[i], i);
+        }
+        return new int[0];
+    }
+
+    public static void main(String[] args) {
+        Scanner in = new Scanner(System.in);
+        int target = in.nextInt();
+        int[] nums = Arrays.stream(in.nextLine().trim().split(" ")).mapToInt(Integer::parseInt).toArray();
+        System.out.println(Arrays.toString(new Solution().twoSum(nums, target)));
+    }
+}
+'''
+STDIN = b'9 2 7 11 15\n'
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    if not (shutil.which('java') and shutil.which('javac')):
+        raise SystemExit('java and javac must be on PATH')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        grind_paths.PROJECT_ROOT    = tmp
+        grind_paths.BUILD_DIR       = os.path.join(tmp, '.grind_build')
+        grind_paths.JVM_SOCKET_FILE = os.path.join(tmp, '.grind_jvm.sock')
+        shutil.copytree(os.path.join(REPO_ROOT, 'utils', 'java'), os.path.join(tmp, 'utils', 'java'))
+        problem = os.path.join(tmp, 'problems', 'two_sum')
+        os.makedirs(problem)
+        source = os.path.join(problem, 'Solution.java')
+        with open(source, 'w') as f:
+            f.write(SOURCE)
+        counter = itertools.count()
+
+        def edit():
+            with open(source, 'a') as f:
+                f.write(f'// {next(counter)}\n')     # new content → cache miss
+
+        def cold():
+            class_dir, _ = grind_build.compile_java(source, CLASSNAME)
+            subprocess.run(['java', '-cp', class_dir + os.pathsep + tmp, CLASSNAME], input=STDIN,
+                           cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        def warm():
+            resp = grind_jvm.run(source, CLASSNAME, STDIN)
+            if not resp or resp['code'] != 0:
+                raise SystemExit(f'warm run failed: {resp and resp["stderr"].decode()}')
+
+        rows = [('cold, compile', best_of(lambda: (edit(), cold()), args.repeat)),
+                ('cold, cached',  best_of(cold, args.repeat))]
+
+        runner = threading.Thread(target=grind_jvm.serve, daemon=True)
+        start = time.perf_counter()
+        runner.start()
+        while not grind_jvm.is_running():
+            if not runner.is_alive() or time.perf_counter() - start > 60:
+                raise SystemExit('warm JVM did not start')
+            time.sleep(0.05)
+        startup = time.perf_counter() - start
+        try:
+            warm()                                    # first request loads javac classes
+            rows += [('warm, compile', best_of(lambda: (edit(), warm()), args.repeat)),
+                     ('warm, cached',  best_of(warm, args.repeat))]
+        finally:
+            grind_jvm.stop()
+            runner.join(10)
+
+        print(f"warm JVM startup (once): {startup*1000:.0f}ms")
+        for label, t in rows:
+            print(f"{label:<14}  {t*1000:>8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
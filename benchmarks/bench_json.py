@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+bench_json — cost of the text views vs --json for the read commands.
+
+Builds a synthetic history (attempts, behavior events, a target with a plan) in
+a temp dir and times each read command with and without --json, stdout
+captured. Both paths share the same report builder, so the difference is what
+the ANSI/column formatting costs an agent that only parses the output.
+
+    python3 benchmarks/bench_json.py [--attempts N] [--repeat N]
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import importlib.util
+import importlib.machinery
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import grind_paths
+
+PATHS = {
+    'PROJECT_ROOT':  '',
+    'MEMORY_FILE':   'memory.md',
+    'ARCHIVE_FILE':  'memory_archive.md',
+    'JOURNAL_FILE':  'memory.journal.jsonl',
+    'CONFIG_FILE':   '.lc_config.json',
+    'SESSION_FILE':  '.session.json',
+    'BEHAVIOR_FILE': 'behavior.jsonl',
+    'DB_FILE':       'grind.db',
+    'INDEX_FILE':    '.memory_index.json',
+    'ROLLUP_FILE':   '.behavior_rollup.json',
+    'SOCKET_FILE':   '.grind.sock',
+}
+
+COMMANDS = [['progress'], ['stats'], ['gap', 'show'], ['behavior', 'summary'],
+            ['plan', 'today'], ['target', 'list']]
+
+
+def load_grind(tmp):
+    """Point grind_paths at tmp, then load grind."""
+    for attr, name in PATHS.items():
+        setattr(grind_paths, attr, os.path.join(tmp, name))
+    path = os.path.join(REPO_ROOT, 'grind')
+    loader = importlib.machinery.SourceFileLoader('grind', path)
+    mod = importlib.util.module_from_spec(importlib.util.spec_from_loader('grind', loader))
+    loader.exec_module(mod)
+    return mod
+
+
+def synthetic_history(g, n):
+    rng   = random.Random(7)
+    bank  = g.load_problems()['tracks']['neetcode150']['problems']
+    today = datetime.now()
+    rows  = []
+    for i in range(n):
+        p    = bank[i % len(bank)]
+        date = today - timedelta(days=n - i)
+        rows.append({'slug': p['slug'], 'topic': p['topic'], 'difficulty': p['difficulty'],
+                     'date': date.strftime('%Y-%m-%d'), 'rating': rng.randint(1, 5),
+                     'time': f'{rng.randint(5, 60)}m', 'hints': rng.randint(0, 3), 'ease': 2.5,
+                     'interval': '6d', 'next_review': (date + timedelta(days=6)).strftime('%Y-%m-%d')})
+    g.write_memory(rows)
+    with open(grind_paths.BEHAVIOR_FILE, 'w') as f:
+        for i, r in enumerate(rows):
+            f.write(json.dumps({'ts': r['date'] + 'T10:00:00', 'slug': r['slug'], 'topic': r['topic'],
+                                'event': 'hint_given', 'hint_level': 1 + i % 3,
+                                'time_to_hint_min': rng.randint(2, 30)}) + '\n')
+    date = (today + timedelta(days=30)).strftime('%Y-%m-%d')
+    g.save_config({'active_track': 'neetcode150', 'active_target': 'acme-001', 'targets': {'acme-001': {
+        'id': 'acme-001', 'company': 'Acme', 'role': 'SWE', 'interview_date': date,
+        'intelligence': {}, 'plan': {}}}})
+    with redirect_stdout(io.StringIO()):
+        g.main(['plan', 'generate'])
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--attempts', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        g = load_grind(tmp)
+        synthetic_history(g, args.attempts)
+
+        print(f"{'command':<18}  {'text':>10}  {'json':>10}  {'saved':>8}  {'text B':>8}  {'json B':>8}")
+        for argv in COMMANDS:
+            sizes = {}
+
+            def run(extra, key):
+                buf = io.StringIO()
+                with redirect_stdout(buf):
+                    g.main(argv + extra)
+                sizes[key] = len(buf.getvalue().encode())
+
+            t_text = best_of(lambda: run([], 'text'), args.repeat)
+            t_json = best_of(lambda: run(['--json'], 'json'), args.repeat)
+            print(f"{' '.join(argv):<18}  {t_text*1000:>8.3f}ms  {t_json*1000:>8.3f}ms  "
+                  f"{(1 - t_json / t_text) * 100:>7.1f}%  {sizes['text']:>8d}  {sizes['json']:>8d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+bench_plan — the plan's coding-day scheduler: original tier scan vs heap/deque rotation.
+
+For a synthetic 10k-problem bank split over 20, 500 and 5000 topics, schedules
+a 365-day horizon with both schedulers, checks the picks are identical, and
+prints the best of --repeat. Then times a full `grind plan generate` for a
+365-day target on the 10k bank (memory empty, all topics unknown) in a temp
+project.
+
+    python3 benchmarks/bench_plan.py [--repeat N] [--problems N] [--days N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grind_paths
+import grind_algos
+
+WEIGHTS = [0.3, 1.0, 1.5, 2.5, 3.0]
+
+
+def legacy_schedule(weights, topic_queues, n_days, per_day=2):
+    """The scheduler as it was: tiers rebuilt from a scan of every topic each day, list.pop(0)."""
+    sorted_topics = sorted(weights.keys(), key=lambda t: -weights.get(t, 0))
+    topic_queues = {t: list(topic_queues.get(t, [])) for t in sorted_topics}
+    weight_tiers = {}
+    for t in sorted_topics:
+        weight_tiers.setdefault(round(weights.get(t, 0), 1), []).append(t)
+    tier_indices = {w: 0 for w in weight_tiers}
+
+    def pick_day_problems(n):
+        picked = []
+        seen_tiers = set()
+        for t in sorted_topics:
+            if len(picked) >= n:
+                break
+            w = round(weights.get(t, 0), 1)
+            if w in seen_tiers:
+                continue
+            seen_tiers.add(w)
+            tier = weight_tiers[w]
+            start = tier_indices[w]
+            for i in range(len(tier)):
+                candidate = tier[(start + i) % len(tier)]
+                if topic_queues.get(candidate):
+                    picked.append((topic_queues[candidate].pop(0), candidate))
+                    tier_indices[w] = (start + i + 1) % len(tier)
+                    break
+        if len(picked) < n:
+            for t in sorted_topics:
+                if len(picked) >= n:
+                    break
+                if topic_queues.get(t) and not any(pp[1] == t for pp in picked):
+                    picked.append((topic_queues[t].pop(0), t))
+        return picked
+
+    days = []
+    for _ in range(n_days):
+        day = pick_day_problems(per_day)
+        if not day:
+            break
+        days.append(day)
+    return days
+
+
+def synthetic(n_problems, n_topics, seed=0):
+    """Topic weights and per-topic queues; one topic holds most problems, as a catch-all tag would."""
+    rng = random.Random(seed)
+    topics  = [f'topic-{i}' for i in range(n_topics)]
+    weights = {t: rng.choice(WEIGHTS) for t in topics}
+    queues  = {t: [] for t in topics}
+    for i in range(n_problems):
+        t = topics[0] if i % 2 else rng.choice(topics)
+        queues[t].append({'slug': f'problem-{i}', 'topic': t, 'difficulty': 'medium'})
+    return weights, queues
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def full_generation(n_problems, days, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        grind_paths.PROJECT_ROOT  = tmp
+        grind_paths.MEMORY_FILE   = os.path.join(tmp, 'memory.md')
+        grind_paths.ARCHIVE_FILE  = os.path.join(tmp, 'memory_archive.md')
+        grind_paths.JOURNAL_FILE  = os.path.join(tmp, 'memory.journal.jsonl')
+        grind_paths.CONFIG_FILE   = os.path.join(tmp, '.lc_config.json')
+        grind_paths.INDEX_FILE    = os.path.join(tmp, '.memory_index.json')
+        grind_paths.PROBLEMS_FILE = os.path.join(tmp, 'problems.json')
+        problems = [{'slug': f'problem-{i}', 'topic': f'topic-{i % 500}', 'difficulty': 'medium',
+                     'number': i + 1} for i in range(n_problems)]
+        with open(grind_paths.PROBLEMS_FILE, 'w') as f:
+            json.dump({'tracks': {'all': {'name': 'All', 'description': 'synthetic', 'problems': problems}}}, f)
+        date = (datetime.now() + timedelta(days=days)).strftime('%Y-%m-%d')
+        config = {'active_target': 't', 'targets': {'t': {
+            'id': 't', 'interview_date': date, 'intelligence': {'rounds': ['technical']}, 'plan': {}}}}
+        grind_algos._generate_plan_for_target(config, 't')        # warm the bank snapshot
+        return best_of(lambda: grind_algos._generate_plan_for_target(config, 't'), repeat), config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--problems', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+
+    print(f"{'topics':>7}  {'original':>10}  {'heap':>10}  {'speedup':>8}  identical")
+    for n_topics in (20, 500, 5000):
+        weights, queues = synthetic(args.problems, n_topics)
+        # every day a coding day: the scheduler's worst case for the horizon
+        old = legacy_schedule(weights, queues, args.days)
+        new = grind_algos.schedule_coding_days(weights, queues, args.days)
+        t_old = best_of(lambda: legacy_schedule(weights, queues, args.days), args.repeat)
+        t_new = best_of(lambda: grind_algos.schedule_coding_days(weights, queues, args.days), args.repeat)
+        print(f"{n_topics:>7}  {t_old*1000:>8.2f}ms  {t_new*1000:>8.2f}ms  {t_old / t_new:>7.1f}x  {old == new}")
+
+    t_full, config = full_generation(args.problems, args.days, args.repeat)
+    n_days = len(config['targets']['t']['plan']['days'])
+    print(f"\nplan generate, {args.problems} problems, {args.days}-day horizon: "
+          f"{t_full*1000:.1f}ms ({n_days} days)")
+
+
+if __name__ == '__main__':
+    main()
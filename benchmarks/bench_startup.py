@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_startup — wall time and import cost of one `grind` invocation.
+
+Copies the CLI (grind, grind_*.py, problems.json) into a temp dir so the runs
+write nowhere near the real history, then times fresh interpreter launches per
+command with the daemon bypassed (GRIND_NO_DAEMON). Import cost comes from one
+`python -X importtime` run per command: total import time and module count.
+`python -c pass` is the interpreter floor. `session event` is the hot path —
+agents call it several times per problem.
+
+    python3 benchmarks/bench_startup.py [--repeat N] [--importtime CMD]
+
+--importtime prints the raw -X importtime table for one command (e.g. "session event").
+"""
+import os
+import sys
+import glob
+import time
+import shlex
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ('session event', ['session', 'event', 'two-sum', 'presented']),
+    ('speak --help',  ['speak', '--help']),
+    ('due',           ['due']),
+    ('progress',      ['progress']),
+    ('context',       ['context']),
+    ('--help',        ['--help']),
+]
+
+
+def copy_cli(dest):
+    for path in [os.path.join(REPO_ROOT, 'grind'), os.path.join(REPO_ROOT, 'problems.json')] + \
+                glob.glob(os.path.join(REPO_ROOT, 'grind_*.py')):
+        shutil.copy(path, dest)
+    return os.path.join(dest, 'grind')
+
+
+def launch(cmd, env, stderr=subprocess.DEVNULL):
+    return subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=stderr, check=False)
+
+
+def best_of(cmd, env, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        launch(cmd, env)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def importtime(cmd, env):
+    """(total import seconds, modules imported, raw table) from one -X importtime run."""
+    raw = launch([cmd[0], '-X', 'importtime'] + cmd[1:], env, stderr=subprocess.PIPE).stderr.decode()
+    total, count = 0, 0
+    for line in raw.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        count += 1
+        if not name.startswith('  '):          # top-level import: cumulative covers its children
+            total += int(cumulative)
+    return total / 1e6, count, raw
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--importtime', metavar='CMD', help='Print the -X importtime table for CMD')
+    args = parser.parse_args()
+
+    env = dict(os.environ, GRIND_NO_DAEMON='1', PYTHONDONTWRITEBYTECODE='')
+    with tempfile.TemporaryDirectory() as tmp:
+        grind = copy_cli(tmp)
+        launch([sys.executable, grind, 'session', 'start'], env)
+        launch([sys.executable, grind, 'bank', 'compile'], env)
+
+        if args.importtime:
+            print(importtime([sys.executable, grind] + shlex.split(args.importtime), env)[2])
+            return
+
+        floor = best_of([sys.executable, '-c', 'pass'], env, args.repeat)
+        print(f"{'command':<15}  {'wall':>9}  {'over floor':>10}  {'imports':>9}  {'modules':>7}")
+        print(f"{'python -c pass':<15}  {floor*1000:>7.1f}ms  {'':>10}  {'':>9}  {'':>7}")
+        for label, argv in CASES:
+            cmd = [sys.executable, grind] + argv
+            wall = best_of(cmd, env, args.repeat)
+            imp, count, _ = importtime(cmd, env)
+            print(f"{label:<15}  {wall*1000:>7.1f}ms  {(wall - floor)*1000:>8.1f}ms  "
+                  f"{imp*1000:>7.1f}ms  {count:>7d}")
+
+
+if __name__ == '__main__':
+    main()
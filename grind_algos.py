@@ -4,13 +4,16 @@ SM-2, gap analysis, behavior patterns, plan generation, notes, plan progress.
 """
 import os
 import math
+import heapq
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import grind_paths as _gp
+from grind_rollup import from_events as rollup_events
+from grind_cli import print_info
 from grind_data import (
-    load_config, save_config, parse_memory, load_problems,
-    get_all_topics, get_problems_by_topic, slug_to_topic,
+    load_config, save_config, config_transaction, parse_memory, get_problem_bank,
+    get_all_topics, gap_totals, memory_index,
     flush_behavior_events,
 )
 
@@ -30,7 +33,6 @@ def sm2_calculate(rating, prev_ease=2.5, prev_interval=0, repetition=0):
 
 def compute_gap_scores(rows, overrides=None, today=None):
     """Classify topics, weighting recent evidence more than stale evidence."""
-    overrides = overrides or {}
     if today is None:
         today = datetime.now().date()
 
@@ -46,18 +48,27 @@ def compute_gap_scores(rows, overrides=None, today=None):
         weight = math.exp(-days_overdue / 30.0)
         topic_weighted[r['topic']].append((r['rating'], weight))
 
+    totals = {t: (len(pairs), sum(w for _, w in pairs), sum(r * w for r, w in pairs))
+              for t, pairs in topic_weighted.items()}
+    return classify_gaps(totals, overrides)
+
+
+def classify_gaps(totals, overrides=None):
+    """
+    totals: {topic: (n, weight_sum, weighted_rating_sum)}. The weighted average is
+    rounded to 9 places so the incremental sums and a full rescan classify alike.
+    """
+    overrides = overrides or {}
     scores = {}
     for topic in get_all_topics():
         if topic in overrides:
             scores[topic] = overrides[topic]
             continue
-        pairs = topic_weighted.get(topic, [])
-        if not pairs:
+        n, total_w, total_rw = totals.get(topic, (0, 0.0, 0.0))
+        if not n:
             scores[topic] = 'unknown'
             continue
-        total_w = sum(w for _, w in pairs)
-        wavg    = sum(r * w for r, w in pairs) / total_w
-        n       = len(pairs)
+        wavg = round(total_rw / total_w, 9) if total_w else 0.0
         if n < 3 or wavg < 3.0:
             scores[topic] = 'weak'
         elif wavg < 4.0:
@@ -67,52 +78,48 @@ def compute_gap_scores(rows, overrides=None, today=None):
     return scores
 
 
+def current_gap_scores(overrides=None, today=None):
+    """compute_gap_scores over live history, read from the memory index's running sums."""
+    if today is None:
+        today = datetime.now().date()
+    totals = gap_totals(today)
+    if totals is None:
+        return compute_gap_scores(parse_memory(), overrides, today)
+    return classify_gaps(totals, overrides)
+
+
 def compute_behavior_patterns(events):
     """Compute per-topic flags from behavior.jsonl events."""
-    hint_times  = defaultdict(list)
-    hint_levels = defaultdict(list)
-    effective   = defaultdict(list)
-    calibration = defaultdict(list)
-
-    for e in events:
-        topic = e.get('topic', 'unknown')
-        ev    = e.get('event', '')
-        if ev == 'hint_given':
-            if 'time_to_hint_min' in e:
-                hint_times[topic].append(e['time_to_hint_min'])
-            if 'hint_level' in e:
-                hint_levels[topic].append(e['hint_level'])
-        elif ev == 'hint_assessed':
-            effective[topic].append(bool(e.get('effective', False)))
-        elif ev == 'rating_calibration':
-            div = abs(e.get('self_rating', 0) - e.get('expected_rating_from_hints', 0))
-            calibration[topic].append(div)
+    return behavior_patterns(rollup_events(events))
+
+
+def behavior_patterns(rollup):
+    """Per-topic averages and flags from a behavior rollup (grind_rollup) — O(topics)."""
+    def avg(acc):
+        return acc[0] / acc[1] if acc and acc[1] else None
 
     patterns = {}
-    all_topics = set(list(hint_times) + list(hint_levels))
-    for topic in all_topics:
-        avg_time  = (sum(hint_times[topic]) / len(hint_times[topic])
-                     if hint_times[topic] else None)
-        avg_level = (sum(hint_levels[topic]) / len(hint_levels[topic])
-                     if hint_levels[topic] else None)
-        eff_rate  = (sum(1 for x in effective[topic] if x) / len(effective[topic])
-                     if effective[topic] else None)
-        cal_delta = (sum(calibration[topic]) / len(calibration[topic])
-                     if calibration[topic] else None)
+    for topic, t in rollup['topics'].items():
+        if not t.get('time', [0, 0])[1] and not t.get('level', [0, 0])[1]:
+            continue
+        avg_time  = avg(t.get('time'))
+        avg_level = avg(t.get('level'))
+        eff_rate  = avg(t.get('effective'))
+        cal_delta = avg(t.get('calibration'))
 
         flags = []
-        if avg_time is not None and avg_time < 5:        flags.append('quick_give_up')
-        if avg_level is not None and avg_level > 2.5:   flags.append('chronic_hint')
-        if eff_rate is not None and eff_rate > 0.75:    flags.append('hint_positive')
-        if eff_rate is not None and eff_rate < 0.40:    flags.append('hint_negative')
-        if cal_delta is not None and cal_delta > 1.5:   flags.append('overconfident')
+        if avg_time is not None and avg_time < 5:         flags.append('quick_give_up')
+        if avg_level is not None and avg_level > 2.5:    flags.append('chronic_hint')
+        if eff_rate is not None and eff_rate > 0.75:     flags.append('hint_positive')
+        if eff_rate is not None and eff_rate < 0.40:     flags.append('hint_negative')
+        if cal_delta is not None and cal_delta > 1.5:    flags.append('overconfident')
 
         patterns[topic] = {
             'avg_time_to_hint_min': round(avg_time, 1)  if avg_time  is not None else None,
             'avg_hint_level':       round(avg_level, 2) if avg_level is not None else None,
             'hint_effectiveness':   round(eff_rate, 2)  if eff_rate  is not None else None,
             'calibration_delta':    round(cal_delta, 1) if cal_delta is not None else None,
-            'sample_count':         len(hint_levels.get(topic, [])),
+            'sample_count':         t.get('level', [0, 0])[1],
             'flags':                flags,
         }
     return patterns
@@ -122,6 +129,83 @@ def _has_design_round(intelligence):
     return any('design' in r for r in intelligence.get('rounds', []))
 
 
+SCORE_WEIGHT = {'unknown': 2.5, 'weak': 3.0, 'developing': 1.0, 'strong': 0.3}
+
+
+def _topic_weights(gap_scores, intelligence, bank):
+    """Plan weight per topic: its gap class, raised to 1.5 for company-reported topics."""
+    reported_topic_set = {bank.topic_of(s) for s in intelligence.get('reported_topics', [])
+                          if bank.get(s)}
+    weights = {}
+    for topic, score in gap_scores.items():
+        w = SCORE_WEIGHT.get(score, 1.0)
+        if topic in reported_topic_set:
+            w = max(w, 1.5)
+        weights[topic] = w
+    return weights
+
+
+def schedule_coding_days(weights, topic_queues, n_days, per_day=2):
+    """
+    Pick up to per_day problems for each of up to n_days coding days.
+    Returns [[(problem, topic), ...] per day], stopping at the first day with nothing left.
+
+    Topics are grouped into tiers by weight (rounded to 0.1). Each day takes one
+    problem from each tier, highest first, rotating round-robin through the
+    topics within a tier; if there are fewer non-empty tiers than slots, the
+    rest come from the heaviest remaining topics not picked that day. Tiers sit
+    in a heap keyed on weight, each tier is a rotation (deque) of its topics
+    with the round-robin cursor at the front, and the fill pass uses a heap of
+    topic ranks. Exhausted topics and tiers are dropped as they are met, so a
+    day costs O(per_day · log topics) amortized.
+    """
+    sorted_topics = sorted(weights, key=lambda t: -weights.get(t, 0))
+    queues    = {t: deque(topic_queues.get(t, ())) for t in sorted_topics}
+    rotations = {}                                   # rounded weight → deque of topics, cursor first
+    for t in sorted_topics:
+        rotations.setdefault(round(weights.get(t, 0), 1), deque()).append(t)
+    tier_heap  = [-w for w in rotations]             # heaviest tier on top
+    heapq.heapify(tier_heap)
+    topic_heap = list(range(len(sorted_topics)))     # ranks in sorted_topics; already a heap
+
+    days = []
+    for _ in range(n_days):
+        picked = []
+        visited = []
+        # One problem per tier, highest tier first
+        while tier_heap and len(picked) < per_day:
+            key = heapq.heappop(tier_heap)
+            rotation = rotations[-key]
+            while rotation and not queues[rotation[0]]:
+                rotation.popleft()                   # exhausted topics never refill
+            if not rotation:
+                continue                             # exhausted tier: drop it
+            topic = rotation[0]
+            rotation.rotate(-1)
+            picked.append((queues[topic].popleft(), topic))
+            visited.append(key)
+        for key in visited:
+            heapq.heappush(tier_heap, key)
+        # Fill remaining slots from the heaviest topics not picked yet today
+        if len(picked) < per_day:
+            taken = {t for _, t in picked}
+            held = []
+            while topic_heap and len(picked) < per_day:
+                rank = heapq.heappop(topic_heap)
+                topic = sorted_topics[rank]
+                if not queues[topic]:
+                    continue
+                held.append(rank)
+                if topic not in taken:
+                    picked.append((queues[topic].popleft(), topic))
+            for rank in held:
+                heapq.heappush(topic_heap, rank)
+        if not picked:
+            break
+        days.append(picked)
+    return days
+
+
 def _generate_plan_for_target(config, tid):
     """
     Generate a day-by-day study plan. Saves to config.
@@ -140,31 +224,19 @@ def _generate_plan_for_target(config, tid):
     except ValueError:
         return False, f"Invalid date format: {date_str} (expected YYYY-MM-DD)"
 
-    rows         = parse_memory()
     overrides    = config.get('gap_overrides', {})
-    gap_scores   = compute_gap_scores(rows, overrides)
+    gap_scores   = current_gap_scores(overrides)
     intelligence = target.get('intelligence', {})
 
     days_remaining = max(1, (interview_date - datetime.now().date()).days)
 
-    reported_set = set(intelligence.get('reported_topics', []))
-    reported_topic_set = set()
-    bank = load_problems()
+    # Map reported problem slugs → topics
+    bank = get_problem_bank()
     if not bank:
         return False, "Problem bank not found — cannot generate plan."
-    for td in bank.get('tracks', {}).values():
-        for p in td.get('problems', []):
-            if p['slug'] in reported_set:
-                reported_topic_set.add(p.get('topic', ''))
-
-    score_weight = {'unknown': 2.5, 'weak': 3.0, 'developing': 1.0, 'strong': 0.3}
-    weights = {}
-    for topic, score in gap_scores.items():
-        w = score_weight.get(score, 1.0)
-        if topic in reported_topic_set:
-            w = max(w, 1.5)
-        weights[topic] = w
+    weights = _topic_weights(gap_scores, intelligence, bank)
 
+    # Time allocation
     reserve_mock    = min(3, days_remaining // 7)
     practice_days   = max(1, days_remaining - reserve_mock)
     has_design      = _has_design_round(intelligence)
@@ -172,54 +244,20 @@ def _generate_plan_for_target(config, tid):
     design_days     = int(practice_days * 0.2) if has_design else 0
     behavioral_days = practice_days - coding_days - design_days
 
-    solved_slugs  = {r['slug'] for r in rows}
-    sorted_topics = sorted(weights.keys(), key=lambda t: -weights.get(t, 0))
-    problems_by_topic = get_problems_by_topic()
-    topic_queues  = {
-        t: [p for p in problems_by_topic.get(t, []) if p['slug'] not in solved_slugs]
-        for t in sorted_topics
+    # Problem pool per topic, excluding everything ever solved (archive included), the
+    # same set cmd_log and `plan rebalance` hand to _rebalance_plan
+    solved_slugs = set(memory_index().schedule.slugs)
+    topic_queues = {
+        t: [p for p in bank.by_topic.get(t, []) if p['slug'] not in solved_slugs]
+        for t in weights
     }
 
     days    = []
     day_num = 1
     today   = datetime.now().date()
 
-    weight_tiers = {}
-    for t in sorted_topics:
-        w = round(weights.get(t, 0), 1)
-        weight_tiers.setdefault(w, []).append(t)
-    tier_indices = {w: 0 for w in weight_tiers}
-
-    def pick_day_problems(n=2):
-        picked = []
-        seen_tiers = set()
-        for t in sorted_topics:
-            if len(picked) >= n:
-                break
-            w = round(weights.get(t, 0), 1)
-            if w in seen_tiers:
-                continue
-            seen_tiers.add(w)
-            tier = weight_tiers[w]
-            start = tier_indices[w]
-            for i in range(len(tier)):
-                candidate = tier[(start + i) % len(tier)]
-                if topic_queues.get(candidate):
-                    picked.append((topic_queues[candidate].pop(0), candidate))
-                    tier_indices[w] = (start + i + 1) % len(tier)
-                    break
-        if len(picked) < n:
-            for t in sorted_topics:
-                if len(picked) >= n:
-                    break
-                if topic_queues.get(t) and not any(pp[1] == t for pp in picked):
-                    picked.append((topic_queues[t].pop(0), t))
-        return picked
-
-    for _ in range(coding_days):
-        day_problems = pick_day_problems(2)
-        if not day_problems:
-            break
+    # Coding days
+    for day_problems in schedule_coding_days(weights, topic_queues, coding_days):
         focus  = day_problems[0][1]
         slugs  = [p['slug'] for p, _ in day_problems]
         days.append({
@@ -232,6 +270,7 @@ def _generate_plan_for_target(config, tid):
         })
         day_num += 1
 
+    # System design days
     for _ in range(design_days):
         days.append({
             'day': day_num,
@@ -243,6 +282,7 @@ def _generate_plan_for_target(config, tid):
         })
         day_num += 1
 
+    # Behavioral days
     for _ in range(behavioral_days):
         days.append({
             'day': day_num,
@@ -254,6 +294,7 @@ def _generate_plan_for_target(config, tid):
         })
         day_num += 1
 
+    # Mock days (reserved at end)
     for _ in range(reserve_mock):
         days.append({
             'day': day_num,
@@ -266,11 +307,12 @@ def _generate_plan_for_target(config, tid):
         day_num += 1
 
     target['plan'] = {
-        'generated_at':            datetime.now().isoformat(),
-        'days_remaining':          days_remaining,
-        'mock_sessions_target':    max(3, days_remaining // 5),
+        'generated_at':           datetime.now().isoformat(),
+        'days_remaining':         days_remaining,
+        'mock_sessions_target':   max(3, days_remaining // 5),
         'mock_sessions_completed': 0,
-        'days':                    days,
+        'weights':                weights,
+        'days':                   days,
     }
     save_config(config)
     return True, f"Plan generated: {len(days)} days until {date_str}"
@@ -278,7 +320,8 @@ def _generate_plan_for_target(config, tid):
 
 def _mark_plan_progress(config, solved_set):
     """
-    Check if any plan days are fully solved. Mark them complete and save config.
+    Check if any plan days are fully solved. Mark them complete; the config is
+    written when the enclosing config_transaction closes (or here, if none is open).
     Returns True if any day was newly marked complete.
     """
     tid    = config.get('active_target')
@@ -288,21 +331,82 @@ def _mark_plan_progress(config, solved_set):
         return False
 
     changed = False
-    for day in days:
-        if day.get('completed') or not day.get('problems'):
-            continue
-        if all(s in solved_set for s in day['problems']):
-            day['completed'] = True
-            changed = True
+    with config_transaction(config):
+        for day in days:
+            if day.get('completed') or not day.get('problems'):
+                continue
+            if all(s in solved_set for s in day['problems']):
+                day['completed'] = True
+                changed = True
 
     if changed:
-        save_config(config)
         done  = sum(1 for d in days if d.get('completed'))
         total = len(days)
         print(f"\033[96m[INFO] Plan progress: {done}/{total} days complete.\033[0m")
     return changed
 
 
+def _rebalance_plan(config, solved_set, tid=None, today=None):
+    """
+    Re-plan the upcoming coding days of a target's plan (the active one by default)
+    after topic weights moved. The plan records the weights (_topic_weights) it was
+    scheduled with; topics whose weight differs since are the changed set. Only open
+    coding days dated today or later whose focus or problems touch a changed topic
+    are re-planned; completed, past and in-progress days (with a solved problem)
+    stay as they are, along with every other day. The affected days are refilled in
+    place by schedule_coding_days from problems that are neither solved nor planned
+    elsewhere; if the bank runs dry the unfilled ones stay in the plan, emptied and
+    marked 'empty', so no day changes its number or date. The config is written when
+    the enclosing config_transaction closes (or here, if none is open).
+    Returns the number of days re-planned.
+    """
+    tid    = tid or config.get('active_target')
+    target = config.get('targets', {}).get(tid) if tid else None
+    plan   = (target or {}).get('plan', {})
+    days   = plan.get('days', [])
+    bank   = get_problem_bank() if days else None
+    if not bank:
+        return 0
+
+    today_str = (today or datetime.now().date()).strftime('%Y-%m-%d')
+    weights = _topic_weights(current_gap_scores(config.get('gap_overrides', {})),
+                             target.get('intelligence', {}), bank)
+    before  = plan.get('weights')
+    with config_transaction(config):
+        plan['weights'] = weights
+        if before is None:
+            return 0                            # plan predates recorded weights: track from now on
+        changed = {t for t in weights.keys() | before.keys() if weights.get(t) != before.get(t)}
+        if not changed:
+            return 0
+        affected = [d for d in days if d.get('type') == 'coding' and not d.get('completed')
+                    and d.get('date', '') >= today_str
+                    and not any(s in solved_set for s in d.get('problems', []))
+                    and (d.get('focus') in changed
+                         or any(bank.topic_of(s) in changed for s in d.get('problems', [])))]
+        if not affected:
+            return 0
+        affected_ids = {id(d) for d in affected}
+        excluded = set(solved_set)
+        for d in days:
+            if id(d) not in affected_ids:
+                excluded.update(d.get('problems', []))
+        topic_queues = {t: [p for p in bank.by_topic.get(t, []) if p['slug'] not in excluded]
+                        for t in weights}
+        picks = schedule_coding_days(weights, topic_queues, len(affected))
+        for d, day_problems in zip(affected, picks):
+            d['problems'] = [p['slug'] for p, _ in day_problems]
+            d['focus']    = day_problems[0][1]
+        for d in affected[len(picks):]:         # bank ran dry: keep the day, without problems
+            d['problems'] = []
+            d['empty']    = True
+            d.pop('focus', None)
+
+    print_info(f"Plan rebalanced: {len(affected)} upcoming coding day(s) re-planned "
+               f"({', '.join(sorted(changed))} moved).")
+    return len(affected)
+
+
 def _append_notes(slug, notes, date, rating):
     """Append a timestamped note to problems/<slug>/notes.md."""
     folder       = slug.replace('-', '_')
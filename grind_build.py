@@ -0,0 +1,259 @@
+"""
+grind_build — content-addressed build cache for `grind run`.
+
+C++ binaries and Java class trees are stored under .grind_build/<key>/, where
+key is a sha256 over everything that decides the compiler's output: the
+solution source, the compiler binary (resolved path, mtime, size), the flags,
+and the shared helper (utils/cpp/lc_utils.h or utils/java/LcUtils.java). C++
+keys also cover every local header the source reaches through #include "..."
+(resolved the way g++ does without -I: next to the including file).
+A hit skips compilation entirely; a miss compiles into a temp dir next to the
+cache and renames it into place, so a concurrent or interrupted build never
+leaves a half-written entry. Failed compiles are not cached.
+
+C++ solutions that include lc_utils.h are compiled against a precompiled copy
+of it (-include <entry>/lc_utils.h, which g++ resolves to the .gch beside it).
+The PCH is an entry of its own, keyed on compiler, flags and header contents,
+so it is rebuilt only when one of those changes; if g++ cannot build it the
+entry keeps just the header and solutions compile the usual way.
+
+Entries are touched on every hit and the least recently used ones are evicted
+once the cache outgrows BUILD_CACHE_LIMIT bytes. Deleting the directory is
+always safe.
+"""
+import os
+import re
+import shutil
+import hashlib
+import subprocess
+
+import grind_paths as _gp
+
+CPP_COMPILER  = 'g++'
+CPP_FLAGS     = ['-std=c++17']
+JAVA_COMPILER = 'javac'
+
+_BINARY    = 'a.out'
+PCH_HEADER = 'lc_utils.h'
+
+
+def _file_digest(path):
+    """sha256 of a file's bytes, or '' if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ''
+
+
+def _compiler_id(name):
+    """Resolved compiler path plus its mtime/size — changes when the toolchain is upgraded."""
+    found = shutil.which(name)
+    if not found:
+        return name
+    real = os.path.realpath(found)
+    st   = os.stat(real)
+    return f"{real}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def build_key(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+_LOCAL_INCLUDE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*"([^"\n]+)"', re.M)
+
+
+def _local_headers(source):
+    """
+    [(path, digest)] for the quoted-include closure of source, in a stable order.
+    A scan of the text, not the preprocessor: includes under a false #if or in a
+    comment are hashed too, which can only cost an extra rebuild. A header that
+    does not exist is listed with an empty digest, so creating it changes the key.
+    """
+    seen, stack, out = set(), [os.path.realpath(source)], []
+    while stack:
+        path = stack.pop()
+        try:
+            with open(path, 'rb') as f:
+                text = f.read()
+        except OSError:
+            continue
+        base = os.path.dirname(path)
+        for name in _LOCAL_INCLUDE.findall(text):
+            header = os.path.realpath(os.path.join(base, name.decode(errors='replace')))
+            if header in seen:
+                continue
+            seen.add(header)
+            out.append((header, _file_digest(header)))
+            if os.path.isfile(header):
+                stack.append(header)
+    return sorted(out)
+
+
+def cpp_key(source):
+    utils_h = os.path.join(_gp.PROJECT_ROOT, 'utils/cpp/lc_utils.h')
+    headers = [part for pair in _local_headers(source) for part in pair]
+    return build_key('cpp', _file_digest(source), _compiler_id(CPP_COMPILER), *CPP_FLAGS,
+                     _file_digest(utils_h), *headers)
+
+
+def pch_key():
+    utils_h = os.path.join(_gp.PROJECT_ROOT, 'utils/cpp/lc_utils.h')
+    return build_key('pch', _compiler_id(CPP_COMPILER), *CPP_FLAGS, _file_digest(utils_h))
+
+
+def java_key(source, classname):
+    utils_java = os.path.join(_gp.PROJECT_ROOT, 'utils/java/LcUtils.java')
+    return build_key('java', classname, _file_digest(source), _compiler_id(JAVA_COMPILER),
+                     _file_digest(utils_java))
+
+
+# ---------------------------------------------------------------------------
+# Cache entries
+# ---------------------------------------------------------------------------
+
+def lookup(key):
+    """Path of the cached entry for key (touched for LRU), or None on a miss."""
+    entry = os.path.join(_gp.BUILD_DIR, key)
+    if not os.path.isdir(entry):
+        return None
+    try:
+        os.utime(entry)
+    except OSError:
+        pass
+    return entry
+
+
+def store(key, compile_into):
+    """
+    Run compile_into(tmp_dir) → bool and publish tmp_dir as the entry for key.
+    Returns the entry path, or None if compilation failed.
+    """
+    os.makedirs(_gp.BUILD_DIR, exist_ok=True)
+    entry = os.path.join(_gp.BUILD_DIR, key)
+    tmp   = f"{entry}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    try:
+        if not compile_into(tmp):
+            return None
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            if not os.path.isdir(entry):        # lost a race: another build published it
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    evict(keep=key)
+    return entry
+
+
+def _entry_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def evict(limit=None, keep=None):
+    """Drop least recently used entries until the cache fits in limit bytes. Returns bytes freed."""
+    limit = _gp.BUILD_CACHE_LIMIT if limit is None else limit
+    try:
+        names = [n for n in os.listdir(_gp.BUILD_DIR) if '.tmp-' not in n]
+    except FileNotFoundError:
+        return 0
+    entries = []
+    for name in names:
+        path = os.path.join(_gp.BUILD_DIR, name)
+        try:
+            entries.append((os.stat(path).st_mtime_ns, name, path, _entry_size(path)))
+        except OSError:
+            pass
+    total = sum(e[3] for e in entries)
+    freed = 0
+    for _, name, path, size in sorted(entries):
+        if total <= limit:
+            break
+        if name == keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        freed += size
+    return freed
+
+
+# ---------------------------------------------------------------------------
+# Compilers
+# ---------------------------------------------------------------------------
+
+def cpp_pch():
+    """Header path to pass to -include so g++ picks up the cached lc_utils.h.gch, or None."""
+    utils_h = os.path.join(_gp.PROJECT_ROOT, 'utils/cpp/lc_utils.h')
+    if not os.path.exists(utils_h):
+        return None
+    key   = pch_key()
+    entry = lookup(key)
+    if not entry:
+        def compile_into(out_dir):
+            header = os.path.join(out_dir, PCH_HEADER)
+            shutil.copyfile(utils_h, header)
+            # A failed PCH is cached too (header only), so it is not retried on every build.
+            subprocess.run([CPP_COMPILER, *CPP_FLAGS, '-x', 'c++-header', header, '-o', header + '.gch'],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        entry = store(key, compile_into)
+    header = os.path.join(entry, PCH_HEADER)
+    return header if os.path.exists(header + '.gch') else None
+
+
+def _includes_lc_utils(source):
+    try:
+        with open(source, 'rb') as f:
+            return PCH_HEADER.encode() in f.read()
+    except OSError:
+        return False
+
+
+def compile_cpp(source, pch=True):
+    """
+    Cached g++ build of source, against the lc_utils.h PCH when the source includes it.
+    Returns (binary path or None, cache hit).
+    """
+    key   = cpp_key(source)
+    entry = lookup(key)
+    if entry:
+        return os.path.join(entry, _BINARY), True
+
+    def compile_into(out_dir):
+        header = cpp_pch() if pch and _includes_lc_utils(source) else None
+        cmd = [CPP_COMPILER, *CPP_FLAGS]
+        if header:
+            cmd += ['-include', header]
+        cmd += [source, '-o', os.path.join(out_dir, _BINARY)]
+        return subprocess.run(cmd).returncode == 0
+
+    entry = store(key, compile_into)
+    return (os.path.join(entry, _BINARY) if entry else None), False
+
+
+def compile_java(source, classname):
+    """Cached javac build of source + LcUtils. Returns (class dir or None, cache hit)."""
+    key   = java_key(source, classname)
+    entry = lookup(key)
+    if entry:
+        return entry, True
+
+    def compile_into(out_dir):
+        utils_java = os.path.join(_gp.PROJECT_ROOT, 'utils/java/LcUtils.java')
+        cmd = [JAVA_COMPILER, '-d', out_dir, '-cp', _gp.PROJECT_ROOT, source, utils_java]
+        return subprocess.run(cmd, cwd=_gp.PROJECT_ROOT).returncode == 0
+
+    return store(key, compile_into), False
@@ -0,0 +1,127 @@
+"""
+grind_cli — argument parsing, dispatch and terminal output for the grind CLI.
+
+Every subcommand lives in a grind_cmd_* module that defines cmd_<name>(args) and,
+when the command takes arguments, add_<name>_arguments(parser). COMMANDS names
+each command's module and help line; main() lists them all on the top-level
+parser but imports only the module the invocation asks for and builds only its
+subparser, so `grind session event` never loads plan generation, reports or
+subprocess machinery.
+"""
+import os
+import sys
+import json
+import argparse
+import importlib
+
+import grind_paths as _gp
+
+# ANSI colors
+CYAN    = '\033[96m'
+GREEN   = '\033[92m'
+RED     = '\033[91m'
+YELLOW  = '\033[93m'
+MAGENTA = '\033[95m'
+BOLD    = '\033[1m'
+DIM     = '\033[2m'
+RESET   = '\033[0m'
+
+
+def print_info(msg):    print(f"{CYAN}[INFO] {msg}{RESET}")
+def print_success(msg): print(f"{GREEN}[OK] {msg}{RESET}")
+def print_error(msg):   print(f"{RED}[ERROR] {msg}{RESET}", file=sys.stderr)
+def print_warn(msg):    print(f"{YELLOW}[WARN] {msg}{RESET}")
+def print_json(doc):    print(json.dumps(doc, separators=(',', ':')))
+
+
+# ---------------------------------------------------------------------------
+# Slug / path helpers
+# ---------------------------------------------------------------------------
+
+def slug_to_folder(slug):
+    """'two-sum' → 'two_sum'. Hyphens invalid in Java package names."""
+    return slug.replace('-', '_')
+
+
+def resolve_problem_dir(slug):
+    return os.path.join(_gp.PROJECT_ROOT, 'problems', slug_to_folder(slug))
+
+
+def find_solution_file(problem_dir):
+    for name in ['solution.cpp', 'solution.py', 'Solution.java']:
+        path = os.path.join(problem_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+# command → (module, help), in `grind --help` order
+COMMANDS = {
+    'init':     ('grind_cmd_workspace', 'First-time setup'),
+    'reset':    ('grind_cmd_workspace', 'Delete all user data and start fresh'),
+    'new':      ('grind_cmd_workspace', 'Scaffold a problem workspace'),
+    'run':      ('grind_cmd_workspace', 'Run a solution (reads input.txt automatically)'),
+    'test':     ('grind_cmd_test',      'Run a solution against all its test cases in parallel'),
+    'bench':    ('grind_cmd_bench',     'Time a solution over growing inputs and estimate its complexity'),
+    'jvm':      ('grind_cmd_workspace', 'Keep a warm JVM that grind run uses for Java solutions'),
+    'pool':     ('grind_cmd_workspace', 'Keep pre-forked Python workers that grind run uses for .py solutions'),
+    'log':      ('grind_cmd_history',   'Log a solved problem with SM-2 spaced repetition'),
+    'list':     ('grind_cmd_history',   'Browse problem bank'),
+    'track':    ('grind_cmd_history',   'View or switch active track'),
+    'bank':     ('grind_cmd_history',   'Problem bank maintenance'),
+    'storage':  ('grind_cmd_history',   'View or switch how attempts are stored'),
+    'due':      ('grind_cmd_history',   'List reviews due today, most overdue first'),
+    'archive':  ('grind_cmd_history',   'Archive old rows from memory.md'),
+    'progress': ('grind_cmd_plan',      'Show progress summary with gap analysis'),
+    'target':   ('grind_cmd_target',    'Manage interview targets'),
+    'resume':   ('grind_cmd_target',    'Manage resume context'),
+    'session':  ('grind_cmd_session',   'Manage coaching sessions'),
+    'behavior': ('grind_cmd_session',   'User behavioral analytics'),
+    'speak':    ('grind_cmd_speak',     'Speak text aloud (TTS)'),
+    'gap':      ('grind_cmd_plan',      'View and override gap analysis'),
+    'stats':    ('grind_cmd_plan',      'Solve rate, rating trends, streak stats'),
+    'plan':     ('grind_cmd_plan',      'Study plan management'),
+    'context':  ('grind_cmd_plan',      'Target, plan, due reviews, gaps and behavior as one JSON document'),
+    'serve':    ('grind_cmd_serve',     'Keep grind warm and answer CLI calls over a local socket'),
+    'batch':    ('grind_cmd_serve',     'Run many commands from stdin in one process'),
+}
+
+
+def json_flag(p):
+    # SUPPRESS keeps the subparser from resetting a --json given before the command
+    p.add_argument('--json', action='store_true', default=argparse.SUPPRESS,
+                   help='Machine-readable output')
+    return p
+
+
+def main(argv=None):
+    argv   = sys.argv[1:] if argv is None else list(argv)
+    parser = argparse.ArgumentParser(
+        prog='grind',
+        description='Your AI coding coach that never gives you the answer.',
+        epilog='Start a session: /setup  ·  First problem: /solve two-sum cpp',
+    )
+    parser.add_argument('--json', action='store_true',
+                        help='Structured output from read commands (progress, stats, gap show, plan today, ...)')
+    sub = parser.add_subparsers(dest='command')
+
+    # Only the requested command's module is imported and only its subparser gets arguments.
+    name   = next((a for a in argv if not a.startswith('-')), None)
+    module = None
+    for cmd, (module_name, help_text) in COMMANDS.items():
+        p = sub.add_parser(cmd, help=help_text)
+        if cmd == name:
+            module = importlib.import_module(module_name)
+            add_arguments = getattr(module, f'add_{cmd}_arguments', None)
+            if add_arguments:
+                add_arguments(p)
+
+    parsed = parser.parse_args(argv)
+    if parsed.command is None:
+        parser.print_help()
+        return
+    getattr(module, f'cmd_{parsed.command}')(parsed)
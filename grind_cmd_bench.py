@@ -0,0 +1,337 @@
+"""
+grind_cmd_bench — `grind bench`: time a solution over growing inputs and estimate its complexity.
+
+Inputs come from the problem's own generator, problems/<folder>/gen.py, run as
+`python3 gen.py <n> <seed>` with its stdout used as stdin for the solution, or
+from a built-in generator (--gen) that prints one line in LeetCode literal
+form, the way lc_utils parses input: an int array, a string, a level-order
+tree (a random BST built from TreeNode) or a linked list (ListNode.from_list's
+input). The solution is compiled once through prepare_run() — the same
+dispatch and build cache `grind run` uses — and then run --repeat times per
+size under the same run limits as `grind run` (grind_exec.run_limited; --timeout
+overrides the wall-clock one); the fastest wall time counts. The sweep stops at
+the first size that is not OK: TLE, MLE and OLE end it, RE fails the command.
+
+Process start-up (interpreter, JVM) is timed first on an n=1 input and
+subtracted from every size; with the default sizes the sweep keeps doubling n
+past 64000 (up to MAX_SIZE) until the largest size's net time clears
+SIGNAL_BANDS noise bands, so the solution's own work shows above the start-up
+jitter. The noise band is NOISE_RATIO of the start-up time, at least
+NOISE_FLOOR; a sweep whose slowest and fastest sizes differ by no more than
+one band is inconclusive rather than fitted to noise.
+
+The net timings are fitted by least squares to t = a + b·f(n) for each class in
+CLASSES; the constant a absorbs what start-up is left. Classes compete on a
+BIC-style score, k·ln(RSS/k) + PARAM_PENALTY·params·ln k over k sizes: O(1)
+fits one parameter and every other class two, so a growth term has to cut the
+residual by more than noise would, and a flat or falling sweep (slope clamped
+to 0) comes out O(1). Reading the input is part of every run, so a sub-linear
+solution over an n-sized input still shows up as O(n) once parsing dominates.
+"""
+import os
+import sys
+import json
+import math
+import random
+import subprocess
+
+import grind_paths as _gp
+import grind_exec
+from grind_cli import GREEN, YELLOW, BOLD, DIM, RESET, print_info, print_error, print_warn, print_json, json_flag
+from grind_cmd_workspace import resolve_solution, prepare_run, add_limit_arguments, run_limits
+
+DEFAULT_SIZES   = (1000, 2000, 4000, 8000, 16000, 32000, 64000)
+DEFAULT_REPEAT  = 3
+MAX_SIZE        = 1024000  # default sweeps double up to this while the signal stays in the noise
+MIN_POINTS      = 3      # sizes needed before a fit means anything
+NOISE_RATIO     = 0.5    # spread of flat best-of-N timings across a sweep, as a fraction of start-up
+NOISE_FLOOR     = 0.002  # seconds; timer and scheduler jitter when start-up is ~1ms (C++)
+SIGNAL_BANDS    = 8      # default sweeps extend until the largest net time spans this many bands (~4 start-ups)
+INCONCLUSIVE    = 'inconclusive'
+PARAM_PENALTY   = 3.0    # BIC's ln k per parameter, tripled: plain BIC calls ~20% of flat noisy sweeps growth
+GENERATOR_FILE  = 'gen.py'
+
+CLASSES = (
+    ('O(1)',       lambda n: 0.0),
+    ('O(log n)',   lambda n: math.log2(n)),
+    ('O(n)',       lambda n: float(n)),
+    ('O(n log n)', lambda n: n * math.log2(n)),
+    ('O(n^2)',     lambda n: float(n) * n),
+)
+
+
+# --- built-in generators ---
+
+def _values(n, rng):
+    return [rng.randint(-10**9, 10**9) for _ in range(n)]
+
+
+def gen_array(n, rng):
+    return json.dumps(_values(n, rng), separators=(',', ':'))
+
+
+def gen_string(n, rng):
+    return json.dumps(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(n)))
+
+
+def gen_list(n, rng):
+    return gen_array(n, rng)             # ListNode.from_list(parse(line))
+
+
+def gen_tree(n, rng):
+    """n distinct values inserted into a BST (expected depth O(log n)), serialized level order."""
+    from utils.python.lc_utils import TreeNode
+    values = rng.sample(range(1, 4 * n + 1), n)
+    root = TreeNode(values[0]) if values else None
+    for v in values[1:]:
+        node = root
+        while True:
+            side = 'left' if v < node.val else 'right'
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, TreeNode(v))
+                break
+            node = child
+    out, queue, i = [], [root], 0
+    while i < len(queue):
+        node = queue[i]
+        i += 1
+        out.append(node.val if node else None)
+        if node:
+            queue += [node.left, node.right]
+    while out and out[-1] is None:
+        out.pop()
+    return json.dumps(out, separators=(',', ':'))
+
+
+GENERATORS = {'array': gen_array, 'string': gen_string, 'tree': gen_tree, 'list': gen_list}
+
+
+def generate_input(problem_dir, gen, n, seed):
+    """Input bytes of size n: the built-in generator `gen`, else problem_dir/gen.py."""
+    if gen:
+        return (GENERATORS[gen](n, random.Random(seed)) + '\n').encode()
+    env = os.environ.copy()
+    env['PYTHONPATH'] = _gp.PROJECT_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    proc = subprocess.run(['python3', os.path.join(problem_dir, GENERATOR_FILE), str(n), str(seed)],
+                          cwd=problem_dir, env=env, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{GENERATOR_FILE} {n} exited with {proc.returncode}: "
+                           f"{proc.stderr.decode(errors='replace').strip()}")
+    return proc.stdout
+
+
+# --- fitting ---
+
+def _fit(sizes, times, f):
+    """Least-squares a, b for t = a + b·f(n) with b >= 0. Returns (a, b, residual sum of squares)."""
+    xs = [f(n) for n in sizes]
+    k = len(xs)
+    mean_x, mean_t = sum(xs) / k, sum(times) / k
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    b = sum((x - mean_x) * (t - mean_t) for x, t in zip(xs, times)) / sxx if sxx else 0.0
+    b = max(b, 0.0)
+    a = mean_t - b * mean_x
+    return a, b, sum((a + b * x - t) ** 2 for x, t in zip(xs, times))
+
+
+def noise_band(startup):
+    """Timing noise, in seconds, for runs whose start-up takes startup seconds."""
+    return max(NOISE_RATIO * startup, NOISE_FLOOR)
+
+
+def estimate_complexity(sizes, times, startup=0.0):
+    """
+    fit_complexity over times less startup (all in seconds), or (INCONCLUSIVE, fits)
+    when the sweep's slowest and fastest sizes are within one noise band of each other.
+    """
+    estimate, fits = fit_complexity(sizes, [max(0.0, t - startup) for t in times])
+    if max(times) - min(times) <= noise_band(startup):
+        return INCONCLUSIVE, fits
+    return estimate, fits
+
+
+def fit_complexity(sizes, times):
+    """
+    Fit every class in CLASSES to (sizes, times in seconds). Returns (best class name,
+    [{'class', 'a', 'b', 'r2'}] in CLASSES order). O(1) competes with the rest on
+    the penalized score, so it beats a class whose slope only buys back noise.
+    """
+    k      = len(times)
+    mean_t = sum(times) / k
+    total  = sum((t - mean_t) ** 2 for t in times)
+    floor  = (total or mean_t ** 2 or 1.0) * 1e-12   # exact fits: keep log() finite
+    fits, best = [], None
+    for name, f in CLASSES:
+        a, b, rss = _fit(sizes, times, f)
+        fits.append({'class': name, 'a': a, 'b': b, 'r2': 1 - rss / total if total else 1.0})
+        params = 1 if name == 'O(1)' else 2
+        score = k * math.log(max(rss, floor) / k) + PARAM_PENALTY * params * math.log(k)
+        if best is None or score < best[1]:
+            best = (name, score)
+    return best[0], fits
+
+
+# --- command ---
+
+def time_size(cmd, cwd, env, problem_dir, gen, n, repeat, limits, seed=0):
+    """
+    Time one size, every run under limits (a grind_exec.Limits). Returns
+    {'n', 'time_ms', 'max_rss_kb', 'status'} — status is a grind_exec.VERDICTS key,
+    the time the fastest of up to repeat runs. An RE row carries 'stderr', an
+    MLE/OLE/TLE row the 'limit' it ran into.
+    """
+    data = generate_input(problem_dir, gen, n, seed)
+    runs = []
+    for _ in range(repeat):
+        m = grind_exec.run_limited(cmd, cwd=cwd, env=env, stdin=data, limits=limits, capture=True)
+        runs.append(m)
+        if m.verdict != 'OK':
+            break
+    last = runs[-1]
+    status = last.verdict
+    row = {'n': n, 'status': status, 'time_ms': round(min(m.wall for m in runs) * 1000, 2),
+           'max_rss_kb': max(m.max_rss_kb for m in runs)}
+    if status == 'RE':
+        row['stderr'] = last.stderr.decode(errors='replace')
+    elif status != 'OK':
+        row['limit'] = limits.describe(status)
+    return row
+
+
+def bench(cmd, cwd, env, problem_dir, gen, sizes, repeat, limits, seed=0, progress=None,
+          startup=0.0, extend_to=None):
+    """
+    Run the sweep: time_size for each size, stopping after the first that is not OK.
+    With extend_to, n keeps doubling past the last size (up to extend_to) until its
+    net time (less startup, in seconds) spans SIGNAL_BANDS noise bands.
+    progress(row, previous row or None) is called as each size finishes.
+    """
+    rows, sizes = [], list(sizes)
+    signal = SIGNAL_BANDS * noise_band(startup)
+    for n in sizes:
+        row = time_size(cmd, cwd, env, problem_dir, gen, n, repeat, limits, seed)
+        if progress:
+            progress(row, rows[-1] if rows else None)
+        rows.append(row)
+        if row['status'] != 'OK':
+            break
+        if (n == sizes[-1] and extend_to and 2 * n <= extend_to
+                and row['time_ms'] / 1000 - startup < signal):
+            sizes.append(2 * n)
+    return rows
+
+
+def _parse_sizes(text):
+    sizes = sorted({int(s) for s in text.split(',') if s.strip()})
+    if not sizes or sizes[0] < 1:
+        raise ValueError("sizes must be positive integers")
+    return sizes
+
+
+def add_bench_arguments(p):
+    p.add_argument('slug', help='Problem slug or file path')
+    p.add_argument('--gen', choices=sorted(GENERATORS),
+                   help=f'Built-in input generator (default: the problem\'s {GENERATOR_FILE})')
+    p.add_argument('--sizes', metavar='N,N,...',
+                   help=f'Input sizes to run (default: 1000 doubling to 64000, and on up to {MAX_SIZE} '
+                        'while the timings stay within start-up noise)')
+    p.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, metavar='N',
+                   help=f'Runs per size, fastest counts (default {DEFAULT_REPEAT})')
+    p.add_argument('--timeout', type=float, metavar='SEC',
+                   help='Per-run wall-clock limit; the sweep stops at the first size over it '
+                        '(default: the run_limits time, as for grind run)')
+    p.add_argument('--seed', type=int, default=0, help='Seed passed to the generator')
+    add_limit_arguments(p, time_flag=False)
+    json_flag(p)
+
+
+def _print_row(row, previous):
+    growth = (f"{row['time_ms'] / previous['time_ms']:>6.2f}x"
+              if previous and previous['time_ms'] and row['status'] == 'OK' else f"{'':>7}")
+    status = ''
+    if row['status'] != 'OK':
+        limit  = f" ({row['limit']})" if row.get('limit') else ''
+        status = f"  {YELLOW}{grind_exec.VERDICTS[row['status']]}{limit}{RESET}"
+    print(f"  {row['n']:>9}  {row['time_ms']:>10.1f}ms  {growth}  {row['max_rss_kb'] / 1024:>8.1f}MB{status}")
+
+
+def cmd_bench(args):
+    as_json  = getattr(args, 'json', False)
+    solution = resolve_solution(args.slug)
+    if not solution:
+        print_error(f"Problem '{args.slug}' not found.")
+        sys.exit(1)
+    problem_dir = os.path.dirname(os.path.abspath(solution))
+    if not args.gen and not os.path.exists(os.path.join(problem_dir, GENERATOR_FILE)):
+        print_error(f"No {GENERATOR_FILE} in {problem_dir} — add one (`python3 {GENERATOR_FILE} <n> <seed>` "
+                    f"prints an input of size n) or pass --gen {'|'.join(sorted(GENERATORS))}.")
+        sys.exit(1)
+    try:
+        sizes = _parse_sizes(args.sizes) if args.sizes else list(DEFAULT_SIZES)
+    except ValueError as e:
+        print_error(f"Bad --sizes: {e}")
+        sys.exit(1)
+
+    if as_json:
+        from contextlib import redirect_stdout
+        with redirect_stdout(sys.stderr):       # keep compile chatter off the JSON stream
+            prepared = prepare_run(solution)
+    else:
+        prepared = prepare_run(solution)
+    if not prepared:
+        sys.exit(1)
+
+    limits = run_limits(args) or grind_exec.Limits(cpu=None, memory=None, output=None)
+    if args.timeout is not None:
+        limits.time = args.timeout or None
+    repeat = max(1, args.repeat)
+    try:
+        base = time_size(*prepared, problem_dir, args.gen, 1, repeat, limits, seed=args.seed)
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+    startup = base['time_ms'] / 1000 if base['status'] == 'OK' else 0.0
+    extend_to = None if args.sizes else MAX_SIZE
+
+    if not as_json:
+        source = f"--gen {args.gen}" if args.gen else GENERATOR_FILE
+        print_info(f"Benchmarking {os.path.basename(solution)} over {len(sizes)} sizes"
+                   f"{' and up' if extend_to else ''} ({source}, best of {repeat})...")
+        if base['status'] == 'OK':
+            print(f"  {DIM}start-up (n=1): {base['time_ms']:.1f}ms, subtracted before fitting{RESET}")
+        else:
+            print_warn(f"n=1 run: {grind_exec.VERDICTS[base['status']]}; start-up not subtracted.")
+        print(f"\n  {BOLD}{'n':>9}  {'time':>12}  {'growth':>7}  {'peak rss':>10}{RESET}")
+    try:
+        rows = bench(*prepared, problem_dir, args.gen, sizes, repeat, limits, seed=args.seed,
+                     progress=None if as_json else _print_row, startup=startup, extend_to=extend_to)
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        return
+
+    ok = [r for r in rows if r['status'] == 'OK']
+    estimate, fits = None, []
+    if len(ok) >= MIN_POINTS:
+        estimate, fits = estimate_complexity([r['n'] for r in ok], [r['time_ms'] / 1000 for r in ok], startup)
+
+    if as_json:
+        print_json({'solution': solution, 'estimate': estimate, 'startup_ms': base['time_ms'],
+                    'sizes': rows, 'fits': [{'class': f['class'], 'r2': round(f['r2'], 4)} for f in fits]})
+    else:
+        if rows and rows[-1]['status'] == 'RE':
+            print(f"\n  {DIM}{rows[-1]['stderr'].strip()}{RESET}")
+        if estimate == INCONCLUSIVE:
+            print_warn(f"Inconclusive: the timings stay within {noise_band(startup) * 1000:.1f}ms of start-up "
+                       f"noise. Try larger --sizes.")
+        elif estimate:
+            print(f"\n  {DIM}fit (R², net of start-up): "
+                  + ', '.join(f"{f['class']} {f['r2']:.3f}" for f in fits) + RESET)
+            print(f"\n  Estimated: {GREEN}{BOLD}{estimate}{RESET}\n")
+        else:
+            print_warn(f"Need at least {MIN_POINTS} completed sizes to estimate complexity.")
+    if rows and rows[-1]['status'] == 'RE':
+        sys.exit(1)
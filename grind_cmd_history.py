@@ -0,0 +1,350 @@
+"""
+grind_cmd_history — log, due, archive, list, track, bank and storage: attempt history
+and the problem bank.
+"""
+import os
+import time as time_module
+from datetime import datetime, timedelta
+from collections import defaultdict
+
+import grind_paths as _gp
+from grind_snapshot import snapshot_path
+from grind_data import (
+    load_config, save_config, config_transaction, get_problem_bank, compile_problem_bank,
+    STORAGE_MODES, storage_mode, parse_memory, write_memory, append_attempt, read_journal,
+    materialize_memory, archive_memory, memory_index, update_memory_index, live_attempt_count,
+    due_reviews, migrate_to_sqlite, export_from_sqlite, appends_buffered, journal_pending,
+)
+from grind_algos import sm2_calculate, _mark_plan_progress, _rebalance_plan, _append_notes
+from grind_cli import (
+    CYAN, GREEN, RED, YELLOW, MAGENTA, BOLD, DIM, RESET, print_info, print_success, print_error,
+    print_warn, print_json, json_flag, slug_to_folder,
+)
+
+
+def add_log_arguments(p):
+    p.add_argument('slug')
+    p.add_argument('rating', type=int, choices=[1, 2, 3, 4, 5])
+    p.add_argument('--time', type=int, metavar='MIN', help='Time spent in minutes')
+    p.add_argument('--hints', type=int, default=0, help='Number of hints used')
+    p.add_argument('--topic', type=str)
+    p.add_argument('--difficulty', type=str)
+    p.add_argument('--notes', type=str, help='Free-text notes (not stored in memory.md)')
+
+
+def cmd_log(args):
+    slug       = args.slug
+    rating     = args.rating
+    time_spent = f"{args.time}m" if args.time else ""
+    hints      = args.hints or 0
+    topic      = args.topic or ""
+    difficulty = args.difficulty or ""
+
+    index = memory_index()
+    prev  = index.schedule.get(slug)
+
+    if prev:
+        prev_ease     = prev['ease']
+        prev_interval = prev['interval']
+        repetition    = prev['repetition']
+        topic         = topic      or prev['topic']
+        difficulty    = difficulty or prev['difficulty']
+    else:
+        prev_ease, prev_interval, repetition = 2.5, 0, 0
+
+    if not topic or not difficulty:
+        bank = get_problem_bank(_gp.PROBLEMS_FILE)
+        p    = bank.get(slug) if bank else None
+        if p:
+            topic      = topic      or p.get('topic', '')
+            difficulty = difficulty or p.get('difficulty', '')
+
+    new_ease, new_interval, _ = sm2_calculate(rating, prev_ease, prev_interval, repetition)
+    today       = datetime.now().strftime('%Y-%m-%d')
+    next_review = (datetime.now() + timedelta(days=new_interval)).strftime('%Y-%m-%d')
+
+    row = {
+        'slug': slug, 'topic': topic, 'difficulty': difficulty,
+        'date': today, 'rating': rating, 'time': time_spent,
+        'hints': hints, 'ease': new_ease,
+        'interval': f"{new_interval}d", 'next_review': next_review,
+    }
+    # Journal and sqlite modes append one record; markdown rewrites the table.
+    # memory.md is re-materialized from the journal in batches. Inside `grind batch`
+    # the attempt is buffered and stored once, when the batch closes.
+    mode     = storage_mode()
+    buffered = appends_buffered()
+    live, pending = None, 0
+    if mode == 'markdown' and not buffered:
+        rows = parse_memory() + [row]
+        write_memory(rows)
+        live = len(rows)
+    else:
+        pending = append_attempt(row)
+    update_memory_index(index, row)
+    print_success(
+        f"Logged {slug}: rating={rating}, ease={new_ease:.1f}, "
+        f"interval={new_interval}d, next_review={next_review}"
+    )
+    notes = getattr(args, 'notes', None)
+    if notes:
+        _append_notes(slug, notes, today, rating)
+        print_info(f"Note appended: problems/{slug_to_folder(slug)}/notes.md")
+    # Plan completion, then re-plan upcoming days if gap scores moved — one config write
+    with config_transaction() as config:
+        solved = set(index.schedule.slugs)
+        _mark_plan_progress(config, solved)
+        _rebalance_plan(config, solved)
+    if not buffered:
+        settle_history(live, pending)
+
+
+def settle_history(live=None, pending=None):
+    """
+    Archive once live history passes ARCHIVE_THRESHOLD, checked after every stored log in
+    every storage mode (and when `grind batch` stores its buffered logs) so parse_memory()
+    holds the same rows whichever mode or path stored them. Otherwise, in journal mode,
+    fold the journal into memory.md once `pending` records reach JOURNAL_THRESHOLD.
+    live and pending are the counts when the caller already knows them.
+    """
+    if (live if live is not None else live_attempt_count()) > _gp.ARCHIVE_THRESHOLD:
+        cmd_archive(None)
+    elif storage_mode() == 'journal':
+        if (pending if pending is not None else journal_pending()) >= _gp.JOURNAL_THRESHOLD:
+            materialize_memory()
+
+
+def add_due_arguments(p):
+    json_flag(p)
+    p.add_argument('--limit', type=int, help='Show at most N reviews')
+    p.add_argument('--topic', help='Only reviews in this topic')
+
+
+def cmd_due(args):
+    limit = getattr(args, 'limit', None)
+    topic = getattr(args, 'topic', None)
+    due   = due_reviews(limit=limit, topic=topic)
+    if getattr(args, 'json', False):
+        print_json([{'slug': s, 'topic': t, 'overdue_days': d} for s, t, d in due])
+        return
+    if not due:
+        print(f"\n  {GREEN}No reviews due today.{RESET}\n")
+        return
+    print(f"\n  {YELLOW}{BOLD}Due for review:{RESET}")
+    for slug, t, overdue in due:
+        label = f"overdue {overdue}d" if overdue > 0 else "due today"
+        print(f"    - {slug} ({t}) — {label}")
+    print()
+
+
+def cmd_archive(args):
+    archived, kept = archive_memory(_gp.ARCHIVE_THRESHOLD)
+    if not archived:
+        if args is not None:
+            print_info(f"Only {kept} rows, no archiving needed.")
+        return
+    where = 'grind.db' if storage_mode() == 'sqlite' else 'memory_archive.md'
+    print_success(f"Archived {archived} rows to {where}")
+
+
+def add_list_arguments(p):
+    json_flag(p)
+    p.add_argument('--track', type=str)
+    p.add_argument('--topic', type=str)
+    p.add_argument('--difficulty', type=str)
+
+
+def cmd_list(args):
+    bank = get_problem_bank(_gp.PROBLEMS_FILE)
+    if not bank:
+        return
+    config       = load_config()
+    track_name   = args.track or config.get('active_track', 'blind75')
+    topic_filter = args.topic.lower() if args.topic else None
+    diff_filter  = args.difficulty.lower() if args.difficulty else None
+
+    tracks = bank.tracks
+    if track_name not in tracks:
+        print_error(f"Track '{track_name}' not found.")
+        print(f"  {DIM}Available: {', '.join(tracks.keys())}{RESET}")
+        return
+
+    track    = tracks[track_name]
+    problems = track['problems']
+    if topic_filter: problems = [p for p in problems if p.get('topic','').lower() == topic_filter]
+    if diff_filter:  problems = [p for p in problems if p.get('difficulty','').lower() == diff_filter]
+    if getattr(args, 'json', False):
+        solved = {r['slug'] for r in parse_memory()}
+        print_json({'track': track_name, 'name': track['name'], 'problems': [
+            {'slug': p['slug'], 'topic': p.get('topic', 'other'), 'difficulty': p.get('difficulty', ''),
+             'number': p.get('number'), 'solved': p['slug'] in solved} for p in problems]})
+        return
+    if not problems:
+        print_info("No problems match the filters.")
+        return
+
+    rows    = parse_memory()
+    solved  = {r['slug'] for r in rows}
+    by_topic = defaultdict(list)
+    for p in problems:
+        by_topic[p.get('topic', 'other')].append(p)
+
+    total        = len(problems)
+    solved_count = sum(1 for p in problems if p['slug'] in solved)
+    print(f"\n  {BOLD}{track['name']}{RESET} {DIM}({solved_count}/{total} solved){RESET}\n")
+
+    dc = {'easy': GREEN, 'medium': YELLOW, 'hard': RED}
+    for topic in sorted(by_topic.keys()):
+        print(f"  {BOLD}{MAGENTA}{topic}{RESET}")
+        for p in by_topic[topic]:
+            slug  = p['slug']
+            diff  = p.get('difficulty', '')
+            num   = p.get('number', '')
+            check = f"{GREEN}*{RESET}" if slug in solved else f"{DIM}.{RESET}"
+            num_s = f"#{num}" if num else ""
+            print(f"    {check} {slug} {DIM}{num_s}{RESET} {dc.get(diff,'')}{diff}{RESET}")
+        print()
+    print(f"  {DIM}Filter: grind list --topic <t> --difficulty <easy|medium|hard>{RESET}\n")
+
+
+def add_track_arguments(p):
+    json_flag(p)
+    p.add_argument('name', nargs='?')
+
+
+def cmd_track(args):
+    bank = get_problem_bank(_gp.PROBLEMS_FILE)
+    if not bank:
+        return
+    config = load_config()
+    tracks = bank.tracks
+    if args.name:
+        if args.name not in tracks:
+            print_error(f"Track '{args.name}' not found.")
+            print(f"  {DIM}Available: {', '.join(tracks.keys())}{RESET}")
+            return
+        config['active_track'] = args.name
+        save_config(config)
+        t = tracks[args.name]
+        print_success(f"Switched to {t['name']} ({len(t['problems'])} problems)")
+    else:
+        current = config.get('active_track', 'blind75')
+        if getattr(args, 'json', False):
+            print_json({'active': current, 'tracks': [
+                {'id': k, 'name': t['name'], 'problems': len(t['problems'])} for k, t in tracks.items()]})
+            return
+        print(f"\n  {BOLD}Active track:{RESET} {current}\n  {BOLD}Available:{RESET}")
+        for k, t in tracks.items():
+            m = f" {GREEN}<-{RESET}" if k == current else ""
+            print(f"    {CYAN}{k}{RESET} — {t['name']} ({len(t['problems'])} problems){m}")
+        print(f"\n  {DIM}Switch: grind track <name>{RESET}\n")
+
+
+def add_bank_arguments(p):
+    bks = p.add_subparsers(dest='bank_cmd')
+    bks.add_parser('compile', help='Rebuild the binary snapshot of problems.json')
+
+
+def cmd_bank(args):
+    if not hasattr(args, 'bank_cmd') or args.bank_cmd is None:
+        print(f"\n  {BOLD}grind bank subcommands:{RESET}")
+        print(f"    compile    Rebuild the binary snapshot of problems.json\n")
+        return
+
+    sub = args.bank_cmd
+
+    if sub == 'compile':
+        if not os.path.exists(_gp.PROBLEMS_FILE):
+            print_error(f"Problem bank not found: {_gp.PROBLEMS_FILE}")
+            return
+        start      = time_module.perf_counter()
+        bank, size = compile_problem_bank(_gp.PROBLEMS_FILE)
+        elapsed    = time_module.perf_counter() - start
+        if size is None:
+            print_warn("Bank has fields the snapshot format does not cover — using JSON.")
+            return
+        n_entries = sum(len(t.get('problems', [])) for t in bank.tracks.values())
+        print_success(
+            f"Compiled {os.path.basename(snapshot_path(_gp.PROBLEMS_FILE))}: "
+            f"{len(bank.tracks)} tracks, {n_entries} entries, {len(bank.by_slug)} unique slugs, "
+            f"{len(bank.topics)} topics, {size} bytes ({elapsed*1000:.1f}ms)"
+        )
+
+    else:
+        print_error(f"Unknown bank subcommand: {sub}")
+
+
+def _storage_migrate(force):
+    try:
+        counts = migrate_to_sqlite(force=force)
+    except ValueError as e:
+        print_error(str(e))
+        return
+    print_success(f"Migrated {counts['attempts']} attempt(s), {counts['events']} behavior event(s) "
+                  f"and {counts['targets']} target(s) to grind.db")
+
+
+def _storage_export(mode):
+    counts = export_from_sqlite(mode)
+    print_success(f"Exported {counts['attempts']} attempt(s) and {counts['events']} behavior event(s) "
+                  f"from grind.db. Storage mode: {mode}")
+
+
+def add_storage_arguments(p):
+    sts = p.add_subparsers(dest='storage_cmd')
+    st_use = sts.add_parser('use')
+    st_use.add_argument('mode', choices=list(STORAGE_MODES))
+    sts.add_parser('compact', help='Fold journaled attempts into memory.md')
+    st_mig = sts.add_parser('migrate', help='Import files into grind.db and switch to sqlite')
+    st_mig.add_argument('--force', action='store_true', help='Overwrite a non-empty grind.db')
+    st_exp = sts.add_parser('export', help='Write grind.db back to memory.md and jsonl files')
+    st_exp.add_argument('mode', nargs='?', choices=['markdown', 'journal'], default='markdown')
+
+
+def cmd_storage(args):
+    config = load_config()
+    mode   = storage_mode(config)
+    sub    = getattr(args, 'storage_cmd', None)
+
+    if sub is None:
+        pending = len(read_journal())
+        print(f"\n  {BOLD}Storage mode:{RESET} {mode}")
+        if pending:
+            print(f"  {DIM}{pending} journaled attempt(s) not yet in memory.md{RESET}")
+        print(f"\n  {DIM}Switch: grind storage use <{'|'.join(STORAGE_MODES)}>  ·  "
+              f"Fold journal: grind storage compact{RESET}\n")
+
+    elif sub == 'use':
+        if args.mode == mode:
+            print_info(f"Storage mode already {mode}.")
+            return
+        if args.mode == 'sqlite':
+            _storage_migrate(force=False)
+            return
+        if mode == 'sqlite':
+            _storage_export(args.mode)
+            return
+        if mode == 'journal':
+            materialize_memory()
+        config['storage'] = args.mode
+        save_config(config)
+        print_success(f"Storage mode: {args.mode}")
+
+    elif sub == 'compact':
+        if mode == 'sqlite':
+            print_info("Nothing to compact in sqlite mode.")
+            return
+        n = materialize_memory()
+        print_success(f"Folded {n} journaled attempt(s) into memory.md")
+
+    elif sub == 'migrate':
+        _storage_migrate(force=getattr(args, 'force', False))
+
+    elif sub == 'export':
+        if mode != 'sqlite':
+            print_error("Storage mode is not sqlite; nothing to export.")
+            return
+        _storage_export(getattr(args, 'mode', None) or 'markdown')
+
+    else:
+        print_error(f"Unknown storage subcommand: {sub}")
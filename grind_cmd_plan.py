@@ -0,0 +1,416 @@
+"""
+grind_cmd_plan — gap analysis, study plans, progress, stats and the context snapshot.
+"""
+from grind_data import load_config, save_config, config_transaction, memory_index
+from grind_algos import _generate_plan_for_target, _rebalance_plan
+from grind_cli import (
+    CYAN, GREEN, RED, YELLOW, MAGENTA, BOLD, DIM, RESET, print_info, print_success, print_error,
+    print_json, json_flag,
+)
+from grind_reports import (
+    gap_report, plan_show_report, plan_today_report, progress_report, stats_report,
+    context_report,
+)
+
+
+# ---------------------------------------------------------------------------
+# GAP
+# ---------------------------------------------------------------------------
+
+def add_gap_arguments(p):
+    gs = p.add_subparsers(dest='gap_cmd')
+    json_flag(gs.add_parser('show'))
+    g_set = gs.add_parser('set')
+    g_set.add_argument('topic')
+    g_set.add_argument('status', choices=['unknown', 'weak', 'developing', 'strong'])
+
+
+def cmd_gap(args):
+    if not hasattr(args, 'gap_cmd') or args.gap_cmd is None:
+        print(f"\n  {BOLD}grind gap subcommands:{RESET}")
+        print(f"    show               Display gap scores per topic")
+        print(f"    set <topic> <status>  Override a topic (unknown|weak|developing|strong)\n")
+        return
+
+    config = load_config()
+    sub    = args.gap_cmd
+
+    if sub == 'show':
+        report    = gap_report(config)
+        if getattr(args, 'json', False):
+            print_json(report)
+            return
+        overrides = report['overrides']
+
+        groups = {'unknown': [], 'weak': [], 'developing': [], 'strong': []}
+        for topic, g in report['topics'].items():
+            groups[g['status']].append(topic)
+
+        print(f"\n{BOLD}Gap Analysis{RESET} {DIM}(from practice history){RESET}")
+        print(f"{DIM}{'─' * 40}{RESET}\n")
+
+        label_cfg = {
+            'unknown':    (f"{DIM}Unknown (never practiced):{RESET}", DIM),
+            'weak':       (f"{RED}{BOLD}Weak (needs focus):{RESET}", RED),
+            'developing': (f"{YELLOW}Developing:{RESET}", YELLOW),
+            'strong':     (f"{GREEN}Strong:{RESET}", GREEN),
+        }
+        for key in ['unknown', 'weak', 'developing', 'strong']:
+            if not groups[key]:
+                continue
+            label, col = label_cfg[key]
+            print(f"  {label}")
+            for t in groups[key]:
+                g      = report['topics'][t]
+                n      = g['attempts']
+                detail = f" (avg {g['avg_rating']:.1f}, {n} attempt{'s' if n!=1 else ''})" if n else ''
+                ov     = f" {DIM}[override]{RESET}" if g['override'] else ''
+                print(f"    {col}{t}{RESET}{detail}{ov}")
+            print()
+
+        if overrides:
+            print(f"  {DIM}Overrides: {', '.join(f'{k}={v}' for k,v in overrides.items())}{RESET}")
+        print(f"  {DIM}Override: grind gap set <topic> <weak|strong|unknown>{RESET}\n")
+
+    elif sub == 'set':
+        valid = ('unknown', 'weak', 'developing', 'strong')
+        if args.status not in valid:
+            print_error(f"Status must be one of: {', '.join(valid)}")
+            return
+        config.setdefault('gap_overrides', {})[args.topic] = args.status
+        save_config(config)
+        print_success(f"Gap override set: {args.topic} = {args.status}")
+
+    else:
+        print_error(f"Unknown gap subcommand: {sub}")
+
+
+# ---------------------------------------------------------------------------
+# PLAN
+# ---------------------------------------------------------------------------
+
+def add_plan_arguments(p):
+    ps = p.add_subparsers(dest='plan_cmd')
+    p_gen = ps.add_parser('generate')
+    p_gen.add_argument('--target')
+    p_show = json_flag(ps.add_parser('show'))
+    p_show.add_argument('--target')
+    p_today = json_flag(ps.add_parser('today'))
+    p_today.add_argument('--target')
+    p_regen = ps.add_parser('regenerate')
+    p_regen.add_argument('--target')
+    p_rebal = ps.add_parser('rebalance')
+    p_rebal.add_argument('--target')
+
+
+def cmd_plan(args):
+    if not hasattr(args, 'plan_cmd') or args.plan_cmd is None:
+        print(f"\n  {BOLD}grind plan subcommands:{RESET}")
+        print(f"    generate [--target <id>]   Build study plan from gap scores")
+        print(f"    show     [--target <id>]   Display plan with progress")
+        print(f"    today    [--target <id>]   Today's recommended problems")
+        print(f"    regenerate [--target <id>] Rebuild plan from current progress")
+        print(f"    rebalance  [--target <id>] Re-plan upcoming days whose topics' gap scores moved\n")
+        return
+
+    with config_transaction() as config:
+        sub = args.plan_cmd
+
+        if sub == 'generate':
+            tid = getattr(args, 'target', None) or config.get('active_target')
+            if not tid:
+                print_error("No active target. Add one: grind target add --company <name> --role <title> --date YYYY-MM-DD")
+                return
+            ok, msg = _generate_plan_for_target(config, tid)
+            if ok:
+                print_success(msg)
+                print_info("View: grind plan show  ·  Today: grind plan today")
+            else:
+                print_error(msg)
+
+        elif sub == 'show':
+            tid = getattr(args, 'target', None) or config.get('active_target')
+            if not tid:
+                print_error("No active target.")
+                return
+            target = config.get('targets', {}).get(tid)
+            if not target or not target.get('plan', {}).get('days'):
+                print_error("No plan found. Generate one: grind plan generate")
+                return
+            report = plan_show_report(config, tid)
+            if getattr(args, 'json', False):
+                print_json(report)
+                return
+            total     = report['days_total']
+            completed = report['days_completed']
+            bar_len   = 20
+            filled    = int(bar_len * completed / total) if total else 0
+            bar       = '█' * filled + '░' * (bar_len - filled)
+            pct       = int(100 * completed / total) if total else 0
+
+            print(f"\n{BOLD}{report['company']} — {report['role']}{RESET}")
+            print(f"Interview: {report['interview_date']}  ·  {report['days_remaining']}d remaining")
+            print(f"Plan: {bar} {pct}%  ({completed}/{total} days)\n")
+
+            for d in report['upcoming']:
+                focus = d['focus']
+                if d['problems']:
+                    # Label each problem with its topic if it differs from focus
+                    probs = ', '.join(f"{p['slug']} [{p['topic']}]" if p['topic'] != focus else p['slug']
+                                      for p in d['problems'])
+                elif d['empty']:
+                    probs = f"{DIM}(no unsolved problems left for this day: review due ones){RESET}"
+                else:
+                    probs = f"({d['type']})"
+                today_marker = f"  {GREEN}← today{RESET}" if d['today'] else ""
+                print(f"  Day {d['day']:2d}  {d['date']}  [ ]  {MAGENTA}{focus}{RESET}: {probs}{today_marker}")
+
+            mocks  = report['mocks_completed']
+            mock_t = report['mocks_target']
+            print(f"\n  Mocks: {mocks}/{mock_t}  {'■'*mocks}{'□'*(mock_t-mocks)}\n")
+
+        elif sub == 'today':
+            tid = getattr(args, 'target', None) or config.get('active_target')
+            if not tid:
+                print_error("No active target.")
+                return
+            target = config.get('targets', {}).get(tid)
+            if not target or not target.get('plan', {}).get('days'):
+                print_error("No plan found. Generate one: grind plan generate")
+                return
+
+            report = plan_today_report(config, tid)
+            if getattr(args, 'json', False):
+                print_json(report)
+                return
+            if report['completed']:
+                print_success("All plan days completed!")
+                return
+
+            print(f"\n{BOLD}Today — {report['company']} (Day {report['day']} of {report['days_total']}){RESET}\n")
+
+            # Reviews first
+            for r in report['reviews']:
+                label = f"overdue {r['overdue_days']}d" if r['overdue_days'] else "due today"
+                check = f"{GREEN}[x]{RESET}" if r['solved'] else f"{YELLOW}[rev]{RESET}"
+                print(f"  {check} {r['slug']}  {DIM}({r['topic']} · {label}){RESET}")
+
+            # Plan-only problems
+            for p in report['problems']:
+                check = f"{GREEN}[x]{RESET}" if p['solved'] else "[ ]"
+                gap   = p['gap']
+                if gap == 'weak':         gap_label = f" {DIM}·{RESET} {RED}{gap}{RESET}"
+                elif gap == 'unknown':    gap_label = f" {DIM}·{RESET} {DIM}{gap}{RESET}"
+                elif gap == 'developing': gap_label = f" {DIM}·{RESET} {YELLOW}{gap}{RESET}"
+                else:                     gap_label = ''
+                print(f"  {check} {p['slug']}{gap_label}")
+
+            print(f"\n  {DIM}/solve <slug>  ·  /mock  ·  /behavioral{RESET}\n")
+
+        elif sub == 'regenerate':
+            tid = getattr(args, 'target', None) or config.get('active_target')
+            if not tid:
+                print_error("No active target.")
+                return
+            target = config.get('targets', {}).get(tid)
+            if not target:
+                print_error(f"Target '{tid}' not found.")
+                return
+
+            # Preserve completed days and mock count
+            old_plan      = target.get('plan', {})
+            completed_days = [d for d in old_plan.get('days', []) if d.get('completed')]
+            mocks_done     = old_plan.get('mock_sessions_completed', 0)
+
+            # Clear and regenerate (one write when the transaction closes)
+            target['plan'] = {}
+            ok, msg = _generate_plan_for_target(config, tid)
+            if not ok:
+                print_error(msg)
+                return
+
+            # Re-attach completed days at front
+            if completed_days:
+                plan    = config['targets'][tid]['plan']
+                offset  = len(completed_days)
+                for d in plan['days']:
+                    d['day'] += offset
+                plan['days']                    = completed_days + plan['days']
+                plan['mock_sessions_completed'] = mocks_done
+
+            n = len(config['targets'][tid]['plan']['days'])
+            print_success(f"Plan regenerated. {len(completed_days)} completed day(s) preserved. {n} days total.")
+
+        elif sub == 'rebalance':
+            tid = getattr(args, 'target', None) or config.get('active_target')
+            target = config.get('targets', {}).get(tid) if tid else None
+            if not target or not target.get('plan', {}).get('days'):
+                print_error("No plan found. Generate one: grind plan generate")
+                return
+            if not _rebalance_plan(config, set(memory_index().schedule.slugs), tid):
+                print_info("Plan is up to date with current gap scores.")
+
+        else:
+            print_error(f"Unknown plan subcommand: {sub}")
+
+
+# ---------------------------------------------------------------------------
+# PROGRESS  (enhanced with gap scores + behavioral patterns)
+# ---------------------------------------------------------------------------
+
+def add_progress_arguments(p):
+    json_flag(p)
+
+
+def cmd_progress(args):
+    report = progress_report()
+    if getattr(args, 'json', False):
+        print_json(report)
+        return
+    if not report['attempts']:
+        print_info("No problems logged yet. Start with: /solve <slug> <lang>")
+        return
+
+    streak = report['streak']
+    print(f"\n{BOLD}Progress{RESET}")
+    print(f"{DIM}{'─' * 40}{RESET}\n")
+    print(f"  {BOLD}Problems solved:{RESET} {report['solved']}")
+    if report['track']:
+        t = report['track']
+        print(f"  {BOLD}Track:{RESET} {t['name']} {t['solved']}/{t['total']}")
+    print(f"  {BOLD}Streak:{RESET} {streak} day{'s' if streak != 1 else ''}")
+
+    target = report['target']
+    if target:
+        d = target['days_until']
+        if d is not None:
+            label = f"{d}d until interview" if d >= 0 else f"interview was {-d}d ago"
+            print(f"  {BOLD}Target:{RESET} {target['company']} — {label}")
+        plan = target['plan']
+        if plan:
+            total  = plan['days_total']
+            done   = plan['days_completed']
+            mocks  = plan['mocks_completed']
+            mock_t = plan['mocks_target']
+            bar    = '█' * int(20*done/total) + '░' * (20 - int(20*done/total)) if total else '░'*20
+            print(f"  {BOLD}Plan:{RESET}  {bar} {int(100*done/total) if total else 0}% ({done}/{total})")
+            print(f"  {BOLD}Mocks:{RESET} {mocks}/{mock_t}  {'■'*mocks}{'□'*(mock_t-mocks)}")
+    print()
+
+    due = report['due']
+    if due:
+        print(f"  {YELLOW}{BOLD}Due for review:{RESET}")
+        for r in due:
+            label = f"overdue {r['overdue_days']}d" if r['overdue_days'] > 0 else "due today"
+            print(f"    - {r['slug']} ({r['topic']}) — {label}")
+        print()
+    else:
+        print(f"  {GREEN}No reviews due today.{RESET}\n")
+
+    # Gap analysis
+    groups = {'unknown': [], 'weak': [], 'developing': [], 'strong': []}
+    for t, g in report['gaps'].items():
+        groups[g['status']].append(t)
+
+    def topic_detail(t):
+        g = report['gaps'][t]
+        n = g['attempts']
+        if not n:
+            return t
+        # Flag insufficient data (< 3 problems) even if avg is high
+        note = f", {n} problem{'s' if n != 1 else ''}" + (" — needs more data" if n < 3 else "")
+        return f"{t} (avg {g['avg_rating']:.1f}{note})"
+
+    print(f"  {BOLD}Gap analysis:{RESET}")
+    if groups['unknown']:
+        print(f"    {DIM}Unknown:    {' · '.join(groups['unknown'])}{RESET}")
+    if groups['weak']:
+        weak_d = [topic_detail(t) for t in groups['weak']]
+        print(f"    {RED}Weak:       {' · '.join(weak_d)}{RESET}")
+    if groups['developing']:
+        dev_d = [topic_detail(t) for t in groups['developing']]
+        print(f"    {YELLOW}Developing: {' · '.join(dev_d)}{RESET}")
+    if groups['strong']:
+        str_d = [topic_detail(t) for t in groups['strong']]
+        print(f"    {GREEN}Strong:     {' · '.join(str_d)}{RESET}")
+    print()
+
+    behavior = report['behavior']
+    if behavior and (behavior['concerns'] or behavior['positives']):
+        print(f"  {BOLD}Behavioral patterns ({behavior['events']} hint events):{RESET}")
+        for t, flags in behavior['concerns'].items():
+            print(f"    {RED}{t}:{RESET} {', '.join(flags)}")
+        for t in behavior['positives']:
+            if t not in behavior['concerns']:
+                print(f"    {GREEN}{t}:{RESET} hints working well")
+        print()
+
+    # Suggestion
+    if due:
+        print(f"  {CYAN}{BOLD}Suggested:{RESET} Review {due[0]['slug']} ({due[0]['topic']})")
+    elif target and target['plan']:
+        print(f"  {CYAN}{BOLD}Suggested:{RESET} /mock --round technical  ·  /plan today")
+    elif report['next_unsolved']:
+        p = report['next_unsolved']
+        print(f"  {CYAN}{BOLD}Suggested:{RESET} {p['slug']} ({p['topic']}, {p['difficulty']})")
+    print()
+
+
+# ---------------------------------------------------------------------------
+# STATS
+# ---------------------------------------------------------------------------
+
+def add_stats_arguments(p):
+    json_flag(p)
+    p.add_argument('--topic', type=str)
+
+
+def cmd_stats(args):
+    topic_filter = getattr(args, 'topic', None)
+    report       = stats_report(topic_filter)
+    if getattr(args, 'json', False):
+        print_json(report)
+        return
+    if not report['logged']:
+        print_info("No problems logged yet.")
+        return
+    if topic_filter:
+        if not report['attempts']:
+            print_info(f"No problems logged for topic: {topic_filter}")
+            return
+        print(f"\n{BOLD}Stats — {topic_filter}{RESET}")
+
+    print(f"\n{BOLD}Weekly Solve Rate{RESET} {DIM}(last 8 weeks){RESET}")
+    max_count = max((w['count'] for w in report['weekly'] if w['count']), default=1)
+    bar_width  = 20
+    for w in report['weekly']:
+        cnt   = w['count']
+        label = f"W-{w['weeks_ago']}" if w['weeks_ago'] > 0 else "This wk"
+        bar   = '█' * int(bar_width * cnt / max_count) if max_count > 0 else ''
+        print(f"  {label:<7}  {bar:<{bar_width}}  {cnt}")
+
+    def arrow(trend):
+        return (f"{GREEN}↑{RESET}" if trend['last'] > trend['first'] else
+                f"{RED}↓{RESET}" if trend['last'] < trend['first'] else f"{DIM}→{RESET}")
+
+    if not topic_filter:
+        print(f"\n{BOLD}Rating Trends{RESET} {DIM}(first 3 vs last 3 attempts){RESET}")
+        for topic, tr in report['trends'].items():
+            print(f"  {MAGENTA}{topic:<20}{RESET}  {tr['first']:.1f} → {tr['last']:.1f}  {arrow(tr)}")
+    elif topic_filter in report['trends']:
+        tr = report['trends'][topic_filter]
+        print(f"\n{BOLD}Rating Trend{RESET} ({topic_filter}): {tr['first']:.1f} → {tr['last']:.1f}  {arrow(tr)}")
+
+    current_streak, best_streak = report['streak']['current'], report['streak']['best']
+    print(f"\n{BOLD}Streak{RESET}")
+    print(f"  Current: {current_streak} day{'s' if current_streak != 1 else ''}")
+    print(f"  Best:    {best_streak} day{'s' if best_streak != 1 else ''}")
+    print()
+
+
+# ---------------------------------------------------------------------------
+# CONTEXT  (one read for agents at session start)
+# ---------------------------------------------------------------------------
+
+def cmd_context(args):
+    print_json(context_report())
@@ -0,0 +1,111 @@
+"""
+grind_cmd_serve — the `grind serve` daemon and `grind batch`.
+"""
+import sys
+import json
+
+import grind_paths as _gp
+import grind_serve
+from grind_data import config_transaction, session_transaction, transaction_savepoint, rollback_transaction
+from grind_cli import print_info, print_success, print_error, main
+
+
+# ---------------------------------------------------------------------------
+# SERVE
+# ---------------------------------------------------------------------------
+
+def add_serve_arguments(p):
+    p.add_argument('--stop', action='store_true', help='Stop the running daemon')
+    p.add_argument('--status', action='store_true', help='Report whether a daemon is running')
+    p.add_argument('--idle-timeout', type=int, metavar='MIN',
+                   help='Exit after MIN minutes without a request')
+
+
+def cmd_serve(args):
+    if getattr(args, 'stop', False):
+        if grind_serve.stop(_gp.SOCKET_FILE):
+            print_success("grind daemon stopped")
+        else:
+            print_info("No grind daemon running.")
+        return
+    if getattr(args, 'status', False):
+        if grind_serve.is_running(_gp.SOCKET_FILE):
+            print_info(f"grind daemon listening on {_gp.SOCKET_FILE}")
+        else:
+            print_info("No grind daemon running.")
+        return
+    idle = getattr(args, 'idle_timeout', None)
+    try:
+        grind_serve.serve(main, _gp.SOCKET_FILE, idle_timeout=idle * 60 if idle else None,
+                          ready=lambda: print_info(f"Serving on {_gp.SOCKET_FILE} (Ctrl-C to stop)"))
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print()
+
+
+# ---------------------------------------------------------------------------
+# BATCH
+# ---------------------------------------------------------------------------
+
+def parse_batch(text):
+    """
+    Commands from batch input: a JSON array (of argv lists or command strings), or
+    one shell-quoted command per line with blank lines and # comments skipped.
+    A leading 'grind' is dropped. Raises ValueError on malformed input.
+    """
+    import shlex
+    if text.lstrip().startswith('['):
+        items = json.loads(text)
+        cmds  = [shlex.split(c) if isinstance(c, str) else [str(a) for a in c] for c in items]
+    else:
+        cmds = [shlex.split(line, comments=True) for line in text.splitlines()]
+    cmds = [c[1:] if c[:1] == ['grind'] else c for c in cmds]
+    return [c for c in cmds if c]
+
+
+def add_batch_arguments(p):
+    p.add_argument('--jsonl', action='store_true',
+                   help='One JSON object per command: argv, stdout, stderr, code')
+    p.add_argument('--stop-on-error', action='store_true',
+                   help='Skip the remaining commands after one fails')
+
+
+def cmd_batch(args):
+    try:
+        cmds = parse_batch(sys.stdin.read())
+    except ValueError as e:
+        print_error(f"Invalid batch input: {e}")
+        sys.exit(1)
+    for argv in cmds:
+        if grind_serve.command_of(argv) == 'batch' or not grind_serve.forwardable(argv):
+            print_error(f"Not allowed in a batch: {' '.join(argv)}")
+            sys.exit(1)
+
+    jsonl     = getattr(args, 'jsonl', False)
+    stop      = getattr(args, 'stop_on_error', False)
+    exit_code = 0
+    # Every command sees the others' config/session changes and logged attempts/events; all of
+    # them are stored once, at the end, and then archived past the threshold like single logs.
+    # A command that fails has its own changes rolled back.
+    with config_transaction(), session_transaction():
+        for argv in cmds:
+            savepoint = transaction_savepoint()
+            res = grind_serve.capture(main, argv)
+            if res['code']:
+                rollback_transaction(savepoint)
+            if jsonl:
+                print(json.dumps({'argv': argv, **res}))
+            else:
+                sys.stdout.write(res['stdout'])
+                sys.stderr.write(res['stderr'])
+            if res['code'] and not exit_code:
+                exit_code = res['code']
+            if res['code'] and stop:
+                break
+    if any(grind_serve.command_of(argv) == 'log' for argv in cmds):
+        from grind_cmd_history import settle_history
+        settle_history()                # archive as the logs would have one by one
+    if exit_code:
+        sys.exit(exit_code)
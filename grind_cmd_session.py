@@ -0,0 +1,341 @@
+"""
+grind_cmd_session — coaching sessions and the behavior log they feed.
+"""
+import os
+import json
+from datetime import datetime, timedelta
+
+import grind_paths as _gp
+from grind_data import (
+    load_config, load_session, save_session, clear_session, slug_to_topic, tail_behavior_events,
+    count_behavior_events, flush_behavior_events, has_behavior_events, behavior_rollup,
+    clear_behavior_events, archive_behavior_events,
+)
+from grind_algos import behavior_patterns
+from grind_cli import (
+    CYAN, GREEN, RED, YELLOW, MAGENTA, BOLD, DIM, RESET, print_info, print_success, print_error,
+    print_warn, print_json, json_flag,
+)
+from grind_reports import behavior_summary_report
+
+
+# ---------------------------------------------------------------------------
+# SESSION
+# ---------------------------------------------------------------------------
+
+def add_session_arguments(p):
+    ss = p.add_subparsers(dest='session_cmd')
+    s_start = ss.add_parser('start')
+    s_start.add_argument('--target')
+    s_event = ss.add_parser('event')
+    s_event.add_argument('slug')
+    s_event.add_argument('event_type',
+        choices=['presented', 'hint_given', 'hint_assessed', 'rating_calibration',
+                 'mock_started', 'logged'])
+    s_event.add_argument('--data', metavar='JSON')
+    ss.add_parser('end')
+    ss.add_parser('recover')
+
+
+def cmd_session(args):
+    if not hasattr(args, 'session_cmd') or args.session_cmd is None:
+        print(f"\n  {BOLD}grind session subcommands:{RESET}")
+        print(f"    start   [--target <id>]")
+        print(f"    event   <slug> <event_type> [--data '<json>']")
+        print(f"    end")
+        print(f"    recover\n")
+        return
+
+    sub = args.session_cmd
+
+    if sub == 'start':
+        config   = load_config()
+        existing = load_session()
+        if existing and not existing.get('clean_exit', True):
+            print_warn("Unclean session found. Run 'grind session recover' first.")
+        target = getattr(args, 'target', None) or config.get('active_target', '')
+        session = {
+            'started_at':  datetime.now().isoformat(),
+            'target':      target,
+            'clean_exit':  False,
+            'problems':    [],
+            'hint_events': [],
+        }
+        save_session(session)
+        print_success(f"Session started (target: {target or 'none'})")
+
+    elif sub == 'event':
+        session = load_session()
+        if not session:
+            print_warn("No active session. Run: grind session start")
+            return
+        slug       = args.slug
+        event_type = args.event_type
+        data       = {}
+        if args.data:
+            try:
+                data = json.loads(args.data)
+            except json.JSONDecodeError as e:
+                print_error(f"Invalid data JSON: {e}")
+                return
+
+        # Ensure problem entry exists
+        problem = next((p for p in session['problems'] if p['slug'] == slug), None)
+        if problem is None:
+            problem = {
+                'slug': slug,
+                'presented_at': datetime.now().isoformat(),
+                'hints': 0, 'rated': False, 'logged': False,
+            }
+            session['problems'].append(problem)
+
+        # Build the event record (for hint events only)
+        hint_event_types = {'hint_given', 'hint_assessed', 'rating_calibration'}
+        if event_type in hint_event_types:
+            record = {
+                'ts':         datetime.now().isoformat(),
+                'session_id': session['started_at'][:19],
+                'slug':       slug,
+                'topic':      slug_to_topic(slug),
+                'event':      event_type,
+                **data,
+            }
+            session['hint_events'].append(record)
+
+        # Update problem summary
+        if event_type == 'hint_given':
+            problem['hints'] = problem.get('hints', 0) + 1
+        elif event_type == 'logged':
+            problem['logged'] = True
+            problem['logged_at'] = datetime.now().isoformat()
+            if 'rating' in data:
+                problem['rating'] = data['rating']
+                problem['rated']  = True
+        elif event_type == 'presented':
+            problem['presented_at'] = datetime.now().isoformat()
+
+        save_session(session)
+        print_success(f"Event recorded: {event_type} for {slug}")
+
+    elif sub == 'end':
+        session = load_session()
+        if not session:
+            print_info("No active session.")
+            return
+        n = flush_behavior_events(session)
+        session['clean_exit'] = True
+        session['ended_at']   = datetime.now().isoformat()
+        save_session(session)
+        clear_session()
+        msg = "Session ended cleanly."
+        if n:
+            msg += f" {n} hint event(s) logged to behavior.jsonl."
+        print_success(msg)
+
+    elif sub == 'recover':
+        session = load_session()
+        if not session:
+            print_info("No recovery needed — no session file found.")
+            return
+        if session.get('clean_exit', False):
+            clear_session()
+            print_info("Previous session exited cleanly. Nothing to recover.")
+            return
+        # Flush pending hint events even during recovery
+        n = flush_behavior_events(session)
+        unlogged = [p for p in session.get('problems', [])
+                    if p.get('rated') and not p.get('logged')]
+        if not unlogged:
+            print_info("No unlogged work found.")
+            clear_session()
+            return
+        print(f"\n{YELLOW}Session recovery:{RESET}")
+        print(f"  Started: {session.get('started_at','?')}")
+        print(f"  Target:  {session.get('target','none')}\n")
+        for p in unlogged:
+            print(f"  {RED}●{RESET} {p['slug']} — rated {p.get('rating','?')}/5, not logged")
+        print(f"\n{DIM}Log with: grind log <slug> <rating>{RESET}")
+        if n:
+            print(f"{DIM}Flushed {n} hint event(s) to behavior.jsonl{RESET}")
+        print()
+
+    else:
+        print_error(f"Unknown session subcommand: {sub}")
+
+
+# ---------------------------------------------------------------------------
+# BEHAVIOR
+# ---------------------------------------------------------------------------
+
+def add_behavior_arguments(p):
+    bs = p.add_subparsers(dest='behavior_cmd')
+    json_flag(bs.add_parser('summary'))
+    b_report = json_flag(bs.add_parser('report'))
+    b_report.add_argument('--topic')
+    b_report.add_argument('--slug')
+    bs.add_parser('export')
+    b_reset = bs.add_parser('reset')
+    b_reset.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+    b_archive = bs.add_parser('archive')
+    b_archive.add_argument('--before', metavar='YYYY-MM-DD',
+                           help='Archive events older than date (default: 90 days ago)')
+    bs.add_parser('rebuild-rollup', help='Recompute .behavior_rollup.json from behavior.jsonl')
+
+
+def cmd_behavior(args):
+    if not hasattr(args, 'behavior_cmd') or args.behavior_cmd is None:
+        print(f"\n  {BOLD}grind behavior subcommands:{RESET}")
+        print(f"    summary                          Print user model (agent reads at session start)")
+        print(f"    report [--topic t] [--slug s]    Detailed hint history")
+        print(f"    export                            Export as markdown")
+        print(f"    reset  [--force]                  Clear behavior.jsonl")
+        print(f"    archive [--before YYYY-MM-DD]     Archive old events")
+        print(f"    rebuild-rollup                    Recompute per-topic aggregates from the log\n")
+        return
+
+    sub = args.behavior_cmd
+
+    if sub == 'summary':
+        report = behavior_summary_report()
+        if getattr(args, 'json', False):
+            print_json(report)
+            return
+        if not report['events']:
+            print_info("No behavioral data yet. Hint events are recorded during sessions.")
+            return
+        patterns = report['patterns']
+        if not patterns:
+            print_info("Not enough data for patterns yet.")
+            return
+
+        print(f"\n{BOLD}User Behavior Model{RESET} {DIM}({report['events']} hint events){RESET}")
+        print(f"{DIM}{'─' * 60}{RESET}\n")
+
+        FLAG_SYM = {
+            'quick_give_up':  f"{YELLOW}⏱ quick-to-hint{RESET}",
+            'chronic_hint':   f"{YELLOW}↑ chronic-hint{RESET}",
+            'hint_positive':  f"{GREEN}✓ hints-effective{RESET}",
+            'hint_negative':  f"{RED}✗ hints-not-working{RESET}",
+            'overconfident':  f"{RED}↑ overconfident{RESET}",
+        }
+        for topic, p in sorted(patterns.items()):
+            parts = []
+            if p['avg_time_to_hint_min'] is not None: parts.append(f"avg {p['avg_time_to_hint_min']}min→hint")
+            if p['avg_hint_level']       is not None: parts.append(f"avg level {p['avg_hint_level']}")
+            if p['hint_effectiveness']   is not None: parts.append(f"effective {int(p['hint_effectiveness']*100)}%")
+            flags_str = '  '.join(FLAG_SYM.get(f, f) for f in p['flags'])
+            print(f"  {BOLD}{MAGENTA}{topic:<20}{RESET} {' · '.join(parts)}")
+            if flags_str:
+                print(f"  {' '*20} {flags_str}")
+
+        if report['adjustments']:
+            print(f"\n{BOLD}Coaching adjustments:{RESET}")
+            for a in report['adjustments']:
+                print(f"  · {a['topic']}: {a['adjustment']}")
+        print()
+
+    elif sub == 'report':
+        as_json = getattr(args, 'json', False)
+        if not as_json and not has_behavior_events():
+            print_info("No behavioral data yet.")
+            return
+        topic = getattr(args, 'topic', None) or None
+        slug  = getattr(args, 'slug', None) or None
+        total = count_behavior_events(topic=topic, slug=slug)
+        if as_json:
+            print_json({'total': total,
+                        'events': tail_behavior_events(50, topic=topic, slug=slug) if total else []})
+            return
+        if not total:
+            print_info("No events match the filter.")
+            return
+        events = tail_behavior_events(50, topic=topic, slug=slug)
+        print(f"\n{BOLD}Behavior Report{RESET} {DIM}({total} events){RESET}\n")
+        for e in events:
+            ts     = e.get('ts', '')[:16]
+            ev     = e.get('event', '')
+            sl     = e.get('slug', '')
+            tp     = e.get('topic', '')
+            detail = ''
+            if ev == 'hint_given':
+                detail = (f"level {e.get('hint_level','?')}  "
+                          f"{e.get('time_to_hint_min','?')}min  "
+                          f"concept: {e.get('hint_concept','')}")
+            elif ev == 'hint_assessed':
+                eff    = 'effective' if e.get('effective') else 'not effective'
+                detail = f"level {e.get('hint_level','?')} — {eff}: {e.get('reasoning','')}"
+            elif ev == 'rating_calibration':
+                delta  = e.get('self_rating', 0) - e.get('expected_rating_from_hints', 0)
+                detail = (f"self={e.get('self_rating')} "
+                          f"expected={e.get('expected_rating_from_hints')} "
+                          f"delta={delta:+d}")
+            print(f"  {DIM}{ts}{RESET}  {CYAN}{ev:<22}{RESET}  {sl} ({tp})  {detail}")
+        print()
+
+    elif sub == 'export':
+        rollup = behavior_rollup()
+        if not rollup['events']:
+            print_info("No behavioral data to export.")
+            return
+        patterns = behavior_patterns(rollup)
+        lines = [
+            f"# grindcoach Behavior Report\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n",
+            f"Total events: {rollup['events']}\n\n",
+            f"## Patterns by Topic\n\n",
+        ]
+        for topic, p in sorted(patterns.items()):
+            lines.append(f"### {topic}\n")
+            lines.append(f"- Avg time to first hint: {p['avg_time_to_hint_min']} min\n")
+            lines.append(f"- Avg hint level needed: {p['avg_hint_level']}\n")
+            lines.append(f"- Hint effectiveness: {p['hint_effectiveness']}\n")
+            lines.append(f"- Calibration delta: {p['calibration_delta']}\n")
+            lines.append(f"- Flags: {', '.join(p['flags']) or 'none'}\n\n")
+        lines.append("## Raw Events (last 100)\n\n")
+        for e in tail_behavior_events(100):
+            lines.append(f"- `{e.get('ts','')}` `{e.get('event','')}` {e.get('slug','')} ({e.get('topic','')})\n")
+        out = os.path.join(_gp.PROJECT_ROOT, f"behavior_report_{datetime.now().strftime('%Y%m%d')}.md")
+        with open(out, 'w') as f:
+            f.writelines(lines)
+        print_success(f"Exported to {out}")
+
+    elif sub == 'reset':
+        if not has_behavior_events():
+            print_info("No behavior.jsonl to reset.")
+            return
+        force = getattr(args, 'force', False)
+        if not force:
+            count = count_behavior_events()
+            print(f"{YELLOW}This will delete {count} behavior events. This cannot be undone.{RESET}")
+            confirm = input("Type 'yes' to confirm: ").strip().lower()
+            if confirm != 'yes':
+                print_info("Aborted.")
+                return
+        clear_behavior_events()
+        print_success("behavior.jsonl cleared.")
+
+    elif sub == 'archive':
+        before_str = getattr(args, 'before', None)
+        if before_str:
+            try:
+                cutoff = datetime.strptime(before_str, '%Y-%m-%d').date()
+            except ValueError:
+                print_error(f"Invalid date: {before_str} (expected YYYY-MM-DD)")
+                return
+        else:
+            cutoff = (datetime.now() - timedelta(days=90)).date()
+
+        archived, remaining = archive_behavior_events(cutoff)
+        if not archived:
+            print_info("No events older than cutoff to archive.")
+            return
+        print_success(f"Archived {archived} event(s) → behavior_archive.jsonl. "
+                      f"{remaining} event(s) remain.")
+
+    elif sub == 'rebuild-rollup':
+        rollup = behavior_rollup(rebuild=True)
+        print_success(f"Rebuilt behavior rollup: {rollup['events']} event(s) across "
+                      f"{len(rollup['topics'])} topic(s).")
+
+    else:
+        print_error(f"Unknown behavior subcommand: {sub}")
@@ -0,0 +1,50 @@
+"""
+grind_cmd_speak — text to speech for verbal mock interviews.
+"""
+import platform
+import subprocess
+
+from grind_cli import print_warn
+
+
+def add_speak_arguments(p):
+    p.add_argument('text')
+    p.add_argument('--rate', type=int, default=175, metavar='WPM')
+
+
+def cmd_speak(args):
+    text   = args.text
+    rate   = getattr(args, 'rate', None) or 175
+    system = platform.system()
+
+    if system == 'Darwin':
+        subprocess.run(['say', '-r', str(rate), text])
+        return
+
+    if system == 'Linux':
+        for cmd in [
+            ['espeak-ng', f'--speed={rate // 10}', text],
+            ['espeak',    f'--speed={rate // 10}', text],
+            ['spd-say',   text],
+        ]:
+            try:
+                res = subprocess.run(cmd, capture_output=True, timeout=30)
+                if res.returncode == 0:
+                    return
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                continue
+        print_warn("No TTS engine found. Text mode:")
+        print(f"\n  {text}\n")
+        return
+
+    if system == 'Windows':
+        safe = text.replace("'", "`")
+        ps   = (
+            f"Add-Type -AssemblyName System.Speech; "
+            f"$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
+            f"$s.Rate = 2; $s.Speak('{safe}')"
+        )
+        subprocess.run(['powershell', '-Command', ps])
+        return
+
+    print(text)  # Unknown OS — text fallback
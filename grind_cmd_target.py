@@ -0,0 +1,303 @@
+"""
+grind_cmd_target — interview targets and resume context.
+"""
+import os
+import json
+from datetime import datetime
+
+from grind_data import load_config, save_config, config_transaction
+from grind_cli import (
+    CYAN, GREEN, BOLD, DIM, RESET, print_info, print_success, print_error, print_warn,
+    print_json, json_flag,
+)
+from grind_reports import target_list_report
+
+
+# ---------------------------------------------------------------------------
+# TARGET
+# ---------------------------------------------------------------------------
+
+def _next_target_id(config, company_slug):
+    targets = config.get('targets', {})
+    i = 1
+    while f"{company_slug}-{i:03d}" in targets:
+        i += 1
+    return f"{company_slug}-{i:03d}"
+
+
+def add_target_arguments(p):
+    ts = p.add_subparsers(dest='target_cmd')
+    t_add = ts.add_parser('add')
+    t_add.add_argument('--company', required=True)
+    t_add.add_argument('--role', required=True)
+    t_add.add_argument('--team')
+    t_add.add_argument('--url')
+    t_add.add_argument('--date', metavar='YYYY-MM-DD')
+    t_add.add_argument('--lang', choices=['cpp', 'python', 'java'])
+    json_flag(ts.add_parser('list'))
+    t_active = ts.add_parser('active')
+    t_active.add_argument('id', nargs='?')
+    t_remove = ts.add_parser('remove')
+    t_remove.add_argument('id')
+    t_show = json_flag(ts.add_parser('show'))
+    t_show.add_argument('id', nargs='?')
+    t_update = ts.add_parser('update')
+    t_update.add_argument('id')
+    t_update.add_argument('--field', required=True)
+    t_update.add_argument('--value', required=True)
+    t_merge = ts.add_parser('merge')
+    t_merge.add_argument('id1')
+    t_merge.add_argument('id2')
+
+
+def cmd_target(args):
+    if not hasattr(args, 'target_cmd') or args.target_cmd is None:
+        print(f"\n  {BOLD}grind target subcommands:{RESET}")
+        print(f"    add     --company <name> --role <title> --date <YYYY-MM-DD>")
+        print(f"    list")
+        print(f"    active  [id]")
+        print(f"    remove  <id>")
+        print(f"    show    [id]")
+        print(f"    update  <id> --field <field> --value <value>")
+        print(f"    merge   <id1> <id2>\n")
+        return
+
+    with config_transaction() as config:
+        sub = args.target_cmd
+
+        if sub == 'add':
+            company_slug = args.company.lower().replace(' ', '-')
+            tid = _next_target_id(config, company_slug)
+            config.setdefault('targets', {})[tid] = {
+                'id':                 tid,
+                'type':               'single',
+                'company':            args.company,
+                'role':               args.role,
+                'team':               args.team or '',
+                'url':                args.url  or '',
+                'interview_date':     args.date or '',
+                'preferred_language': args.lang or 'cpp',
+                'status':             'active',
+                'required_skills':    [],
+                'intelligence':       {},
+                'plan':               {},
+            }
+            config['active_target'] = tid
+            save_config(config)
+            print_success(f"Added target {tid}: {args.company} — {args.role}")
+            print_info(f"Active target set to {tid}")
+
+        elif sub == 'list':
+            report = target_list_report(config)
+            if getattr(args, 'json', False):
+                print_json(report)
+                return
+            if not report['targets']:
+                print_info("No targets. Add one: grind target add --company <name> --role <title> --date <YYYY-MM-DD>")
+                return
+            print(f"\n  {BOLD}Interview Targets{RESET}\n")
+            for t in report['targets']:
+                marker = f" {GREEN}← active{RESET}" if t['active'] else ""
+                d      = t['days_until']
+                days_s = ''
+                if d is not None:
+                    days_s = (f" · {GREEN}{d}d until interview{RESET}" if d >= 0
+                              else f" · {DIM}interview was {-d}d ago{RESET}")
+                print(f"  {CYAN}{t['id']}{RESET}  {t['company']} — {t['role']}{marker}{days_s}")
+            print()
+
+        elif sub == 'active':
+            if args.id:
+                targets = config.get('targets', {})
+                if args.id not in targets:
+                    print_error(f"Target '{args.id}' not found.")
+                    return
+                config['active_target'] = args.id
+                save_config(config)
+                t = targets[args.id]
+                print_success(f"Active target: {args.id} — {t['company']} {t['role']}")
+            else:
+                active = config.get('active_target')
+                if not active:
+                    print_info("No active target. Set one: grind target active <id>")
+                    return
+                t = config.get('targets', {}).get(active, {})
+                print(f"\n  {BOLD}Active target:{RESET} {active}")
+                print(f"  Company:  {t.get('company','')}")
+                print(f"  Role:     {t.get('role','')}")
+                print(f"  Date:     {t.get('interview_date','')}")
+                print(f"  Language: {t.get('preferred_language','cpp')}")
+                intel = t.get('intelligence', {})
+                if intel.get('reported_topics'):
+                    print(f"  Reported: {', '.join(intel['reported_topics'][:8])}")
+                print()
+
+        elif sub == 'remove':
+            targets = config.get('targets', {})
+            if args.id not in targets:
+                print_error(f"Target '{args.id}' not found.")
+                return
+            del targets[args.id]
+            if config.get('active_target') == args.id:
+                config['active_target'] = next(iter(targets), '')
+            save_config(config)
+            print_success(f"Removed target {args.id}")
+
+        elif sub == 'show':
+            tid = args.id or config.get('active_target')
+            if not tid:
+                print_error("No target specified and no active target.")
+                return
+            t = config.get('targets', {}).get(tid)
+            if not t:
+                print_error(f"Target '{tid}' not found.")
+                return
+            if getattr(args, 'json', False):
+                print_json(t)
+            else:
+                print(json.dumps(t, indent=2))
+
+        elif sub == 'update':
+            targets = config.get('targets', {})
+            if args.id not in targets:
+                print_error(f"Target '{args.id}' not found.")
+                return
+            try:
+                value = json.loads(args.value)
+            except (json.JSONDecodeError, TypeError):
+                value = args.value
+            # Support nested dot notation: intelligence.rounds
+            parts = args.field.split('.')
+            obj = targets[args.id]
+            for part in parts[:-1]:
+                obj = obj.setdefault(part, {})
+            obj[parts[-1]] = value
+            save_config(config)
+            print_success(f"Updated {args.id}.{args.field}")
+
+        elif sub == 'merge':
+            targets = config.get('targets', {})
+            t1 = targets.get(args.id1)
+            t2 = targets.get(args.id2)
+            if not t1 or not t2:
+                print_error("One or both target IDs not found.")
+                return
+            skills1 = set(t1.get('required_skills', []))
+            skills2 = set(t2.get('required_skills', []))
+            shared    = skills1 & skills2
+            only1     = skills1 - skills2
+            only2     = skills2 - skills1
+            total     = skills1 | skills2
+            overlap   = len(shared) / len(total) if total else 0
+            merge_type = 'combined' if overlap >= 0.6 else ('hybrid' if overlap >= 0.3 else 'separate')
+            mid = f"merged-{args.id1}-{args.id2}"
+
+            # Inherit interview_date from earliest source; merge company/role labels
+            date1 = t1.get('interview_date', '')
+            date2 = t2.get('interview_date', '')
+            earliest_date = min(d for d in [date1, date2] if d) if (date1 or date2) else ''
+            merged_company = f"{t1.get('company', args.id1)} + {t2.get('company', args.id2)}"
+            merged_role    = t1.get('role', '') or t2.get('role', '')
+            merged_lang    = t1.get('preferred_language') or t2.get('preferred_language') or 'cpp'
+
+            targets[mid] = {
+                'id':                mid,
+                'type':              merge_type,
+                'company':           merged_company,
+                'role':              merged_role,
+                'interview_date':    earliest_date,
+                'preferred_language': merged_lang,
+                'overlap_ratio':     round(overlap, 2),
+                'shared_skills':     sorted(shared),
+                f'{args.id1}_only':  sorted(only1),
+                f'{args.id2}_only':  sorted(only2),
+                'required_skills':   sorted(total),
+                'sources':           [args.id1, args.id2],
+                'intelligence':      {},
+                'status':            'active',
+                'plan':              {},
+            }
+            save_config(config)
+
+            # Output — designed for agent to present clearly
+            c1 = t1.get('company', args.id1)
+            c2 = t2.get('company', args.id2)
+            print_success(f"Merged → {mid}  (overlap {overlap:.0%}, type: {merge_type})")
+            print()
+            print(f"  {BOLD}{c1}{RESET}  {DIM}{', '.join(sorted(skills1)) or 'no required_skills set'}{RESET}")
+            print(f"  {BOLD}{c2}{RESET}  {DIM}{', '.join(sorted(skills2)) or 'no required_skills set'}{RESET}")
+            print()
+            if shared:
+                print(f"  {GREEN}Core curriculum:{RESET}  {', '.join(sorted(shared))}")
+            if only1:
+                print(f"  {CYAN}{c1}-specific:{RESET}  {', '.join(sorted(only1))}")
+            if only2:
+                print(f"  {CYAN}{c2}-specific:{RESET}  {', '.join(sorted(only2))}")
+            print()
+            if merge_type == 'combined':
+                print_info("High overlap — combined track recommended.")
+            elif merge_type == 'hybrid':
+                print_warn("Moderate overlap — agent should ask: combined track or separate?")
+            else:
+                print_warn("Low overlap — separate tracks recommended.")
+            print_info(f"Interview date: {earliest_date or 'not set — set on merged target'}")
+            print_info(f"Set active: grind target active {mid}")
+
+        else:
+            print_error(f"Unknown target subcommand: {sub}")
+
+
+# ---------------------------------------------------------------------------
+# RESUME
+# ---------------------------------------------------------------------------
+
+def add_resume_arguments(p):
+    rs = p.add_subparsers(dest='resume_cmd')
+    r_set = rs.add_parser('set')
+    r_set.add_argument('--path')
+    r_set.add_argument('--profile', metavar='JSON', help='Extracted profile as JSON string')
+    rs.add_parser('show')
+    rs.add_parser('clear')
+
+
+def cmd_resume(args):
+    if not hasattr(args, 'resume_cmd') or args.resume_cmd is None:
+        print(f"\n  {BOLD}grind resume subcommands:{RESET}")
+        print(f"    set   --path <path> [--profile '<json>']")
+        print(f"    show")
+        print(f"    clear\n")
+        return
+
+    config = load_config()
+    sub    = args.resume_cmd
+
+    if sub == 'set':
+        config.setdefault('resume', {})
+        if args.path:
+            config['resume']['path'] = os.path.expanduser(args.path)
+        config['resume']['set_at'] = datetime.now().isoformat()
+        if args.profile:
+            try:
+                profile = json.loads(args.profile)
+                config['resume'].update(profile)
+                config['resume']['analyzed_at'] = datetime.now().isoformat()
+            except json.JSONDecodeError as e:
+                print_error(f"Invalid profile JSON: {e}")
+                return
+        save_config(config)
+        print_success(f"Resume set: {config['resume'].get('path','(no path)')}")
+
+    elif sub == 'show':
+        r = config.get('resume')
+        if not r:
+            print_info("No resume set. Use: grind resume set --path <path>")
+            return
+        print(json.dumps(r, indent=2))
+
+    elif sub == 'clear':
+        config.pop('resume', None)
+        save_config(config)
+        print_success("Resume cleared.")
+
+    else:
+        print_error(f"Unknown resume subcommand: {sub}")
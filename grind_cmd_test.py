@@ -0,0 +1,167 @@
+"""
+grind_cmd_test — `grind test`: run a solution against every case in its problem folder.
+
+Cases come from problems/<folder>/tests/<name>.in (expected output in
+<name>.out, optional) and from problems/<folder>/cases.json, a list of
+{"name"?, "input", "output"?}. The solution is compiled once through
+prepare_run() — the same dispatch and build cache `grind run` uses — then every
+case runs as its own process, up to --jobs at a time, under the same run limits
+as `grind run` (--timeout overrides the wall-clock one). Outputs are compared
+line by line, ignoring trailing whitespace and trailing blank lines.
+"""
+import os
+import sys
+import glob
+import json
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
+
+import grind_exec
+from grind_cli import (
+    GREEN, RED, YELLOW, BOLD, DIM, RESET, print_info, print_error, print_json, json_flag,
+)
+from grind_cmd_workspace import resolve_solution, prepare_run, add_limit_arguments, run_limits
+
+# status → color; PASS/FAIL need an expected output, RAN means there was none to compare
+STATUS_COLORS = {'PASS': GREEN, 'RAN': DIM, 'FAIL': RED, 'TLE': YELLOW, 'MLE': YELLOW, 'OLE': YELLOW, 'RE': RED}
+FAILED = ('FAIL', 'RE', 'TLE', 'MLE', 'OLE')
+
+
+def discover_cases(problem_dir):
+    """[{'name', 'input', 'output' (None if unknown)}] from tests/*.in and cases.json."""
+    cases = []
+    for path in sorted(glob.glob(os.path.join(problem_dir, 'tests', '*.in'))):
+        stem = os.path.splitext(path)[0]
+        with open(path) as f:
+            case = {'name': os.path.basename(stem), 'input': f.read(), 'output': None}
+        if os.path.exists(stem + '.out'):
+            with open(stem + '.out') as f:
+                case['output'] = f.read()
+        cases.append(case)
+    case_file = os.path.join(problem_dir, 'cases.json')
+    if os.path.exists(case_file):
+        with open(case_file) as f:
+            for i, c in enumerate(json.load(f), 1):
+                cases.append({'name': str(c.get('name', f'case{i}')), 'input': c.get('input', ''),
+                              'output': c.get('output')})
+    return cases
+
+
+def _normalize(text):
+    lines = [line.rstrip() for line in text.splitlines()]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def outputs_match(got, expected):
+    return _normalize(got) == _normalize(expected)
+
+
+def run_case(cmd, cwd, env, case, limits):
+    """Run one case. Returns {'name', 'status', 'time_ms', 'exit_code', 'output', 'stderr', 'expected'}."""
+    m = grind_exec.run_limited(cmd, cwd=cwd, env=env, stdin=case['input'].encode(), limits=limits,
+                               capture=True)
+    result = {'name': case['name'], 'expected': case['output'], 'exit_code': m.code,
+              'output': m.stdout.decode(errors='replace'), 'stderr': m.stderr.decode(errors='replace'),
+              'time_ms': round(m.wall * 1000, 1)}
+    if m.verdict != 'OK':
+        result['status'] = m.verdict
+    elif case['output'] is None:
+        result['status'] = 'RAN'
+    else:
+        result['status'] = 'PASS' if outputs_match(result['output'], case['output']) else 'FAIL'
+    return result
+
+
+def run_cases(cmd, cwd, env, cases, jobs, limits):
+    """
+    Every case, up to jobs processes at a time; results in case order. Threads are
+    safe here because run_limited never runs Python between fork and exec.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda c: run_case(cmd, cwd, env, c, limits), cases))
+
+
+def _excerpt(text, limit=5):
+    lines = _normalize(text)
+    shown = '\n'.join(f"      {line}" for line in lines[:limit])
+    if len(lines) > limit:
+        shown += f"\n      {DIM}... {len(lines) - limit} more lines{RESET}"
+    return shown or f"      {DIM}(empty){RESET}"
+
+
+def print_results(results, elapsed):
+    width = max([len(r['name']) for r in results] + [4])
+    print()
+    print(f"  {BOLD}{'case':<{width}}  {'result':<6}  {'time':>9}{RESET}")
+    for r in results:
+        color = STATUS_COLORS[r['status']]
+        print(f"  {r['name']:<{width}}  {color}{r['status']:<6}{RESET}  {r['time_ms']:>7.1f}ms")
+    for r in results:
+        if r['status'] == 'FAIL':
+            print(f"\n  {RED}{r['name']}{RESET}  expected:\n{_excerpt(r['expected'])}\n"
+                  f"    got:\n{_excerpt(r['output'])}")
+        elif r['status'] in FAILED:
+            what = {'RE': f"exited with {r['exit_code']}, stderr",
+                    'TLE': 'output before the timeout'}.get(r['status'], grind_exec.VERDICTS[r['status']])
+            print(f"\n  {RED}{r['name']}{RESET}  {what}:\n{_excerpt(r['stderr'] or r['output'])}")
+    passed  = sum(r['status'] == 'PASS' for r in results)
+    checked = sum(r['status'] != 'RAN' for r in results)
+    print(f"\n  {passed}/{checked} passed" + (f", {len(results) - checked} without expected output"
+                                             if checked < len(results) else '')
+          + f"  {DIM}({elapsed*1000:.0f}ms wall){RESET}\n")
+
+
+def add_test_arguments(p):
+    p.add_argument('slug', help='Problem slug or file path')
+    p.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                   help='Cases to run at once (default: CPU count)')
+    p.add_argument('--timeout', type=float, metavar='SEC',
+                   help='Per-case wall-clock limit (default: the run_limits time, as for grind run)')
+    add_limit_arguments(p, time_flag=False)
+    json_flag(p)
+
+
+def cmd_test(args):
+    as_json  = getattr(args, 'json', False)
+    solution = resolve_solution(args.slug)
+    if not solution:
+        print_error(f"Problem '{args.slug}' not found.")
+        sys.exit(1)
+    problem_dir = os.path.dirname(os.path.abspath(solution))
+    try:
+        cases = discover_cases(problem_dir)
+    except (OSError, ValueError) as e:
+        print_error(f"Could not read cases: {e}")
+        sys.exit(1)
+    if not cases:
+        print_error(f"No cases in {problem_dir} — add tests/<name>.in (+ .out) or cases.json.")
+        sys.exit(1)
+
+    if as_json:
+        from contextlib import redirect_stdout
+        with redirect_stdout(sys.stderr):       # keep compile chatter off the JSON stream
+            prepared = prepare_run(solution)
+    else:
+        prepared = prepare_run(solution)
+    if not prepared:
+        sys.exit(1)
+
+    limits = run_limits(args) or grind_exec.Limits(cpu=None, memory=None, output=None)
+    if args.timeout is not None:
+        limits.time = args.timeout or None
+    if not as_json:
+        limit = f"{limits.time:g}s limit" if limits.time else "no time limit"
+        print_info(f"Running {len(cases)} case{'s' if len(cases) != 1 else ''} "
+                   f"({min(args.jobs, len(cases))} at a time, {limit})...")
+    start   = time_module.perf_counter()
+    results = run_cases(*prepared, cases, args.jobs, limits)
+    elapsed = time_module.perf_counter() - start
+
+    if as_json:
+        print_json({'solution': solution, 'wall_ms': round(elapsed * 1000, 1), 'cases': results})
+    else:
+        print_results(results, elapsed)
+    if any(r['status'] in FAILED for r in results):
+        sys.exit(1)
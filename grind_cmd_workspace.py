@@ -0,0 +1,618 @@
+"""
+grind_cmd_workspace — init, reset, new and run: the problem workspace and its files.
+"""
+import os
+import sys
+import shutil
+import subprocess
+import time as time_module
+
+import grind_paths as _gp
+import grind_build
+import grind_jvm
+import grind_pool
+import grind_exec
+from grind_data import load_config, save_config, write_memory
+from grind_cli import (
+    CYAN, GREEN, RED, YELLOW, BOLD, DIM, RESET, print_info, print_success, print_error, print_warn,
+    slug_to_folder, resolve_problem_dir, find_solution_file,
+)
+
+GRIND_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'grind')
+
+
+def _grind_on_path():
+    """Return True if `grind` resolves to this script on PATH."""
+    found = shutil.which('grind')
+    if not found:
+        return False
+    return os.path.realpath(found) == os.path.realpath(GRIND_SCRIPT)
+
+
+def _install_to_path():
+    """Symlink grind into ~/.local/bin (created if missing). Returns (ok, message)."""
+    local_bin = os.path.expanduser('~/.local/bin')
+    os.makedirs(local_bin, exist_ok=True)
+    dest = os.path.join(local_bin, 'grind')
+    src = GRIND_SCRIPT
+    if os.path.lexists(dest):
+        os.remove(dest)
+    os.symlink(src, dest)
+    return dest, local_bin
+
+
+def cmd_init(args):
+    created = []
+    if not os.path.exists(_gp.MEMORY_FILE):
+        write_memory([])
+        created.append('memory.md')
+    if not os.path.exists(_gp.CONFIG_FILE):
+        save_config({"active_track": "blind75"})
+        created.append('.lc_config.json')
+    os.makedirs(os.path.join(_gp.PROJECT_ROOT, 'problems'), exist_ok=True)
+
+    print()
+    print(f"  {BOLD}{GREEN}grindcoach{RESET} initialized!")
+    print()
+    if created:
+        for f in created:
+            print(f"  {DIM}Created {f}{RESET}")
+        print()
+
+    # PATH setup — only shown when grind isn't already accessible
+    if not _grind_on_path():
+        print(f"  {BOLD}{YELLOW}PATH setup{RESET}")
+        try:
+            dest, local_bin = _install_to_path()
+            print(f"  {DIM}Symlinked grind → {dest}{RESET}")
+            # Check if local_bin is already on PATH
+            path_dirs = os.environ.get('PATH', '').split(':')
+            if local_bin not in path_dirs:
+                shell = os.path.basename(os.environ.get('SHELL', 'bash'))
+                rc = '.zshrc' if shell == 'zsh' else '.bashrc'
+                print()
+                print(f"  Add {BOLD}~/.local/bin{RESET} to your PATH then restart your terminal:")
+                print()
+                print(f"    {CYAN}echo 'export PATH=\"$HOME/.local/bin:$PATH\"' >> ~/{rc}{RESET}")
+                print(f"    {CYAN}source ~/{rc}{RESET}")
+        except OSError as e:
+            print(f"  {DIM}Could not symlink automatically ({e}).{RESET}")
+            print(f"  Add this to your shell config manually:")
+            print()
+            print(f"    {CYAN}export PATH=\"{_gp.PROJECT_ROOT}:$PATH\"{RESET}")
+        print()
+
+    print(f"  {BOLD}Quick start (agent commands — no CLI needed):{RESET}")
+    print(f"    {CYAN}/setup{RESET}              Full onboarding — resume + job target + plan")
+    print(f"    {CYAN}/solve two-sum cpp{RESET}  Start your first problem")
+    print(f"    {CYAN}/progress{RESET}           Check your progress")
+    print()
+    print(f"  {DIM}Active track: Blind 75  ·  grind track <name> to switch{RESET}")
+    print()
+
+
+def add_reset_arguments(p):
+    p.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+
+
+def cmd_reset(args):
+    data_files = [
+        _gp.MEMORY_FILE,
+        _gp.JOURNAL_FILE,
+        os.path.join(_gp.PROJECT_ROOT, 'memory_archive.md'),
+        _gp.CONFIG_FILE,
+        _gp.CONFIG_FILE + '.bak',
+        _gp.SESSION_FILE,
+        _gp.BEHAVIOR_FILE,
+        os.path.join(_gp.PROJECT_ROOT, 'behavior_archive.jsonl'),
+        _gp.DB_FILE,
+        _gp.DB_FILE + '-wal',
+        _gp.DB_FILE + '-shm',
+        _gp.INDEX_FILE,
+        _gp.ROLLUP_FILE,
+    ]
+    # Collect behavior reports
+    import glob as _glob
+    data_files += _glob.glob(os.path.join(_gp.PROJECT_ROOT, 'behavior_report_*.md'))
+
+    problems_dir = os.path.join(_gp.PROJECT_ROOT, 'problems')
+
+    existing_files = [f for f in data_files if os.path.exists(f)]
+    has_problems = os.path.isdir(problems_dir) and bool(os.listdir(problems_dir))
+
+    if not existing_files and not has_problems:
+        print(f"\n  {DIM}Nothing to reset — no user data found.{RESET}\n")
+        return
+
+    print(f"\n  {BOLD}{RED}Reset grindcoach{RESET}")
+    print()
+    print(f"  This will permanently delete all your data:")
+    print()
+    for f in existing_files:
+        print(f"    {DIM}{os.path.basename(f)}{RESET}")
+    if has_problems:
+        print(f"    {DIM}problems/ (all scaffolded solutions){RESET}")
+    print()
+
+    if not args.force:
+        try:
+            answer = input(f"  Type {BOLD}reset{RESET} to confirm, or press Enter to cancel: ").strip()
+        except (KeyboardInterrupt, EOFError):
+            print()
+            print(f"  {DIM}Cancelled.{RESET}\n")
+            return
+        if answer != 'reset':
+            print(f"\n  {DIM}Cancelled.{RESET}\n")
+            return
+
+    if 'grind_db' in sys.modules:
+        sys.modules['grind_db'].close()
+    removed = []
+    for f in existing_files:
+        os.remove(f)
+        removed.append(os.path.basename(f))
+
+    if has_problems:
+        import shutil as _shutil
+        _shutil.rmtree(problems_dir)
+        removed.append('problems/')
+    shutil.rmtree(_gp.BUILD_DIR, ignore_errors=True)   # compiled solutions go with them
+
+    print()
+    for name in removed:
+        print(f"  {DIM}Removed {name}{RESET}")
+    print()
+    print(f"  {GREEN}Reset complete.{RESET} Run {BOLD}grind init{RESET} to start fresh.\n")
+
+
+def add_new_arguments(p):
+    p.add_argument('slug')
+    p.add_argument('lang', choices=['python', 'cpp', 'java'])
+
+
+def cmd_new(args):
+    lang_cfg = {
+        'python': {'template': 'templates/python.txt', 'filename': 'solution.py'},
+        'cpp':    {'template': 'templates/cpp.txt',    'filename': 'solution.cpp'},
+        'java':   {'template': 'templates/java.txt',   'filename': 'Solution.java'},
+    }
+    slug          = args.slug
+    lang          = args.lang
+    template_path = os.path.join(_gp.PROJECT_ROOT, lang_cfg[lang]['template'])
+    problem_dir   = resolve_problem_dir(slug)
+    solution_file = os.path.join(problem_dir, lang_cfg[lang]['filename'])
+    input_file    = os.path.join(problem_dir, 'input.txt')
+
+    if os.path.exists(solution_file):
+        print_error(f"Solution already exists: {solution_file}")
+        return
+    if not os.path.exists(template_path):
+        print_error(f"Template not found: {template_path}")
+        return
+
+    os.makedirs(problem_dir, exist_ok=True)
+    with open(template_path) as f:
+        content = f.read()
+    content = content.replace("{{PROBLEM_NAME}}", slug)
+    content = content.replace("{{PROBLEM_SLUG}}", slug)
+    content = content.replace("{{PROBLEM_CLASS}}", "Solution")
+    content = content.replace("{{PROBLEM_FOLDER}}", slug_to_folder(slug))
+    with open(solution_file, 'w') as f:
+        f.write(content)
+    if not os.path.exists(input_file):
+        open(input_file, 'w').close()
+
+    print_success(f"Created {solution_file}")
+    print_success(f"Created {input_file}")
+    try:
+        subprocess.run(['code', solution_file, input_file], check=False,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        pass
+
+
+DEFAULT_PROFILE_RUNS = 5
+
+# Limits attribute → (.lc_config.json "run_limits" key, units per config/flag value)
+LIMIT_KEYS = {
+    'time':   ('time', 1),
+    'cpu':    ('cpu', 1),
+    'memory': ('memory_mb', 1024 * 1024),
+    'output': ('output_kb', 1024),
+}
+
+
+def add_limit_arguments(p, time_flag=True):
+    """--time-limit/--cpu-limit/--memory-limit/--output-limit/--no-limits (0 turns one off)."""
+    d = grind_exec.Limits.DEFAULTS
+    if time_flag:
+        p.add_argument('--time-limit', type=float, metavar='SEC',
+                       help=f"Wall-clock limit (default {d['time']:g}s)")
+    p.add_argument('--cpu-limit', type=float, metavar='SEC', help=f"CPU-time limit (default {d['cpu']:g}s)")
+    p.add_argument('--memory-limit', type=int, metavar='MB',
+                   help=f"Address-space limit; heap size for Java (default {d['memory'] // (1024 * 1024)}MB)")
+    p.add_argument('--output-limit', type=int, metavar='KB',
+                   help=f"stdout + stderr limit (default {d['output'] // 1024}KB)")
+    p.add_argument('--no-limits', action='store_true', help='Run without a sandbox (reads the terminal if no input)')
+
+
+def run_limits(args):
+    """
+    grind_exec.Limits for a run: the defaults, overridden by "run_limits" in
+    .lc_config.json ({"time", "cpu", "memory_mb", "output_kb"}), overridden by
+    flags. 0 or null turns a limit off. None for --no-limits.
+    """
+    if getattr(args, 'no_limits', False):
+        return None
+    configured = load_config().get('run_limits') or {}
+    limits = grind_exec.Limits()
+    for attr, (key, unit) in LIMIT_KEYS.items():
+        value = getattr(args, f'{attr}_limit', None)
+        if value is None and key in configured:
+            value = configured[key]
+        if value is not None:
+            setattr(limits, attr, value * unit if value else None)
+    return limits
+
+
+def add_run_arguments(p):
+    p.add_argument('filename', help='Problem slug or file path')
+    p.add_argument('--profile', action='store_true',
+                   help='Report compile time, wall/CPU time and peak memory of the run')
+    p.add_argument('--repeat', type=int, metavar='N',
+                   help=f'Profile over N runs: min/median/p95 (implies --profile, default {DEFAULT_PROFILE_RUNS})')
+    add_limit_arguments(p)
+
+
+def resolve_solution(slug_or_file):
+    """Solution file for a slug, a folder under problems/ or a path; None if there is none."""
+    problem_dir   = resolve_problem_dir(slug_or_file)
+    solution_file = find_solution_file(problem_dir) if os.path.isdir(problem_dir) else None
+
+    if not solution_file:
+        raw_dir = os.path.join(_gp.PROJECT_ROOT, 'problems', slug_or_file)
+        if os.path.isdir(raw_dir):
+            solution_file = find_solution_file(raw_dir)
+    if solution_file:
+        return solution_file
+
+    if os.path.exists(slug_or_file):
+        return slug_or_file
+    for stem in [slug_or_file, slug_or_file.replace('-', '_')]:
+        for ext in ['.py', '.cpp', '.java']:
+            c = os.path.join(_gp.PROJECT_ROOT, 'problems', stem + ext)
+            if os.path.exists(c):
+                return c
+    return None
+
+
+def cmd_run(args):
+    solution_file = resolve_solution(args.filename)
+    if not solution_file:
+        print_error(f"Problem '{args.filename}' not found.")
+        print(f"\n  {DIM}Scaffold first: grind new {args.filename} cpp{RESET}\n")
+        return
+    limits = run_limits(args)
+    repeat = getattr(args, 'repeat', None)
+    if repeat is not None or getattr(args, 'profile', False):
+        _profile_file(solution_file, max(1, repeat or DEFAULT_PROFILE_RUNS), limits)
+    else:
+        _run_file(solution_file, limits)
+
+
+def _compile(language, build):
+    """Run a grind_build compile and report whether it hit the cache. Returns the output path or None."""
+    start = time_module.time()
+    path, hit = build()
+    if hit:
+        print_info(f"Using cached {language} build.")
+    elif path:
+        print_info(f"Compiled {language} in {(time_module.time() - start)*1000:.0f}ms.")
+    else:
+        print_error("Compilation failed.")
+    return path
+
+
+def java_classname(filename):
+    """problems/two_sum/Solution.java → problems.two_sum.Solution (its package follows the folder)."""
+    rel = os.path.relpath(filename, _gp.PROJECT_ROOT)
+    return os.path.splitext(rel)[0].replace(os.sep, '.')
+
+
+def prepare_run(filename):
+    """
+    Compile filename if its language needs it (through the build cache) and return
+    (argv, cwd, env) that run it, or None after reporting why it cannot run.
+    """
+    ext = os.path.splitext(filename)[1]
+    if ext == '.py':
+        env = os.environ.copy()
+        env['PYTHONPATH'] = _gp.PROJECT_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+        return ['python3', filename], None, env
+    if ext == '.cpp':
+        out_bin = _compile('C++', lambda: grind_build.compile_cpp(filename))
+        return ([out_bin], None, None) if out_bin else None
+    if ext == '.java':
+        classname = java_classname(filename)
+        class_dir = _compile('Java', lambda: grind_build.compile_java(filename, classname))
+        if not class_dir:
+            return None
+        classpath = class_dir + os.pathsep + _gp.PROJECT_ROOT
+        return ['java', '-cp', classpath, classname], _gp.PROJECT_ROOT, None
+    print_error(f"Unsupported extension: {ext}")
+    return None
+
+
+def _run_python_warm(filename, stdin_file, limits=None):
+    """Run on a `grind pool` worker if one is listening. Returns {'code', 'verdict'} once it ran, None to run cold."""
+    outcome = grind_pool.run(filename, stdin_file.fileno() if stdin_file else 0, limits=limits)
+    if outcome is not None:
+        return outcome
+    if os.path.exists(_gp.POOL_SOCKET_FILE):
+        print_warn("Python pool did not answer — running cold.")
+    return None
+
+
+def _run_java_warm(filename, classname, input_file, limits=None):
+    """
+    Run on the `grind jvm` runner if one is listening. Returns {'code', 'verdict'}
+    once it ran, False if it did not compile, or None to fall back to javac + java.
+    The runner enforces the wall, CPU (main()'s thread) and output limits; memory is
+    the heap `grind jvm` was started with, shared by every run.
+    """
+    if os.path.exists(_gp.JVM_SOCKET_FILE) and grind_jvm.calls_exit(filename):
+        print_info("Solution calls System.exit — running it cold, not on the warm JVM.")
+        return None
+    stdin = b''
+    if input_file:
+        with open(input_file, 'rb') as f:
+            stdin = f.read()
+    resp = grind_jvm.run(filename, classname, stdin, limits=limits)
+    if resp is None:
+        if os.path.exists(_gp.JVM_SOCKET_FILE):
+            print_warn("Warm JVM did not answer — running cold.")
+        return None
+    if not resp['compiled']:
+        sys.stderr.write(resp['stderr'].decode(errors='replace'))
+        print_error("Compilation failed.")
+        return False
+    print_info("Running on warm JVM...")
+    sys.stdout.write(resp['stdout'].decode(errors='replace'))
+    sys.stdout.flush()
+    sys.stderr.write(resp['stderr'].decode(errors='replace'))
+    sys.stderr.flush()
+    compile_note = 'cached' if resp['cached'] else f"{resp['compile_ms']:.0f}ms"
+    print(f"{DIM}Warm JVM: compile {compile_note}, run {resp['run_ms']:.0f}ms, "
+          f"round trip {resp['round_trip_ms']:.0f}ms{RESET}")
+    code = resp['code']
+    if code == grind_jvm.EXITED:
+        print_warn("main() exited the warm JVM, so its exit status is unknown; restart it with `grind jvm`.")
+        return {'code': 0, 'verdict': 'OK'}
+    if code == grind_jvm.TIMED_OUT:
+        verdict = 'TLE'
+    elif code == grind_jvm.OUTPUT_LIMITED:
+        verdict = 'OLE'
+    elif code != 0 and b'java.lang.OutOfMemoryError' in resp['stderr']:
+        verdict = 'MLE'
+    else:
+        verdict = 'OK' if code == 0 else 'RE'
+    return {'code': code, 'verdict': verdict}
+
+
+def _input_file(filename):
+    """input.txt next to the solution, else <solution>.txt; None if neither has content."""
+    input_file = os.path.join(os.path.dirname(filename), 'input.txt')
+    if not os.path.exists(input_file):
+        input_file = os.path.splitext(filename)[0] + '.txt'
+    if os.path.exists(input_file) and os.path.getsize(input_file) > 0:
+        return input_file
+    return None
+
+
+def _report_verdict(outcome, limits):
+    """LeetCode-style line for a run that did not finish cleanly."""
+    verdict = outcome['verdict']
+    if verdict == 'OK':
+        return
+    if verdict == 'RE':
+        detail = f"exit code {outcome['code']}"
+    elif verdict == 'TLE' and outcome.get('warm_jvm'):
+        limit  = limits.describe(verdict) if limits else f"{grind_jvm.RUN_TIMEOUT}s wall"
+        detail = f"{limit} on the warm JVM"
+    else:
+        detail = limits.describe(verdict) if limits else ''
+    message = grind_exec.VERDICTS[verdict]
+    if verdict == 'OLE':
+        print()                             # the output was cut mid-line
+    print_error(f"{message} ({detail})" if detail else message)
+
+
+def _run_file(filename, limits=None):
+    """
+    Run a solution once, warm if a pool/JVM is listening. With limits (a
+    grind_exec.Limits) the run is sandboxed and ends with a verdict line.
+    """
+    ext        = os.path.splitext(filename)[1]
+    input_file = _input_file(filename)
+
+    stdin_file = None
+    if input_file:
+        print_info(f"Reading input from {os.path.basename(input_file)}...")
+        stdin_file = open(input_file)
+    elif limits:
+        stdin_file = open(os.devnull)       # the sandbox is not the terminal's foreground group
+
+    start = time_module.time()
+    try:
+        outcome = None
+        if ext == '.py':
+            outcome = _run_python_warm(filename, stdin_file, limits)
+        elif ext == '.java':
+            outcome = _run_java_warm(filename, java_classname(filename), input_file, limits)
+            if outcome:
+                outcome['warm_jvm'] = True
+        if outcome is False:
+            return
+        if outcome is None:
+            prepared = prepare_run(filename)
+            if not prepared:
+                return
+            cmd, cwd, env = prepared
+            if ext != '.py':
+                print_info("Running...")
+            if limits:
+                m = grind_exec.run_limited(cmd, cwd=cwd, env=env, stdin=stdin_file, limits=limits)
+                outcome = {'code': m.code, 'verdict': m.verdict}
+            else:
+                code = subprocess.run(cmd, cwd=cwd, env=env, stdin=stdin_file).returncode
+                outcome = {'code': code, 'verdict': 'OK' if code == 0 else 'RE'}
+        _report_verdict(outcome, limits)
+
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        if stdin_file:
+            stdin_file.close()
+
+    elapsed = time_module.time() - start
+    print(f"\n{DIM}Elapsed: {elapsed*1000:.0f}ms{RESET}" if elapsed < 1
+          else f"\n{DIM}Elapsed: {elapsed:.2f}s{RESET}")
+
+
+def _format_seconds(seconds):
+    return f"{seconds*1000:.1f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+
+def _format_kb(kb):
+    return f"{kb / 1024:.1f}MB" if kb >= 1024 else f"{kb}KB"
+
+
+def _profile_file(filename, repeat, limits=None):
+    """
+    Compile once, then run the solution cold `repeat` times and report each phase
+    from the child's rusage. The warm pool/JVM are bypassed: their workers'
+    rusage would not be the solution's alone. Of the limits only the wall-clock
+    one applies; the first run past it ends the profile.
+    """
+    input_file = _input_file(filename)
+    start    = time_module.perf_counter()
+    prepared = prepare_run(filename)
+    compile_time = time_module.perf_counter() - start
+    if not prepared:
+        return
+    cmd, cwd, env = prepared
+
+    if input_file:
+        print_info(f"Reading input from {os.path.basename(input_file)}...")
+    runs = []
+    try:
+        for i in range(repeat):
+            stdin_file = open(input_file, 'rb') if input_file else subprocess.DEVNULL
+            try:
+                runs.append(grind_exec.run_measured(cmd, cwd=cwd, env=env, stdin=stdin_file, quiet=i > 0,
+                                                    timeout=limits.time if limits else None))
+            finally:
+                if input_file:
+                    stdin_file.close()
+            if runs[-1].timed_out:
+                _report_verdict({'code': runs[-1].code, 'verdict': 'TLE'}, limits)
+                break
+            if i == 0 and repeat > 1:
+                print_info(f"Profiling {repeat - 1} more run{'s' if repeat > 2 else ''} (output hidden)...")
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        if not runs:
+            return
+
+    failed = [m.code for m in runs if m.code != 0]
+    if failed:
+        print_warn(f"{len(failed)} of {len(runs)} runs exited non-zero (first: {failed[0]}).")
+    stats = grind_exec.summarize(runs)
+    rows = [('wall', 'wall', _format_seconds), ('cpu user', 'user', _format_seconds),
+            ('cpu sys', 'system', _format_seconds), ('peak rss', 'max_rss_kb', _format_kb)]
+    print(f"\n  {BOLD}Profile{RESET} {DIM}({len(runs)} run{'s' if len(runs) != 1 else ''}){RESET}")
+    if not filename.endswith('.py'):
+        print(f"  {'compile':<9} {_format_seconds(compile_time):>10}")
+    print(f"  {DIM}{'':<9} {'min':>10} {'median':>10} {'p95':>10}{RESET}")
+    for label, key, fmt in rows:
+        s = stats[key]
+        print(f"  {label:<9} {fmt(s['min']):>10} {fmt(s['median']):>10} {fmt(s['p95']):>10}")
+    print()
+
+
+def add_jvm_arguments(p):
+    p.add_argument('--stop', action='store_true', help='Stop the running warm JVM')
+    p.add_argument('--status', action='store_true', help='Report whether a warm JVM is running')
+    p.add_argument('--idle-timeout', type=int, metavar='MIN',
+                   help='Exit after MIN minutes without a run')
+
+
+def cmd_jvm(args):
+    if getattr(args, 'stop', False):
+        if grind_jvm.stop(_gp.JVM_SOCKET_FILE):
+            print_success("Warm JVM stopped")
+        else:
+            print_info("No warm JVM running.")
+        return
+    if getattr(args, 'status', False):
+        if grind_jvm.is_running(_gp.JVM_SOCKET_FILE):
+            print_info(f"Warm JVM listening on {_gp.JVM_SOCKET_FILE}")
+        else:
+            print_info("No warm JVM running.")
+        return
+    idle = getattr(args, 'idle_timeout', None)
+    print_info(f"Starting warm JVM on {_gp.JVM_SOCKET_FILE} (Ctrl-C to stop)")
+    try:
+        limits = run_limits(args)
+        code = grind_jvm.serve(_gp.JVM_SOCKET_FILE, idle_timeout=idle * 60 if idle else None,
+                               heap=limits.memory if limits else None)
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+    except FileNotFoundError:
+        print_error("java not found on PATH.")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print()
+        return
+    if code:
+        sys.exit(code)
+
+
+def add_pool_arguments(p):
+    p.add_argument('--stop', action='store_true', help='Stop the running pool')
+    p.add_argument('--status', action='store_true', help='Report whether a pool is running')
+    p.add_argument('--workers', type=int, default=grind_pool.DEFAULT_WORKERS, metavar='N',
+                   help=f'Workers kept forked and waiting (default {grind_pool.DEFAULT_WORKERS})')
+    p.add_argument('--max-runs', type=int, default=1, metavar='N',
+                   help='Recycle a worker after N runs (default 1: a fresh fork per run)')
+    p.add_argument('--idle-timeout', type=int, metavar='MIN',
+                   help='Exit after MIN minutes without a run')
+
+
+def cmd_pool(args):
+    if getattr(args, 'stop', False):
+        if grind_pool.stop(_gp.POOL_SOCKET_FILE):
+            print_success("Python pool stopped")
+        else:
+            print_info("No Python pool running.")
+        return
+    if getattr(args, 'status', False):
+        if grind_pool.is_running(_gp.POOL_SOCKET_FILE):
+            print_info(f"Python pool listening on {_gp.POOL_SOCKET_FILE}")
+        else:
+            print_info("No Python pool running.")
+        return
+    if args.workers < 1 or args.max_runs < 1:
+        print_error("--workers and --max-runs must be at least 1.")
+        sys.exit(1)
+    idle = getattr(args, 'idle_timeout', None)
+    ready = lambda: print_info(f"{args.workers} Python workers on {_gp.POOL_SOCKET_FILE} (Ctrl-C to stop)")
+    try:
+        grind_pool.serve(_gp.POOL_SOCKET_FILE, workers=args.workers, max_runs=args.max_runs,
+                         idle_timeout=idle * 60 if idle else None, ready=ready)
+    except RuntimeError as e:
+        print_error(str(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print()
@@ -4,88 +4,282 @@ Imports from grind_paths so monkeypatching grind_paths propagates here.
 """
 import os
 import sys
+import copy
 import json
-import shutil
+from itertools import islice
+from contextlib import contextmanager
 from datetime import datetime
 from collections import defaultdict
 
 import grind_paths as _gp
+import grind_snapshot as _snapshot
+import grind_index as _index
+import grind_rollup as _rollup
 
 
-def load_config():
-    if os.path.exists(_gp.CONFIG_FILE):
+def _db():
+    """grind_db is imported lazily so file-backed invocations never load sqlite3."""
+    import grind_db
+    return grind_db
+
+
+def _backup(path):
+    """path → path.bak. shutil is imported here so read-only invocations never load it."""
+    import shutil
+    shutil.copy2(path, path + '.bak')
+
+
+def _stat_sig(path):
+    """(inode, mtime_ns, size) — atomic replaces get a new inode, so a rewrite is never missed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+_config_cache = {}   # path → (stat sig, parsed config); callers always get a private copy
+
+
+def _read_config_file():
+    sig = _stat_sig(_gp.CONFIG_FILE)
+    if sig is None:
+        return {"active_track": "blind75"}
+    cached = _config_cache.get(_gp.CONFIG_FILE)
+    if cached is None or cached[0] != sig:
         with open(_gp.CONFIG_FILE) as f:
-            return json.load(f)
-    return {"active_track": "blind75"}
+            cached = _config_cache[_gp.CONFIG_FILE] = (sig, json.load(f))
+    return copy.deepcopy(cached[1])
 
 
-def save_config(config):
+_config_txn = None   # {'config', 'before', 'dirty'} while a config_transaction is open
+
+
+def load_config():
+    if _config_txn is not None:
+        return _config_txn['config']
+    config = _read_config_file()
+    if config.get('storage') == 'sqlite':
+        config['targets'] = _db().load_targets()
+    return config
+
+
+def _write_config_file(config):
     tmp = _gp.CONFIG_FILE + '.tmp'
     with open(tmp, 'w') as f:
         json.dump(config, f, indent=2)
         f.write('\n')
     os.replace(tmp, _gp.CONFIG_FILE)
-    shutil.copy2(_gp.CONFIG_FILE, _gp.CONFIG_FILE + '.bak')
+    _backup(_gp.CONFIG_FILE)
+    _config_cache[_gp.CONFIG_FILE] = (_stat_sig(_gp.CONFIG_FILE), copy.deepcopy(config))
 
 
-def load_problems():
-    if not os.path.exists(_gp.PROBLEMS_FILE):
-        print(f"\033[91m[ERROR] Problem bank not found: {_gp.PROBLEMS_FILE}\033[0m",
+def save_config(config):
+    if _config_txn is not None:
+        _config_txn['config'] = config
+        _config_txn['dirty']  = True
+        return
+    if config.get('storage') == 'sqlite':
+        _db().save_targets(config.get('targets', {}))
+        config = {k: v for k, v in config.items() if k != 'targets'}
+    _write_config_file(config)
+
+
+@contextmanager
+def config_transaction(config=None):
+    """
+    Load config once and write it at most once (one os.replace, one .bak) on exit,
+    and only if save_config was called or the dict changed. Inside the block
+    load_config() returns the same dict and save_config() defers to the commit;
+    nested transactions join the outermost one. An exception discards the write.
+    config: an already-loaded dict to adopt instead of reading the file.
+    """
+    global _config_txn
+    if _config_txn is not None:
+        if config is not None:
+            _config_txn['config'] = config
+        yield _config_txn['config']
+        return
+    if config is None:
+        config = load_config()
+    txn = _config_txn = {'config': config, 'dirty': False,
+                         'before': json.dumps(config, sort_keys=True)}
+    try:
+        yield config
+    finally:
+        _config_txn = None
+    if txn['dirty'] or json.dumps(txn['config'], sort_keys=True) != txn['before']:
+        save_config(txn['config'])
+
+
+class ProblemBank:
+    """
+    Indexed view of problems.json. Built once per file version; lookups are O(1).
+    Slug-keyed indexes keep the first occurrence across tracks, matching the
+    historical linear-scan semantics.
+    """
+
+    def __init__(self, data):
+        self.data          = data
+        self.tracks        = data.get('tracks', {})
+        self.by_slug       = {}                  # slug → problem dict
+        self.by_topic      = defaultdict(list)   # topic → [problem], deduplicated by slug
+        self.by_difficulty = defaultdict(list)   # difficulty → [problem], deduplicated by slug
+        topics = set()
+        for td in self.tracks.values():
+            for p in td.get('problems', []):
+                if p.get('topic'):
+                    topics.add(p['topic'])
+                if p['slug'] in self.by_slug:
+                    continue
+                self.by_slug[p['slug']] = p
+                self.by_topic[p.get('topic', 'other')].append(p)
+                self.by_difficulty[p.get('difficulty', '')].append(p)
+        self.topics = sorted(topics)
+
+    def get(self, slug):
+        return self.by_slug.get(slug)
+
+    def topic_of(self, slug):
+        return self.by_slug.get(slug, {}).get('topic', '')
+
+    def track(self, name):
+        return self.tracks.get(name)
+
+    def track_problems(self, name):
+        return self.tracks.get(name, {}).get('problems', [])
+
+
+_bank_cache = {}   # path → ((mtime_ns, size), ProblemBank)
+
+
+def get_problem_bank(path=None):
+    """
+    Process-cached ProblemBank. Reloads only when the file's mtime or size changes.
+    Cold loads mmap the compiled snapshot when it matches, else parse JSON and recompile it.
+    """
+    path = path or _gp.PROBLEMS_FILE
+    try:
+        st = os.stat(path)
+    except OSError:
+        _bank_cache.pop(path, None)
+        print(f"\033[91m[ERROR] Problem bank not found: {path}\033[0m",
               file=sys.stderr)
         return None
-    with open(_gp.PROBLEMS_FILE) as f:
-        return json.load(f)
+    sig    = (st.st_mtime_ns, st.st_size)
+    cached = _bank_cache.get(path)
+    if cached and cached[0] == sig:
+        return cached[1]
+    bank = _snapshot.open_snapshot(path, sig)
+    if bank is None:
+        with open(path) as f:
+            data = json.load(f)
+        bank = ProblemBank(data)
+        _snapshot.compile_snapshot(path, data, sig)
+    _bank_cache[path] = (sig, bank)
+    return bank
+
+
+def compile_problem_bank(path=None):
+    """Force a snapshot rebuild. Returns (ProblemBank, snapshot size or None)."""
+    path = path or _gp.PROBLEMS_FILE
+    st   = os.stat(path)
+    sig  = (st.st_mtime_ns, st.st_size)
+    with open(path) as f:
+        data = json.load(f)
+    bank = ProblemBank(data)
+    _bank_cache[path] = (sig, bank)
+    return bank, _snapshot.compile_snapshot(path, data, sig)
+
+
+def load_problems():
+    bank = get_problem_bank()
+    return bank.data if bank else None
 
 
 def get_all_topics():
     """All unique topics across all tracks, sorted."""
-    bank = load_problems()
-    if not bank:
-        return []
-    topics = set()
-    for td in bank.get('tracks', {}).values():
-        for p in td.get('problems', []):
-            if p.get('topic'):
-                topics.add(p['topic'])
-    return sorted(topics)
+    bank = get_problem_bank()
+    return list(bank.topics) if bank else []
 
 
 def get_problems_by_topic():
     """topic → [problem dicts], deduplicated by slug."""
-    bank = load_problems()
+    bank = get_problem_bank()
     if not bank:
         return {}
-    seen = set()
-    by_topic = defaultdict(list)
-    for td in bank.get('tracks', {}).values():
-        for p in td.get('problems', []):
-            if p['slug'] not in seen:
-                seen.add(p['slug'])
-                by_topic[p.get('topic', 'other')].append(p)
-    return dict(by_topic)
+    return {t: list(ps) for t, ps in bank.by_topic.items()}
 
 
 def slug_to_topic(slug):
     """Look up a slug's topic from problems.json."""
-    bank = load_problems()
-    if not bank:
-        return ''
-    for td in bank.get('tracks', {}).values():
-        for p in td.get('problems', []):
-            if p['slug'] == slug:
-                return p.get('topic', '')
-    return ''
+    bank = get_problem_bank()
+    return bank.topic_of(slug) if bank else ''
 
 
-def parse_memory():
-    if not os.path.exists(_gp.MEMORY_FILE):
-        return []
-    with open(_gp.MEMORY_FILE) as f:
+STORAGE_MODES = ('markdown', 'journal', 'sqlite')
+
+MEMORY_FIELDS = ('slug', 'topic', 'difficulty', 'date', 'rating',
+                 'time', 'hints', 'ease', 'interval', 'next_review')
+
+_WATERMARK_PREFIX = '<!-- journal-seq: '
+
+
+def storage_mode(config=None):
+    """
+    'markdown' rewrites memory.md on every log; 'journal' appends to memory.journal.jsonl;
+    'sqlite' keeps attempts, behavior and targets in grind.db (see grind_db).
+    """
+    if config is None:
+        config = _config_txn['config'] if _config_txn is not None else _read_config_file()
+    mode = config.get('storage', 'markdown')
+    return mode if mode in STORAGE_MODES else 'markdown'
+
+
+def _row_from_cells(cells):
+    return {
+        'slug':        cells[0],
+        'topic':       cells[1],
+        'difficulty':  cells[2],
+        'date':        cells[3],
+        'rating':      int(cells[4]) if cells[4] else 0,
+        'time':        cells[5],
+        'hints':       int(cells[6]) if cells[6] else 0,
+        'ease':        float(cells[7]) if cells[7] else 2.5,
+        'interval':    cells[8],
+        'next_review': cells[9],
+    }
+
+
+def _row_cells(r):
+    """Cell strings exactly as write_memory renders them."""
+    return [str(r['slug']), str(r['topic']), str(r['difficulty']), str(r['date']),
+            str(r['rating']), str(r['time']), str(r['hints']), f"{r['ease']:.1f}",
+            str(r['interval']), str(r['next_review'])]
+
+
+def _normalize_row(r):
+    return _row_from_cells(_row_cells(r))
+
+
+def _parse_memory_table(path=None):
+    """Rows in memory.md (or an archive) plus the highest journal seq folded into it."""
+    path = path or _gp.MEMORY_FILE
+    if not os.path.exists(path):
+        return [], 0
+    with open(path) as f:
         lines = f.readlines()
     rows = []
+    watermark = 0
     in_table = False
     for line in lines:
         s = line.strip()
+        if s.startswith(_WATERMARK_PREFIX):
+            try:
+                watermark = int(s[len(_WATERMARK_PREFIX):].split()[0])
+            except (ValueError, IndexError):
+                pass
+            continue
         if s.startswith('| Slug'):
             in_table = True
             continue
@@ -94,77 +288,686 @@ def parse_memory():
         if in_table and s.startswith('|'):
             cells = [c.strip() for c in s.split('|')[1:-1]]
             if len(cells) >= 10:
-                rows.append({
-                    'slug':        cells[0],
-                    'topic':       cells[1],
-                    'difficulty':  cells[2],
-                    'date':        cells[3],
-                    'rating':      int(cells[4]) if cells[4] else 0,
-                    'time':        cells[5],
-                    'hints':       int(cells[6]) if cells[6] else 0,
-                    'ease':        float(cells[7]) if cells[7] else 2.5,
-                    'interval':    cells[8],
-                    'next_review': cells[9],
-                })
+                rows.append(_row_from_cells(cells))
         elif in_table and not s.startswith('|'):
             in_table = False
-    return rows
+    return rows, watermark
 
 
-def write_memory(rows):
-    """Atomic write: write to .tmp then os.replace, keep rolling .bak."""
-    tmp = _gp.MEMORY_FILE + '.tmp'
-    lines = [
-        '# LeetCode Progress\n', '\n',
+def _memory_watermark():
+    """Journal seq recorded in memory.md's header (stops reading at the table)."""
+    if not os.path.exists(_gp.MEMORY_FILE):
+        return 0
+    with open(_gp.MEMORY_FILE) as f:
+        for line in f:
+            s = line.strip()
+            if s.startswith(_WATERMARK_PREFIX):
+                try:
+                    return int(s[len(_WATERMARK_PREFIX):].split()[0])
+                except (ValueError, IndexError):
+                    return 0
+            if s.startswith('|'):
+                break
+    return 0
+
+
+def read_journal():
+    """Journal records in append order. A torn trailing line is skipped."""
+    if not os.path.exists(_gp.JOURNAL_FILE):
+        return []
+    records = []
+    with open(_gp.JOURNAL_FILE) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(rec, dict) and isinstance(rec.get('seq'), int):
+                records.append(rec)
+    return records
+
+
+def _last_journal_seq():
+    """seq of the journal's last intact record (0 if none), read from the file's tail."""
+    for rec in _iter_jsonl(_gp.JOURNAL_FILE, needles=(b'"seq"',), reverse=True):
+        if isinstance(rec, dict) and isinstance(rec.get('seq'), int):
+            return rec['seq']
+    return 0
+
+
+def parse_memory():
+    """All live attempts: the materialized table followed by journal records not yet folded in."""
+    if storage_mode() == 'sqlite':
+        return _db().load_attempts() + _buffered('attempts')
+    rows, watermark = _parse_memory_table()
+    for rec in read_journal():
+        if rec['seq'] > watermark:
+            rows.append(_row_from_cells([str(rec.get(k, '')) for k in MEMORY_FIELDS]))
+    return rows + _buffered('attempts')
+
+
+def append_attempt(row):
+    """
+    Durably append one attempt to the journal (write + fsync).
+    Returns the number of journal records now pending materialization (0 for sqlite,
+    and 0 inside a session_transaction, which buffers the attempt until it closes).
+    """
+    if _append_txn is not None:
+        _buffer('attempts', [_normalize_row(row)])
+        return 0
+    if storage_mode() == 'sqlite':
+        _db().insert_attempts([_normalize_row(row)])
+        return 0
+    return _append_journal([row])
+
+
+def _append_journal(rows):
+    """Append rows as journal records with one write and one fsync. Returns the pending count."""
+    watermark = _memory_watermark()
+    first     = max(watermark, _last_journal_seq()) + 1
+    records   = [{'seq': first + i, **dict(zip(MEMORY_FIELDS, _row_cells(r)))} for i, r in enumerate(rows)]
+    with open(_gp.JOURNAL_FILE, 'a+b') as f:
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b'\n'
+        else:
+            torn = False
+        f.write((('\n' if torn else '') + ''.join(json.dumps(r) + '\n' for r in records)).encode())
+        f.flush()
+        os.fsync(f.fileno())
+    return first + len(rows) - 1 - watermark    # seqs past the watermark are contiguous
+
+
+def journal_pending():
+    """Journal records not yet folded into memory.md, from the journal's tail."""
+    return max(0, _last_journal_seq() - _memory_watermark())
+
+
+def _table_rows(rows):
+    return ['| ' + ' | '.join(_row_cells(r)) + ' |\n' for r in rows]
+
+
+def _table_lines(title, rows):
+    return [
+        f'# {title}\n', '\n',
         '| Slug | Topic | Difficulty | Date | Rating | Time | Hints | Ease | Interval | Next Review |\n',
         '|------|-------|------------|------|--------|------|-------|------|----------|-------------|\n',
-    ]
-    for r in rows:
-        lines.append(
-            f"| {r['slug']} | {r['topic']} | {r['difficulty']} | {r['date']} "
-            f"| {r['rating']} | {r['time']} | {r['hints']} | {r['ease']:.1f} "
-            f"| {r['interval']} | {r['next_review']} |\n"
-        )
+    ] + _table_rows(rows)
+
+
+def _write_memory_table(rows):
+    journal = read_journal()
+    seq     = max([_memory_watermark()] + [r['seq'] for r in journal])
+    lines   = _table_lines('LeetCode Progress', rows)
+    if seq:
+        lines[2:2] = [f'{_WATERMARK_PREFIX}{seq} -->\n', '\n']
+    tmp = _gp.MEMORY_FILE + '.tmp'
     with open(tmp, 'w') as f:
         f.writelines(lines)
     os.replace(tmp, _gp.MEMORY_FILE)
-    shutil.copy2(_gp.MEMORY_FILE, _gp.MEMORY_FILE + '.bak')
+    _backup(_gp.MEMORY_FILE)
+    if journal:
+        os.remove(_gp.JOURNAL_FILE)
 
 
-def load_behavior_events():
-    if not os.path.exists(_gp.BEHAVIOR_FILE):
-        return []
-    events = []
-    with open(_gp.BEHAVIOR_FILE) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
-    return events
+def write_memory(rows):
+    """
+    Atomic write: write to .tmp then os.replace, keep rolling .bak.
+    rows is the full live history, so any journal it covers is folded in and removed.
+    """
+    _flush_appends()
+    if storage_mode() == 'sqlite':
+        _db().replace_attempts([_normalize_row(r) for r in rows])
+    else:
+        _write_memory_table(rows)
+
+
+def archive_memory(keep=None):
+    """Move all but the newest `keep` live attempts to the archive. Returns (archived, kept)."""
+    keep = _gp.ARCHIVE_THRESHOLD if keep is None else keep
+    _flush_appends()
+    sig = history_signature()
+    if storage_mode() == 'sqlite':
+        rows  = _db().load_attempts()
+        moved = _db().archive_attempts(keep)
+        _index.stamp(_gp.INDEX_FILE, sig, history_signature(), archived=rows[:moved])
+        return moved, _db().count_attempts()
+    rows = parse_memory()
+    if len(rows) <= keep:
+        return 0, len(rows)
+    to_archive = rows[:len(rows) - keep]
+    to_keep    = rows[len(rows) - keep:]
+    archive_lines = []
+    if os.path.exists(_gp.ARCHIVE_FILE):
+        with open(_gp.ARCHIVE_FILE) as f:
+            archive_lines = f.readlines()
+    if not archive_lines:
+        archive_lines = _table_lines('LeetCode Progress Archive', [])
+    archive_lines += _table_rows(to_archive)
+    with open(_gp.ARCHIVE_FILE, 'w') as f:
+        f.writelines(archive_lines)
+    write_memory(to_keep)
+    _index.stamp(_gp.INDEX_FILE, sig, history_signature(), archived=to_archive)
+    return len(to_archive), len(to_keep)
+
+
+def materialize_memory():
+    """Fold pending journal records into memory.md. Returns the number folded in."""
+    _flush_appends()
+    watermark = _memory_watermark()
+    pending   = [r for r in read_journal() if r['seq'] > watermark]
+    sig       = history_signature()
+    if pending:
+        write_memory(parse_memory())
+    elif os.path.exists(_gp.JOURNAL_FILE):
+        os.remove(_gp.JOURNAL_FILE)
+    _index.stamp(_gp.INDEX_FILE, sig, history_signature())
+    return len(pending)
+
+
+def _file_sig(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def history_signature():
+    """Cheap fingerprint of stored attempts; derived indexes are valid only while it matches."""
+    mode = storage_mode()
+    if mode == 'sqlite':
+        sig = [mode] + _db().attempts_signature()
+    else:
+        sig = [mode] + [_file_sig(p) for p in (_gp.MEMORY_FILE, _gp.ARCHIVE_FILE, _gp.JOURNAL_FILE)]
+    return sig + _buffered_sig('attempts')
+
+
+def _archived_and_live():
+    if storage_mode() == 'sqlite':
+        return _db().load_attempts(archived=True), _db().load_attempts()
+    return _parse_memory_table(_gp.ARCHIVE_FILE)[0], parse_memory()
+
+
+def load_history():
+    """Every attempt ever logged, archived first, oldest to newest."""
+    archived, live = _archived_and_live()
+    return archived + live
+
+
+_derived = {}   # derived cache file → (source signature, loaded object), reused while the sig holds
+
+
+def _remember(path, sig, obj):
+    _derived[path] = (sig, obj)
+    return obj
+
+
+def _recall(path, sig):
+    cached = _derived.get(path)
+    return cached[1] if cached is not None and cached[0] == sig else None
+
+
+def memory_index():
+    """
+    The derived per-slug schedule, due heap and gap accumulators (grind_index.MemoryIndex),
+    rebuilt from history only when the stored signature is stale. Kept in memory for the
+    life of the process (one CLI call, or a `grind serve` daemon) while the signature holds.
+    """
+    sig   = history_signature()
+    index = _recall(_gp.INDEX_FILE, sig) or _index.load(_gp.INDEX_FILE, sig)
+    if index is None:
+        index = _index.MemoryIndex.build(*_archived_and_live(), datetime.now().date())
+        _index.save(_gp.INDEX_FILE, index, sig)
+    return _remember(_gp.INDEX_FILE, sig, index)
+
+
+def schedule_index():
+    """Latest SM-2 state per slug over archive + live history."""
+    return memory_index().schedule
+
+
+def update_memory_index(index, row):
+    """Fold an attempt that was just stored into index and re-stamp it against the new history."""
+    index.record(_normalize_row(row), datetime.now().date())
+    sig = history_signature()
+    _index.save(_gp.INDEX_FILE, index, sig)
+    _remember(_gp.INDEX_FILE, sig, index)
+
+
+def gap_totals(today=None):
+    """
+    {topic: (n, weight_sum, weighted_rating_sum)} over live attempts from the running
+    accumulators, or None if today precedes their anchor.
+    """
+    return memory_index().gap.totals(today or datetime.now().date())
+
+
+def live_attempt_count():
+    if storage_mode() == 'sqlite':
+        return _db().count_attempts() + len(_buffered('attempts'))
+    return len(parse_memory())
+
+
+def _behavior_archive_file():
+    return os.path.join(_gp.PROJECT_ROOT, 'behavior_archive.jsonl')
+
+
+_TAIL_BLOCK = 1 << 16
+
+
+def _lines_reversed(f, block=None):
+    """Raw lines of a binary file, last first, reading fixed-size blocks from the end."""
+    block = block or _TAIL_BLOCK
+    f.seek(0, os.SEEK_END)
+    pos, tail = f.tell(), b''
+    while pos > 0:
+        step = min(block, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + tail).split(b'\n')
+        tail  = lines.pop(0)
+        yield from reversed(lines)
+    yield tail
+
+
+def _iter_jsonl(path, needles=(), reverse=False):
+    """
+    Parsed records one at a time. Lines lacking any of the byte-string needles are
+    skipped before json.loads; unparseable lines are skipped.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        for raw in (_lines_reversed(f) if reverse else f):
+            if not all(n in raw for n in needles):
+                continue
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                yield json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass
+
+
+def _read_jsonl(path):
+    return list(_iter_jsonl(path))
+
+
+def iter_behavior_events(topic=None, slug=None, event=None, reverse=False):
+    """
+    Live behavior events as a stream, oldest first (newest first with reverse).
+    Filters are pushed down: to the SQL WHERE clause, or to a substring test on
+    each raw line before it is parsed, so memory stays flat however long the log is.
+    """
+    filters  = [(k, v) for k, v in (('topic', topic), ('slug', slug), ('event', event)) if v is not None]
+    buffered = [e for e in _buffered('events') if all(e.get(k) == v for k, v in filters)]
+    if reverse:
+        yield from reversed(buffered)
+    if storage_mode() == 'sqlite':
+        yield from _db().iter_behavior(topic=topic, slug=slug, event=event, reverse=reverse)
+    else:
+        needles = [json.dumps(v).encode() for _, v in filters]
+        for e in _iter_jsonl(_gp.BEHAVIOR_FILE, needles, reverse):
+            if all(e.get(k) == v for k, v in filters):
+                yield e
+    if not reverse:
+        yield from buffered
+
+
+def tail_behavior_events(n, topic=None, slug=None, event=None):
+    """The last n matching events in chronological order, reading only the file's suffix."""
+    newest = islice(iter_behavior_events(topic, slug, event, reverse=True), n)
+    return list(newest)[::-1]
+
+
+def count_behavior_events(topic=None, slug=None, event=None):
+    if topic is None and slug is None and event is None:
+        return behavior_rollup()['events']
+    return sum(1 for _ in iter_behavior_events(topic, slug, event))
+
+
+def load_behavior_events(topic=None, slug=None):
+    """Live behavior events, optionally filtered by topic and/or slug."""
+    return list(iter_behavior_events(topic=topic, slug=slug))
 
 
 def flush_behavior_events(session):
-    """Append hint_events from session dict to behavior.jsonl (append-only)."""
+    """
+    Append hint_events from session dict to behavior.jsonl (append-only) and the rollup.
+    Inside a session_transaction the events are buffered until it closes.
+    """
     events = session.get('hint_events', [])
     if not events:
         return 0
-    with open(_gp.BEHAVIOR_FILE, 'a') as f:
-        for ev in events:
-            f.write(json.dumps(ev) + '\n')
+    rollup = behavior_rollup()
+    if _append_txn is not None:
+        _buffer('events', events)
+    else:
+        _store_events(events)
+    for ev in events:
+        _rollup.add_event(rollup, ev)
+    sig = behavior_signature()
+    _rollup.save(_gp.ROLLUP_FILE, rollup, sig)
+    _remember(_gp.ROLLUP_FILE, sig, rollup)
     return len(events)
 
 
-def load_session():
+def _store_events(events):
+    if storage_mode() == 'sqlite':
+        _db().insert_behavior(events)
+    else:
+        with open(_gp.BEHAVIOR_FILE, 'a') as f:
+            f.writelines(json.dumps(ev) + '\n' for ev in events)
+
+
+def behavior_signature():
+    if storage_mode() == 'sqlite':
+        return ['sqlite'] + _db().behavior_signature() + _buffered_sig('events')
+    return ['file', _file_sig(_gp.BEHAVIOR_FILE)] + _buffered_sig('events')
+
+
+def behavior_rollup(rebuild=False):
+    """
+    Per-topic behavior sums and counts (see grind_rollup), rebuilt from the live
+    events only when stale or when rebuild is set.
+    """
+    sig    = behavior_signature()
+    rollup = None if rebuild else (_recall(_gp.ROLLUP_FILE, sig) or _rollup.load(_gp.ROLLUP_FILE, sig))
+    if rollup is None:
+        rollup = _rollup.from_events(iter_behavior_events())
+        _rollup.save(_gp.ROLLUP_FILE, rollup, sig)
+    return _remember(_gp.ROLLUP_FILE, sig, rollup)
+
+
+def archive_behavior_events(cutoff):
+    """
+    Move events dated before cutoff (a date) to the archive in one streaming pass.
+    Returns (archived, remaining).
+    """
+    _flush_appends()
+    if storage_mode() == 'sqlite':
+        return _db().archive_behavior(cutoff.strftime('%Y-%m-%d'))
+    if not os.path.exists(_gp.BEHAVIOR_FILE):
+        return 0, 0
+    archived, kept, rollup = 0, 0, _rollup.empty()
+    tmp_path = _gp.BEHAVIOR_FILE + '.tmp'
+    archive  = None
+    try:
+        with open(tmp_path, 'w') as out:
+            for e in _iter_jsonl(_gp.BEHAVIOR_FILE):
+                try:
+                    old = datetime.fromisoformat(e['ts']).date() < cutoff
+                except (ValueError, KeyError, TypeError):
+                    old = False
+                if old:
+                    if archive is None:
+                        archive = open(_behavior_archive_file(), 'a')
+                    archive.write(json.dumps(e) + '\n')
+                    archived += 1
+                else:
+                    out.write(json.dumps(e) + '\n')
+                    _rollup.add_event(rollup, e)
+                    kept += 1
+    finally:
+        if archive is not None:
+            archive.close()
+    if not archived:
+        os.remove(tmp_path)
+        return 0, kept
+    os.replace(tmp_path, _gp.BEHAVIOR_FILE)
+    sig = behavior_signature()
+    _rollup.save(_gp.ROLLUP_FILE, rollup, sig)
+    _remember(_gp.ROLLUP_FILE, sig, rollup)
+    return archived, kept
+
+
+def has_behavior_events():
+    if storage_mode() == 'sqlite':
+        return _db().count_behavior() > 0
+    return os.path.exists(_gp.BEHAVIOR_FILE)
+
+
+def clear_behavior_events():
+    _flush_appends()
+    if storage_mode() == 'sqlite':
+        _db().clear_behavior()
+    elif os.path.exists(_gp.BEHAVIOR_FILE):
+        os.remove(_gp.BEHAVIOR_FILE)
+    if os.path.exists(_gp.ROLLUP_FILE):
+        os.remove(_gp.ROLLUP_FILE)
+    _derived.pop(_gp.ROLLUP_FILE, None)
+
+
+def due_reviews(today=None, limit=None, topic=None):
+    """
+    Slugs whose latest attempt has next_review today or earlier, most overdue first,
+    popped from the schedule index's due heap (O(k log k) for k results once loaded).
+    Returns [(slug, topic, days_overdue)].
+    """
+    if today is None:
+        today = datetime.now().date()
+    return schedule_index().due_reviews(today, limit=limit, topic=topic)
+
+
+def topic_rating_totals():
+    """topic → (attempt count, rating sum) over live rated attempts, from the gap accumulators."""
+    return memory_index().gap.rating_totals()
+
+
+def migrate_to_sqlite(force=False):
+    """
+    One-shot import of memory/archive/behavior files and config targets into grind.db,
+    then switch storage to sqlite. The source files are left in place untouched.
+    Returns a dict of imported counts.
+    """
+    _flush_appends()
+    config = load_config()
+    if config.get('storage') == 'sqlite':
+        raise ValueError("storage is already sqlite")
+    db = _db()
+    if not db.is_empty():
+        if not force:
+            raise ValueError(f"{os.path.basename(_gp.DB_FILE)} already has data (use --force to replace it)")
+        db.reset()
+    live     = parse_memory()
+    archived = _parse_memory_table(_gp.ARCHIVE_FILE)[0]
+    events   = _read_jsonl(_gp.BEHAVIOR_FILE)
+    old_ev   = _read_jsonl(_behavior_archive_file())
+    db.insert_attempts([_normalize_row(r) for r in archived], archived=True)
+    db.insert_attempts([_normalize_row(r) for r in live])
+    db.insert_behavior(old_ev, archived=True)
+    db.insert_behavior(events)
+    config['storage'] = 'sqlite'
+    save_config(config)
+    return {'attempts': len(live), 'archived_attempts': len(archived),
+            'events': len(events), 'archived_events': len(old_ev),
+            'targets': len(config.get('targets', {}))}
+
+
+def export_from_sqlite(mode=None):
+    """
+    Write grind.db back out as memory.md, memory_archive.md, behavior.jsonl,
+    behavior_archive.jsonl and targets in .lc_config.json. With mode, also switch
+    storage to that file-backed mode; without it the DB stays authoritative and the
+    targets written to .lc_config.json are only a copy. Returns exported counts.
+    """
+    _flush_appends()
+    config = load_config()
+    if storage_mode(config) != 'sqlite':
+        raise ValueError("storage is not sqlite")
+    db       = _db()
+    live     = db.load_attempts()
+    archived = db.load_attempts(archived=True)
+    events   = db.load_behavior()
+    old_ev   = db.load_behavior(archived=True)
+
+    _write_memory_table(live)
+    with open(_gp.ARCHIVE_FILE, 'w') as f:
+        f.writelines(_table_lines('LeetCode Progress Archive', archived))
+    for path, evs in ((_gp.BEHAVIOR_FILE, events), (_behavior_archive_file(), old_ev)):
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            for e in evs:
+                f.write(json.dumps(e) + '\n')
+        os.replace(tmp, path)
+    config['storage'] = mode or 'sqlite'
+    targets = config.get('targets', {})
+    _write_config_file(config)
+    return {'attempts': len(live), 'archived_attempts': len(archived),
+            'events': len(events), 'archived_events': len(old_ev),
+            'targets': len(targets)}
+
+
+_session_txn = None   # {'session', 'dirty'} while a session_transaction is open
+_append_txn  = None   # {'attempts', 'events', 'gen'}: appends buffered by the open session_transaction
+
+
+def _read_session_file():
     if not os.path.exists(_gp.SESSION_FILE):
         return None
     with open(_gp.SESSION_FILE) as f:
         return json.load(f)
 
 
-def save_session(session):
+def _write_session_file(session):
+    if session is None:
+        if os.path.exists(_gp.SESSION_FILE):
+            os.remove(_gp.SESSION_FILE)
+        return
     with open(_gp.SESSION_FILE, 'w') as f:
         json.dump(session, f, indent=2)
         f.write('\n')
+
+
+def load_session():
+    if _session_txn is not None:
+        return _session_txn['session']
+    return _read_session_file()
+
+
+def save_session(session):
+    if _session_txn is not None:
+        _session_txn['session'] = session
+        _session_txn['dirty']   = True
+        return
+    _write_session_file(session)
+
+
+def clear_session():
+    """Delete .session.json (deferred like save_session inside a session_transaction)."""
+    save_session(None)
+
+
+@contextmanager
+def session_transaction():
+    """
+    Same contract as config_transaction for .session.json: one read up front,
+    at most one write (or delete) on exit, nothing written if the block raises.
+    Attempts (append_attempt) and behavior events (flush_behavior_events) are
+    buffered too — readers see them — and stored with one append each on exit.
+    """
+    global _session_txn, _append_txn
+    if _session_txn is not None:
+        yield _session_txn['session']
+        return
+    txn = _session_txn = {'session': _read_session_file(), 'dirty': False}
+    _append_txn = {'attempts': [], 'events': [], 'gen': 0}
+    try:
+        yield txn['session']
+    except BaseException:
+        _append_txn = None
+        raise
+    finally:
+        _session_txn = None
+    if txn['dirty']:
+        _write_session_file(txn['session'])
+    _flush_appends(close=True)
+
+
+def appends_buffered():
+    """True while a session_transaction is buffering attempts and behavior events."""
+    return _append_txn is not None
+
+
+def _buffered(kind):
+    return list(_append_txn[kind]) if _append_txn is not None else []
+
+
+def _buffered_sig(kind):
+    """Signature suffix for buffered appends: a generation that never repeats, so derived
+    caches stamped while the buffer held other content (or was rolled back) go stale."""
+    return [['buffered', _append_txn['gen']]] if _append_txn is not None and _append_txn[kind] else []
+
+
+def _buffer(kind, items):
+    _append_txn[kind].extend(items)
+    _append_txn['gen'] += 1
+
+
+def _flush_appends(close=False):
+    """
+    Store the attempts and events buffered by the open session_transaction (one append
+    each) and re-stamp the memory index and behavior rollup against the stored files.
+    Called on close, and before anything rewrites attempts or events wholesale.
+    """
+    global _append_txn
+    txn = _append_txn
+    if txn is None or not (txn['attempts'] or txn['events']):
+        if close:
+            _append_txn = None
+        return
+    old_history, old_behavior = history_signature(), behavior_signature()
+    attempts, events = txn['attempts'][:], txn['events'][:]
+    _append_txn = None
+    if attempts:
+        mode = storage_mode()
+        if mode == 'sqlite':
+            _db().insert_attempts(attempts)
+        elif mode == 'journal':
+            _append_journal(attempts)
+        else:
+            _write_memory_table(parse_memory() + attempts)
+        _restamp(_gp.INDEX_FILE, _index, old_history, history_signature())
+    if events:
+        _store_events(events)
+        _restamp(_gp.ROLLUP_FILE, _rollup, old_behavior, behavior_signature())
+    if not close:
+        txn['attempts'].clear()
+        txn['events'].clear()
+        txn['gen'] += 1
+        _append_txn = txn
+
+
+def _restamp(path, module, old_sig, new_sig):
+    """Carry a derived cache built over buffered appends over to the stored files."""
+    cached = _recall(path, old_sig)
+    if cached is None:
+        cached = module.load(path, old_sig)
+    if cached is not None:
+        module.save(path, cached, new_sig)
+        _remember(path, new_sig, cached)
+
+
+def transaction_savepoint():
+    """State of the open config/session transactions, for rollback_transaction()."""
+    return {'config':   copy.deepcopy(_config_txn) if _config_txn is not None else None,
+            'session':  copy.deepcopy(_session_txn) if _session_txn is not None else None,
+            'attempts': len(_append_txn['attempts']) if _append_txn is not None else 0,
+            'events':   len(_append_txn['events']) if _append_txn is not None else 0}
+
+
+def rollback_transaction(savepoint):
+    """Discard config/session changes and buffered appends made since savepoint."""
+    if _config_txn is not None and savepoint['config'] is not None:
+        _config_txn.update(savepoint['config'])
+    if _session_txn is not None and savepoint['session'] is not None:
+        _session_txn.update(savepoint['session'])
+    if _append_txn is not None:
+        del _append_txn['attempts'][savepoint['attempts']:]
+        del _append_txn['events'][savepoint['events']:]
+        _append_txn['gen'] += 1
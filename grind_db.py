@@ -0,0 +1,236 @@
+"""
+grind_db — optional SQLite storage engine for grindcoach (stdlib sqlite3).
+
+Selected with "storage": "sqlite" in .lc_config.json. Holds attempts (memory.md +
+memory_archive.md), behavior events (behavior.jsonl + behavior_archive.jsonl) and
+targets/plans. Scalar settings (active track/target, overrides, resume, the storage
+mode itself) stay in .lc_config.json so the backend can be discovered without it.
+
+Rows handed to this module are already normalized by grind_data, so a round trip
+through SQLite yields the same dicts as a round trip through markdown.
+"""
+import json
+import sqlite3
+
+import grind_paths as _gp
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id          INTEGER PRIMARY KEY,
+    slug        TEXT NOT NULL,
+    topic       TEXT NOT NULL DEFAULT '',
+    difficulty  TEXT NOT NULL DEFAULT '',
+    date        TEXT NOT NULL DEFAULT '',
+    rating      INTEGER NOT NULL DEFAULT 0,
+    time        TEXT NOT NULL DEFAULT '',
+    hints       INTEGER NOT NULL DEFAULT 0,
+    ease        REAL NOT NULL DEFAULT 2.5,
+    interval    TEXT NOT NULL DEFAULT '',
+    next_review TEXT NOT NULL DEFAULT '',
+    archived    INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS attempts_slug        ON attempts(slug, id);
+CREATE INDEX IF NOT EXISTS attempts_topic       ON attempts(topic, next_review);
+CREATE INDEX IF NOT EXISTS attempts_date        ON attempts(date);
+CREATE INDEX IF NOT EXISTS attempts_next_review ON attempts(next_review);
+
+CREATE TABLE IF NOT EXISTS behavior (
+    id       INTEGER PRIMARY KEY,
+    ts       TEXT NOT NULL DEFAULT '',
+    slug     TEXT NOT NULL DEFAULT '',
+    topic    TEXT NOT NULL DEFAULT '',
+    event    TEXT NOT NULL DEFAULT '',
+    body     TEXT NOT NULL,
+    archived INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS behavior_topic ON behavior(topic, event);
+CREATE INDEX IF NOT EXISTS behavior_slug  ON behavior(slug);
+CREATE INDEX IF NOT EXISTS behavior_ts    ON behavior(ts);
+
+CREATE TABLE IF NOT EXISTS targets (
+    id       TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    body     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plans (
+    target_id TEXT PRIMARY KEY,
+    body      TEXT NOT NULL
+);
+"""
+
+ATTEMPT_COLUMNS = ('slug', 'topic', 'difficulty', 'date', 'rating',
+                   'time', 'hints', 'ease', 'interval', 'next_review')
+
+_DATE_GLOB = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+
+_connections = {}   # path → sqlite3.Connection
+
+
+def connect(path=None):
+    """Process-wide connection per database file; creates the schema on first use."""
+    path = path or _gp.DB_FILE
+    conn = _connections.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(SCHEMA)
+        _connections[path] = conn
+    return conn
+
+
+def close(path=None):
+    conn = _connections.pop(path or _gp.DB_FILE, None)
+    if conn is not None:
+        conn.close()
+
+
+def _attempt(row):
+    return {k: row[k] for k in ATTEMPT_COLUMNS}
+
+
+# --- attempts ---
+
+def load_attempts(archived=False):
+    conn = connect()
+    cur = conn.execute(
+        f"SELECT {', '.join(ATTEMPT_COLUMNS)} FROM attempts WHERE archived = ? ORDER BY id",
+        (1 if archived else 0,))
+    return [_attempt(r) for r in cur]
+
+
+def insert_attempts(rows, archived=False):
+    conn = connect()
+    with conn:
+        conn.executemany(
+            f"INSERT INTO attempts ({', '.join(ATTEMPT_COLUMNS)}, archived) "
+            f"VALUES ({', '.join('?' * len(ATTEMPT_COLUMNS))}, ?)",
+            [tuple(r[k] for k in ATTEMPT_COLUMNS) + (1 if archived else 0,) for r in rows])
+
+
+def replace_attempts(rows):
+    """Replace the live (unarchived) history; archived attempts are untouched."""
+    conn = connect()
+    with conn:
+        conn.execute("DELETE FROM attempts WHERE archived = 0")
+        conn.executemany(
+            f"INSERT INTO attempts ({', '.join(ATTEMPT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(ATTEMPT_COLUMNS))})",
+            [tuple(r[k] for k in ATTEMPT_COLUMNS) for r in rows])
+
+
+def archive_attempts(keep):
+    """Mark all but the newest `keep` live attempts archived. Returns how many moved."""
+    conn = connect()
+    with conn:
+        cur = conn.execute(
+            "UPDATE attempts SET archived = 1 WHERE archived = 0 AND id NOT IN "
+            "(SELECT id FROM attempts WHERE archived = 0 ORDER BY id DESC LIMIT ?)", (keep,))
+    return cur.rowcount
+
+
+def count_attempts():
+    return connect().execute("SELECT COUNT(*) FROM attempts WHERE archived = 0").fetchone()[0]
+
+
+def attempts_signature():
+    """(row count, live count, max id) — changes on every insert, replace or archive."""
+    n, live, top = connect().execute(
+        "SELECT COUNT(*), COALESCE(SUM(archived = 0), 0), COALESCE(MAX(id), 0) FROM attempts").fetchone()
+    return [n, live, top]
+
+
+# --- behavior ---
+
+def iter_behavior(topic=None, slug=None, event=None, archived=False, reverse=False):
+    """Events in insertion order (newest first with reverse), filtered by indexed columns."""
+    sql, params = "SELECT body FROM behavior WHERE archived = ?", [1 if archived else 0]
+    for col, val in (('topic', topic), ('slug', slug), ('event', event)):
+        if val is not None:
+            sql += f" AND {col} = ?"
+            params.append(val)
+    cur = connect().execute(sql + (" ORDER BY id DESC" if reverse else " ORDER BY id"), params)
+    for r in cur:
+        yield json.loads(r['body'])
+
+
+def load_behavior(topic=None, slug=None, event=None, archived=False):
+    return list(iter_behavior(topic, slug, event, archived))
+
+
+def insert_behavior(events, archived=False):
+    conn = connect()
+    with conn:
+        conn.executemany(
+            "INSERT INTO behavior (ts, slug, topic, event, body, archived) VALUES (?, ?, ?, ?, ?, ?)",
+            [(str(e.get('ts', '')), str(e.get('slug', '')), str(e.get('topic', 'unknown')),
+              str(e.get('event', '')), json.dumps(e), 1 if archived else 0) for e in events])
+
+
+def archive_behavior(cutoff_str):
+    """Archive events whose ts date is before cutoff (YYYY-MM-DD). Returns (archived, remaining)."""
+    conn = connect()
+    with conn:
+        cur = conn.execute(
+            "UPDATE behavior SET archived = 1 WHERE archived = 0 AND ts GLOB ? AND substr(ts, 1, 10) < ?",
+            (_DATE_GLOB, cutoff_str))
+    return cur.rowcount, count_behavior()
+
+
+def behavior_signature():
+    """(live count, max id) — changes on every insert, archive or clear."""
+    live, top = connect().execute(
+        "SELECT COALESCE(SUM(archived = 0), 0), COALESCE(MAX(id), 0) FROM behavior").fetchone()
+    return [live, top]
+
+
+def count_behavior():
+    return connect().execute("SELECT COUNT(*) FROM behavior WHERE archived = 0").fetchone()[0]
+
+
+def clear_behavior():
+    conn = connect()
+    with conn:
+        conn.execute("DELETE FROM behavior WHERE archived = 0")
+
+
+# --- targets / plans ---
+
+def load_targets():
+    conn = connect()
+    plans = {r['target_id']: json.loads(r['body'])
+             for r in conn.execute("SELECT target_id, body FROM plans")}
+    targets = {}
+    for r in conn.execute("SELECT id, body FROM targets ORDER BY position"):
+        t = json.loads(r['body'])
+        t['plan'] = plans.get(r['id'], {})
+        targets[r['id']] = t
+    return targets
+
+
+def save_targets(targets):
+    conn = connect()
+    with conn:
+        conn.execute("DELETE FROM targets")
+        conn.execute("DELETE FROM plans")
+        for pos, (tid, t) in enumerate(targets.items()):
+            body = {k: v for k, v in t.items() if k != 'plan'}
+            conn.execute("INSERT INTO targets (id, position, body) VALUES (?, ?, ?)",
+                         (tid, pos, json.dumps(body)))
+            conn.execute("INSERT INTO plans (target_id, body) VALUES (?, ?)",
+                         (tid, json.dumps(t.get('plan', {}))))
+
+
+def is_empty():
+    conn = connect()
+    return not any(conn.execute(f"SELECT 1 FROM {t} LIMIT 1").fetchone()
+                   for t in ('attempts', 'behavior', 'targets'))
+
+
+def reset():
+    """Drop every row (used by migrate --force)."""
+    conn = connect()
+    with conn:
+        for t in ('attempts', 'behavior', 'targets', 'plans'):
+            conn.execute(f"DELETE FROM {t}")
@@ -0,0 +1,367 @@
+"""
+grind_exec — run a prepared solution command and measure what the child used.
+
+run_measured() starts the command through a small launcher (`python3 -S`)
+that forks it, reaps it with os.wait4 so the rusage covers exactly that
+process (CPU user/sys time, peak RSS), and reports back over a pipe. The
+launcher is needed because exec() records the exec'ing process's peak RSS as
+the new program's starting maxrss: spawned straight from grind, every solution
+would report at least grind's own peak. The child is killed if it outlives
+the timeout. summarize() folds repeated runs into min/median/p95 per metric
+for `grind run --profile`.
+
+run_limited() is the sandboxed run behind `grind run` and `grind test`: the
+child starts a new session (its own process group) and execs through a second
+launcher that sets the CPU, address-space and file-size rlimits before it
+execs the command — nothing runs between fork and exec in grind, which may
+have pump threads and a `grind test` thread pool going (preexec_fn is not safe
+with threads). Its stdout/stderr are relayed through pipes and cut off past
+the output limit, and the whole group is killed on a wall-clock timeout or
+Ctrl-C. Each run ends with a LeetCode-style verdict (VERDICTS).
+"""
+import os
+import sys
+import signal
+import threading
+import time as time_module
+import subprocess
+import tempfile
+from statistics import median
+
+
+class Measurement:
+    """One finished child: exit code, wall/user/system seconds, peak RSS in KiB, captured output."""
+
+    __slots__ = ('code', 'wall', 'user', 'system', 'max_rss_kb', 'timed_out', 'stdout', 'stderr', 'verdict')
+
+    def __init__(self, code, wall, user, system, max_rss_kb, timed_out=False, stdout=None, stderr=None,
+                 verdict=None):
+        self.code       = code
+        self.wall       = wall
+        self.user       = user
+        self.system     = system
+        self.max_rss_kb = max_rss_kb
+        self.timed_out  = timed_out
+        self.stdout     = stdout
+        self.stderr     = stderr
+        self.verdict    = verdict
+
+    @property
+    def cpu(self):
+        return self.user + self.system
+
+
+def _rss_kb(ru_maxrss):
+    # Linux reports KiB, macOS bytes
+    return ru_maxrss // 1024 if sys.platform == 'darwin' else ru_maxrss
+
+
+def _exit_code(status):
+    """wait status → returncode as subprocess reports it (negative signal number if killed)."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# Runs argv[2:] as its child and writes "status utime stime maxrss wall" to fd argv[1].
+# SIGTERM kills the child (the timeout); SIGINT is left to the child, which gets it
+# from the terminal, so an interrupted run is still reported.
+_LAUNCHER = """
+import os, sys, time, signal
+fd, cmd, pid = int(sys.argv[1]), sys.argv[2:], 0
+signal.signal(signal.SIGINT, signal.SIG_IGN)
+signal.signal(signal.SIGTERM, lambda *_: os.kill(pid, signal.SIGKILL) if pid else os._exit(143))
+start = time.perf_counter()
+pid = os.fork()
+if pid == 0:
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    os.close(fd)
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
+        os.write(2, f"{cmd[0]}: {e.strerror}\\n".encode())
+    os._exit(127)
+_, status, ru = os.wait4(pid, 0)
+wall = time.perf_counter() - start
+os.write(fd, f"{status} {ru.ru_utime} {ru.ru_stime} {ru.ru_maxrss} {wall}".encode())
+"""
+
+
+def run_measured(cmd, cwd=None, env=None, stdin=None, capture=False, timeout=None, quiet=False):
+    """
+    Run cmd to completion and return a Measurement.
+    stdin: file object, bytes, or None to inherit. capture: collect stdout/stderr
+    (as bytes) instead of passing them through; quiet: discard them.
+    """
+    data = None
+    if isinstance(stdin, bytes):
+        data, stdin = stdin, tempfile.TemporaryFile()
+        stdin.write(data)
+        stdin.seek(0)
+    out = err = None
+    if capture:
+        out, err = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+    elif quiet:
+        out = err = subprocess.DEVNULL
+    report_r, report_w = os.pipe()
+    try:
+        proc = subprocess.Popen([sys.executable, '-S', '-c', _LAUNCHER, str(report_w), *cmd],
+                                cwd=cwd, env=env, stdin=stdin, stdout=out, stderr=err,
+                                pass_fds=(report_w,))
+        os.close(report_w)
+        report_w = None
+        timer = None
+        timed_out = []
+        if timeout:
+            timer = threading.Timer(timeout, lambda: (timed_out.append(True), proc.terminate()))
+            timer.start()
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(report_r, 256)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            proc.wait()
+        except KeyboardInterrupt:
+            proc.terminate()
+            proc.wait()
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+        fields = b''.join(chunks).split()
+        if len(fields) == 5:
+            status, user, system, max_rss, wall = fields
+            m = Measurement(_exit_code(int(status)), float(wall), float(user), float(system),
+                            _rss_kb(int(max_rss)), timed_out=bool(timed_out))
+        elif timed_out:                             # stopped before it started the command
+            m = Measurement(-signal.SIGKILL, timeout, 0.0, 0.0, 0, timed_out=True)
+        else:
+            raise RuntimeError(f"measuring {cmd[0]} failed (launcher exited with {proc.returncode})")
+        if capture:
+            out.seek(0)
+            err.seek(0)
+            m.stdout, m.stderr = out.read(), err.read()
+        return m
+    finally:
+        os.close(report_r)
+        if report_w is not None:
+            os.close(report_w)
+        for f in (out, err):
+            if capture and f:
+                f.close()
+        if data is not None:
+            stdin.close()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))          # ceil(n * pct / 100)
+    return ordered[int(rank) - 1]
+
+
+def summarize(measurements):
+    """{'wall'|'user'|'system'|'max_rss_kb': {'min', 'median', 'p95'}} over repeated runs."""
+    stats = {}
+    for key in ('wall', 'user', 'system', 'max_rss_kb'):
+        values = [getattr(m, key) for m in measurements]
+        stats[key] = {'min': min(values), 'median': median(values), 'p95': percentile(values, 95)}
+    return stats
+
+
+# --- limited runs ---
+
+VERDICTS = {
+    'OK':  'Accepted',
+    'RE':  'Runtime Error',
+    'TLE': 'Time Limit Exceeded',
+    'MLE': 'Memory Limit Exceeded',
+    'OLE': 'Output Limit Exceeded',
+}
+
+# stderr markers of a failed allocation under RLIMIT_AS / -Xmx
+MEMORY_ERRORS = (b'MemoryError', b'std::bad_alloc', b'java.lang.OutOfMemoryError')
+OUTPUT_ERRORS = (b'File too large',)     # RLIMIT_FSIZE where SIGXFSZ is ignored (python)
+_TAIL = 4096             # bytes of stderr kept to look for these
+
+
+class Limits:
+    """
+    Per-run limits; None turns one off. time: wall seconds, cpu: CPU seconds,
+    memory: bytes of address space (the heap cap for java), output: bytes of
+    stdout + stderr.
+    """
+
+    __slots__ = ('time', 'cpu', 'memory', 'output')
+
+    DEFAULTS = {'time': 10.0, 'cpu': 10.0, 'memory': 1024 * 1024 * 1024, 'output': 4 * 1024 * 1024}
+
+    def __init__(self, time=DEFAULTS['time'], cpu=DEFAULTS['cpu'], memory=DEFAULTS['memory'],
+                 output=DEFAULTS['output']):
+        self.time   = time
+        self.cpu    = cpu
+        self.memory = memory
+        self.output = output
+
+    def describe(self, verdict):
+        """The limit a verdict ran into, for messages: '10s', '1024MB', ...'"""
+        if verdict == 'TLE':
+            return ' / '.join(f"{v:g}s {k}" for k, v in (('wall', self.time), ('CPU', self.cpu)) if v)
+        if verdict == 'MLE' and self.memory:
+            return f"{self.memory // (1024 * 1024)}MB"
+        if verdict == 'OLE' and self.output:
+            return f"{self.output // 1024}KB"
+        return ''
+
+
+def _is_java(cmd):
+    return os.path.basename(cmd[0]) == 'java'
+
+
+# Sets the rlimits in argv[1:4] (CPU seconds, address-space bytes, file-size bytes;
+# 0 = unlimited) on itself, then execs argv[4:], which inherits them.
+_LIMITER = """
+import os, sys, resource
+cpu, memory, output = (int(a) for a in sys.argv[1:4])
+cmd = sys.argv[4:]
+if cpu:
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+if memory:
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+if output:
+    resource.setrlimit(resource.RLIMIT_FSIZE, (output, output))
+try:
+    os.execvp(cmd[0], cmd)
+except OSError as e:
+    os.write(2, f"{cmd[0]}: {e.strerror}\\n".encode())
+os._exit(127)
+"""
+
+
+def _limited_command(cmd, limits, address_space):
+    """cmd wrapped in the _LIMITER launcher for limits."""
+    cpu    = max(1, int(-(-limits.cpu // 1))) if limits.cpu else 0      # whole seconds, rounded up
+    memory = limits.memory if limits.memory and address_space else 0
+    return [sys.executable, '-S', '-c', _LIMITER, str(cpu), str(memory), str(limits.output or 0), *cmd]
+
+
+def _pump(src, sink, budget, on_exceeded, tail=None):
+    """Relay src to sink until EOF, charging budget (a one-item list shared by both streams, or None)."""
+    fd = src.fileno()
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        if budget is not None:
+            allowed = max(0, budget[0])
+            budget[0] -= len(chunk)
+            if len(chunk) > allowed:
+                chunk = chunk[:allowed]
+                on_exceeded()
+        if chunk:
+            sink(chunk)
+            if tail is not None:
+                tail[:] = (tail + chunk)[-_TAIL:]
+    src.close()
+
+
+def _writer(stream):
+    out = getattr(stream, 'buffer', stream)
+
+    def write(chunk):
+        out.write(chunk)
+        out.flush()
+    return write
+
+
+def run_limited(cmd, cwd=None, env=None, stdin=None, limits=None, capture=False):
+    """
+    Run cmd under limits (a Limits; None for the defaults) and return a Measurement
+    whose .verdict is a VERDICTS key. stdin: file object, bytes, or None for no input
+    (never the terminal: the child is not in the foreground process group). Output
+    is relayed to sys.stdout/sys.stderr as it arrives, or collected as bytes into
+    .stdout/.stderr when capture. max_rss_kb here includes grind's own footprint
+    (see run_measured); it is not a measurement of the solution.
+    """
+    limits = limits or Limits()
+    java = _is_java(cmd)
+    if java and limits.memory:
+        cmd = [cmd[0], f'-Xmx{limits.memory // (1024 * 1024)}m', *cmd[1:]]   # the JVM reserves far more than it uses
+    data = None
+    if isinstance(stdin, bytes):
+        data, stdin = stdin, tempfile.TemporaryFile()
+        stdin.write(data)
+        stdin.seek(0)
+    elif stdin is None:
+        stdin = subprocess.DEVNULL
+
+    reasons = []
+
+    def kill(reason):
+        reasons.append(reason)
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    collected = ([], []) if capture else None
+    sinks = ((collected[0].append, collected[1].append) if capture
+             else (_writer(sys.stdout), _writer(sys.stderr)))
+    budget = [limits.output] if limits.output else None
+    tail = bytearray()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        start = time_module.perf_counter()
+        proc  = subprocess.Popen(_limited_command(cmd, limits, not java), cwd=cwd, env=env, stdin=stdin,
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True)
+        pumps = [threading.Thread(target=_pump, args=(proc.stdout, sinks[0], budget, lambda: kill('output'))),
+                 threading.Thread(target=_pump, args=(proc.stderr, sinks[1], budget, lambda: kill('output'),
+                                                      tail))]
+        for t in pumps:
+            t.start()
+        timer = None
+        if limits.time:
+            timer = threading.Timer(limits.time, lambda: kill('time'))
+            timer.start()
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+        except KeyboardInterrupt:
+            kill('interrupt')
+            proc.wait()
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)      # anything the solution left running
+            except (ProcessLookupError, PermissionError):
+                pass
+            for t in pumps:
+                t.join()
+        wall = time_module.perf_counter() - start
+        proc.returncode = _exit_code(status)
+        m = Measurement(proc.returncode, wall, usage.ru_utime, usage.ru_stime, _rss_kb(usage.ru_maxrss),
+                        timed_out='time' in reasons)
+        m.verdict = _verdict(m, reasons, bytes(tail), limits)
+        if capture:
+            m.stdout, m.stderr = b''.join(collected[0]), b''.join(collected[1])
+        return m
+    finally:
+        if data is not None:
+            stdin.close()
+
+
+def _verdict(m, reasons, stderr_tail, limits):
+    if 'time' in reasons:
+        return 'TLE'
+    if ('output' in reasons or m.code == -signal.SIGXFSZ
+            or m.code != 0 and any(marker in stderr_tail for marker in OUTPUT_ERRORS)):
+        return 'OLE'
+    if m.code == -signal.SIGXCPU or (m.code == -signal.SIGKILL and limits.cpu and m.cpu >= limits.cpu):
+        return 'TLE'
+    if m.code != 0 and any(marker in stderr_tail for marker in MEMORY_ERRORS):
+        return 'MLE'
+    return 'RE' if m.code != 0 else 'OK'
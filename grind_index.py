@@ -0,0 +1,293 @@
+"""
+grind_index — derived indexes over attempt history, persisted in .memory_index.json.
+
+The index is a cache: it is stamped with a signature of the storage it was built
+from (file mtimes/sizes, or the attempts table's row count and max id) and is
+rebuilt from full history (archive + live) whenever that signature no longer
+matches. grind_data owns the signature and the write paths; this module only
+knows how to fold rows into the index and (de)serialize it.
+
+  slugs   slug → latest schedule state: topic, difficulty, ease, interval (days),
+          repetition (attempts logged so far), last_date, next_review
+  due     binary min-heap of [next_review, slug], one push per logged attempt.
+          Entries whose date no longer matches the slug's latest next_review are
+          stale and skipped; the heap is re-built once stale entries outnumber live ones.
+  gap     per-topic running sums behind compute_gap_scores, over live (unarchived)
+          attempts only — see GapAccumulators.
+"""
+import os
+import json
+import math
+import heapq
+from datetime import date
+
+VERSION = 3
+
+GAP_DECAY_DAYS = 30.0
+
+
+def _interval_days(value):
+    try:
+        return int(str(value).rstrip('d') or 0)
+    except ValueError:
+        return 0
+
+
+def _review_date(value):
+    """next_review as a date, or None if it is not YYYY-MM-DD."""
+    try:
+        return date.fromisoformat(value) if len(value) == 10 else None
+    except (TypeError, ValueError):
+        return None
+
+
+class ScheduleIndex:
+    """
+    Latest SM-2 state per slug plus a due-date heap over it.
+    record() is O(log n); rows must arrive oldest first.
+    """
+
+    def __init__(self, slugs=None, due=None):
+        self.slugs = slugs if slugs is not None else {}
+        self.due   = due if due is not None else self._heap()
+
+    def _heap(self):
+        due = [[st['next_review'], slug] for slug, st in self.slugs.items()
+               if _review_date(st['next_review'])]
+        heapq.heapify(due)
+        return due
+
+    @classmethod
+    def from_rows(cls, rows):
+        index = cls()
+        for r in rows:
+            index.record(r)
+        return index
+
+    def record(self, row):
+        prev = self.slugs.get(row['slug'])
+        self.slugs[row['slug']] = {
+            'topic':       row.get('topic', ''),
+            'difficulty':  row.get('difficulty', ''),
+            'ease':        float(row.get('ease') or 2.5),
+            'interval':    _interval_days(row.get('interval', '')),
+            'repetition':  (prev['repetition'] if prev else 0) + 1,
+            'last_date':   row.get('date', ''),
+            'next_review': row.get('next_review', ''),
+        }
+        if _review_date(row.get('next_review', '')):
+            heapq.heappush(self.due, [row['next_review'], row['slug']])
+            if len(self.due) > 2 * len(self.slugs) + 16:
+                self.due = self._heap()
+
+    def iter_due(self, until=None):
+        """
+        Live heap entries in next_review order (most overdue first), stopping after
+        until (YYYY-MM-DD). Best-first walk of the heap array: yielding k entries
+        costs O(k log k) and leaves the heap untouched.
+        """
+        heap     = self.due
+        frontier = [(heap[0], 0)] if heap else []
+        seen     = set()
+        while frontier:
+            (nr, slug), i = heapq.heappop(frontier)
+            if until is not None and nr > until:
+                return
+            for c in (2 * i + 1, 2 * i + 2):
+                if c < len(heap):
+                    heapq.heappush(frontier, (heap[c], c))
+            st = self.slugs.get(slug)
+            if st is not None and st['next_review'] == nr and slug not in seen:
+                seen.add(slug)
+                yield slug, st
+
+    def due_reviews(self, today, limit=None, topic=None):
+        """[(slug, topic, days_overdue)] for reviews due on or before today, most overdue first."""
+        due = []
+        for slug, st in self.iter_due(today.isoformat()):
+            if topic is not None and st['topic'] != topic:
+                continue
+            due.append((slug, st['topic'], (today - _review_date(st['next_review'])).days))
+            if limit is not None and len(due) >= limit:
+                break
+        return due
+
+    def get(self, slug):
+        return self.slugs.get(slug)
+
+    def __contains__(self, slug):
+        return slug in self.slugs
+
+    def __len__(self):
+        return len(self.slugs)
+
+    # --- persistence ---
+
+    def to_dict(self):
+        return {'slugs': self.slugs, 'due': self.due}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('slugs', {}), d.get('due'))
+
+
+class GapAccumulators:
+    """
+    Running per-topic sums for the gap-score decay weight exp(-max(0, today - next_review) / 30),
+    plus the attempt count n and plain rating sum s.
+
+    An attempt whose next_review is on or before the anchor date is folded into
+    w = Σ exp((next_review - anchor) / 30) and rw = Σ rating · (same); moving to a
+    later day only scales both by exp(-(today - anchor) / 30). Attempts reviewed
+    after the anchor still weigh 1 and wait in per-date pending buckets until
+    settle() moves the anchor past them. Attempts with no parseable next_review
+    weigh 1 forever and live in the '-' bucket.
+    """
+
+    def __init__(self, anchor, topics=None):
+        self.anchor = anchor                     # YYYY-MM-DD
+        self.topics = topics if topics is not None else {}
+
+    @classmethod
+    def from_rows(cls, rows, today):
+        acc = cls(today.isoformat())
+        for r in rows:
+            acc.record(r)
+        return acc
+
+    def _apply(self, row, sign):
+        topic, rating = row.get('topic'), row.get('rating')
+        if not topic or not rating:
+            return
+        t  = self.topics.setdefault(topic, {'n': 0, 's': 0, 'w': 0.0, 'rw': 0.0, 'pending': {}})
+        nr = _review_date(row.get('next_review', ''))
+        t['n'] += sign
+        t['s'] += sign * rating
+        if nr is not None and nr.isoformat() <= self.anchor:
+            e = math.exp((nr - date.fromisoformat(self.anchor)).days / GAP_DECAY_DAYS)
+            t['w']  += sign * e
+            t['rw'] += sign * rating * e
+        else:
+            key    = nr.isoformat() if nr is not None else '-'
+            bucket = t['pending'].setdefault(key, [0, 0])
+            bucket[0] += sign
+            bucket[1] += sign * rating
+            if not bucket[0]:
+                del t['pending'][key]
+        if not t['n']:
+            del self.topics[topic]
+
+    def record(self, row):
+        self._apply(row, 1)
+
+    def remove(self, row):
+        """Undo record(row) — used when attempts are archived."""
+        self._apply(row, -1)
+
+    def settle(self, today):
+        """Advance the anchor to today, folding due pending buckets into the decayed sums."""
+        if today.isoformat() <= self.anchor:
+            return
+        f = math.exp(-(today - date.fromisoformat(self.anchor)).days / GAP_DECAY_DAYS)
+        for t in self.topics.values():
+            t['w'] *= f
+            t['rw'] *= f
+            for key in [k for k in t['pending'] if k != '-' and k <= today.isoformat()]:
+                count, rsum = t['pending'].pop(key)
+                e = math.exp(-(today - date.fromisoformat(key)).days / GAP_DECAY_DAYS)
+                t['w']  += count * e
+                t['rw'] += rsum * e
+        self.anchor = today.isoformat()
+
+    def totals(self, today):
+        """
+        {topic: (n, weight_sum, weighted_rating_sum)} as of today, or None when today
+        is before the anchor (the sums can't be decayed backwards).
+        """
+        if today.isoformat() < self.anchor:
+            return None
+        f   = math.exp(-(today - date.fromisoformat(self.anchor)).days / GAP_DECAY_DAYS)
+        out = {}
+        for topic, t in self.topics.items():
+            w, rw = t['w'] * f, t['rw'] * f
+            for key, (count, rsum) in t['pending'].items():
+                e = 1.0
+                if key != '-' and key <= today.isoformat():
+                    e = math.exp(-(today - date.fromisoformat(key)).days / GAP_DECAY_DAYS)
+                w  += count * e
+                rw += rsum * e
+            out[topic] = (t['n'], w, rw)
+        return out
+
+    def rating_totals(self):
+        """{topic: (n, plain rating sum)} — undecayed, for averages shown to the user."""
+        return {topic: (t['n'], t['s']) for topic, t in self.topics.items()}
+
+    def to_dict(self):
+        return {'anchor': self.anchor, 'topics': self.topics}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['anchor'], d.get('topics', {}))
+
+
+class MemoryIndex:
+    """Everything persisted in .memory_index.json."""
+
+    def __init__(self, schedule, gap):
+        self.schedule = schedule
+        self.gap      = gap
+
+    @classmethod
+    def build(cls, archived, live, today):
+        return cls(ScheduleIndex.from_rows(archived + live), GapAccumulators.from_rows(live, today))
+
+    def record(self, row, today):
+        self.schedule.record(row)
+        self.gap.settle(today)
+        self.gap.record(row)
+
+    def to_dict(self):
+        return {**self.schedule.to_dict(), 'gap': self.gap.to_dict()}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(ScheduleIndex.from_dict(d), GapAccumulators.from_dict(d['gap']))
+
+
+def load(path, sig):
+    """The persisted index if it was stamped with sig, else None."""
+    try:
+        with open(path) as f:
+            d = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(d, dict) or d.get('version') != VERSION or d.get('sig') != sig:
+        return None
+    try:
+        return MemoryIndex.from_dict(d)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save(path, index, sig):
+    """Atomic write (tmp + os.replace). A failed write only costs a rebuild later."""
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'w') as f:
+            json.dump({'version': VERSION, 'sig': sig, **index.to_dict()}, f, separators=(',', ':'))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def stamp(path, old_sig, new_sig, archived=()):
+    """
+    Re-stamp an index whose storage changed shape but not content (compaction), or
+    whose archived rows just left the live history (their gap contributions are removed).
+    """
+    index = load(path, old_sig)
+    if index is not None:
+        for r in archived:
+            index.gap.remove(r)
+        save(path, index, new_sig)
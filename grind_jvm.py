@@ -0,0 +1,183 @@
+"""
+grind_jvm — warm JVM for running Java solutions (`grind jvm`, utils/java/GrindRunner.java).
+
+`grind jvm` compiles GrindRunner and LcUtils into the build cache and keeps one
+JVM listening on .grind_jvm.sock. While it answers, `grind run` on a .java file
+sends the solution path, its build key and input.txt instead of spawning javac
+and a fresh JVM; the runner compiles in memory (cached by key), runs main() and
+returns stdout, stderr, the exit code and its compile/run timings.
+
+run() returns None when no runner answers, and the caller falls back to javac +
+java. A solution whose source calls System.exit (or Runtime exit/halt) is never
+sent, since it would take the runner down with it; calls_exit() tells the
+caller to run it cold. Once a request is sent the solution has run (or started
+to), so a runner that then exits answers EXITED from its shutdown hook, and
+one that vanishes without answering is reported as a failed run — never re-run
+cold. Wire format is documented in GrindRunner.java.
+"""
+import os
+import re
+import time
+import struct
+import subprocess
+
+import grind_paths as _gp
+import grind_build
+
+OP_RUN, OP_PING, OP_STOP = 0, 1, 2
+
+RUNNER_CLASS   = 'utils.java.GrindRunner'
+CLIENT_TIMEOUT = 120.0   # seconds; longer than the runner's own main() timeout
+RUN_TIMEOUT    = 60      # seconds main() may run before the runner gives up and exits
+TIMED_OUT      = 124     # exit code the runner reports for a main() past its wall/CPU limit
+EXITED         = 125     # main() exited the JVM (the runner answered from its shutdown hook)
+OUTPUT_LIMITED = 153     # main() wrote past the output limit and was stopped
+LOST           = 1       # the runner took the request and vanished without answering
+
+_EXIT_CALL = re.compile(rb'\bSystem\s*\.\s*exit\s*\(|\bgetRuntime\s*\(\s*\)\s*\.\s*(?:exit|halt)\s*\(')
+
+_INT  = struct.Struct('>i')
+_HEAD = struct.Struct('>ibbqq')
+_LIMITS = struct.Struct('>qqq')   # time_ms, cpu_ms, output_bytes; 0 = runner default / unlimited
+
+
+class RunnerLost(OSError):
+    """The runner accepted a request and closed the connection without a full answer."""
+
+
+def calls_exit(source):
+    """True if the solution's text calls System.exit or Runtime.getRuntime().exit/halt."""
+    try:
+        with open(source, 'rb') as f:
+            return bool(_EXIT_CALL.search(f.read()))
+    except OSError:
+        return False
+
+
+def _runner_sources():
+    java = os.path.join(_gp.PROJECT_ROOT, 'utils', 'java')
+    return [os.path.join(java, 'GrindRunner.java'), os.path.join(java, 'LcUtils.java')]
+
+
+def runner_classes():
+    """Build-cache entry holding GrindRunner + LcUtils classes, or None if javac failed."""
+    sources = _runner_sources()
+    key     = grind_build.build_key('jvm-runner', grind_build._compiler_id(grind_build.JAVA_COMPILER),
+                                    *(grind_build._file_digest(s) for s in sources))
+    entry   = grind_build.lookup(key)
+    if entry:
+        return entry
+
+    def compile_into(out_dir):
+        cmd = [grind_build.JAVA_COMPILER, '-d', out_dir, *sources]
+        return subprocess.run(cmd).returncode == 0
+
+    return grind_build.store(key, compile_into)
+
+
+def serve(path=None, idle_timeout=None, heap=None):
+    """
+    Run the warm JVM in the foreground until stopped or idle for idle_timeout seconds,
+    with a heap of at most heap bytes (every run shares it). Returns the java exit
+    code. Raises RuntimeError if one is already running or the runner cannot be built.
+    """
+    path = path or _gp.JVM_SOCKET_FILE
+    if os.path.exists(path):
+        if is_running(path):
+            raise RuntimeError(f"a warm JVM is already listening on {path}")
+        os.remove(path)
+    entry = runner_classes()
+    if not entry:
+        raise RuntimeError("could not compile GrindRunner (needs a JDK, Java 16+)")
+    heap_flags = [f'-Xmx{heap // (1024 * 1024)}m'] if heap else []
+    cmd = ['java', *heap_flags, '-cp', entry, RUNNER_CLASS, path, str(int(idle_timeout or 0)), str(RUN_TIMEOUT)]
+    return subprocess.run(cmd).returncode
+
+
+# --- client ---
+
+def _pack_bytes(b):
+    return _INT.pack(len(b)) + b
+
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("runner closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def _request(payload, path, timeout=CLIENT_TIMEOUT):
+    """
+    Send one request and read the response. Raises OSError if no runner took it,
+    RunnerLost if one took it and then went away (or stopped answering).
+    """
+    import socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        s.connect(path)
+        s.sendall(payload)
+        try:
+            code, compiled, cached, compile_us, run_us = _HEAD.unpack(_recv_exact(s, _HEAD.size))
+            stdout = _recv_exact(s, _INT.unpack(_recv_exact(s, 4))[0])
+            stderr = _recv_exact(s, _INT.unpack(_recv_exact(s, 4))[0])
+        except OSError as e:
+            raise RunnerLost(str(e)) from e
+    return {'code': code, 'compiled': bool(compiled), 'cached': bool(cached),
+            'compile_ms': compile_us / 1000, 'run_ms': run_us / 1000,
+            'stdout': stdout, 'stderr': stderr}
+
+
+def _ms(seconds):
+    return int(seconds * 1000) if seconds else 0
+
+
+def run(source, classname, stdin=b'', path=None, limits=None):
+    """
+    Compile and run a solution on the warm JVM. Returns the response dict plus
+    'round_trip_ms', or None when no runner took the request (run it cold instead).
+    A runner lost mid-request gives code LOST and an explanation in stderr.
+    limits (a grind_exec.Limits) caps main()'s wall time, its thread's CPU time and
+    stdout + stderr; without them the runner's RUN_TIMEOUT applies and output is uncapped.
+    """
+    path = path or _gp.JVM_SOCKET_FILE
+    if not os.path.exists(path) or calls_exit(source):
+        return None
+    payload = (_INT.pack(OP_RUN)
+               + _pack_bytes(grind_build.java_key(source, classname).encode())
+               + _pack_bytes(classname.encode())
+               + _pack_bytes(os.path.abspath(source).encode())
+               + _pack_bytes(stdin)
+               + _LIMITS.pack(_ms(limits and limits.time), _ms(limits and limits.cpu),
+                              int(limits and limits.output or 0)))
+    timeout = CLIENT_TIMEOUT + ((limits.time or 0) if limits else 0)
+    start = time.perf_counter()
+    try:
+        resp = _request(payload, path, timeout)
+    except RunnerLost as e:
+        resp = {'code': LOST, 'compiled': True, 'cached': False, 'compile_ms': 0.0, 'run_ms': 0.0,
+                'stdout': b'', 'stderr': f"grind: the warm JVM stopped during the run ({e}); "
+                                        f"not re-running it cold\n".encode()}
+    except OSError:
+        return None
+    resp['round_trip_ms'] = (time.perf_counter() - start) * 1000
+    return resp
+
+
+def is_running(path=None):
+    try:
+        return _request(_INT.pack(OP_PING), path or _gp.JVM_SOCKET_FILE)['code'] == 0
+    except OSError:
+        return False
+
+
+def stop(path=None):
+    """Ask a running warm JVM to exit. Returns True if one answered."""
+    try:
+        _request(_INT.pack(OP_STOP), path or _gp.JVM_SOCKET_FILE)
+        return True
+    except OSError:
+        return False
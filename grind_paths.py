@@ -9,8 +9,18 @@ _HERE = os.path.dirname(os.path.realpath(__file__))
 PROJECT_ROOT      = _HERE
 MEMORY_FILE       = os.path.join(_HERE, 'memory.md')
 ARCHIVE_FILE      = os.path.join(_HERE, 'memory_archive.md')
+JOURNAL_FILE      = os.path.join(_HERE, 'memory.journal.jsonl')
 CONFIG_FILE       = os.path.join(_HERE, '.lc_config.json')
 SESSION_FILE      = os.path.join(_HERE, '.session.json')
 BEHAVIOR_FILE     = os.path.join(_HERE, 'behavior.jsonl')
+DB_FILE           = os.path.join(_HERE, 'grind.db')
+INDEX_FILE        = os.path.join(_HERE, '.memory_index.json')
+ROLLUP_FILE       = os.path.join(_HERE, '.behavior_rollup.json')
+SOCKET_FILE       = os.path.join(_HERE, '.grind.sock')
+JVM_SOCKET_FILE   = os.path.join(_HERE, '.grind_jvm.sock')
+POOL_SOCKET_FILE  = os.path.join(_HERE, '.grind_pool.sock')
 PROBLEMS_FILE     = os.path.join(_HERE, 'problems.json')
+BUILD_DIR         = os.path.join(_HERE, '.grind_build')
 ARCHIVE_THRESHOLD = 50
+JOURNAL_THRESHOLD = 20
+BUILD_CACHE_LIMIT = 256 * 1024 * 1024   # bytes of cached binaries/classes before LRU eviction
@@ -0,0 +1,358 @@
+"""
+grind_pool — pre-forked Python workers for `grind run` on .py solutions (`grind pool`).
+
+The pool master imports utils.python.lc_utils and the stdlib modules solutions
+usually reach for (PRELOAD), binds .grind_pool.sock and forks `workers`
+children that all block in accept() on it. A client passes its stdin (input.txt),
+stdout and stderr file descriptors over the socket (SCM_RIGHTS); the worker
+puts them on fds 0-2 and runs the solution with runpy in a fresh __main__
+namespace, so output streams straight to the terminal as it would from a
+`python3` subprocess. A worker exits after max_runs runs (1 by default: every
+run gets a pristine fork) and the master forks its replacement right away.
+Between runs of a reused worker, cwd, argv, sys.path and any modules the
+solution imported are rolled back.
+
+Protocol: one request per connection. The client sends {"op": "run", "path",
+"cwd", "limits"?} with three fds; the worker answers {"pid": N} when it starts
+and {"code": N, "verdict": V} when the solution returns. {"op": "ping"} /
+{"op": "stop"} are control requests answered with {"code": 0}.
+
+Limits: the worker lowers its soft CPU, address-space and file-size rlimits
+for the run and restores them afterwards; SIGXCPU and MemoryError become TLE
+and MLE verdicts. The wall-clock limit is the client's: it SIGKILLs the
+worker, and the master forks a replacement. Output goes straight to the
+caller's fds, so it is only capped when it goes to a file.
+
+The client half is imported on every `grind run`, so socket and json are only
+imported once a socket file shows a pool may be listening.
+"""
+import os
+import sys
+
+import grind_paths as _gp
+
+PRELOAD = (
+    'collections', 'heapq', 'bisect', 'itertools', 'functools', 'math', 're', 'string',
+    'typing', 'json', 'dataclasses', 'operator', 'random', 'pprint', 'runpy', 'traceback',
+    'utils.python.lc_utils',
+)
+
+DEFAULT_WORKERS = 2
+
+
+# --- client ---
+
+def _request(obj, path, fds=None):
+    """Send one request; returns (socket file for reading replies, socket). Raises OSError."""
+    import json
+    import socket
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.connect(path)
+        data = json.dumps(obj).encode() + b'\n'
+        if fds:
+            socket.send_fds(s, [data], fds)
+        else:
+            s.sendall(data)
+        return s.makefile('rb'), s
+    except OSError:
+        s.close()
+        raise
+
+
+def _reply(f):
+    import json
+    line = f.readline()
+    if not line:
+        raise ConnectionError("pool worker closed the connection")
+    return json.loads(line)
+
+
+def run(source, stdin_fd=0, path=None, limits=None):
+    """
+    Run a solution on a pool worker with this process's stdout/stderr. Returns
+    {'code', 'verdict'} (verdict: a grind_exec.VERDICTS key), or None when no
+    worker picked it up (run it cold instead). limits: a grind_exec.Limits.
+    """
+    import signal
+    import socket
+    path = path or _gp.POOL_SOCKET_FILE
+    if not os.path.exists(path):
+        return None
+    sys.stdout.flush()
+    sys.stderr.flush()
+    req = {'op': 'run', 'path': os.path.abspath(source), 'cwd': os.getcwd()}
+    if limits:
+        req['limits'] = {'cpu': limits.cpu, 'memory': limits.memory, 'output': limits.output}
+    try:
+        f, s = _request(req, path, [stdin_fd, 1, 2])
+    except OSError:
+        return None
+    with s, f:
+        try:
+            pid = _reply(f)['pid']
+        except (OSError, ValueError):
+            return None                         # never started: nothing ran yet
+        if limits and limits.time:
+            s.settimeout(limits.time)
+        try:
+            reply = _reply(f)
+            return {'code': reply['code'], 'verdict': reply['verdict']}
+        except KeyboardInterrupt:
+            os.kill(pid, signal.SIGINT)         # the worker is not in our process group
+            raise
+        except socket.timeout:
+            os.kill(pid, signal.SIGKILL)
+            return {'code': -signal.SIGKILL, 'verdict': 'TLE'}
+        except (OSError, ValueError):
+            return {'code': 1, 'verdict': 'RE'}  # worker died mid-run (os._exit, crash)
+
+
+def is_running(path=None):
+    try:
+        f, s = _request({'op': 'ping'}, path or _gp.POOL_SOCKET_FILE)
+        with s, f:
+            return _reply(f).get('code') == 0
+    except (OSError, ValueError):
+        return False
+
+
+def stop(path=None):
+    """Ask a running pool to exit. Returns True if one answered."""
+    try:
+        f, s = _request({'op': 'stop'}, path or _gp.POOL_SOCKET_FILE)
+        with s, f:
+            _reply(f)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+# --- worker ---
+
+def _solution_traceback(exc, source):
+    """Print exc like `python3 source` would: frames from the solution down, runpy's hidden."""
+    import traceback
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename != source:
+        tb = tb.tb_next
+    traceback.print_exception(type(exc), exc, tb or exc.__traceback__)
+
+
+class _CpuLimit(BaseException):
+    """Raised from the SIGXCPU handler; a BaseException so the solution's `except Exception` misses it."""
+
+
+def _on_xcpu(signum, frame):
+    raise _CpuLimit()
+
+
+def _set_limits(limits):
+    """Lower the soft rlimits for one run. Returns [(resource, previous limits)] to restore."""
+    import math
+    import resource
+    saved = []
+
+    def lower(res, value):
+        soft, hard = resource.getrlimit(res)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(res, (value, hard))
+        saved.append((res, (soft, hard)))
+
+    if limits.get('cpu'):
+        used = resource.getrusage(resource.RUSAGE_SELF)    # a reused worker has spent some already
+        lower(resource.RLIMIT_CPU, math.ceil(used.ru_utime + used.ru_stime + limits['cpu']))
+    if limits.get('memory'):
+        lower(resource.RLIMIT_AS, int(limits['memory']))
+    if limits.get('output'):
+        lower(resource.RLIMIT_FSIZE, int(limits['output']))
+    return saved
+
+
+def _run(req, fds):
+    """
+    Run one solution in this process on the client's stdin/stdout/stderr.
+    Returns (exit code, verdict).
+    """
+    import errno
+    import signal
+    import runpy
+    import resource
+    source = req['path']
+    saved  = [os.dup(fd) for fd in (0, 1, 2)]
+    for fd, target in zip(fds, (0, 1, 2)):
+        os.dup2(fd, target)
+        os.close(fd)
+    state = (os.getcwd(), sys.argv, list(sys.path), set(sys.modules),
+             sys.stdin, sys.stdout, sys.stderr)
+    streams = (open(0, 'r', closefd=False),
+               open(1, 'w', buffering=1 if os.isatty(1) else -1, closefd=False),
+               open(2, 'w', buffering=1, closefd=False))
+    sys.stdin, sys.stdout, sys.stderr = streams
+    code, verdict = 0, None
+    saved_limits = []
+    try:
+        os.chdir(req.get('cwd') or os.path.dirname(source))
+        sys.argv = [source]
+        sys.path[:0] = [os.path.dirname(source), _gp.PROJECT_ROOT]
+        saved_limits = _set_limits(req.get('limits') or {})
+        runpy.run_path(source, run_name='__main__')
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except _CpuLimit:
+        code, verdict = -signal.SIGXCPU, 'TLE'
+    except BaseException as e:
+        _solution_traceback(e, source)
+        code = 1
+        if isinstance(e, MemoryError):
+            verdict = 'MLE'
+        elif isinstance(e, OSError) and e.errno == errno.EFBIG:
+            verdict = 'OLE'
+    finally:
+        for res, limit in saved_limits:
+            resource.setrlimit(res, limit)
+        for stream in streams:
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+        cwd, sys.argv, sys.path[:], modules, sys.stdin, sys.stdout, sys.stderr = state
+        os.chdir(cwd)
+        for name in set(sys.modules) - modules:
+            del sys.modules[name]
+        for fd, target in zip(saved, (0, 1, 2)):
+            os.dup2(fd, target)
+            os.close(fd)
+    return code, verdict or ('OK' if code == 0 else 'RE')
+
+
+def _worker(sock, wake, max_runs, master):
+    """Accept requests on the shared socket until max_runs solutions have run."""
+    import json
+    import signal
+    import socket
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGXCPU, _on_xcpu)
+    runs = 0
+    while runs < max_runs:
+        conn, _ = sock.accept()
+        os.write(wake, b'.')                    # activity: resets the master's idle clock
+        with conn:
+            try:
+                msg, fds, _, _ = socket.recv_fds(conn, 1 << 16, 3)
+                req = json.loads(msg)
+            except (OSError, ValueError):
+                continue
+            op = req.get('op', 'run')
+            if op != 'run' or len(fds) != 3:
+                for fd in fds:
+                    os.close(fd)
+                if op == 'run':
+                    continue                    # no fds to run on: closing tells the client to run cold
+                conn.sendall(b'{"code": 0}\n')
+                if op == 'stop':
+                    os.kill(master, signal.SIGTERM)
+                    os.write(wake, b'.')
+                continue
+            runs += 1
+            try:
+                conn.sendall(json.dumps({'pid': os.getpid()}).encode() + b'\n')
+                code, verdict = _run(req, fds)
+                conn.sendall(json.dumps({'code': code, 'verdict': verdict}).encode() + b'\n')
+            except OSError:
+                pass                            # client went away (Ctrl-C)
+
+
+# --- master ---
+
+def _preload():
+    import importlib
+    if _gp.PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _gp.PROJECT_ROOT)
+    for name in PRELOAD:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def serve(path=None, workers=DEFAULT_WORKERS, max_runs=1, idle_timeout=None, ready=None):
+    """
+    Keep `workers` pre-forked workers listening until stopped, interrupted, or idle
+    for idle_timeout seconds. ready: optional callable invoked once they are up.
+    """
+    import time
+    import select
+    import signal
+    import socket
+    path = path or _gp.POOL_SOCKET_FILE
+    if os.path.exists(path):
+        if is_running(path):
+            raise RuntimeError(f"a grind pool is already listening on {path}")
+        os.remove(path)
+    _preload()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    os.chmod(path, 0o600)
+    sock.listen(16)
+    wake_r, wake_w = os.pipe()
+    stopping  = []
+    prev_term = signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    master    = os.getpid()
+    children  = set()
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                os.close(wake_r)
+                _worker(sock, wake_w, max_runs, master)
+                os.write(wake_w, b'x')          # done: ask for a replacement
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children.add(pid)
+
+    try:
+        for _ in range(workers):
+            spawn()
+        if ready is not None:
+            ready()
+        last = time.monotonic()
+        while not stopping:
+            if select.select([wake_r], [], [], 1.0)[0]:
+                os.read(wake_r, 1024)
+                last = time.monotonic()
+            while children:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+                if not pid:
+                    break
+                children.discard(pid)
+                if not stopping:
+                    spawn()
+            if idle_timeout and time.monotonic() - last > idle_timeout:
+                break
+    finally:
+        signal.signal(signal.SIGTERM, prev_term)
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        sock.close()
+        os.close(wake_r)
+        os.close(wake_w)
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,387 @@
+"""
+grind_reports — the data behind grindcoach's read commands.
+
+Each *_report() returns plain dicts/lists: the grind_cmd_* modules render them as
+text, and --json / `grind context` print them as they are. Builders read stored
+state through a ReportData, so one snapshot can feed several reports.
+"""
+from datetime import datetime, timedelta
+from functools import cached_property
+from collections import defaultdict
+
+import grind_paths as _gp
+from grind_data import (
+    load_config, get_problem_bank, slug_to_topic, parse_memory, memory_index, behavior_rollup,
+)
+from grind_algos import compute_gap_scores, classify_gaps, behavior_patterns
+
+
+# ---------------------------------------------------------------------------
+# Report inputs (shared by the read commands and `grind context`)
+# ---------------------------------------------------------------------------
+
+class ReportData:
+    """
+    The stored state the report builders read, each piece loaded on first use and
+    kept for the life of the object. A builder called on its own makes a fresh one;
+    `grind context` hands one instance to every builder so memory, config, the
+    index and the behavior rollup are read once and derived views computed once.
+    """
+
+    def __init__(self, today=None, config=None):
+        self.today = today or datetime.now().date()
+        if config is not None:
+            self.config = config
+
+    @cached_property
+    def config(self):
+        return load_config()
+
+    @cached_property
+    def rows(self):
+        return parse_memory()
+
+    @cached_property
+    def latest(self):
+        """slug → its most recent live attempt."""
+        return {r['slug']: r for r in self.rows}
+
+    @cached_property
+    def bank(self):
+        return get_problem_bank(_gp.PROBLEMS_FILE)
+
+    @cached_property
+    def index(self):
+        return memory_index()
+
+    @cached_property
+    def due(self):
+        """[(slug, topic, days_overdue)], most overdue first."""
+        return self.index.schedule.due_reviews(self.today)
+
+    @cached_property
+    def overrides(self):
+        return self.config.get('gap_overrides', {})
+
+    @cached_property
+    def gap_scores(self):
+        totals = self.index.gap.totals(self.today)
+        if totals is None:
+            return compute_gap_scores(self.rows, self.overrides, self.today)
+        return classify_gaps(totals, self.overrides)
+
+    @cached_property
+    def rating_totals(self):
+        """topic → (attempt count, rating sum) over live rated attempts."""
+        return self.index.gap.rating_totals()
+
+    @cached_property
+    def rollup(self):
+        return behavior_rollup()
+
+    @cached_property
+    def patterns(self):
+        return behavior_patterns(self.rollup) if self.rollup['events'] else {}
+
+
+# ---------------------------------------------------------------------------
+# TARGET
+# ---------------------------------------------------------------------------
+
+def _days_until(date_s, today):
+    try:
+        return (datetime.strptime(date_s, '%Y-%m-%d').date() - today).days
+    except (TypeError, ValueError):
+        return None
+
+
+def target_list_report(config, today=None):
+    """Targets in insertion order with days until each interview (`target list --json`)."""
+    today  = today or datetime.now().date()
+    active = config.get('active_target') or None
+    return {'active': active, 'targets': [
+        {'id': tid, 'company': t['company'], 'role': t['role'],
+         'interview_date': t.get('interview_date', ''),
+         'days_until': _days_until(t.get('interview_date', ''), today), 'active': tid == active}
+        for tid, t in config.get('targets', {}).items()]}
+
+
+def target_summary(config, tid, today):
+    """Interview countdown and plan progress for target tid."""
+    t = config.get('targets', {}).get(tid, {})
+    target = {'id': tid, 'company': t.get('company', ''),
+              'interview_date': t.get('interview_date', ''), 'days_until': None, 'plan': None}
+    try:
+        target['days_until'] = (datetime.strptime(target['interview_date'], '%Y-%m-%d').date() - today).days
+    except ValueError:
+        pass
+    plan = t.get('plan', {})
+    if plan.get('days'):
+        target['plan'] = {'days_total':      len(plan['days']),
+                          'days_completed':  sum(1 for d in plan['days'] if d.get('completed')),
+                          'mocks_completed': plan.get('mock_sessions_completed', 0),
+                          'mocks_target':    plan.get('mock_sessions_target', 3)}
+    return target
+
+
+# ---------------------------------------------------------------------------
+# BEHAVIOR
+# ---------------------------------------------------------------------------
+
+_COACHING_ADJUSTMENTS = (
+    ('quick_give_up', "waiting longer before engaging on silence"),
+    ('hint_negative', "stepping further back when hints don't help"),
+    ('overconfident', "will surface calibration question after self-rating"),
+)
+
+
+def behavior_summary_report(data=None):
+    """Per-topic behavior patterns and the coaching adjustments they imply (`behavior summary --json`)."""
+    data        = data or ReportData()
+    patterns    = data.patterns
+    adjustments = [{'topic': topic, 'flag': flag, 'adjustment': text}
+                   for topic, p in patterns.items()
+                   for flag, text in _COACHING_ADJUSTMENTS if flag in p['flags']]
+    return {'events': data.rollup['events'], 'patterns': patterns, 'adjustments': adjustments}
+
+
+# ---------------------------------------------------------------------------
+# GAP
+# ---------------------------------------------------------------------------
+
+def gap_report(config=None, data=None):
+    """Gap status per topic with attempt counts and average rating (`grind gap show --json`)."""
+    data      = data or ReportData(config=config)
+    overrides = data.overrides
+    totals    = data.rating_totals
+    topics    = {}
+    for topic, status in sorted(data.gap_scores.items()):
+        n, total = totals.get(topic, (0, 0))
+        topics[topic] = {'status': status, 'attempts': n,
+                         'avg_rating': total / n if n else None, 'override': topic in overrides}
+    return {'topics': topics, 'overrides': overrides}
+
+
+# ---------------------------------------------------------------------------
+# PLAN
+# ---------------------------------------------------------------------------
+
+def plan_show_report(config, tid, today=None):
+    """Plan progress and the next 7 open days for target tid (`plan show --json`)."""
+    today_str = (today or datetime.now().date()).strftime('%Y-%m-%d')
+    target    = config['targets'][tid]
+    plan      = target['plan']
+    upcoming  = []
+    for d in plan['days']:
+        if d.get('completed'):
+            continue
+        if len(upcoming) >= 7:
+            break
+        focus = d.get('focus', d.get('type', ''))
+        upcoming.append({'day': d['day'], 'date': d['date'], 'type': d.get('type'), 'focus': focus,
+                         'problems': [{'slug': s, 'topic': slug_to_topic(s) or focus}
+                                      for s in d.get('problems', [])],
+                         'today': d['date'] == today_str, 'empty': d.get('empty', False)})
+    return {'target': tid, 'company': target['company'], 'role': target['role'],
+            'interview_date': target.get('interview_date', ''),
+            'days_remaining': plan.get('days_remaining', 0),
+            'days_total': len(plan['days']),
+            'days_completed': sum(1 for d in plan['days'] if d.get('completed')),
+            'upcoming': upcoming,
+            'mocks_completed': plan.get('mock_sessions_completed', 0),
+            'mocks_target': plan.get('mock_sessions_target', 3)}
+
+
+def plan_today_report(config, tid, today=None, data=None):
+    """
+    Today's plan day for target tid: up to 3 due reviews first, then the day's other
+    problems with their topic's gap status (`plan today --json`).
+    """
+    data      = data or ReportData(today, config)
+    today_str = data.today.strftime('%Y-%m-%d')
+    target    = config['targets'][tid]
+    plan      = target['plan']
+    report    = {'target': tid, 'company': target['company'], 'days_total': len(plan['days']),
+                 'completed': False, 'day': None, 'date': None, 'focus': None,
+                 'reviews': [], 'problems': []}
+    today_day = next(
+        (d for d in plan['days'] if d.get('date') == today_str and not d.get('completed')),
+        next((d for d in plan['days'] if not d.get('completed')), None)
+    )
+    if not today_day:
+        report['completed'] = True
+        return report
+
+    solved_slugs = data.latest
+    gap_scores   = data.gap_scores
+
+    # Deduplicated due-review list (most overdue first)
+    due        = data.due
+    review_set = {s for s, _, _ in due}
+    report.update({
+        'day': today_day['day'], 'date': today_day.get('date'),
+        'focus': today_day.get('focus', today_day.get('type', '')),
+        'reviews': [{'slug': s, 'topic': t, 'overdue_days': d, 'solved': s in solved_slugs}
+                    for s, t, d in due[:3]],
+        'problems': [{'slug': s, 'topic': slug_to_topic(s), 'gap': gap_scores.get(slug_to_topic(s)),
+                      'solved': s in solved_slugs}
+                     for s in today_day.get('problems', []) if s not in review_set],
+    })
+    return report
+
+
+# ---------------------------------------------------------------------------
+# PROGRESS  (enhanced with gap scores + behavioral patterns)
+# ---------------------------------------------------------------------------
+
+def progress_report(today=None, data=None):
+    """Everything `grind progress` shows, as plain data (also the --json document)."""
+    data          = data or ReportData(today)
+    today         = data.today
+    rows          = data.rows
+    config        = data.config
+    active_track  = config.get('active_track', 'blind75')
+    active_target = config.get('active_target')
+    report = {'attempts': len(rows), 'solved': 0, 'track': None, 'next_unsolved': None,
+              'streak': 0, 'target': None, 'due': [], 'gaps': {}, 'behavior': None}
+    if not rows:
+        return report
+
+    solve_dates = {datetime.strptime(r['date'], '%Y-%m-%d').date() for r in rows}
+    check = today
+    while check in solve_dates:
+        report['streak'] += 1
+        check -= timedelta(days=1)
+
+    unique_slugs     = data.latest
+    report['solved'] = len(unique_slugs)
+
+    bank = data.bank
+    t    = bank.track(active_track) if bank else None
+    if t:
+        report['track'] = {'id': active_track, 'name': t['name'], 'total': len(t['problems']),
+                           'solved': sum(1 for p in t['problems'] if p['slug'] in unique_slugs)}
+        p = next((p for p in t['problems'] if p['slug'] not in unique_slugs), None)
+        if p:
+            report['next_unsolved'] = {'slug': p['slug'], 'topic': p.get('topic', ''),
+                                       'difficulty': p.get('difficulty', '')}
+
+    if active_target:
+        report['target'] = target_summary(config, active_target, today)
+
+    report['due'] = [{'slug': s, 'topic': tp, 'overdue_days': d} for s, tp, d in data.due]
+
+    report['gaps'] = gap_report(data=data)['topics']
+
+    # Behavioral patterns (only if ≥5 events)
+    rollup = data.rollup
+    if rollup['events'] >= 5:
+        patterns = data.patterns
+        report['behavior'] = {
+            'events':    rollup['events'],
+            'concerns':  {t: p['flags'] for t, p in patterns.items()
+                          if any(f in p['flags'] for f in ['quick_give_up', 'hint_negative', 'overconfident'])},
+            'positives': [t for t, p in patterns.items() if 'hint_positive' in p['flags']],
+        }
+    return report
+
+
+# ---------------------------------------------------------------------------
+# STATS
+# ---------------------------------------------------------------------------
+
+def stats_report(topic=None, today=None):
+    """Weekly solve counts, rating trends and streaks (the `grind stats` data / --json document)."""
+    today  = today or datetime.now().date()
+    rows   = parse_memory()
+    report = {'topic': topic, 'logged': len(rows), 'attempts': 0, 'weekly': [],
+              'trends': {}, 'streak': {'current': 0, 'best': 0}}
+    if topic:
+        rows = [r for r in rows if r.get('topic') == topic]
+    report['attempts'] = len(rows)
+    if not rows:
+        return report
+
+    # --- Weekly solve rate (last 8 weeks, oldest first) ---
+    week_counts = defaultdict(int)
+    for r in rows:
+        try:
+            d = datetime.strptime(r['date'], '%Y-%m-%d').date()
+            weeks_ago = (today - d).days // 7
+            if weeks_ago < 8:
+                week_counts[weeks_ago] += 1
+        except ValueError:
+            pass
+    report['weekly'] = [{'weeks_ago': w, 'count': week_counts.get(w, 0)} for w in range(7, -1, -1)]
+
+    # --- Rating trend per topic (first 3 vs last 3 rated attempts) ---
+    topic_rows = defaultdict(list)
+    for r in rows:
+        if r.get('topic') and r.get('rating'):
+            topic_rows[r['topic']].append(r)
+    if topic:
+        topic_rows = {topic: [r for r in rows if r.get('rating')]}
+    for t in sorted(topic_rows):
+        tr = topic_rows[t]
+        if len(tr) >= 3:
+            report['trends'][t] = {'first': sum(r['rating'] for r in tr[:3]) / 3,
+                                   'last':  sum(r['rating'] for r in tr[-3:]) / 3}
+
+    # --- Streak stats ---
+    solve_dates = sorted({datetime.strptime(r['date'], '%Y-%m-%d').date()
+                          for r in rows if r.get('date')}, reverse=True)
+    current_streak, best_streak = 0, 0
+    if solve_dates:
+        # Current streak
+        check = today
+        for d in solve_dates:
+            if d == check or d == check - timedelta(days=1):
+                if d < check:
+                    check = d
+                current_streak += 1
+                check -= timedelta(days=1)
+            elif d < check:
+                break
+        # Best streak
+        streak, prev = 1, solve_dates[-1]
+        for d in reversed(solve_dates[:-1]):
+            if (d - prev).days == 1:
+                streak += 1
+                best_streak = max(best_streak, streak)
+            else:
+                streak = 1
+            prev = d
+        best_streak = max(best_streak, streak)
+    report['streak'] = {'current': current_streak, 'best': best_streak}
+    return report
+
+
+# ---------------------------------------------------------------------------
+# CONTEXT  (one read for agents at session start)
+# ---------------------------------------------------------------------------
+
+def context_report(today=None, data=None):
+    """
+    Active target, today's plan, due reviews, gap scores and the behavior summary in
+    one document. Every section reads the same ReportData, so memory, config, the
+    memory index and the behavior rollup are loaded once for the whole snapshot.
+    """
+    data     = data or ReportData(today)
+    config   = data.config
+    progress = progress_report(data=data)
+    tid      = config.get('active_target')
+    target   = config.get('targets', {}).get(tid) if tid else None
+    has_plan = bool(target and target.get('plan', {}).get('days'))
+    return {
+        'date':          data.today.strftime('%Y-%m-%d'),
+        'attempts':      progress['attempts'],
+        'solved':        progress['solved'],
+        'streak':        progress['streak'],
+        'track':         progress['track'],
+        'next_unsolved': progress['next_unsolved'],
+        'target':        target_summary(config, tid, data.today) if target else None,
+        'plan_today':    plan_today_report(config, tid, data=data) if has_plan else None,
+        'due':           [{'slug': s, 'topic': t, 'overdue_days': d} for s, t, d in data.due],
+        'gaps':          gap_report(data=data),
+        'behavior':      behavior_summary_report(data),
+    }
@@ -0,0 +1,74 @@
+"""
+grind_rollup — per-topic behavior aggregates, persisted in .behavior_rollup.json.
+
+compute_behavior_patterns only needs sums and counts, so those are kept here and
+updated as events are flushed instead of re-reading behavior.jsonl. Like the
+memory index, the rollup is stamped with a signature of the live event store and
+rebuilt from it when that no longer matches.
+
+  events   number of live events (every kind)
+  topics   topic → {time: [sum, n], level: [sum, n], effective: [hits, n],
+                    calibration: [sum of |self - expected|, n]}
+"""
+import os
+import json
+
+VERSION = 1
+
+
+def empty():
+    return {'events': 0, 'topics': {}}
+
+
+def add_event(rollup, e):
+    """Fold one event in, mirroring what compute_behavior_patterns reads from it."""
+    rollup['events'] += 1
+    ev = e.get('event', '')
+    if ev not in ('hint_given', 'hint_assessed', 'rating_calibration'):
+        return
+    t = rollup['topics'].setdefault(e.get('topic', 'unknown'), {})
+
+    def bump(key, value):
+        acc = t.setdefault(key, [0, 0])
+        acc[0] += value
+        acc[1] += 1
+
+    if ev == 'hint_given':
+        if 'time_to_hint_min' in e:
+            bump('time', e['time_to_hint_min'])
+        if 'hint_level' in e:
+            bump('level', e['hint_level'])
+    elif ev == 'hint_assessed':
+        bump('effective', 1 if e.get('effective', False) else 0)
+    else:
+        bump('calibration', abs(e.get('self_rating', 0) - e.get('expected_rating_from_hints', 0)))
+
+
+def from_events(events):
+    rollup = empty()
+    for e in events:
+        add_event(rollup, e)
+    return rollup
+
+
+def load(path, sig):
+    """The persisted rollup if it was stamped with sig, else None."""
+    try:
+        with open(path) as f:
+            d = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(d, dict) or d.get('version') != VERSION or d.get('sig') != sig:
+        return None
+    return {'events': d.get('events', 0), 'topics': d.get('topics', {})}
+
+
+def save(path, rollup, sig):
+    """Atomic write (tmp + os.replace). A failed write only costs a rebuild later."""
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'w') as f:
+            json.dump({'version': VERSION, 'sig': sig, **rollup}, f, separators=(',', ':'))
+        os.replace(tmp, path)
+    except OSError:
+        pass
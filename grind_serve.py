@@ -0,0 +1,215 @@
+"""
+grind_serve — keep one grind process warm and answer CLI invocations over a Unix socket.
+
+`grind serve` runs serve(); every other invocation first calls forward(), which
+ships argv to the daemon and replays its stdout, stderr and exit code, or returns
+None so the caller runs the command in-process instead. The daemon holds the
+process-level caches in grind_data (problem bank, memory index, behavior rollup,
+config); each is keyed on a file or table signature, so writes made by other
+processes are picked up on the next request.
+
+Protocol: one request per connection. The client sends a JSON object
+{"argv": [...], "cwd": "..."} (plus "stdin" for batch) and shuts down its write
+side; the server replies {"stdout": "...", "stderr": "...", "code": N} and
+closes. {"op": "ping"} and {"op": "stop"} are control requests.
+
+This module is imported before grind_data on every CLI call, so it must stay light:
+socket and json are imported only once a socket file shows a daemon may be listening.
+"""
+import os
+import sys
+
+import grind_paths as _gp
+
+# Commands that never prompt, spawn editors/compilers or speak; everything else runs locally.
+FORWARDED = frozenset({
+    'log', 'list', 'track', 'bank', 'storage', 'due', 'archive', 'progress',
+    'target', 'resume', 'session', 'behavior', 'gap', 'stats', 'plan', 'context', 'batch',
+})
+
+CLIENT_TIMEOUT = 120.0   # seconds to wait for the daemon to answer one request
+
+
+def command_of(argv):
+    """The subcommand name: the first argument that is not a global option like --json."""
+    return next((a for a in argv if not a.startswith('-')), None)
+
+
+def forwardable(argv):
+    cmd = command_of(argv)
+    if cmd not in FORWARDED:
+        return False
+    if cmd == 'behavior' and 'reset' in argv and '--force' not in argv:
+        return False                            # asks for confirmation on stdin
+    return True
+
+
+def _send(sock, obj):
+    import json
+    import socket
+    sock.sendall(json.dumps(obj).encode())
+    sock.shutdown(socket.SHUT_WR)
+
+
+def _recv(sock):
+    import json
+    chunks = []
+    while True:
+        chunk = sock.recv(1 << 16)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return json.loads(b''.join(chunks))
+
+
+def _request(obj, path):
+    """One round trip. Raises OSError/ValueError if the daemon is not there or misbehaves."""
+    import socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(CLIENT_TIMEOUT)
+        s.connect(path)
+        _send(s, obj)
+        return _recv(s)
+
+
+# --- client ---
+
+def forward(argv, path=None):
+    """
+    Run argv on the daemon and replay its output. Returns the exit code, or None
+    when the command should run in-process (no daemon, not forwardable, or
+    GRIND_NO_DAEMON set). Once a request has been sent it is never retried
+    locally, so a write is not applied twice.
+    """
+    path = path or _gp.SOCKET_FILE
+    if os.environ.get('GRIND_NO_DAEMON') or not forwardable(argv) or not os.path.exists(path):
+        return None
+    import socket
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.settimeout(CLIENT_TIMEOUT)
+        try:
+            s.connect(path)
+        except OSError:
+            return None                         # stale socket file: nobody listening
+        try:
+            req = {'argv': list(argv), 'cwd': os.getcwd()}
+            if command_of(argv) == 'batch':
+                req['stdin'] = sys.stdin.read()
+            _send(s, req)
+            resp = _recv(s)
+        except (OSError, ValueError) as e:
+            print(f"\033[91m[ERROR] grind daemon did not answer: {e}\033[0m", file=sys.stderr)
+            return 1
+    finally:
+        s.close()
+    sys.stdout.write(resp.get('stdout', ''))
+    sys.stdout.flush()
+    sys.stderr.write(resp.get('stderr', ''))
+    sys.stderr.flush()
+    return resp.get('code', 1)
+
+
+def is_running(path=None):
+    try:
+        return _request({'op': 'ping'}, path or _gp.SOCKET_FILE).get('code') == 0
+    except (OSError, ValueError):
+        return False
+
+
+def stop(path=None):
+    """Ask a running daemon to exit. Returns True if one answered."""
+    try:
+        _request({'op': 'stop'}, path or _gp.SOCKET_FILE)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+# --- server ---
+
+def capture(run, argv, cwd=None, stdin=None):
+    """
+    run(argv) with stdout/stderr captured (and stdin replaced by the given text).
+    Returns {'stdout', 'stderr', 'code'}, code being what the interpreter would exit with.
+    """
+    import io
+    import traceback
+    from contextlib import redirect_stdout, redirect_stderr
+    out, err, code = io.StringIO(), io.StringIO(), 0
+    home, real_stdin = os.getcwd(), sys.stdin
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                os.chdir(cwd or home)
+                if stdin is not None:
+                    sys.stdin = io.StringIO(stdin)
+                run(argv)
+            except SystemExit as e:
+                if e.code is None:
+                    code = 0
+                elif isinstance(e.code, int):
+                    code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.stdin = real_stdin
+        os.chdir(home)
+    return {'stdout': out.getvalue(), 'stderr': err.getvalue(), 'code': code}
+
+
+def serve(run, path=None, idle_timeout=None, ready=None):
+    """
+    Answer requests one at a time until stopped, interrupted, or idle for
+    idle_timeout seconds. run(argv) is grind's main(). Requests are handled
+    sequentially, so commands never interleave inside the daemon.
+    ready: optional callable invoked once the socket is listening.
+    """
+    import json
+    import socket
+    path = path or _gp.SOCKET_FILE
+    if os.path.exists(path):
+        if is_running(path):
+            raise RuntimeError(f"a grind daemon is already listening on {path}")
+        os.remove(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        os.chmod(path, 0o600)
+        sock.listen(16)
+        sock.settimeout(idle_timeout)
+        if ready is not None:
+            ready()
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                return
+            with conn:
+                conn.settimeout(CLIENT_TIMEOUT)
+                try:
+                    req = _recv(conn)
+                except (OSError, ValueError):
+                    continue
+                op = req.get('op')
+                if op == 'stop' and os.path.exists(path):
+                    os.remove(path)             # gone before the client hears back
+                if op in ('ping', 'stop'):
+                    resp = {'stdout': '', 'stderr': '', 'code': 0}
+                else:
+                    resp = capture(run, [str(a) for a in req.get('argv', [])],
+                                   req.get('cwd'), req.get('stdin'))
+                try:
+                    conn.sendall(json.dumps(resp).encode())
+                except OSError:
+                    pass
+                if op == 'stop':
+                    return
+    finally:
+        sock.close()
+        if os.path.exists(path):
+            os.remove(path)
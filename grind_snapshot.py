@@ -0,0 +1,359 @@
+"""
+grind_snapshot — compact binary snapshot of problems.json for fast cold start.
+
+The snapshot is compiled from problems.json the first time a process loads a
+changed bank, and later processes mmap it instead of parsing JSON. Layout
+(little-endian, u32 unless noted):
+
+  header    magic 'GCBS', u16 version, u16 reserved, u64 src mtime_ns, u64 src size,
+            section offsets: strings, records, tracks, slugs, topics, difficulties, all_topics
+  strings   n, offsets[n + 1], utf-8 blob              (interned slugs/topics/difficulties/names)
+  records   n, n × (slug, topic, difficulty, number)   (one per track entry, i32 number)
+  tracks    n, n × (key, name, description, first_record, count)
+  slugs     capacity, n_unique, capacity × (record + 1) (open addressing on crc32, first occurrence)
+  topics    n, n × (name, start, count), then record ids (deduplicated by slug)
+  diffs     same shape as topics
+  all       n, sorted topic string ids (every topic in every track)
+
+Banks with fields outside slug/topic/difficulty/number, or a number that does
+not fit the i32 field (or collides with the -1 "no number" sentinel), are not
+compiled; the caller keeps using the JSON path for them.
+"""
+import os
+import sys
+import mmap
+import zlib
+import struct
+from array import array
+from collections.abc import Mapping
+
+MAGIC   = b'GCBS'
+VERSION = 1
+NONE    = 0xFFFFFFFF
+NO_NUMBER = -1
+
+_HEADER   = struct.Struct('<4sHHQQ7I')
+_RECORD   = struct.Struct('<IIIi')
+_TRACK    = struct.Struct('<IIIII')
+_GROUP    = struct.Struct('<III')
+_U32      = struct.Struct('<I')
+
+_PROBLEM_KEYS = ('slug', 'topic', 'difficulty', 'number')
+_TRACK_KEYS   = {'name', 'description', 'problems'}
+
+
+def snapshot_path(problems_path):
+    """problems.json → .problems.snapshot in the same directory."""
+    head, tail = os.path.split(problems_path)
+    return os.path.join(head, '.' + os.path.splitext(tail)[0] + '.snapshot')
+
+
+def _u32_array(values):
+    a = array('I', values)
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return a.tobytes()
+
+
+def _compilable(data):
+    if set(data) - {'tracks'}:
+        return False
+    for td in data.get('tracks', {}).values():
+        if set(td) - _TRACK_KEYS:
+            return False
+        for p in td.get('problems', []):
+            if set(p) - set(_PROBLEM_KEYS) or not isinstance(p.get('slug'), str):
+                return False
+            if 'number' in p and not (isinstance(p['number'], int)
+                                      and -2**31 <= p['number'] < 2**31 and p['number'] != NO_NUMBER):
+                return False
+            if any(k in p and not isinstance(p[k], str) for k in ('topic', 'difficulty')):
+                return False
+    return True
+
+
+def build(data, src_sig):
+    """Encode a parsed problems.json dict. Returns bytes, or None if not compilable."""
+    if not _compilable(data):
+        return None
+
+    strings, sid = [], {}
+
+    def intern(s):
+        if s is None:
+            return NONE
+        if s not in sid:
+            sid[s] = len(strings)
+            strings.append(s)
+        return sid[s]
+
+    records, track_rows = [], []
+    first    = {}                   # slug → record id of first occurrence
+    by_topic = {}                   # topic → [record id], deduplicated by slug
+    by_diff  = {}
+    topics   = set()
+    for key, td in data.get('tracks', {}).items():
+        start = len(records)
+        for p in td.get('problems', []):
+            rid = len(records)
+            records.append((intern(p['slug']), intern(p.get('topic')),
+                            intern(p.get('difficulty')), p.get('number', NO_NUMBER)))
+            if p.get('topic'):
+                topics.add(p['topic'])
+            if p['slug'] in first:
+                continue
+            first[p['slug']] = rid
+            by_topic.setdefault(p.get('topic', 'other'), []).append(rid)
+            by_diff.setdefault(p.get('difficulty', ''), []).append(rid)
+        track_rows.append((intern(key), intern(td.get('name')), intern(td.get('description')),
+                           start, len(records) - start))
+
+    def group_section(groups):
+        rows, ids = [], []
+        for name, rids in groups.items():
+            rows.append(_GROUP.pack(intern(name), len(ids), len(rids)))
+            ids.extend(rids)
+        return _U32.pack(len(rows)) + b''.join(rows) + _u32_array(ids)
+
+    topic_sec = group_section(by_topic)
+    diff_sec  = group_section(by_diff)
+    all_sec   = _U32.pack(len(topics)) + _u32_array(intern(t) for t in sorted(topics))
+
+    capacity = 8
+    while capacity < 2 * len(first):
+        capacity *= 2
+    slots = [0] * capacity
+    for slug, rid in first.items():
+        i = zlib.crc32(slug.encode()) & (capacity - 1)
+        while slots[i]:
+            i = (i + 1) & (capacity - 1)
+        slots[i] = rid + 1
+    slug_sec = _U32.pack(capacity) + _U32.pack(len(first)) + _u32_array(slots)
+
+    encoded = [s.encode() for s in strings]
+    offsets, pos = [0], 0
+    for b in encoded:
+        pos += len(b)
+        offsets.append(pos)
+    str_sec = _U32.pack(len(strings)) + _u32_array(offsets) + b''.join(encoded)
+    str_sec += b'\0' * (-len(str_sec) % 4)
+
+    rec_sec   = _U32.pack(len(records)) + b''.join(_RECORD.pack(*r) for r in records)
+    track_sec = _U32.pack(len(track_rows)) + b''.join(_TRACK.pack(*t) for t in track_rows)
+
+    sections = [str_sec, rec_sec, track_sec, slug_sec, topic_sec, diff_sec, all_sec]
+    offs, pos = [], _HEADER.size
+    for sec in sections:
+        offs.append(pos)
+        pos += len(sec)
+    header = _HEADER.pack(MAGIC, VERSION, 0, src_sig[0], src_sig[1], *offs)
+    return header + b''.join(sections)
+
+
+def compile_snapshot(problems_path, data, src_sig):
+    """Atomically write the snapshot next to problems.json. Returns its size, or None."""
+    blob = build(data, src_sig)
+    if blob is None:
+        return None
+    out = snapshot_path(problems_path)
+    tmp = out + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp, out)
+    except OSError:
+        return None
+    return len(blob)
+
+
+def open_snapshot(problems_path, src_sig):
+    """mmap a snapshot matching src_sig. Returns a SnapshotBank, or None if missing/stale."""
+    try:
+        with open(snapshot_path(problems_path), 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mm) < _HEADER.size:
+        mm.close()
+        return None
+    magic, version, _, mtime_ns, size, *offs = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION or (mtime_ns, size) != tuple(src_sig):
+        mm.close()
+        return None
+    return SnapshotBank(mm, offs)
+
+
+# ---------------------------------------------------------------------------
+# Read side — lazily decoded views with the same surface as grind_data.ProblemBank
+# ---------------------------------------------------------------------------
+
+class _SlugIndex(Mapping):
+    def __init__(self, bank):
+        self._bank = bank
+        self._capacity, self._len = struct.unpack_from('<II', bank._mm, bank._off_slugs)
+        self._slots = bank._off_slugs + 8
+
+    def __getitem__(self, slug):
+        bank, mask = self._bank, self._capacity - 1
+        i = zlib.crc32(slug.encode()) & mask
+        while True:
+            ref, = _U32.unpack_from(bank._mm, self._slots + 4 * i)
+            if not ref:
+                raise KeyError(slug)
+            if bank._record_slug(ref - 1) == slug:
+                return bank._problem(ref - 1)
+            i = (i + 1) & mask
+
+    def __iter__(self):
+        refs = struct.unpack_from(f'<{self._capacity}I', self._bank._mm, self._slots)
+        for ref in sorted(r for r in refs if r):
+            yield self._bank._record_slug(ref - 1)
+
+    def __len__(self):
+        return self._len
+
+
+class _GroupIndex(Mapping):
+    def __init__(self, bank, off):
+        self._bank = bank
+        n, = _U32.unpack_from(bank._mm, off)
+        self._ids_off = off + 4 + n * _GROUP.size
+        self._groups  = {}
+        for i in range(n):
+            name, start, count = _GROUP.unpack_from(bank._mm, off + 4 + i * _GROUP.size)
+            self._groups[bank._string(name)] = (start, count)
+        self._cache = {}
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            start, count = self._groups[name]
+            rids = struct.unpack_from(f'<{count}I', self._bank._mm, self._ids_off + 4 * start)
+            self._cache[name] = [self._bank._problem(r) for r in rids]
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self):
+        return len(self._groups)
+
+
+class _TrackIndex(Mapping):
+    def __init__(self, bank):
+        self._bank  = bank
+        n, = _U32.unpack_from(bank._mm, bank._off_tracks)
+        self._rows  = {}
+        for i in range(n):
+            row = _TRACK.unpack_from(bank._mm, bank._off_tracks + 4 + i * _TRACK.size)
+            self._rows[bank._string(row[0])] = row
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            _, name, desc, start, count = self._rows[key]
+            td = {}
+            if name != NONE:
+                td['name'] = self._bank._string(name)
+            if desc != NONE:
+                td['description'] = self._bank._string(desc)
+            td['problems'] = [self._bank._problem(r, shared=False)
+                              for r in range(start, start + count)]
+            self._cache[key] = td
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+
+class SnapshotBank:
+    """mmap-backed problem bank. Nothing is decoded until it is looked up."""
+
+    def __init__(self, mm, offs):
+        self._mm = mm
+        (self._off_strings, self._off_records, self._off_tracks, self._off_slugs,
+         self._off_topics, self._off_diffs, self._off_all) = offs
+        self._n_strings, = _U32.unpack_from(mm, self._off_strings)
+        self._blob      = self._off_strings + 4 + 4 * (self._n_strings + 1)
+        self._strings   = {}
+        self._problems  = {}
+        self._lazy      = {}
+
+    # --- raw decoding ---
+
+    def _string(self, sid):
+        s = self._strings.get(sid)
+        if s is None:
+            start, end = struct.unpack_from('<II', self._mm, self._off_strings + 4 + 4 * sid)
+            s = self._strings[sid] = self._mm[self._blob + start:self._blob + end].decode()
+        return s
+
+    def _record(self, rid):
+        return _RECORD.unpack_from(self._mm, self._off_records + 4 + rid * _RECORD.size)
+
+    def _record_slug(self, rid):
+        return self._string(self._record(rid)[0])
+
+    def _problem(self, rid, shared=True):
+        """Decode a record. Index views share one dict per record, like ProblemBank."""
+        if shared and rid in self._problems:
+            return self._problems[rid]
+        slug, topic, diff, number = self._record(rid)
+        p = {'slug': self._string(slug)}
+        if topic != NONE:
+            p['topic'] = self._string(topic)
+        if diff != NONE:
+            p['difficulty'] = self._string(diff)
+        if number != NO_NUMBER:
+            p['number'] = number
+        if shared:
+            self._problems[rid] = p
+        return p
+
+    def _view(self, name, factory):
+        if name not in self._lazy:
+            self._lazy[name] = factory()
+        return self._lazy[name]
+
+    # --- ProblemBank surface ---
+
+    @property
+    def by_slug(self):
+        return self._view('by_slug', lambda: _SlugIndex(self))
+
+    @property
+    def by_topic(self):
+        return self._view('by_topic', lambda: _GroupIndex(self, self._off_topics))
+
+    @property
+    def by_difficulty(self):
+        return self._view('by_difficulty', lambda: _GroupIndex(self, self._off_diffs))
+
+    @property
+    def tracks(self):
+        return self._view('tracks', lambda: _TrackIndex(self))
+
+    @property
+    def topics(self):
+        def decode():
+            n, = _U32.unpack_from(self._mm, self._off_all)
+            return [self._string(s) for s in struct.unpack_from(f'<{n}I', self._mm, self._off_all + 4)]
+        return self._view('topics', decode)
+
+    @property
+    def data(self):
+        return self._view('data', lambda: {'tracks': {k: self.tracks[k] for k in self.tracks}})
+
+    def get(self, slug):
+        return self.by_slug.get(slug)
+
+    def topic_of(self, slug):
+        return (self.get(slug) or {}).get('topic', '')
+
+    def track(self, name):
+        return self.tracks.get(name)
+
+    def track_problems(self, name):
+        return (self.tracks.get(name) or {}).get('problems', [])
@@ -8,6 +8,8 @@ import importlib.util
 import pytest
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
 
 
 def import_grind():
@@ -39,9 +41,17 @@ def tmp_env(tmp_path, monkeypatch):
         "PROJECT_ROOT":  str(tmp_path),
         "MEMORY_FILE":   str(tmp_path / "memory.md"),
         "ARCHIVE_FILE":  str(tmp_path / "memory_archive.md"),
+        "JOURNAL_FILE":  str(tmp_path / "memory.journal.jsonl"),
         "CONFIG_FILE":   str(tmp_path / ".lc_config.json"),
         "SESSION_FILE":  str(tmp_path / ".session.json"),
         "BEHAVIOR_FILE": str(tmp_path / "behavior.jsonl"),
+        "DB_FILE":       str(tmp_path / "grind.db"),
+        "INDEX_FILE":    str(tmp_path / ".memory_index.json"),
+        "ROLLUP_FILE":   str(tmp_path / ".behavior_rollup.json"),
+        "SOCKET_FILE":   str(tmp_path / ".grind.sock"),
+        "JVM_SOCKET_FILE": str(tmp_path / ".grind_jvm.sock"),
+        "POOL_SOCKET_FILE": str(tmp_path / ".grind_pool.sock"),
+        "BUILD_DIR":     str(tmp_path / ".grind_build"),
     }
 
     # Patch the shared constants module so grind_data / grind_algos see temp paths
@@ -52,10 +62,6 @@ def tmp_env(tmp_path, monkeypatch):
     except ImportError:
         pass  # grind_paths not yet split out — no-op
 
+    # grind keeps no constants of its own: g.MEMORY_FILE etc. resolve to grind_paths
     g = import_grind()
-
-    # Also patch g directly (monolith grind keeps its own module-level constants)
-    for attr, val in patches.items():
-        monkeypatch.setattr(g, attr, val)
-
     return g, tmp_path
@@ -0,0 +1,143 @@
+"""
+Tests for ProblemBank — indexed, process-cached problems.json.
+
+Invariants:
+- Slug lookups keep the first occurrence across tracks
+- Topic/difficulty indexes are deduplicated by slug
+- The bank is parsed once per process and reused while the file is unchanged
+- Changing the file (mtime or size) invalidates the cached bank
+"""
+import os
+import json
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def write_bank(path, tracks):
+    with open(path, "w") as f:
+        json.dump({"tracks": tracks}, f)
+
+
+SAMPLE = {
+    "a": {"name": "Track A", "problems": [
+        {"slug": "two-sum", "topic": "arrays", "difficulty": "easy", "number": 1},
+        {"slug": "coin-change", "topic": "dp", "difficulty": "medium", "number": 322},
+    ]},
+    "b": {"name": "Track B", "problems": [
+        {"slug": "two-sum", "topic": "hashing", "difficulty": "easy", "number": 1},
+        {"slug": "word-ladder", "topic": "graphs", "difficulty": "hard", "number": 127},
+    ]},
+}
+
+
+def test_indexes(tmp_path):
+    import grind_data
+    path = str(tmp_path / "problems.json")
+    write_bank(path, SAMPLE)
+    bank = grind_data.get_problem_bank(path)
+
+    assert bank.topic_of("two-sum") == "arrays"          # first occurrence wins
+    assert bank.get("word-ladder")["number"] == 127
+    assert bank.get("missing") is None
+    assert bank.topic_of("missing") == ""
+    assert [p["slug"] for p in bank.by_topic["arrays"]] == ["two-sum"]
+    assert "hashing" not in bank.by_topic                 # duplicate slug not re-indexed
+    assert bank.topics == ["arrays", "dp", "graphs", "hashing"]
+    assert [p["slug"] for p in bank.by_difficulty["hard"]] == ["word-ladder"]
+    assert len(bank.track_problems("b")) == 2
+    assert bank.track("missing") is None
+
+
+def test_cached_until_file_changes(tmp_path):
+    import grind_data
+    path = str(tmp_path / "problems.json")
+    write_bank(path, SAMPLE)
+    first = grind_data.get_problem_bank(path)
+    assert grind_data.get_problem_bank(path) is first
+
+    tracks = dict(SAMPLE)
+    tracks["c"] = {"name": "Track C", "problems": [
+        {"slug": "lru-cache", "topic": "design", "difficulty": "medium", "number": 146}]}
+    write_bank(path, tracks)
+    second = grind_data.get_problem_bank(path)
+    assert second is not first
+    assert second.topic_of("lru-cache") == "design"
+
+
+def test_missing_bank_returns_none(tmp_path, capsys):
+    import grind_data
+    assert grind_data.get_problem_bank(str(tmp_path / "nope.json")) is None
+    assert "Problem bank not found" in capsys.readouterr().err
+
+
+def test_helpers_match_bank(grind):
+    import grind_data
+    bank = grind_data.get_problem_bank()
+    assert grind.get_all_topics() == bank.topics
+    assert grind.slug_to_topic("two-sum") == bank.topic_of("two-sum")
+    by_topic = grind.get_problems_by_topic()
+    assert sum(len(v) for v in by_topic.values()) == len(bank.by_slug)
+
+
+# --- Binary snapshot ---
+
+def _sig(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def test_snapshot_matches_json_bank(tmp_path):
+    import grind_data, grind_snapshot
+    path = str(tmp_path / "problems.json")
+    write_bank(path, SAMPLE)
+    grind_data.get_problem_bank(path)                     # cold load compiles it
+    assert os.path.exists(grind_snapshot.snapshot_path(path))
+
+    snap = grind_snapshot.open_snapshot(path, _sig(path))
+    ref  = grind_data.ProblemBank(json.load(open(path)))
+    assert snap is not None
+    assert snap.topics == ref.topics
+    assert dict(snap.by_slug) == ref.by_slug
+    assert dict(snap.by_topic) == dict(ref.by_topic)
+    assert dict(snap.by_difficulty) == dict(ref.by_difficulty)
+    assert snap.data == ref.data
+    assert snap.topic_of("two-sum") == "arrays"
+    assert snap.get("missing") is None
+
+
+def test_snapshot_rejected_when_source_changes(tmp_path):
+    import grind_data, grind_snapshot
+    path = str(tmp_path / "problems.json")
+    write_bank(path, SAMPLE)
+    grind_data.compile_problem_bank(path)
+    old_sig = _sig(path)
+    write_bank(path, {"a": SAMPLE["a"]})
+    assert grind_snapshot.open_snapshot(path, _sig(path)) is None
+    assert grind_snapshot.open_snapshot(path, old_sig) is not None
+
+
+def test_snapshot_skipped_for_unknown_fields(tmp_path):
+    import grind_data, grind_snapshot
+    path = str(tmp_path / "problems.json")
+    write_bank(path, {"x": {"name": "X", "problems": [
+        {"slug": "two-sum", "topic": "arrays", "difficulty": "easy", "url": "https://x"}]}})
+    _, size = grind_data.compile_problem_bank(path)
+    assert size is None
+    assert not os.path.exists(grind_snapshot.snapshot_path(path))
+    assert grind_data.get_problem_bank(path).get("two-sum")["url"] == "https://x"
+
+
+def test_snapshot_skipped_for_out_of_range_number(tmp_path):
+    import grind_data, grind_snapshot
+    path = str(tmp_path / "problems.json")
+    write_bank(path, {"x": {"name": "X", "problems": [
+        {"slug": "two-sum", "topic": "arrays", "difficulty": "easy", "number": 2**40}]}})
+    _, size = grind_data.compile_problem_bank(path)
+    assert size is None
+    assert not os.path.exists(grind_snapshot.snapshot_path(path))
+    assert grind_data.get_problem_bank(path).get("two-sum")["number"] == 2**40
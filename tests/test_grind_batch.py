@@ -0,0 +1,177 @@
+"""
+Tests for grind batch.
+
+Invariants:
+- Input is either one shell-quoted command per line or a JSON array
+- Commands share state: each sees the config/session changes made before it
+- .lc_config.json and .session.json are written at most once, after the last command;
+  attempts and behavior events are buffered (visible to later commands) and stored once too,
+  then archived so the batch leaves the same history as running its commands one by one
+- A failing command's config/session changes and buffered appends are rolled back
+- --jsonl emits one record per command; failures don't stop the batch unless --stop-on-error
+- Interactive / process-spawning commands are rejected before anything runs
+"""
+import io
+import os
+import json
+import argparse
+from datetime import datetime, timedelta
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def run_batch(g, monkeypatch, text, jsonl=False, stop_on_error=False):
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+    code = 0
+    try:
+        g.cmd_batch(argparse.Namespace(jsonl=jsonl, stop_on_error=stop_on_error))
+    except SystemExit as e:
+        code = e.code
+    return code
+
+
+@pytest.fixture
+def writes(tmp_env, monkeypatch):
+    import grind_data
+    counts = {"config": 0, "session": 0}
+    real_config, real_session = grind_data._write_config_file, grind_data._write_session_file
+
+    def config(c):
+        counts["config"] += 1
+        real_config(c)
+
+    def session(s):
+        counts["session"] += 1
+        real_session(s)
+
+    monkeypatch.setattr(grind_data, "_write_config_file", config)
+    monkeypatch.setattr(grind_data, "_write_session_file", session)
+    return counts
+
+
+def test_parse_lines_and_json(grind):
+    text = "grind due --limit 3\n\n# comment\nlog two-sum 4 --notes 'a b'  # trailing\n"
+    assert grind.parse_batch(text) == [["due", "--limit", "3"], ["log", "two-sum", "4", "--notes", "a b"]]
+    assert grind.parse_batch('[["gap", "show"], "target list"]') == [["gap", "show"], ["target", "list"]]
+    with pytest.raises(ValueError):
+        grind.parse_batch("[1,")
+
+
+def test_review_step_writes_once(tmp_env, writes, monkeypatch, capsys):
+    g, tmp = tmp_env
+    date = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+    g.save_config({"active_target": "acme-001", "targets": {"acme-001": {
+        "id": "acme-001", "company": "Acme", "role": "SWE", "interview_date": date,
+        "intelligence": {}, "plan": {}}}})
+    writes["config"] = 0
+    code = run_batch(g, monkeypatch, "\n".join([
+        "session start",
+        "session event two-sum presented",
+        "session event two-sum hint_given --data '{\"hint_level\": 1}'",
+        "plan generate",
+        "log two-sum 4 --time 12",
+        "plan today",
+        "session end",
+    ]))
+    out = capsys.readouterr().out
+    assert code == 0
+    assert "Session started" in out and "Event recorded: hint_given" in out
+    assert writes == {"config": 1, "session": 1}
+    assert not os.path.exists(g.SESSION_FILE)
+    assert [r["slug"] for r in g.parse_memory()] == ["two-sum"]
+    assert g.load_config()["targets"]["acme-001"]["plan"]["days"]
+    import grind_data
+    assert grind_data.count_behavior_events() == 1
+
+
+def test_later_commands_see_earlier_config(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    g.save_config({"active_track": "blind75"})
+    run_batch(g, monkeypatch, "storage use journal\nlog two-sum 4\n")
+    assert os.path.exists(g.JOURNAL_FILE)
+    assert g.storage_mode() == "journal"
+
+
+def test_jsonl_and_errors(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    g.save_config({"active_track": "blind75"})
+    code = run_batch(g, monkeypatch, '["log two-sum 9", ["due"]]', jsonl=True)
+    records = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+    assert [r["argv"] for r in records] == [["log", "two-sum", "9"], ["due"]]
+    assert records[0]["code"] != 0 and records[1]["code"] == 0
+    assert code == records[0]["code"]
+    run_batch(g, monkeypatch, "log two-sum 9\ndue\n", jsonl=True, stop_on_error=True)
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+
+def test_rejects_interactive_commands(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    assert run_batch(g, monkeypatch, "log two-sum 4\nrun two-sum\n") == 1
+    assert "Not allowed in a batch: run two-sum" in capsys.readouterr().err
+    assert g.parse_memory() == []
+
+
+def test_appends_stored_once(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    import grind_data
+    g.save_config({"active_track": "blind75"})
+    stores = []
+    real_table, real_events = grind_data._write_memory_table, grind_data._store_events
+    monkeypatch.setattr(grind_data, "_write_memory_table", lambda rows: (stores.append("memory"), real_table(rows)))
+    monkeypatch.setattr(grind_data, "_store_events", lambda evs: (stores.append("events"), real_events(evs)))
+    code = run_batch(g, monkeypatch, "\n".join([
+        "log two-sum 4", "log contains-duplicate 2",
+        "session start", "session event two-sum hint_given", "session end",
+        "due --json", "log valid-anagram 5",
+    ]))
+    assert code == 0
+    assert sorted(stores) == ["events", "memory"]
+    assert [r["slug"] for r in g.parse_memory()] == ["two-sum", "contains-duplicate", "valid-anagram"]
+    assert grind_data.count_behavior_events() == 1
+    assert set(g.schedule_index().slugs) == {"two-sum", "contains-duplicate", "valid-anagram"}
+
+
+def test_failed_command_is_rolled_back(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    import grind_cmd_history
+    g.save_config({"active_track": "blind75"})
+
+    def broken(config, solved):
+        config["half_done"] = True
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(grind_cmd_history, "_rebalance_plan", broken)
+    code = run_batch(g, monkeypatch, "log two-sum 4\nstorage use journal\n")
+    assert code == 1
+    assert "boom" in capsys.readouterr().err
+    assert g.parse_memory() == []
+    assert "half_done" not in g.load_config() and g.storage_mode() == "journal"
+    assert g.schedule_index().get("two-sum") is None
+
+
+@pytest.mark.parametrize("mode", ["markdown", "journal"])
+def test_logs_archive_like_sequential_runs(tmp_env, monkeypatch, capsys, mode):
+    g, tmp = tmp_env
+    slugs = [p["slug"] for p in g.get_problem_bank().track_problems("blind75")[:55]]
+    lines = [f"log {slug} {i % 5 + 1} --time 20" for i, slug in enumerate(slugs)]
+    seen = {}
+    for how in ("sequential", "batch"):
+        for path in (g.MEMORY_FILE, g.ARCHIVE_FILE, g.JOURNAL_FILE, g.INDEX_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        g.save_config({"active_track": "blind75", "storage": mode})
+        if how == "batch":
+            assert run_batch(g, monkeypatch, "\n".join(lines)) == 0
+        else:
+            for line in lines:
+                g.main(line.split())
+        capsys.readouterr()
+        g.main(["progress"])
+        seen[how] = (g.parse_memory(), g.load_history(), capsys.readouterr().out)
+    assert len(seen["batch"][0]) == g.ARCHIVE_THRESHOLD
+    assert seen["batch"] == seen["sequential"]
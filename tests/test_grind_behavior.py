@@ -1,5 +1,6 @@
 """
-Tests for compute_behavior_patterns() and flush_behavior_events().
+Tests for compute_behavior_patterns(), flush_behavior_events(), the behavior rollup
+and the streaming behavior.jsonl reader.
 
 Behavioral flags:
 - quick_give_up: avg time to hint < 5 min
@@ -246,3 +247,87 @@ def test_behavior_archive_atomic_rewrite(tmp_env):
     g.cmd_behavior(argparse.Namespace(behavior_cmd='archive', before=None))
     # No .tmp leftover
     assert not (tmp / "behavior.jsonl.tmp").exists()
+
+
+# --- Rollup tests ---
+
+def mixed_events(n):
+    events = []
+    for i in range(n):
+        topic = ["dp", "graphs", "trees"][i % 3]
+        events += [hint_given(topic, 1 + i % 3, 2 + i % 7),
+                   hint_assessed(topic, 1 + i % 3, i % 2 == 0),
+                   rating_calibration(topic, 1 + i % 5, 3)]
+    return events
+
+
+def test_rollup_flush_matches_rescan(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    events = mixed_events(20)
+    for i in range(0, len(events), 7):
+        g.flush_behavior_events({"hint_events": events[i:i + 7]})
+    rollup = grind_data.behavior_rollup()
+    assert rollup["events"] == len(events)
+    assert g.behavior_patterns(rollup) == g.compute_behavior_patterns(events)
+    assert rollup == grind_data.behavior_rollup(rebuild=True)
+
+
+def test_rollup_rebuilt_after_external_write(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.flush_behavior_events({"hint_events": mixed_events(2)})
+    with open(g.BEHAVIOR_FILE, "a") as f:
+        f.write(json.dumps(hint_given("heap", 3, 1)) + "\n")
+    assert "heap" in g.behavior_patterns(grind_data.behavior_rollup())
+
+
+def test_rollup_follows_archive_and_reset(tmp_env):
+    g, tmp = tmp_env
+    import argparse
+    import grind_data
+    old = dict(hint_given("dp", 3, 1), ts="2025-01-01T10:00:00")
+    g.flush_behavior_events({"hint_events": [old, hint_given("graphs", 1, 10)]})
+    g.cmd_behavior(argparse.Namespace(behavior_cmd="archive", before="2026-01-01"))
+    assert set(grind_data.behavior_rollup()["topics"]) == {"graphs"}
+    g.cmd_behavior(argparse.Namespace(behavior_cmd="reset", force=True))
+    assert not os.path.exists(g.ROLLUP_FILE)
+    assert grind_data.behavior_rollup()["events"] == 0
+
+
+# --- Streaming reader tests ---
+
+def test_tail_reads_backwards_across_blocks(tmp_env, monkeypatch):
+    g, tmp = tmp_env
+    import grind_data
+    monkeypatch.setattr(grind_data, "_TAIL_BLOCK", 37)         # force many partial blocks
+    events = mixed_events(30)
+    g.flush_behavior_events({"hint_events": events})
+    with open(g.BEHAVIOR_FILE, "a") as f:
+        f.write('{"topic": "dp", "event": "hint_giv')           # torn last line, no newline
+    assert grind_data.tail_behavior_events(5) == events[-5:]
+    dp = [e for e in events if e["topic"] == "dp"]
+    assert grind_data.tail_behavior_events(4, topic="dp") == dp[-4:]
+    assert grind_data.tail_behavior_events(1000, topic="dp") == dp
+    assert list(grind_data.iter_behavior_events(topic="dp", event="hint_assessed")) == \
+        [e for e in dp if e["event"] == "hint_assessed"]
+    assert grind_data.count_behavior_events(topic="dp") == len(dp)
+
+
+def test_filter_is_exact_after_pushdown(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    tricky = dict(hint_given("graphs", 1, 5), slug="dp")          # "dp" appears, but as slug
+    g.flush_behavior_events({"hint_events": [tricky, hint_given("dp", 1, 5)]})
+    assert [e["topic"] for e in grind_data.iter_behavior_events(topic="dp")] == ["dp"]
+
+
+def test_report_prints_last_50_of_filter(tmp_env, capsys):
+    g, tmp = tmp_env
+    import argparse
+    events = [dict(hint_given("dp", 1, i), slug=f"p{i}") for i in range(60)]
+    g.flush_behavior_events({"hint_events": events + [hint_given("graphs", 1, 1)]})
+    g.cmd_behavior(argparse.Namespace(behavior_cmd="report", topic="dp", slug=None))
+    out = capsys.readouterr().out
+    assert "(60 events)" in out
+    assert "p9 (dp)" not in out and "p10 (dp)" in out and "p59 (dp)" in out
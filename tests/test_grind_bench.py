@@ -0,0 +1,172 @@
+"""
+Tests for grind bench (grind_cmd_bench.py).
+
+Invariants:
+- fit_complexity picks the class the timings were generated from, and O(1) for a flat or
+  falling sweep, noisy or not
+- With start-up noise like a Python process's (~50ms, jittering), the default sweep extends
+  until the solution's own time shows and recovers the class; a sweep that never leaves the
+  noise band is inconclusive
+- Built-in generators print one LeetCode-style line lc_utils can parse (tree: a BST of n nodes)
+- The problem's gen.py receives <n> <seed>; its stdout is the solution's stdin
+- The sweep compiles once, runs under run_limits, stops at the first TLE/MLE/OLE/RE, and --json
+  reports sizes and the estimate
+"""
+import json
+import math
+import random
+import pytest
+
+import grind_cmd_bench as bench
+from utils.python.lc_utils import TreeNode
+
+
+@pytest.mark.parametrize("name, f", [
+    ("O(log n)",   lambda n: math.log2(n)),
+    ("O(n)",       lambda n: n),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)",     lambda n: n * n),
+])
+def test_fit_recovers_class(name, f):
+    sizes = [1000 * 2 ** i for i in range(7)]
+    rng = random.Random(1)
+    scale = 0.5 / f(sizes[-1])
+    times = [0.03 + scale * f(n) * rng.uniform(0.97, 1.03) for n in sizes]
+    estimate, fits = bench.fit_complexity(sizes, times)
+    assert estimate == name
+    assert [fit["class"] for fit in fits] == [c for c, _ in bench.CLASSES]
+
+
+def test_flat_sweep_is_constant():
+    estimate, _ = bench.fit_complexity([10, 100, 1000, 10000], [0.030, 0.031, 0.029, 0.032])
+    assert estimate == "O(1)"
+
+
+@pytest.mark.parametrize("trend", [1.0, 0.6])
+def test_noisy_flat_or_falling_sweep_is_constant(trend):
+    sizes = [1000 * 2 ** i for i in range(7)]
+    noise = [1.0, 1.12, 0.9, 1.1, 0.92, 1.08, 0.95]           # jitter past the old 15% cut-off
+    times = [0.03 * trend ** i * e for i, e in enumerate(noise)]
+    assert max(times) > min(times) * 1.15
+    estimate, fits = bench.fit_complexity(sizes, times)
+    assert estimate == "O(1)"
+    if trend < 1:
+        assert all(fit["b"] == 0 for fit in fits)
+
+
+STARTUP = 0.048                               # a python3 start-up, jittering by up to 15%
+
+
+def synthetic_sweep(monkeypatch, work, seed, sizes=bench.DEFAULT_SIZES, extend_to=bench.MAX_SIZE):
+    """(estimate, largest n) from bench() over runs timed as STARTUP + jitter + work(n)."""
+    import grind_exec
+    rng = random.Random(seed)
+
+    def run_limited(cmd, cwd=None, env=None, stdin=None, limits=None, capture=False):
+        wall = STARTUP * rng.uniform(1.0, 1.15) + work(int(stdin)) * rng.uniform(0.97, 1.03)
+        return grind_exec.Measurement(0, wall, wall, 0.0, 1024, stdout=b"", stderr=b"", verdict="OK")
+
+    monkeypatch.setattr(grind_exec, "run_limited", run_limited)
+    monkeypatch.setattr(bench, "generate_input", lambda problem_dir, gen, n, seed: str(n).encode())
+    startup = bench.time_size(None, None, None, None, None, 1, 3, None)["time_ms"] / 1000
+    rows = bench.bench(None, None, None, None, None, sizes, 3, None, startup=startup, extend_to=extend_to)
+    estimate, _ = bench.estimate_complexity([r["n"] for r in rows], [r["time_ms"] / 1000 for r in rows],
+                                            startup)
+    return estimate, rows[-1]["n"]
+
+
+@pytest.mark.parametrize("name, work", [
+    ("O(n)",       lambda n: 2.5e-7 * n),     # sum(arr): ~16ms of work at 64000, under the start-up
+    ("O(n log n)", lambda n: 1.3e-8 * n * math.log2(n)),
+    ("O(n^2)",     lambda n: 1e-11 * n * n),
+])
+def test_startup_noise_is_outgrown(monkeypatch, name, work):
+    estimates = [synthetic_sweep(monkeypatch, work, seed) for seed in range(20)]
+    assert sum(e == name for e, _ in estimates) >= 18
+    assert all(n > bench.DEFAULT_SIZES[-1] for _, n in estimates)
+
+
+def test_startup_noise_alone_is_inconclusive(monkeypatch):
+    for seed in range(20):
+        assert synthetic_sweep(monkeypatch, lambda n: 0.0, seed) == (bench.INCONCLUSIVE, bench.MAX_SIZE)
+    fixed = [synthetic_sweep(monkeypatch, lambda n: 2.5e-7 * n, seed, extend_to=None) for seed in range(20)]
+    assert all(n == bench.DEFAULT_SIZES[-1] for _, n in fixed)
+    assert any(e == bench.INCONCLUSIVE for e, _ in fixed)
+
+
+def test_builtin_generators():
+    rng = random.Random(0)
+    assert len(json.loads(bench.gen_array(50, rng))) == 50
+    assert len(json.loads(bench.gen_string(50, rng))) == 50
+    values = json.loads(bench.gen_tree(200, rng))
+    root, seen, stack = TreeNode.from_list(values), [], []
+    node = root
+    while stack or node:                     # in-order walk of a BST is sorted
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        seen.append(node.val)
+        node = node.right
+    assert len(seen) == 200 and seen == sorted(seen)
+
+
+@pytest.fixture()
+def problem(tmp_env):
+    g, tmp = tmp_env
+    d = tmp / "problems" / "count"
+    d.mkdir(parents=True)
+    (d / "solution.py").write_text(
+        "import sys, json, time\n"
+        "a = json.loads(sys.stdin.readline())\n"
+        "if len(a) >= 400: time.sleep(5)\n"
+        "if a[:1] == [-1] and len(a) >= 200: x = bytearray(1 << 30)\n"
+        "print(len(a))\n")
+    return g, d
+
+
+def run_json(g, capsys, *argv):
+    code = 0
+    try:
+        g.main(["bench", "count", "--json", "--repeat", "1", *argv])
+    except SystemExit as e:
+        code = e.code
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_gen_script_and_tle_stops_sweep(problem, capsys):
+    g, d = problem
+    (d / "gen.py").write_text("import sys\nn, seed = map(int, sys.argv[1:])\nprint([seed] * n)\n")
+    code, doc = run_json(g, capsys, "--sizes", "100,200,300,400,800", "--timeout", "1", "--seed", "7")
+    assert code == 0
+    assert [(r["n"], r["status"]) for r in doc["sizes"]] == [
+        (100, "OK"), (200, "OK"), (300, "OK"), (400, "TLE")]
+    assert doc["estimate"] == bench.INCONCLUSIVE              # len() of a short list: start-up noise
+    assert doc["startup_ms"] > 0
+    assert all(r["max_rss_kb"] > 0 for r in doc["sizes"])
+
+
+def test_memory_limit_stops_sweep(problem, capsys):
+    g, d = problem
+    (d / "gen.py").write_text("import sys\nn, seed = map(int, sys.argv[1:])\nprint([-1] * n)\n")
+    code, doc = run_json(g, capsys, "--sizes", "50,100,150,200,300", "--memory-limit", "256")
+    assert code == 0
+    assert [(r["n"], r["status"]) for r in doc["sizes"]] == [
+        (50, "OK"), (100, "OK"), (150, "OK"), (200, "MLE")]
+    assert doc["sizes"][-1]["limit"] == "256MB"
+    g.main(["bench", "count", "--sizes", "50,200", "--repeat", "1", "--memory-limit", "256"])
+    assert "Memory Limit Exceeded (256MB)" in capsys.readouterr().out
+
+
+def test_builtin_gen_table(problem, capsys):
+    g, d = problem
+    g.main(["bench", "count", "--gen", "array", "--sizes", "10,20,40", "--repeat", "1"])
+    out = capsys.readouterr().out
+    assert "start-up (n=1)" in out and "growth" in out and "Inconclusive" in out
+
+
+def test_missing_generator_is_an_error(problem, capsys):
+    g, d = problem
+    with pytest.raises(SystemExit) as e:
+        g.main(["bench", "count"])
+    assert e.value.code == 1
@@ -0,0 +1,117 @@
+"""
+Tests for the grind run build cache (grind_build.py).
+
+Invariants:
+- An unchanged C++ solution compiles once; later runs reuse the cached binary
+- Editing the solution, lc_utils.h or any local header it includes (transitively) changes the key
+- Solutions that include lc_utils.h build against its cached PCH; others never see it
+- Failed compiles are not cached
+- Eviction drops least recently used entries first and never the one just built
+"""
+import os
+import shutil
+import pytest
+
+import grind_build
+
+needs_gxx = pytest.mark.skipif(not shutil.which("g++"), reason="g++ not installed")
+
+SOURCE = '#include "../../utils/cpp/lc_utils.h"\nint main() { cout << "hi" << endl; }\n'
+
+
+@pytest.fixture()
+def workspace(tmp_env):
+    g, tmp = tmp_env
+    utils = tmp / "utils" / "cpp"
+    utils.mkdir(parents=True)
+    (utils / "lc_utils.h").write_text("#include <iostream>\nusing namespace std;\n")
+    problem = tmp / "problems" / "hello"
+    problem.mkdir(parents=True)
+    (problem / "solution.cpp").write_text(SOURCE)
+    return g, tmp, str(problem / "solution.cpp")
+
+
+@needs_gxx
+def test_unchanged_solution_compiles_once(workspace, capfd):
+    g, tmp, source = workspace
+    g._run_file(source)
+    first = capfd.readouterr().out
+    g._run_file(source)
+    second = capfd.readouterr().out
+    assert "Compiled C++" in first and "hi" in first
+    assert "Using cached C++ build" in second and "hi" in second
+    assert not os.path.exists(os.path.join(os.path.dirname(source), "a.out"))
+
+
+@needs_gxx
+def test_lc_utils_solutions_use_the_pch(workspace, monkeypatch):
+    g, tmp, source = workspace
+    calls = []
+    run = grind_build.subprocess.run
+    monkeypatch.setattr(grind_build.subprocess, "run", lambda cmd, **kw: calls.append(cmd) or run(cmd, **kw))
+
+    binary, hit = grind_build.compile_cpp(source)
+    header = grind_build.cpp_pch()
+    assert binary and not hit
+    assert header and os.path.exists(header + ".gch")
+    assert calls[-1][calls[-1].index("-include") + 1] == header
+
+    plain = tmp / "problems" / "plain.cpp"
+    plain.write_text("#include <cstdio>\nint main() { puts(\"hi\"); }\n")
+    assert grind_build.compile_cpp(str(plain))[0]
+    assert "-include" not in calls[-1]
+
+
+def test_key_tracks_source_and_header(workspace):
+    g, tmp, source = workspace
+    key = grind_build.cpp_key(source)
+    assert grind_build.cpp_key(source) == key
+    with open(source, "a") as f:
+        f.write("// edit\n")
+    edited = grind_build.cpp_key(source)
+    assert edited != key
+    (tmp / "utils" / "cpp" / "lc_utils.h").write_text("#include <vector>\n")
+    assert grind_build.cpp_key(source) != edited
+
+
+def test_key_tracks_local_include_closure(workspace):
+    g, tmp, source = workspace
+    problem = tmp / "problems" / "hello"
+    (problem / "solution.cpp").write_text('#include "helpers.h"\nint main() { return helper(); }\n')
+    (problem / "helpers.h").write_text('#include "inner/deep.h"\n')
+    key = grind_build.cpp_key(source)                        # inner/deep.h missing so far
+    (problem / "inner").mkdir()
+    (problem / "inner" / "deep.h").write_text("int helper() { return 0; }\n")
+    created = grind_build.cpp_key(source)
+    assert created != key
+    (problem / "inner" / "deep.h").write_text("int helper() { return 1; }\n")
+    assert grind_build.cpp_key(source) != created
+    (problem / "helpers.h").write_text('#include "helpers.h"\n')   # cycles terminate
+    assert grind_build.cpp_key(source)
+
+
+def test_failed_compile_is_not_cached(workspace):
+    assert grind_build.store("k", lambda out_dir: False) is None
+    assert grind_build.lookup("k") is None
+
+
+def test_lru_eviction(workspace, monkeypatch):
+    def write(size):
+        def compile_into(out_dir):
+            with open(os.path.join(out_dir, "a.out"), "wb") as f:
+                f.write(b"x" * size)
+            return True
+        return compile_into
+
+    monkeypatch.setattr(grind_build._gp, "BUILD_CACHE_LIMIT", 250)
+    old, warm = grind_build.store("old", write(100)), grind_build.store("warm", write(100))
+    os.utime(old, (1, 1))
+    os.utime(warm, (2, 2))
+    grind_build.lookup("warm")                   # touched: now the most recently used
+    grind_build.store("new", write(100))
+    assert grind_build.lookup("old") is None
+    assert grind_build.lookup("warm") and grind_build.lookup("new")
+
+    grind_build.store("huge", write(1000))       # over the limit alone, but just built
+    assert grind_build.lookup("huge")
+    assert grind_build.lookup("warm") is None
@@ -0,0 +1,77 @@
+"""
+Tests for the grind dispatcher (grind_cli.py).
+
+Invariants:
+- Every registered command resolves to a module with a cmd_<name> handler and a working --help
+- `grind --help` lists every command without importing any command module
+- An invocation imports only its own command module (the hot `session event` path
+  never loads plan generation, the problem-workspace commands or subprocess)
+- Names that used to live in the grind script still resolve as grind.<name>
+"""
+import sys
+import json
+import importlib
+import subprocess
+import pytest
+from conftest import import_grind, REPO_ROOT
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def loaded_modules(tmp_path, argv):
+    """sys.modules after grind_cli.main(argv) in a fresh interpreter, data paths under tmp_path."""
+    code = (
+        "import sys, json, grind_paths\n"
+        "for k in ('MEMORY_FILE', 'ARCHIVE_FILE', 'JOURNAL_FILE', 'CONFIG_FILE', 'SESSION_FILE',\n"
+        "          'BEHAVIOR_FILE', 'DB_FILE', 'INDEX_FILE', 'ROLLUP_FILE', 'SOCKET_FILE'):\n"
+        f"    setattr(grind_paths, k, {str(tmp_path)!r} + '/' + k.lower())\n"
+        "import grind_cli\n"
+        "try:\n"
+        f"    grind_cli.main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(json.dumps(sorted(sys.modules)))\n"
+    )
+    res = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True)
+    return set(json.loads(res.stderr.splitlines()[-1]))
+
+
+def test_registry_is_complete(grind, capsys):
+    import grind_cli
+    for name, (module, _) in grind_cli.COMMANDS.items():
+        assert callable(getattr(importlib.import_module(module), f"cmd_{name}")), name
+        with pytest.raises(SystemExit) as e:
+            grind_cli.main([name, "--help"])
+        assert e.value.code == 0
+        assert f"usage: grind {name}" in capsys.readouterr().out
+
+
+def test_top_level_help_imports_no_command_module(tmp_path):
+    mods = loaded_modules(tmp_path, ["--help"])
+    assert not any(m.startswith("grind_cmd_") for m in mods)
+    assert "grind_data" not in mods
+
+
+def test_session_event_imports_only_its_module(tmp_path):
+    mods = loaded_modules(tmp_path, ["session", "event", "two-sum", "presented"])
+    assert {m for m in mods if m.startswith("grind_cmd_")} == {"grind_cmd_session"}
+    assert "subprocess" not in mods
+    assert "socket" not in mods
+
+
+def test_help_lists_every_command(grind, capsys):
+    import grind_cli
+    grind.main([])
+    out = capsys.readouterr().out
+    assert all(name in out for name in grind_cli.COMMANDS)
+
+
+def test_legacy_names_resolve(grind):
+    assert grind.cmd_session.__module__ == "grind_cmd_session"
+    assert grind.sm2_calculate.__module__ == "grind_algos"
+    assert grind.progress_report.__module__ == "grind_reports"
+    with pytest.raises(AttributeError):
+        grind.no_such_name
@@ -1,7 +1,9 @@
 """
-Tests for atomic save_config() — tmp+replace pattern with .bak.
+Tests for atomic save_config() — tmp+replace pattern with .bak — and config_transaction().
 """
 import os
+import argparse
+from datetime import datetime, timedelta
 import pytest
 from conftest import import_grind
 
@@ -38,3 +40,56 @@ def test_save_and_load_roundtrip(tmp_env):
     loaded = g.load_config()
     assert loaded["active_track"] == "blind75"
     assert loaded["active_target"] == "foo-001"
+
+
+# --- config_transaction ---
+
+@pytest.fixture
+def count_writes(tmp_env, monkeypatch):
+    import grind_data
+    writes = []
+    real = grind_data._write_config_file
+    monkeypatch.setattr(grind_data, "_write_config_file", lambda c: (writes.append(c), real(c)))
+    return writes
+
+
+def test_transaction_defers_and_batches_saves(tmp_env, count_writes):
+    g, tmp = tmp_env
+    import grind_data
+    with grind_data.config_transaction() as config:
+        config["active_track"] = "neetcode150"
+        g.save_config(config)
+        assert g.load_config() is config
+        with grind_data.config_transaction() as inner:      # nested joins the outer one
+            inner["gap_overrides"] = {"dp": "weak"}
+            g.save_config(inner)
+        assert count_writes == []
+    assert len(count_writes) == 1
+    assert g.load_config()["gap_overrides"] == {"dp": "weak"}
+
+
+def test_transaction_skips_unchanged_and_discards_on_error(tmp_env, count_writes):
+    g, tmp = tmp_env
+    import grind_data
+    with grind_data.config_transaction():
+        pass
+    assert count_writes == []
+    with pytest.raises(RuntimeError):
+        with grind_data.config_transaction() as config:
+            config["active_track"] = "neetcode150"
+            raise RuntimeError
+    assert count_writes == []
+    assert g.load_config()["active_track"] == "blind75"
+
+
+def test_plan_regenerate_writes_once(tmp_env, count_writes):
+    g, tmp = tmp_env
+    date = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+    g.save_config({"active_target": "acme-001", "targets": {"acme-001": {
+        "id": "acme-001", "company": "Acme", "role": "SWE", "interview_date": date,
+        "intelligence": {}, "plan": {}}}})
+    count_writes.clear()
+    g.cmd_plan(argparse.Namespace(plan_cmd="generate", target=None))
+    g.cmd_plan(argparse.Namespace(plan_cmd="regenerate", target=None))
+    assert len(count_writes) == 2
+    assert g.load_config()["targets"]["acme-001"]["plan"]["days"]
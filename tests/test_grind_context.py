@@ -0,0 +1,86 @@
+"""
+Tests for grind context — the one-call session-start snapshot.
+
+Invariants:
+- Each section equals what the standalone read command reports
+- Memory, config, the memory index and the behavior rollup are each read once per call
+- A fresh install (no history, no target) still yields a complete document
+"""
+import json
+from datetime import datetime, timedelta
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def make_row(slug, topic="arrays", rating=4, next_review="2000-01-01"):
+    date = datetime.now().strftime("%Y-%m-%d")
+    return {"slug": slug, "topic": topic, "difficulty": "easy", "date": date,
+            "rating": rating, "time": "20m", "hints": 0, "ease": 2.5,
+            "interval": "6d", "next_review": next_review}
+
+
+@pytest.fixture
+def history(tmp_env, capsys):
+    g, tmp = tmp_env
+    g.write_memory([make_row("two-sum"), make_row("coin-change", "dp", 2),
+                    make_row("word-ladder", "graphs", 3, next_review="2099-01-01")])
+    date = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+    g.save_config({"active_track": "blind75", "active_target": "acme-001", "targets": {"acme-001": {
+        "id": "acme-001", "company": "Acme", "role": "SWE", "interview_date": date,
+        "intelligence": {}, "plan": {}}}})
+    g.main(["plan", "generate"])
+    with open(g.BEHAVIOR_FILE, "w") as f:
+        for i in range(6):
+            f.write(json.dumps({"ts": "2026-01-01T10:00:00", "slug": "coin-change", "topic": "dp",
+                                "event": "hint_given", "hint_level": 3, "time_to_hint_min": 2}) + "\n")
+    capsys.readouterr()
+    return g
+
+
+def test_sections_match_standalone_reports(history, capsys):
+    g = history
+    g.main(["context"])
+    doc = json.loads(capsys.readouterr().out)
+    config = g.load_config()
+    assert doc["target"]["company"] == "Acme" and doc["target"]["plan"]["days_total"]
+    assert doc["plan_today"] == g.plan_today_report(config, "acme-001")
+    assert doc["gaps"] == g.gap_report()
+    assert doc["behavior"] == g.behavior_summary_report()
+    assert [d["slug"] for d in doc["due"]] == [s for s, _, _ in g.due_reviews()]
+    progress = g.progress_report()
+    assert {k: doc[k] for k in ("attempts", "solved", "streak", "track")} == \
+           {k: progress[k] for k in ("attempts", "solved", "streak", "track")}
+
+
+def test_sources_read_once(history, monkeypatch):
+    g = history
+    import grind_reports
+    calls = {}
+
+    def counted(name):
+        real = getattr(grind_reports, name)
+
+        def wrapper(*a, **kw):
+            calls[name] = calls.get(name, 0) + 1
+            return real(*a, **kw)
+        monkeypatch.setattr(grind_reports, name, wrapper)
+
+    for name in ("parse_memory", "load_config", "memory_index", "behavior_rollup"):
+        counted(name)
+    g.context_report()
+    assert calls == {"parse_memory": 1, "load_config": 1, "memory_index": 1, "behavior_rollup": 1}
+
+
+def test_fresh_install(tmp_env, capsys):
+    g, tmp = tmp_env
+    g.main(["context"])
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["attempts"] == 0 and doc["due"] == []
+    assert doc["target"] is None and doc["plan_today"] is None
+    assert all(t["status"] == "unknown" for t in doc["gaps"]["topics"].values())
+    assert doc["behavior"]["events"] == 0
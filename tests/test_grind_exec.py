@@ -0,0 +1,150 @@
+"""
+Tests for measured runs (grind_exec.py) and `grind run --profile`.
+
+Invariants:
+- run_measured reports the child's own CPU time and peak RSS (wait4), its exit code and stdin;
+  the caller's memory does not leak into the child's peak RSS
+- A child past its timeout is killed and flagged
+- percentile is nearest-rank; summarize gives min/median/p95 per metric
+- `grind run --profile/--repeat N` runs N times, shows output once and prints the stats table
+- run_limited: wall/CPU time, memory and output limits give TLE/MLE/OLE verdicts, the whole
+  process group is killed, and `grind run` reports them LeetCode-style (limits from config or flags)
+- run_limited never runs Python between fork and exec (no preexec_fn), so it is safe from threads
+"""
+import sys
+import json
+import time
+import pytest
+
+import grind_exec
+
+
+def test_measures_cpu_and_rss():
+    burn = "x = bytearray(64 * 1024 * 1024)\nn = 0\nfor i in range(2_000_000): n += i\n"
+    m = grind_exec.run_measured([sys.executable, "-c", burn])
+    assert m.code == 0 and not m.timed_out
+    assert m.user > 0.02 and m.cpu >= m.user
+    assert m.max_rss_kb > 60 * 1024
+    assert m.wall >= m.user * 0.5
+
+
+def test_rss_excludes_callers_footprint():
+    ballast = bytearray(128 * 1024 * 1024)
+    ballast[::4096] = b"x" * len(ballast[::4096])        # touch every page
+    m = grind_exec.run_measured([sys.executable, "-c", "pass"])
+    assert m.max_rss_kb < 64 * 1024
+    del ballast
+
+
+def test_stdin_capture_and_exit_code():
+    code = "import sys; d = sys.stdin.read(); print(d.upper()); sys.exit(4)"
+    m = grind_exec.run_measured([sys.executable, "-c", code], stdin=b"abc", capture=True)
+    assert m.code == 4
+    assert m.stdout.strip() == b"ABC"
+
+
+def test_timeout_kills_child():
+    m = grind_exec.run_measured([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.3)
+    assert m.timed_out and m.code < 0
+    assert m.wall < 5
+
+
+def test_percentile_and_summarize():
+    assert grind_exec.percentile([5, 1, 3, 2, 4], 50) == 3
+    assert grind_exec.percentile(list(range(1, 21)), 95) == 19
+    assert grind_exec.percentile([7], 95) == 7
+    runs = [grind_exec.Measurement(0, w, w / 2, 0.0, rss) for w, rss in [(3, 10), (1, 30), (2, 20)]]
+    stats = grind_exec.summarize(runs)
+    assert stats["wall"] == {"min": 1, "median": 2, "p95": 3}
+    assert stats["max_rss_kb"]["min"] == 10 and stats["user"]["median"] == 1
+
+
+@pytest.fixture()
+def problem(tmp_env):
+    g, tmp = tmp_env
+    d = tmp / "problems" / "echo"
+    d.mkdir(parents=True)
+    (d / "solution.py").write_text("import sys\nprint('sum', sum(map(int, sys.stdin.read().split())))\n")
+    (d / "input.txt").write_text("1 2 3\n")
+    return g, d
+
+
+def test_run_profile_repeat(problem, capfd):
+    g, d = problem
+    g.main(["run", "echo", "--repeat", "3"])
+    out = capfd.readouterr().out
+    assert out.count("sum 6") == 1                    # only the first run's output is shown
+    assert "(3 runs)" in out
+    for row in ("wall", "cpu user", "cpu sys", "peak rss", "median", "p95"):
+        assert row in out
+
+
+def test_run_profile_defaults_to_five_runs(problem, capfd):
+    g, d = problem
+    g.main(["run", "echo", "--profile"])
+    assert "(5 runs)" in capfd.readouterr().out
+
+
+@pytest.mark.parametrize("code, limits, verdict", [
+    ("print('hi')",                             {},                                "OK"),
+    ("raise SystemExit(3)",                     {},                                "RE"),
+    ("while True: pass",                        {"cpu": 1, "time": 20},            "TLE"),
+    ("import time; time.sleep(30)",             {"time": 0.3},                     "TLE"),
+    ("x = bytearray(2 * 1024 ** 3)",            {"memory": 256 * 1024 * 1024},     "MLE"),
+    ("while True: print('y' * 100)",            {"output": 10000},                 "OLE"),
+    ("open('big', 'w').write('a' * 20000)",     {"output": 1000},                  "OLE"),
+])
+def test_run_limited_verdicts(tmp_path, code, limits, verdict):
+    m = grind_exec.run_limited([sys.executable, "-c", code], cwd=str(tmp_path),
+                               limits=grind_exec.Limits(**limits), capture=True)
+    assert m.verdict == verdict
+    assert len(m.stdout) <= limits.get("output", 1 << 30)
+
+
+def test_run_limited_kills_the_group(tmp_path):
+    code = ("import subprocess, sys; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "print('started', flush=True); import time; time.sleep(30)")
+    start = time.perf_counter()
+    m = grind_exec.run_limited([sys.executable, "-c", code], limits=grind_exec.Limits(time=0.5), capture=True)
+    assert m.verdict == "TLE" and m.stdout == b"started\n"
+    assert time.perf_counter() - start < 5          # the grandchild did not hold the pipes open
+
+
+def test_run_limited_is_thread_safe(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    real_popen = grind_exec.subprocess.Popen
+
+    def popen(*args, **kwargs):
+        assert kwargs.get("preexec_fn") is None
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(grind_exec.subprocess, "Popen", popen)
+    cases = [("x = bytearray(2 * 1024 ** 3)", "MLE"), ("print('ok')", "OK"),
+             ("while True: print('y' * 100)", "OLE"), ("raise SystemExit(2)", "RE")] * 2
+    limits = grind_exec.Limits(memory=256 * 1024 * 1024, output=10000)
+    with ThreadPoolExecutor(4) as pool:
+        verdicts = list(pool.map(lambda c: grind_exec.run_limited(
+            [sys.executable, "-c", c[0]], cwd=str(tmp_path), limits=limits, capture=True).verdict, cases))
+    assert verdicts == [v for _, v in cases]
+    missing = grind_exec.run_limited(["no-such-binary-xyz"], capture=True)
+    assert missing.code == 127 and b"no-such-binary-xyz" in missing.stderr
+
+
+def test_run_reports_verdict(problem, capfd):
+    g, d = problem
+    (d / "solution.py").write_text("while True:\n    pass\n")
+    g.main(["run", "echo", "--time-limit", "0.5"])
+    assert "Time Limit Exceeded (0.5s wall" in capfd.readouterr().err
+
+
+def test_limits_from_config(problem, capfd):
+    g, d = problem
+    (d / "solution.py").write_text("x = bytearray(512 * 1024 * 1024)\n")
+    config = g._gp.CONFIG_FILE
+    with open(config, "w") as f:
+        json.dump({"run_limits": {"memory_mb": 128}}, f)
+    g.main(["run", "echo"])
+    assert "Memory Limit Exceeded (128MB)" in capfd.readouterr().err
+    g.main(["run", "echo", "--memory-limit", "0"])
+    assert "Limit Exceeded" not in capfd.readouterr().err
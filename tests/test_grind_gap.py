@@ -7,6 +7,7 @@ Classification rules:
 - avg < 4.0 → 'developing'
 - avg >= 4.0 → 'strong'
 - Explicit override wins over computed score
+- The incremental accumulators (grind_index.GapAccumulators) match a full rescan
 """
 import pytest
 from conftest import import_grind
@@ -137,3 +138,81 @@ def test_decay_same_date_is_unchanged(grind):
              for i, r in enumerate([3, 4, 3, 4, 3])]
     scores = grind.compute_gap_scores(rows, today=today)
     assert scores.get("graphs") == "developing"   # avg 3.4, unchanged
+
+
+# --- Incremental accumulators ---
+
+def random_rows(n, seed=3):
+    import random
+    from datetime import date
+    rng, topics = random.Random(seed), ["arrays", "dp", "graphs", "trees"]
+    rows = []
+    for i in range(n):
+        nr = date(2026, 1, 1).toordinal() + rng.randrange(120)
+        rows.append({"slug": f"p{i}", "topic": rng.choice(topics), "rating": rng.randint(1, 5),
+                     "next_review": date.fromordinal(nr).isoformat() if rng.random() > 0.05 else ""})
+    return rows
+
+
+def reference_totals(rows, today):
+    import math
+    from datetime import date
+    out = {}
+    for r in rows:
+        nr   = r["next_review"]
+        over = max(0, (today - date.fromisoformat(nr)).days) if nr else 0
+        w    = math.exp(-over / 30.0)
+        n, tw, trw = out.get(r["topic"], (0, 0.0, 0.0))
+        out[r["topic"]] = (n + 1, tw + w, trw + r["rating"] * w)
+    return out
+
+
+def assert_totals_close(got, want):
+    assert got.keys() == want.keys()
+    for t in want:
+        assert got[t][0] == want[t][0]
+        assert got[t][1] == pytest.approx(want[t][1], rel=1e-9)
+        assert got[t][2] == pytest.approx(want[t][2], rel=1e-9)
+
+
+def test_accumulators_match_rescan_as_days_pass(grind):
+    """Log rows day by day (settling each time) and query across a 6-month window."""
+    from datetime import date, timedelta
+    import grind_index
+    rows  = random_rows(400)
+    start = date(2026, 1, 15)
+    acc   = grind_index.GapAccumulators.from_rows([], start)
+    for i, r in enumerate(rows):
+        acc.settle(start + timedelta(days=i // 4))
+        acc.record(r)
+    for offset in (0, 1, 30, 75, 180):
+        today = start + timedelta(days=len(rows) // 4 + offset)
+        assert_totals_close(acc.totals(today), reference_totals(rows, today))
+        assert grind.classify_gaps(acc.totals(today)) == grind.compute_gap_scores(rows, today=today)
+
+
+def test_accumulators_remove_and_refuse_past(grind):
+    from datetime import date
+    import grind_index
+    rows  = random_rows(100)
+    today = date(2026, 3, 1)
+    acc   = grind_index.GapAccumulators.from_rows(rows, today)
+    for r in rows[:40]:
+        acc.remove(r)
+    assert_totals_close(acc.totals(today), reference_totals(rows[40:], today))
+    assert acc.totals(date(2026, 2, 1)) is None
+
+
+def test_current_gap_scores_tracks_log_and_archive(tmp_env):
+    g, tmp = tmp_env
+    import argparse
+    g.save_config({"active_track": "blind75"})
+    for i, slug in enumerate(["two-sum", "contains-duplicate", "valid-anagram", "two-sum"] * 3):
+        g.cmd_log(argparse.Namespace(slug=slug, rating=1 + i % 5, time=20, hints=0,
+                                     topic=None, difficulty=None, notes=None))
+        assert g.current_gap_scores() == g.compute_gap_scores(g.parse_memory())
+    import grind_data
+    grind_data.archive_memory(keep=5)
+    assert g.current_gap_scores() == g.compute_gap_scores(g.parse_memory())
+    assert grind_data.topic_rating_totals()["arrays"][0] == len(
+        [r for r in g.parse_memory() if r["topic"] == "arrays"])
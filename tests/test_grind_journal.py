@@ -0,0 +1,130 @@
+"""
+Tests for journal storage mode — append-only attempts next to memory.md.
+
+Invariants:
+- parse_memory returns identical row dicts whether attempts came from the table or the journal
+- write_memory folds the journal in and records a seq watermark
+- Records at or below the watermark are never counted twice (crash between replace and remove)
+- A torn trailing journal line is skipped and does not corrupt the next append
+- append_attempt takes the next seq from the journal's tail, not a full re-read
+- In journal mode, `grind log` leaves memory.md untouched until JOURNAL_THRESHOLD, but
+  archives past ARCHIVE_THRESHOLD on every log, exactly like markdown mode
+"""
+import os
+import argparse
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def make_row(slug, rating=4, ease=2.36):
+    return {"slug": slug, "topic": "arrays", "difficulty": "easy",
+            "date": "2026-02-19", "rating": rating, "time": "20m", "hints": 0,
+            "ease": ease, "interval": "6d", "next_review": "2026-02-25"}
+
+
+def log_args(slug, rating=4):
+    return argparse.Namespace(slug=slug, rating=rating, time=20, hints=0,
+                              topic="arrays", difficulty="easy", notes=None)
+
+
+def test_journal_rows_match_table_rows(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    grind_data.append_attempt(make_row("two-sum"))
+    journaled = g.parse_memory()
+
+    g.write_memory([make_row("two-sum")])
+    assert g.parse_memory() == journaled
+
+
+def test_write_memory_folds_journal(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a")])
+    grind_data.append_attempt(make_row("b"))
+    grind_data.append_attempt(make_row("c"))
+    assert [r["slug"] for r in g.parse_memory()] == ["a", "b", "c"]
+
+    assert grind_data.materialize_memory() == 2
+    assert not os.path.exists(g.JOURNAL_FILE)
+    assert "journal-seq: 2" in open(g.MEMORY_FILE).read()
+    assert [r["slug"] for r in g.parse_memory()] == ["a", "b", "c"]
+
+
+def test_watermark_prevents_double_count(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    grind_data.append_attempt(make_row("a"))
+    leftover = open(g.JOURNAL_FILE).read()
+    grind_data.materialize_memory()
+    with open(g.JOURNAL_FILE, "w") as f:     # simulate a crash before the journal was removed
+        f.write(leftover)
+    assert [r["slug"] for r in g.parse_memory()] == ["a"]
+
+    grind_data.append_attempt(make_row("b"))
+    assert [r["slug"] for r in g.parse_memory()] == ["a", "b"]
+
+
+def test_torn_line_skipped(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    grind_data.append_attempt(make_row("a"))
+    with open(g.JOURNAL_FILE, "a") as f:
+        f.write('{"seq": 2, "slug": "tor')
+    assert [r["slug"] for r in g.parse_memory()] == ["a"]
+    grind_data.append_attempt(make_row("b"))
+    assert [r["slug"] for r in g.parse_memory()] == ["a", "b"]
+
+
+def test_append_reads_only_the_tail(tmp_env, monkeypatch):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a")])
+    with monkeypatch.context() as m:
+        m.setattr(grind_data, "read_journal", lambda: pytest.fail("full journal read"))
+        assert [grind_data.append_attempt(make_row(s)) for s in "bcd"] == [1, 2, 3]
+        with open(g.JOURNAL_FILE, "a") as f:
+            f.write('{"seq": 4, "slug": "tor')
+        assert grind_data.append_attempt(make_row("e")) == 4
+    assert [r["slug"] for r in g.parse_memory()] == ["a", "b", "c", "d", "e"]
+
+
+def test_log_in_journal_mode_defers_table_write(tmp_env, monkeypatch):
+    g, tmp = tmp_env
+    import grind_paths
+    monkeypatch.setattr(grind_paths, "JOURNAL_THRESHOLD", 3)
+    g.save_config({"active_track": "blind75", "storage": "journal"})
+
+    g.cmd_log(log_args("two-sum"))
+    g.cmd_log(log_args("two-sum", 5))
+    assert not os.path.exists(g.MEMORY_FILE)
+    assert [r["slug"] for r in g.parse_memory()] == ["two-sum", "two-sum"]
+
+    g.cmd_log(log_args("contains-duplicate"))
+    assert os.path.exists(g.MEMORY_FILE)
+    assert not os.path.exists(g.JOURNAL_FILE)
+    assert len(g.parse_memory()) == 3
+
+
+def test_archiving_matches_markdown_mode(tmp_env, capsys):
+    g, tmp = tmp_env
+    slugs = [p["slug"] for p in g.get_problem_bank().track_problems("blind75")[:55]]
+    seen = {}
+    for mode in ("markdown", "journal"):
+        for path in (g.MEMORY_FILE, g.ARCHIVE_FILE, g.JOURNAL_FILE, g.INDEX_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        g.save_config({"active_track": "blind75", "storage": mode})
+        for i, slug in enumerate(slugs):
+            g.cmd_log(argparse.Namespace(slug=slug, rating=i % 5 + 1, time=20, hints=0,
+                                         topic=None, difficulty=None, notes=None))
+        capsys.readouterr()
+        g.cmd_progress(argparse.Namespace(json=False))
+        seen[mode] = (g.parse_memory(), capsys.readouterr().out)
+    assert len(seen["journal"][0]) == g.ARCHIVE_THRESHOLD
+    assert seen["journal"] == seen["markdown"]
@@ -0,0 +1,83 @@
+"""
+Tests for --json output on read commands.
+
+Invariants:
+- Every read command accepts --json and prints one valid JSON document, no ANSI codes
+- --json works before the subcommand (global) and after it (per-command)
+- The JSON carries the same facts as the text view (same due list, same gap statuses)
+- Empty history still yields a valid document
+"""
+import json
+from datetime import datetime, timedelta
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+READ_COMMANDS = [
+    ["progress"], ["stats"], ["due"], ["gap", "show"], ["list"], ["track"],
+    ["behavior", "summary"], ["behavior", "report"], ["target", "list"],
+    ["target", "show"], ["plan", "show"], ["plan", "today"],
+]
+
+
+def make_row(slug, topic="arrays", rating=4, days_ago=0, next_review="2000-01-01"):
+    date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+    return {"slug": slug, "topic": topic, "difficulty": "easy", "date": date,
+            "rating": rating, "time": "20m", "hints": 0, "ease": 2.5,
+            "interval": "6d", "next_review": next_review}
+
+
+def run_json(g, argv, capsys):
+    g.main(argv)
+    out = capsys.readouterr().out
+    assert "\033" not in out, argv
+    return json.loads(out)
+
+
+@pytest.fixture
+def history(tmp_env):
+    g, tmp = tmp_env
+    g.write_memory([make_row("two-sum", days_ago=3), make_row("coin-change", "dp", 2, days_ago=1),
+                    make_row("word-ladder", "graphs", 3, next_review="2099-01-01")])
+    date = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+    g.save_config({"active_track": "blind75", "active_target": "acme-001", "targets": {"acme-001": {
+        "id": "acme-001", "company": "Acme", "role": "SWE", "interview_date": date,
+        "intelligence": {}, "plan": {}}}})
+    g.main(["plan", "generate"])
+    return g
+
+
+def test_every_read_command_emits_json(history, capsys):
+    capsys.readouterr()
+    for argv in READ_COMMANDS:
+        doc = run_json(history, argv + ["--json"], capsys)
+        assert isinstance(doc, list if argv == ["due"] else dict), argv
+
+
+def test_global_flag_matches_per_command_flag(history, capsys):
+    capsys.readouterr()
+    for argv in (["progress"], ["gap", "show"], ["plan", "today"]):
+        assert run_json(history, ["--json"] + argv, capsys) == run_json(history, argv + ["--json"], capsys)
+
+
+def test_progress_json_matches_sources(history, capsys):
+    capsys.readouterr()
+    doc = run_json(history, ["progress", "--json"], capsys)
+    assert doc["attempts"] == 3
+    assert doc["target"]["company"] == "Acme"
+    assert {d["slug"] for d in doc["due"]} == {"two-sum", "coin-change"}
+    gap = run_json(history, ["gap", "show", "--json"], capsys)
+    assert doc["gaps"] == gap["topics"]
+    assert gap["topics"]["dp"]["status"] == history.gap_report()["topics"]["dp"]["status"]
+
+
+def test_empty_history_is_valid_json(tmp_env, capsys):
+    g, tmp = tmp_env
+    g.write_memory([])
+    for argv in (["progress"], ["stats"], ["due"], ["gap", "show"], ["behavior", "summary"]):
+        run_json(g, argv + ["--json"], capsys)
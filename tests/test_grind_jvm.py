@@ -0,0 +1,286 @@
+"""
+Tests for the warm JVM client (grind_jvm.py).
+
+A stand-in runner written in Python speaks GrindRunner's wire protocol, so
+most of these run without a JDK; the real runner is compiled and driven by the
+tests marked needs_jdk, which skip when javac/java are not on PATH.
+
+Invariants:
+- run() sends the build key, class name, absolute source path, input.txt bytes and the run's
+  wall/CPU/output limits; TIMED_OUT and OUTPUT_LIMITED replies become TLE/OLE verdicts
+- grind run on a .java file replays the runner's stdout and reports round-trip timing
+- No runner or a stale socket → None (cold fallback)
+- Sources calling System.exit are never sent; a runner lost mid-request is reported, not re-run
+- GrindRunner: runs, caches by key, survives stray output, answers EXITED when main() exits it
+"""
+import os
+import time
+import shutil
+import socket
+import struct
+import threading
+import subprocess
+import pytest
+
+import grind_jvm
+import grind_build
+
+
+def read_bytes(conn):
+    n, = struct.unpack(">i", recv_exact(conn, 4))
+    return recv_exact(conn, n)
+
+
+def recv_exact(conn, n):
+    buf = b""
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        assert chunk
+        buf += chunk
+    return buf
+
+
+@pytest.fixture()
+def reply(request):
+    """What the fake runner answers: exit code and stdout (default: echo stdin)."""
+    return getattr(request, "param", {})
+
+
+@pytest.fixture()
+def fake_runner(tmp_env, reply):
+    """Answer one run request like GrindRunner; yields the list of requests seen."""
+    g, tmp = tmp_env
+    path = grind_jvm._gp.JVM_SOCKET_FILE
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    seen = []
+
+    def answer():
+        conn, _ = server.accept()
+        with conn:
+            op, = struct.unpack(">i", recv_exact(conn, 4))
+            key, classname, source, stdin = (read_bytes(conn) for _ in range(4))
+            limits = struct.unpack(">qqq", recv_exact(conn, 24))
+            seen.append({"op": op, "key": key.decode(), "classname": classname.decode(),
+                         "source": source.decode(), "stdin": stdin, "limits": limits})
+            out, err = reply.get("stdout", b"answer: " + stdin), b""
+            conn.sendall(struct.pack(">ibbqq", reply.get("code", 0), 1, 0, 120_000, 3_000)
+                         + struct.pack(">i", len(out)) + out + struct.pack(">i", len(err)) + err)
+
+    t = threading.Thread(target=answer, daemon=True)
+    t.start()
+    yield g, tmp, seen
+    t.join(5)
+    server.close()
+
+
+def java_problem(tmp):
+    problem = tmp / "problems" / "two_sum"
+    problem.mkdir(parents=True)
+    (problem / "Solution.java").write_text("package problems.two_sum;\npublic class Solution {}\n")
+    (problem / "input.txt").write_text("[2,7,11,15]\n")
+    return str(problem / "Solution.java")
+
+
+def test_run_sends_key_and_stdin(fake_runner):
+    g, tmp, seen = fake_runner
+    source = java_problem(tmp)
+    resp = grind_jvm.run(source, "problems.two_sum.Solution", b"[1]\n")
+    assert resp["stdout"] == b"answer: [1]\n"
+    assert resp["compiled"] and not resp["cached"]
+    assert resp["compile_ms"] == 120 and resp["run_ms"] == 3
+    assert resp["round_trip_ms"] >= 0
+    assert seen == [{"op": grind_jvm.OP_RUN, "classname": "problems.two_sum.Solution",
+                     "key": grind_build.java_key(source, "problems.two_sum.Solution"),
+                     "source": os.path.abspath(source), "stdin": b"[1]\n", "limits": (0, 0, 0)}]
+
+
+def test_grind_run_uses_warm_jvm(fake_runner, capsys):
+    g, tmp, seen = fake_runner
+    g._run_file(java_problem(tmp))
+    out = capsys.readouterr().out
+    assert "answer: [2,7,11,15]" in out
+    assert "Warm JVM: compile 120ms, run 3ms, round trip" in out
+    assert seen[0]["stdin"] == b"[2,7,11,15]\n"
+
+
+@pytest.mark.parametrize("reply, verdict", [
+    ({"code": grind_jvm.TIMED_OUT, "stdout": b""}, "Time Limit Exceeded (1.5s wall / 10s CPU on the warm JVM)"),
+    ({"code": grind_jvm.OUTPUT_LIMITED, "stdout": b"y" * 2048}, "Output Limit Exceeded (2KB)"),
+], indirect=["reply"])
+def test_warm_jvm_gets_and_reports_limits(fake_runner, capsys, verdict):
+    g, tmp, seen = fake_runner
+    g.main(["run", java_problem(tmp), "--time-limit", "1.5", "--output-limit", "2"])
+    assert seen[0]["limits"] == (1500, 10_000, 2048)
+    assert verdict in capsys.readouterr().err
+
+
+def test_no_runner_falls_back(tmp_env):
+    g, tmp = tmp_env
+    assert grind_jvm.run("Solution.java", "Solution") is None
+    open(grind_jvm._gp.JVM_SOCKET_FILE, "w").close()         # stale socket file
+    assert grind_jvm.run("Solution.java", "Solution") is None
+    assert not grind_jvm.is_running()
+
+
+def dying_runner(path):
+    """Accept one request and close the connection without answering (e.g. Runtime.halt)."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+
+    def die():
+        conn, _ = server.accept()
+        conn.recv(1 << 16)
+        conn.close()
+
+    t = threading.Thread(target=die, daemon=True)
+    t.start()
+    return server, t
+
+
+def test_runner_lost_mid_request_is_reported_not_rerun(tmp_env, monkeypatch, capsys):
+    g, tmp = tmp_env
+    import grind_cmd_workspace
+    server, t = dying_runner(grind_jvm._gp.JVM_SOCKET_FILE)
+    monkeypatch.setattr(grind_cmd_workspace, "prepare_run", lambda f: pytest.fail("re-ran cold"))
+    try:
+        g._run_file(java_problem(tmp))
+    finally:
+        t.join(5)
+        server.close()
+    err = capsys.readouterr().err
+    assert "warm JVM stopped during the run" in err and "Runtime Error" in err
+
+
+def test_exit_calls_are_not_sent(tmp_env):
+    g, tmp = tmp_env
+    source = java_problem(tmp)
+    with open(source, "w") as f:
+        f.write("public class Solution { public static void main(String[] a) {\n"
+                "  Runtime.getRuntime() . halt(0); } }\n")
+    assert grind_jvm.calls_exit(source)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(grind_jvm._gp.JVM_SOCKET_FILE)
+    server.listen(1)
+    try:
+        assert grind_jvm.run(source, "Solution") is None
+        server.settimeout(0.1)
+        with pytest.raises(socket.timeout):
+            server.accept()                                   # nothing was sent
+    finally:
+        server.close()
+    with open(source, "w") as f:
+        f.write("class Solution { void exitEarly() {} }  // System.exitEarly is not System.exit\n")
+    assert not grind_jvm.calls_exit(source)
+
+
+# --- the real GrindRunner (needs a JDK) ---
+
+needs_jdk = pytest.mark.skipif(not (shutil.which("javac") and shutil.which("java")),
+                               reason="javac/java not installed")
+
+
+@pytest.fixture()
+def real_runner(tmp_env):
+    g, tmp = tmp_env
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    shutil.copytree(os.path.join(repo, "utils", "java"), tmp / "utils" / "java")
+    entry = grind_jvm.runner_classes()
+    assert entry, "GrindRunner did not compile"
+    path = grind_jvm._gp.JVM_SOCKET_FILE
+    proc = subprocess.Popen(["java", "-cp", entry, grind_jvm.RUNNER_CLASS, path, "0", "5"])
+    deadline = time.time() + 30
+    while not grind_jvm.is_running(path):
+        assert time.time() < deadline and proc.poll() is None, "runner did not start"
+        time.sleep(0.1)
+    yield g, tmp, proc
+    grind_jvm.stop(path)
+    try:
+        proc.wait(10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def write_solution(tmp, name, body):
+    problem = tmp / "problems" / name
+    problem.mkdir(parents=True, exist_ok=True)
+    (problem / "Solution.java").write_text(f"package problems.{name};\n{body}\n")
+    return str(problem / "Solution.java"), f"problems.{name}.Solution"
+
+
+@needs_jdk
+def test_real_runner_runs_and_caches(real_runner):
+    g, tmp, proc = real_runner
+    source, cls = write_solution(tmp, "echo", """
+import java.io.*;
+public class Solution {
+    public static void main(String[] args) throws IOException {
+        String line = new BufferedReader(new InputStreamReader(System.in)).readLine();
+        new Thread(() -> { try { Thread.sleep(300); } catch (InterruptedException e) {} System.out.println("stray"); }).start();
+        System.out.println("got " + line);
+        System.err.println("note");
+    }
+}""")
+    first = grind_jvm.run(source, cls, b"[1,2]\n")
+    assert first["code"] == 0 and first["compiled"] and not first["cached"]
+    assert first["stdout"] == b"got [1,2]\n" and first["stderr"] == b"note\n"
+    time.sleep(0.5)                                            # the stray thread writes between runs
+    second = grind_jvm.run(source, cls, b"x\n")
+    assert second["cached"] and second["stdout"] == b"got x\n"
+
+    broken, bcls = write_solution(tmp, "broken", "public class Solution { int x = ; }")
+    resp = grind_jvm.run(broken, bcls)
+    assert not resp["compiled"] and b"error" in resp["stderr"]
+
+
+@needs_jdk
+def test_real_runner_exit_is_answered_once(real_runner):
+    g, tmp, proc = real_runner
+    source, cls = write_solution(tmp, "quits", """
+public class Solution {
+    public static void main(String[] args) {
+        System.out.println("before");
+        Runtime r = Runtime.getRuntime();
+        r.exit(3);
+    }
+}""")
+    assert not grind_jvm.calls_exit(source)                   # indirect: only the hook can catch it
+    resp = grind_jvm.run(source, cls)
+    assert resp["code"] == grind_jvm.EXITED and resp["stdout"] == b"before\n"
+    proc.wait(10)
+    assert not grind_jvm.is_running() and not os.path.exists(grind_jvm._gp.JVM_SOCKET_FILE)
+
+
+@needs_jdk
+def test_system_exit_runs_cold_once(real_runner, capfd):
+    g, tmp, proc = real_runner
+    source, cls = write_solution(tmp, "exits", """
+public class Solution {
+    public static void main(String[] args) { System.out.println("ran"); System.exit(0); }
+}""")
+    g._run_file(source)
+    out = capfd.readouterr().out
+    assert out.count("ran") == 1 and "running it cold" in out
+    assert grind_jvm.is_running()
+
+
+@needs_jdk
+def test_real_runner_enforces_limits(real_runner):
+    import grind_exec
+    g, tmp, proc = real_runner
+    source, cls = write_solution(tmp, "chatty", """
+public class Solution {
+    public static void main(String[] args) { while (true) System.out.println("yyyyyyyyy"); }
+}""")
+    resp = grind_jvm.run(source, cls, limits=grind_exec.Limits(time=5, output=1000))
+    assert resp["code"] == grind_jvm.OUTPUT_LIMITED and len(resp["stdout"]) == 1000
+    assert resp["run_ms"] < 5000 and grind_jvm.is_running()
+
+    source, cls = write_solution(tmp, "spins", """
+public class Solution {
+    public static void main(String[] args) { long n = 0; while (true) n++; }
+}""")
+    resp = grind_jvm.run(source, cls, limits=grind_exec.Limits(time=10, cpu=1))
+    assert resp["code"] == grind_jvm.TIMED_OUT and resp["run_ms"] < 5000
@@ -7,9 +7,15 @@ Plan invariants:
 - Company-reported topics get extra weight (at least 1.5x)
 - mock_sessions_target >= 3
 - Plan is stored in target config
+- Generation and rebalancing skip every solved problem, archived ones included (memory index)
+- schedule_coding_days picks exactly what the original tier-scan scheduler picked
+- Rebalancing re-plans only open, upcoming coding days that hold a topic whose weight changed;
+  completed and past days stay put, days keep their numbers and dates (an unfillable one is
+  left empty), no problem is planned twice, and a log writes config once
 """
 import json
 import os
+import random
 import pytest
 from datetime import datetime, timedelta
 from conftest import import_grind
@@ -110,6 +116,21 @@ def test_company_reported_topics_included(tmp_env):
     assert len(all_focuses) > 0
 
 
+def test_plan_skips_archived_solves_without_reparsing(tmp_env, monkeypatch):
+    import grind_algos
+    g, tmp = tmp_env
+    plan   = generated_plan(g)["targets"]["test-001"]["plan"]
+    solved = [s for d in plan["days"][:3] for s in d.get("problems", [])]
+    bank   = g.get_problem_bank()
+    g.write_memory([make_row(s, bank.topic_of(s), 4) for s in solved])
+    g.archive_memory(keep=1)
+    assert len(g.parse_memory()) == 1
+    monkeypatch.setattr(grind_algos, "parse_memory", lambda: pytest.fail("memory reparsed"))
+    g._generate_plan_for_target(g.load_config(), "test-001")
+    planned = {s for d in g.load_config()["targets"]["test-001"]["plan"]["days"] for s in d.get("problems", [])}
+    assert planned and not planned & set(solved)
+
+
 def test_plan_regenerate_preserves_completed_days(tmp_env):
     g, tmp = tmp_env
     config = make_config(days_away=20)
@@ -222,3 +243,194 @@ def test_non_coding_days_not_auto_completed(tmp_env):
     g._mark_plan_progress(fresh, set())
     reloaded = g.load_config()
     assert reloaded['targets']['test-001']['plan']['days'][0]['completed'] is False
+
+
+def reference_schedule(weights, topic_queues, n_days, per_day=2):
+    """The original list-scanning scheduler, kept verbatim as the oracle."""
+    sorted_topics = sorted(weights.keys(), key=lambda t: -weights.get(t, 0))
+    topic_queues = {t: list(topic_queues.get(t, [])) for t in sorted_topics}
+    weight_tiers = {}
+    for t in sorted_topics:
+        w = round(weights.get(t, 0), 1)
+        weight_tiers.setdefault(w, []).append(t)
+    tier_indices = {w: 0 for w in weight_tiers}
+
+    def pick_day_problems(n):
+        picked = []
+        seen_tiers = set()
+        for t in sorted_topics:
+            if len(picked) >= n:
+                break
+            w = round(weights.get(t, 0), 1)
+            if w in seen_tiers:
+                continue
+            seen_tiers.add(w)
+            tier = weight_tiers[w]
+            start = tier_indices[w]
+            for i in range(len(tier)):
+                candidate = tier[(start + i) % len(tier)]
+                if topic_queues.get(candidate):
+                    picked.append((topic_queues[candidate].pop(0), candidate))
+                    tier_indices[w] = (start + i + 1) % len(tier)
+                    break
+        if len(picked) < n:
+            for t in sorted_topics:
+                if len(picked) >= n:
+                    break
+                if topic_queues.get(t) and not any(pp[1] == t for pp in picked):
+                    picked.append((topic_queues[t].pop(0), t))
+        return picked
+
+    days = []
+    for _ in range(n_days):
+        day = pick_day_problems(per_day)
+        if not day:
+            break
+        days.append(day)
+    return days
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_scheduler_matches_reference(grind, seed):
+    rng = random.Random(seed)
+    n_topics = rng.randint(1, 30)
+    weights = {f"t{i}": rng.choice([0.3, 1.0, 1.5, 2.5, 3.0, 1.04, 0.96]) for i in range(n_topics)}
+    queues = {t: [{"slug": f"{t}-{j}"} for j in range(rng.randint(0, 12))] for t in weights}
+    n_days, per_day = rng.randint(1, 150), rng.choice([1, 2, 3])
+    assert (grind.schedule_coding_days(weights, queues, n_days, per_day)
+            == reference_schedule(weights, queues, n_days, per_day))
+
+
+# --- Incremental rebalancing ---
+
+def planned(plan):
+    return [(d["day"], d["type"], tuple(d.get("problems", [])), d.get("completed")) for d in plan["days"]]
+
+
+def generated_plan(g, days_away=30):
+    config = make_config(days_away=days_away)
+    g.save_config(config)
+    g._generate_plan_for_target(g.load_config(), "test-001")
+    return g.load_config()
+
+
+def touches(g, day, topic):
+    bank = g.get_problem_bank()
+    return day.get("focus") == topic or any(bank.topic_of(s) == topic for s in day.get("problems", []))
+
+
+def shifted_plan(g, back=6):
+    """A generated plan whose first `back` days are already past."""
+    config = generated_plan(g)
+    for d in config["targets"]["test-001"]["plan"]["days"]:
+        d["date"] = (datetime.strptime(d["date"], "%Y-%m-%d") - timedelta(days=back)).strftime("%Y-%m-%d")
+    return config
+
+
+def test_rebalance_replans_only_upcoming_days_holding_moved_topic(tmp_env):
+    g, tmp = tmp_env
+    config = shifted_plan(g)
+    plan   = config["targets"]["test-001"]["plan"]
+    today  = datetime.now().strftime("%Y-%m-%d")
+    coding = [d for d in plan["days"] if d["type"] == "coding"]
+    upcoming = [d for d in coding if d["date"] >= today]
+    upcoming[0]["completed"] = True
+    past    = [d for d in coding if d["date"] < today]
+    lighter = next(p["focus"] for p in past if any(touches(g, d, p["focus"]) for d in upcoming[1:]))
+    expected = {d["day"] for d in upcoming[1:] if touches(g, d, lighter)}
+    config["gap_overrides"] = {lighter: "strong"}
+    g.save_config(config)
+    before = planned(plan)
+
+    assert g._rebalance_plan(g.load_config(), set()) == len(expected)
+    plan = g.load_config()["targets"]["test-001"]["plan"]
+    after = planned(plan)
+    assert [r for r in after if r[0] not in expected] == [r for r in before if r[0] not in expected]
+    assert [d["date"] for d in plan["days"]] == [d["date"] for d in config["targets"]["test-001"]["plan"]["days"]]
+    assert plan["weights"][lighter] == 0.3
+    slugs = [s for d in plan["days"] for s in d.get("problems", [])]
+    assert len(slugs) == len(set(slugs))
+    assert g._rebalance_plan(g.load_config(), set()) == 0          # nothing moved since
+
+
+def test_rebalance_replans_on_any_weight_change(tmp_env, capsys):
+    g, tmp = tmp_env
+    config = generated_plan(g)
+    plan   = config["targets"]["test-001"]["plan"]
+    topic  = plan["days"][0]["focus"]
+    assert plan["weights"][topic] == 2.5                           # unknown
+    expected = {d["day"] for d in plan["days"] if d["type"] == "coding" and touches(g, d, topic)}
+    config["gap_overrides"] = {topic: "weak"}
+    g.save_config(config)
+    before = planned(plan)
+    capsys.readouterr()
+    assert g._rebalance_plan(g.load_config(), set()) == len(expected)
+    assert f"[INFO] Plan rebalanced: {len(expected)} upcoming" in capsys.readouterr().out
+    plan = g.load_config()["targets"]["test-001"]["plan"]
+    assert [r for r in planned(plan) if r[0] not in expected] == [r for r in before if r[0] not in expected]
+    assert plan["weights"][topic] == 3.0
+
+
+def test_rebalance_with_dry_bank_empties_days_in_place(tmp_env, monkeypatch, capsys):
+    import grind_algos
+    g, tmp = tmp_env
+    config = shifted_plan(g)
+    plan   = config["targets"]["test-001"]["plan"]
+    today  = datetime.now().strftime("%Y-%m-%d")
+    upcoming = [d for d in plan["days"] if d["type"] == "coding" and d["date"] >= today]
+    lighter = max(plan["weights"], key=lambda t: sum(touches(g, d, t) for d in upcoming))
+    last    = [d["day"] for d in upcoming if touches(g, d, lighter)][-1]
+    config["gap_overrides"] = {lighter: "strong"}
+    g.save_config(config)
+    layout = [(d["day"], d["date"]) for d in plan["days"]]
+    past   = [d for d in plan["days"] if d["date"] < today]
+    real   = grind_algos.schedule_coding_days
+    monkeypatch.setattr(grind_algos, "schedule_coding_days",
+                        lambda w, q, n, *a: real(w, q, n, *a)[:n - 1])
+    assert g._rebalance_plan(g.load_config(), set()) >= 2
+    plan = g.load_config()["targets"]["test-001"]["plan"]
+    assert [(d["day"], d["date"]) for d in plan["days"]] == layout
+    assert [d for d in plan["days"] if d["date"] < today] == past
+    emptied = [d for d in plan["days"] if d.get("empty")]
+    assert [d["day"] for d in emptied] == [last] and emptied[0]["problems"] == []
+    config = g.load_config()
+    for d in config["targets"]["test-001"]["plan"]["days"]:
+        d["completed"] = d["day"] < last                           # bring the empty day into view
+    g.save_config(config)
+    capsys.readouterr()
+    g.main(["plan", "show"])
+    line = next(l for l in capsys.readouterr().out.splitlines() if f"Day {last:2d}" in l)
+    assert "no unsolved problems left" in line
+
+
+def test_rebalance_without_recorded_weights_only_records_them(tmp_env):
+    g, tmp = tmp_env
+    config = generated_plan(g)
+    plan   = config["targets"]["test-001"]["plan"]
+    del plan["weights"]
+    config["gap_overrides"] = {plan["days"][0]["focus"]: "strong"}
+    g.save_config(config)
+    before = planned(plan)
+    assert g._rebalance_plan(g.load_config(), set()) == 0
+    plan = g.load_config()["targets"]["test-001"]["plan"]
+    assert planned(plan) == before and "weights" in plan
+
+
+def test_log_rebalances_with_one_config_write(tmp_env, monkeypatch):
+    import argparse
+    import grind_data
+    g, tmp = tmp_env
+    config = generated_plan(g)
+    plan   = config["targets"]["test-001"]["plan"]
+    day    = next(d for d in plan["days"] if d["type"] == "coding")
+    slug   = day["problems"][0]
+    topic  = g.get_problem_bank().topic_of(slug)
+    writes = []
+    real = grind_data._write_config_file
+    monkeypatch.setattr(grind_data, "_write_config_file", lambda c: (writes.append(c), real(c)))
+    g.cmd_log(argparse.Namespace(slug=slug, rating=1, time=40, hints=2,
+                                 topic=None, difficulty=None, notes=None))
+    assert len(writes) == 1
+    plan = g.load_config()["targets"]["test-001"]["plan"]
+    assert plan["weights"][topic] == 3.0                           # weak now, was unknown
+    assert next(d for d in plan["days"] if d["day"] == day["day"])["problems"] == day["problems"]
@@ -0,0 +1,111 @@
+"""
+Tests for the pre-forked Python pool (grind_pool.py).
+
+Invariants:
+- A solution runs on a worker with input.txt as stdin and output on the caller's fds
+- Exit codes and tracebacks match a `python3` run
+- A reused worker (max_runs > 1) rolls back modules, sys.path and cwd between runs
+- Workers are replaced after max_runs, and no pool → None (cold fallback)
+- Limits: MemoryError → MLE, SIGXCPU → TLE, past the wall limit the worker is killed (TLE);
+  a reused worker gets its own limits back afterwards
+"""
+import os
+import sys
+import time
+import subprocess
+import pytest
+
+import grind_pool
+from grind_exec import Limits
+from conftest import REPO_ROOT
+
+
+@pytest.fixture()
+def pool(tmp_env):
+    g, tmp = tmp_env
+    path = grind_pool._gp.POOL_SOCKET_FILE
+    code = ("import sys; sys.path.insert(0, %r)\n"
+            "import grind_paths; grind_paths.PROJECT_ROOT = %r\n"
+            "import grind_pool; grind_pool.serve(%r, workers=1, max_runs=2)\n") % (REPO_ROOT, REPO_ROOT, path)
+    proc = subprocess.Popen([sys.executable, "-c", code])
+    deadline = time.time() + 10
+    while not grind_pool.is_running(path):
+        assert proc.poll() is None and time.time() < deadline, "pool did not start"
+        time.sleep(0.05)
+    yield g, tmp
+    grind_pool.stop(path)
+    proc.wait(10)
+    assert not os.path.exists(path)
+
+
+def solution(tmp, body, name="solution.py"):
+    problem = tmp / "problems" / "echo"
+    problem.mkdir(parents=True, exist_ok=True)
+    (problem / name).write_text(body)
+    return str(problem / name)
+
+
+def run(source, stdin=b"", limits=None, verdict=False):
+    r, w = os.pipe()
+    os.write(w, stdin)
+    os.close(w)
+    try:
+        outcome = grind_pool.run(source, r, limits=limits)
+    finally:
+        os.close(r)
+    return outcome if verdict else outcome["code"]
+
+
+def test_runs_with_stdin_and_exit_code(pool, capfd):
+    g, tmp = pool
+    source = solution(tmp, "import sys\nfrom utils.python.lc_utils import parse\n"
+                           "print('got', parse(sys.stdin.read().strip()), __name__)\nsys.exit(3)\n")
+    assert run(source, b"[1,2]\n") == 3
+    assert capfd.readouterr().out == "got [1, 2] __main__\n"
+
+
+def test_traceback_starts_at_solution(pool, capfd):
+    g, tmp = pool
+    source = solution(tmp, "raise ValueError('boom')\n")
+    assert run(source) == 1
+    err = capfd.readouterr().err
+    assert err.startswith("Traceback") and "runpy" not in err and "ValueError: boom" in err
+
+
+def test_reused_worker_is_rolled_back(pool, capfd):
+    g, tmp = pool
+    solution(tmp, "count = 0\n", name="helper.py")
+    source = solution(tmp, "import os, sys, helper\nhelper.count += 1\nsys.path.append('x')\n"
+                           "os.chdir('/')\nprint(helper.count, len(sys.path), os.getpid())\n")
+    cwd = os.getcwd()
+    outs = []
+    for _ in range(3):                      # max_runs=2: runs 1-2 share a worker, run 3 gets a new one
+        assert run(source) == 0
+        outs.append(capfd.readouterr().out.split())
+    assert os.getcwd() == cwd
+    assert [o[:2] for o in outs] == [outs[0][:2]] * 3 and outs[0][0] == "1"
+    assert outs[0][2] == outs[1][2] != outs[2][2]
+
+
+def test_limits_give_verdicts(pool, capfd):
+    g, tmp = pool
+    hog  = solution(tmp, "x = bytearray(512 * 1024 * 1024)\n", name="hog.py")
+    spin = solution(tmp, "while True:\n    pass\n", name="spin.py")
+    nap  = solution(tmp, "import time\ntime.sleep(30)\n", name="nap.py")
+    ok   = solution(tmp, "x = bytearray(512 * 1024 * 1024)\nprint('fine')\n", name="ok.py")
+    assert run(hog, limits=Limits(memory=256 * 1024 * 1024), verdict=True)["verdict"] == "MLE"
+    assert run(ok, verdict=True) == {"code": 0, "verdict": "OK"}         # same worker, limit lifted
+    assert run(spin, limits=Limits(cpu=1, time=20), verdict=True)["verdict"] == "TLE"
+    start = time.time()
+    assert run(nap, limits=Limits(time=0.5), verdict=True)["verdict"] == "TLE"
+    assert time.time() - start < 5
+    assert "MemoryError" in capfd.readouterr().err
+    assert run(ok) == 0                                                  # killed worker was replaced
+
+
+def test_no_pool_falls_back(tmp_env):
+    g, tmp = tmp_env
+    assert grind_pool.run("solution.py") is None
+    open(grind_pool._gp.POOL_SOCKET_FILE, "w").close()
+    assert grind_pool.run("solution.py") is None
+    assert not grind_pool.is_running()
@@ -0,0 +1,154 @@
+"""
+Tests for the per-slug schedule index (.memory_index.json).
+
+Invariants:
+- The index holds the latest attempt per slug over archive + live history
+- repetition counts every logged attempt of the slug, including archived ones
+- grind log updates the index in place; it always equals a rebuild from history
+- Archiving and journal compaction re-stamp the index instead of invalidating it
+- Editing memory.md behind grind's back invalidates the index (rebuilt on next read)
+"""
+import os
+import argparse
+import pytest
+from datetime import date
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def make_row(slug, ease=2.5, interval="6d", next_review="2026-02-25"):
+    return {"slug": slug, "topic": "arrays", "difficulty": "easy",
+            "date": "2026-02-19", "rating": 4, "time": "20m", "hints": 0,
+            "ease": ease, "interval": interval, "next_review": next_review}
+
+
+def log_args(slug, rating=4):
+    return argparse.Namespace(slug=slug, rating=rating, time=20, hints=0,
+                              topic="arrays", difficulty="easy", notes=None)
+
+
+def rebuilt():
+    import grind_data, grind_index
+    return grind_index.ScheduleIndex.from_rows(grind_data.load_history()).slugs
+
+
+def index_is_current():
+    import grind_data, grind_index, grind_paths
+    return grind_index.load(grind_paths.INDEX_FILE, grind_data.history_signature()) is not None
+
+
+def test_latest_state_per_slug(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a", 2.5, "1d", "2026-02-20"),
+                    make_row("b"),
+                    make_row("a", 2.6, "6d", "2026-02-26")])
+    st = grind_data.schedule_index().get("a")
+    assert (st["ease"], st["interval"], st["repetition"], st["next_review"]) == (2.6, 6, 2, "2026-02-26")
+    assert grind_data.schedule_index().get("missing") is None
+
+
+def test_log_updates_index_incrementally(tmp_env):
+    g, tmp = tmp_env
+    g.save_config({"active_track": "blind75"})
+    for slug in ("two-sum", "two-sum", "contains-duplicate", "two-sum"):
+        g.cmd_log(log_args(slug))
+        assert index_is_current()
+    import grind_data
+    assert grind_data.schedule_index().slugs == rebuilt()
+    assert grind_data.schedule_index().get("two-sum")["repetition"] == 3
+
+
+def test_repetition_survives_archive(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a")] + [make_row(f"p{i}") for i in range(5)])
+    grind_data.schedule_index()
+    assert grind_data.archive_memory(keep=3) == (3, 3)
+    assert index_is_current()
+    assert grind_data.schedule_index().get("a")["repetition"] == 1
+    assert grind_data.schedule_index().slugs == rebuilt()
+
+
+def test_journal_compaction_keeps_index(tmp_env):
+    g, tmp = tmp_env
+    g.save_config({"active_track": "blind75", "storage": "journal"})
+    g.cmd_log(log_args("two-sum"))
+    import grind_data
+    grind_data.materialize_memory()
+    assert not os.path.exists(g.JOURNAL_FILE)
+    assert index_is_current()
+
+
+def test_external_edit_invalidates(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a")])
+    grind_data.schedule_index()
+    with open(g.MEMORY_FILE, "a") as f:
+        f.write("| b | arrays | easy | 2026-02-19 | 4 | 20m | 0 | 2.5 | 6d | 2026-02-20 |\n")
+    assert not index_is_current()
+    assert "b" in grind_data.schedule_index()
+
+
+def test_due_reviews_use_latest_attempt(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory([make_row("a", next_review="2026-02-20"),
+                    make_row("b", next_review="2026-02-22"),
+                    make_row("a", next_review="2026-03-10")])
+    assert grind_data.due_reviews(date(2026, 2, 23)) == [("b", "arrays", 1)]
+
+
+# --- Due-review heap ---
+
+def brute_force_due(rows, today):
+    latest = {}
+    for r in rows:
+        latest[r["slug"]] = r
+    due = [(s, r["topic"], (today - date.fromisoformat(r["next_review"])).days)
+           for s, r in latest.items() if date.fromisoformat(r["next_review"]) <= today]
+    return sorted(due, key=lambda x: (-x[2], x[0]))
+
+
+def test_due_heap_matches_scan():
+    import random
+    import grind_index
+    rng, today = random.Random(7), date(2026, 3, 1)
+    rows = []
+    for _ in range(500):
+        nr = date(2026, 2, 1).toordinal() + rng.randrange(60)
+        rows.append({**make_row(f"p{rng.randrange(40)}"),
+                     "next_review": date.fromordinal(nr).isoformat()})
+    index = grind_index.ScheduleIndex.from_rows(rows)
+    assert len(index.due) <= 2 * len(index) + 16           # stale entries get compacted
+    assert index.due_reviews(today) == brute_force_due(rows, today)
+    assert index.due_reviews(today, limit=5) == brute_force_due(rows, today)[:5]
+
+
+def test_due_heap_survives_reload(tmp_env):
+    g, tmp = tmp_env
+    import grind_data, grind_index, grind_paths
+    g.write_memory([make_row("a", next_review="2026-02-20"),
+                    make_row("a", next_review="2026-02-20"),
+                    make_row("b", next_review="2026-02-22")])
+    grind_data.schedule_index()
+    loaded = grind_index.load(grind_paths.INDEX_FILE, grind_data.history_signature())
+    assert loaded.schedule.due_reviews(date(2026, 2, 23)) == [("a", "arrays", 3), ("b", "arrays", 1)]
+
+
+def test_cmd_due_filters_and_json(tmp_env, capsys):
+    g, tmp = tmp_env
+    import json
+    g.write_memory([make_row("a", next_review="2000-01-01"),
+                    {**make_row("b", next_review="2000-01-02"), "topic": "dp"}])
+    g.cmd_due(argparse.Namespace(limit=None, topic="dp", json=True))
+    out = json.loads(capsys.readouterr().out)
+    assert [d["slug"] for d in out] == ["b"]
+    g.cmd_due(argparse.Namespace(limit=1, topic=None, json=False))
+    out = capsys.readouterr().out
+    assert "a (arrays)" in out and "b (dp)" not in out
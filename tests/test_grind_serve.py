@@ -0,0 +1,119 @@
+"""
+Tests for grind serve (grind_serve.py).
+
+Invariants:
+- A forwarded invocation prints exactly what the in-process one prints, with the same exit code
+- Writes made through the daemon and writes made in-process are visible to each other
+- forward() returns None (run locally) when no daemon answers or the command is not forwardable
+- serve --stop shuts the daemon down and removes the socket
+- grind batch is forwarded with its stdin
+"""
+import io
+import os
+import json
+import shutil
+import tempfile
+import threading
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def make_row(slug, topic="arrays", rating=4, next_review="2000-01-01"):
+    return {"slug": slug, "topic": topic, "difficulty": "easy",
+            "date": "2026-02-19", "rating": rating, "time": "20m", "hints": 0,
+            "ease": 2.5, "interval": "6d", "next_review": next_review}
+
+
+@pytest.fixture
+def daemon(tmp_env, monkeypatch):
+    """A daemon on a short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    g, tmp = tmp_env
+    import grind_paths
+    import grind_serve
+    sock_dir = tempfile.mkdtemp(prefix="grind", dir="/tmp")
+    path = os.path.join(sock_dir, "s")
+    monkeypatch.setattr(grind_paths, "SOCKET_FILE", path)
+    ready = threading.Event()
+    thread = threading.Thread(target=grind_serve.serve, args=(g.main, path),
+                              kwargs={"ready": ready.set}, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield g, tmp, path
+    grind_serve.stop(path)
+    thread.join(5)
+    shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+def run_local(g, argv, capsys):
+    code = 0
+    try:
+        g.main(argv)
+    except SystemExit as e:
+        code = e.code or 0
+    cap = capsys.readouterr()
+    return cap.out, cap.err, code
+
+
+def run_forwarded(argv, path, capsys):
+    import grind_serve
+    code = grind_serve.forward(argv, path)
+    cap = capsys.readouterr()
+    return cap.out, cap.err, code
+
+
+def test_output_matches_in_process(daemon, capsys):
+    g, tmp, path = daemon
+    g.write_memory([make_row("two-sum"), make_row("coin-change", topic="dp", rating=2)])
+    g.save_config({"active_track": "blind75"})
+    for argv in (["due"], ["due", "--json"], ["progress"], ["gap", "show"],
+                 ["target", "list"], ["target", "show", "missing"], ["stats"]):
+        assert run_forwarded(argv, path, capsys) == run_local(g, argv, capsys), argv
+
+
+def test_writes_are_shared(daemon, capsys):
+    g, tmp, path = daemon
+    g.save_config({"active_track": "blind75"})
+    assert run_forwarded(["log", "two-sum", "4", "--time", "10"], path, capsys)[2] == 0
+    assert [r["slug"] for r in g.parse_memory()] == ["two-sum"]
+    g.write_memory(g.parse_memory() + [make_row("word-ladder", topic="graphs")])
+    out, err, code = run_forwarded(["due"], path, capsys)
+    assert "word-ladder" in out
+
+
+def test_fallback_to_in_process(daemon, monkeypatch):
+    g, tmp, path = daemon
+    import grind_serve
+    assert grind_serve.forward(["due"], os.path.join(str(tmp), "absent.sock")) is None
+    assert grind_serve.forward(["run", "two-sum"], path) is None
+    assert grind_serve.forward(["behavior", "reset"], path) is None
+    assert grind_serve.forward([], path) is None
+    stale = os.path.join(str(tmp), "stale.sock")
+    open(stale, "w").close()
+    assert grind_serve.forward(["due"], stale) is None
+    monkeypatch.setenv("GRIND_NO_DAEMON", "1")
+    assert grind_serve.forward(["due"], path) is None
+
+
+def test_stop(daemon, capsys):
+    g, tmp, path = daemon
+    import grind_serve
+    assert grind_serve.is_running(path)
+    g.cmd_serve(g.argparse.Namespace(stop=True, status=False, idle_timeout=None))
+    assert "stopped" in capsys.readouterr().out
+    assert not grind_serve.is_running(path)
+    assert not os.path.exists(path)
+
+
+def test_batch_forwards_stdin(daemon, monkeypatch, capsys):
+    g, tmp, path = daemon
+    g.save_config({"active_track": "blind75"})
+    monkeypatch.setattr("sys.stdin", io.StringIO("log two-sum 4\ndue --json\n"))
+    out, err, code = run_forwarded(["batch", "--jsonl"], path, capsys)
+    assert code == 0
+    assert [json.loads(l)["argv"][0] for l in out.splitlines()] == ["log", "due"]
+    assert [r["slug"] for r in g.parse_memory()] == ["two-sum"]
@@ -0,0 +1,118 @@
+"""
+Tests for the sqlite storage engine (grind.db).
+
+Invariants:
+- migrate → parse_memory returns the same rows as the file backend did
+- Archived rows/events live in the DB but are excluded from live reads
+- due_reviews / topic_rating_totals give the same answers as the in-memory scans
+- Targets round-trip through load_config/save_config while scalars stay in .lc_config.json
+- export writes the DB back out as files the markdown backend reads identically
+"""
+import os
+import json
+import argparse
+from datetime import date
+import pytest
+from conftest import import_grind
+
+
+@pytest.fixture(scope="module")
+def grind():
+    return import_grind()
+
+
+def make_row(slug, topic="arrays", rating=4, next_review="2026-02-25"):
+    return {"slug": slug, "topic": topic, "difficulty": "easy",
+            "date": "2026-02-19", "rating": rating, "time": "20m", "hints": 0,
+            "ease": 2.36, "interval": "6d", "next_review": next_review}
+
+
+ROWS = [
+    make_row("two-sum", next_review="2026-02-20"),
+    make_row("coin-change", topic="dp", rating=2, next_review="2026-02-22"),
+    make_row("two-sum", rating=5, next_review="2026-03-10"),
+    make_row("word-ladder", topic="graphs", rating=3, next_review="2026-02-18"),
+]
+
+EVENTS = [
+    {"ts": "2025-10-01T10:00:00", "slug": "two-sum", "topic": "arrays", "event": "hint"},
+    {"ts": "2026-02-19T10:00:00", "slug": "coin-change", "topic": "dp", "event": "hint"},
+    {"ts": "2026-02-19T11:00:00", "slug": "two-sum", "topic": "arrays", "event": "stuck"},
+]
+
+
+@pytest.fixture
+def sqlite_env(tmp_env):
+    g, tmp = tmp_env
+    import grind_data
+    g.write_memory(ROWS)
+    with open(g.BEHAVIOR_FILE, "w") as f:
+        for e in EVENTS:
+            f.write(json.dumps(e) + "\n")
+    g.save_config({"active_track": "blind75",
+                   "targets": {"acme-001": {"company": "Acme", "plan": {"days": [1, 2]}}}})
+    file_rows = g.parse_memory()
+    grind_data.migrate_to_sqlite()
+    yield g, tmp, file_rows
+    import grind_db
+    grind_db.close()
+
+
+def test_migrate_round_trip(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    assert g.storage_mode() == "sqlite"
+    assert g.parse_memory() == file_rows
+    assert "targets" not in json.load(open(g.CONFIG_FILE))
+    assert g.load_config()["targets"]["acme-001"]["plan"] == {"days": [1, 2]}
+
+
+def test_migrate_refuses_twice(sqlite_env):
+    import grind_data
+    with pytest.raises(ValueError):
+        grind_data.migrate_to_sqlite()
+
+
+def test_log_appends_to_db(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    mtime = os.path.getmtime(g.MEMORY_FILE)
+    g.cmd_log(argparse.Namespace(slug="contains-duplicate", rating=4, time=10, hints=0,
+                                 topic="arrays", difficulty="easy", notes=None))
+    assert [r["slug"] for r in g.parse_memory()][-1] == "contains-duplicate"
+    assert os.path.getmtime(g.MEMORY_FILE) == mtime
+
+
+def test_indexed_queries_match_scans(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    import grind_data
+    today = date(2026, 2, 23)
+    assert grind_data.due_reviews(today) == [
+        ("word-ladder", "graphs", 5), ("coin-change", "dp", 1)]
+    assert grind_data.topic_rating_totals() == {"arrays": (2, 9), "dp": (1, 2), "graphs": (1, 3)}
+
+
+def test_archive_keeps_newest(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    import grind_data
+    assert grind_data.archive_memory(keep=2) == (2, 2)
+    assert g.parse_memory() == file_rows[2:]
+
+
+def test_behavior_filter_and_archive(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    import grind_data
+    assert len(grind_data.load_behavior_events(slug="two-sum")) == 2
+    assert grind_data.load_behavior_events(topic="dp") == [EVENTS[1]]
+    assert grind_data.archive_behavior_events(date(2026, 1, 1)) == (1, 2)
+    assert grind_data.load_behavior_events() == EVENTS[1:]
+
+
+def test_export_back_to_files(sqlite_env):
+    g, tmp, file_rows = sqlite_env
+    import grind_data
+    grind_data.archive_memory(keep=3)
+    grind_data.export_from_sqlite("markdown")
+    assert g.storage_mode() == "markdown"
+    assert g.parse_memory() == file_rows[1:]
+    assert grind_data._parse_memory_table(g.ARCHIVE_FILE)[0] == file_rows[:1]
+    assert grind_data.load_behavior_events() == EVENTS
+    assert g.load_config()["targets"]["acme-001"]["company"] == "Acme"
@@ -0,0 +1,134 @@
+"""
+Tests for grind test (grind_cmd_test.py).
+
+Invariants:
+- Cases come from tests/*.in (+ .out) and cases.json, in that order
+- Each case gets PASS / FAIL / RE / TLE / MLE, or RAN when it has no expected output
+- Output comparison ignores trailing whitespace and trailing blank lines
+- Cases run in parallel: wall time tracks the slowest case, not the sum, and limited
+  runs spawned from the thread pool never fork with a preexec_fn
+- Any FAIL / RE / TLE exits 1; --json prints one document with every case
+- Cases run under the configured run_limits; --timeout overrides only the wall-clock limit
+"""
+import json
+import time
+import pytest
+
+SOLUTION = """
+import sys, time
+a, b = map(int, sys.stdin.read().split())
+if a < 0:
+    time.sleep(-a)
+if a == 99:
+    sys.exit(3)
+if a == 77:
+    x = bytearray(1 << 30)
+print(a + b, "  ")
+print()
+"""
+
+
+@pytest.fixture()
+def problem(tmp_env):
+    g, tmp = tmp_env
+    d = tmp / "problems" / "add_two"
+    (d / "tests").mkdir(parents=True)
+    (d / "solution.py").write_text(SOLUTION)
+    return g, d
+
+
+def add_case(d, name, inp, out=None):
+    (d / "tests" / f"{name}.in").write_text(inp)
+    if out is not None:
+        (d / "tests" / f"{name}.out").write_text(out)
+
+
+def run_json(g, capsys, *argv):
+    code = 0
+    try:
+        g.main(["test", "add-two", "--json", *argv])
+    except SystemExit as e:
+        code = e.code
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_discovery_and_statuses(problem, capsys):
+    g, d = problem
+    add_case(d, "01", "1 2\n", "3\n")
+    add_case(d, "02", "5 5\n", "11\n")
+    add_case(d, "03", "4 4\n")
+    (d / "cases.json").write_text(json.dumps([{"input": "99 1", "output": "100"},
+                                              {"name": "slow", "input": "-3 0", "output": "-3"}]))
+    code, doc = run_json(g, capsys, "--timeout", "0.5")
+    assert code == 1
+    assert [(c["name"], c["status"]) for c in doc["cases"]] == [
+        ("01", "PASS"), ("02", "FAIL"), ("03", "RAN"), ("case1", "RE"), ("slow", "TLE")]
+    assert doc["cases"][3]["exit_code"] == 3
+    assert doc["cases"][1]["output"].split() == ["10"]
+
+
+def test_memory_limit(problem, capsys):
+    g, d = problem
+    add_case(d, "hog", "77 0\n", "77\n")
+    add_case(d, "fine", "1 2\n", "3\n")
+    code, doc = run_json(g, capsys, "--memory-limit", "256")
+    assert code == 1
+    assert [(c["name"], c["status"]) for c in doc["cases"]] == [("fine", "PASS"), ("hog", "MLE")]
+
+
+def test_configured_time_limit_applies_without_timeout(problem, capsys):
+    g, d = problem
+    add_case(d, "slow", "-2 0\n", "-2\n")
+    g.save_config({"run_limits": {"time": 0.5}})
+    code, doc = run_json(g, capsys)
+    assert code == 1 and doc["cases"][0]["status"] == "TLE"
+    code, doc = run_json(g, capsys, "--timeout", "5")
+    assert code == 0 and doc["cases"][0]["status"] == "PASS"
+
+
+def test_all_pass_exits_zero_and_prints_table(problem, capsys):
+    g, d = problem
+    add_case(d, "small", "1 1\n", "2")
+    add_case(d, "big", "1000 2000\n", "3000\n\n")
+    g.main(["test", "add-two"])
+    out = capsys.readouterr().out
+    assert "2/2 passed" in out
+    assert "small" in out and "big" in out and "PASS" in out
+
+
+def test_cases_run_in_parallel(problem, capsys):
+    g, d = problem
+    for i in range(4):
+        add_case(d, f"sleep{i}", "-1 1\n", "0\n")
+    start = time.perf_counter()
+    code, doc = run_json(g, capsys, "--jobs", "4")
+    assert code == 0
+    assert all(c["status"] == "PASS" for c in doc["cases"])
+    assert time.perf_counter() - start < 3.5          # serial would be 4s+
+
+
+def test_parallel_limited_cases_keep_their_verdicts(problem, capsys, monkeypatch):
+    import grind_exec
+    g, d = problem
+    real_popen = grind_exec.subprocess.Popen
+
+    def popen(*a, **kw):
+        assert kw.get("preexec_fn") is None
+        return real_popen(*a, **kw)
+    monkeypatch.setattr(grind_exec.subprocess, "Popen", popen)
+    expected = {}
+    for i in range(12):
+        inp, out, status = [("1 2\n", "3\n", "PASS"), ("77 0\n", "77\n", "MLE"),
+                            ("99 0\n", "99\n", "RE")][i % 3]
+        add_case(d, f"c{i:02}", inp, out)
+        expected[f"c{i:02}"] = status
+    code, doc = run_json(g, capsys, "--jobs", "6", "--memory-limit", "256")
+    assert code == 1
+    assert {c["name"]: c["status"] for c in doc["cases"]} == expected
+
+
+def test_no_cases_is_an_error(problem, capsys):
+    g, d = problem
+    with pytest.raises(SystemExit) as e:
+        g.main(["test", "add-two"])
+    assert e.value.code == 1
@@ -0,0 +1,451 @@
+// Warm Java runner for `grind run` — started by `grind jvm`, driven by grind_jvm.py.
+//
+// Keeps one JVM alive with LcUtils already loaded, compiles each solution in
+// memory with javax.tools and invokes its main() with the request's stdin.
+// Compiled classes are cached by the build key grind sends (source, javac and
+// LcUtils hashes), so an unchanged solution only runs. Every run gets a fresh
+// class loader, so static state never leaks between runs.
+//
+// System.in/out/err are replaced once, at startup, by routes that point at the
+// running request's buffers (and nowhere between runs), so stray threads left by
+// a solution never write into the runner's own streams. grind runs sources that
+// call System.exit cold; if main() still exits the JVM some other way, a shutdown
+// hook answers the request with the output so far and EXITED before it goes.
+//
+// Protocol: one request per connection on a Unix socket, big-endian ints and
+// length-prefixed (int) byte strings.
+//   request   int op (0 run, 1 ping, 2 stop); run adds key, class name, source path, stdin,
+//             then long time_ms, long cpu_ms, long output_bytes (0 = the runner's timeout / no limit)
+//   response  int code, byte compiled, byte cached, long compile_us, long run_us, stdout, stderr
+//             (code is TIMED_OUT, OUTPUT_LIMITED or EXITED when main() ran past the wall/CPU
+//             limit, wrote past the output limit or exited the JVM)
+//
+// The output limit covers stdout + stderr together: the write that crosses it keeps what
+// fits and throws OutputLimitExceeded into the solution, so a print loop stops at once and
+// the runner never buffers more than the limit. A main() past its wall or CPU limit (CPU
+// is main()'s own thread) cannot be stopped safely, so the runner answers and exits.
+// Requires Java 16+ (Unix domain socket channels) and a JDK (javax.tools).
+
+package utils.java;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.io.StringWriter;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.StandardProtocolFamily;
+import java.net.URI;
+import java.net.UnixDomainSocketAddress;
+import java.nio.channels.Channels;
+import java.nio.channels.SelectionKey;
+import java.nio.channels.Selector;
+import java.nio.channels.ServerSocketChannel;
+import java.nio.channels.SocketChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.atomic.AtomicBoolean;
+import javax.tools.FileObject;
+import javax.tools.ForwardingJavaFileManager;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileManager;
+import javax.tools.JavaFileObject;
+import javax.tools.SimpleJavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+public class GrindRunner {
+    static final int OP_RUN = 0, OP_PING = 1, OP_STOP = 2;
+    static final int TIMED_OUT = 124;
+    static final int EXITED = 125;
+    static final int OUTPUT_LIMITED = 153;   // 128 + SIGXFSZ, as for a process past RLIMIT_FSIZE
+    static final int MAX_CACHED = 64;
+
+    final JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+    final StandardJavaFileManager files = compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8);
+    final String classpath = System.getProperty("java.class.path");   // GrindRunner + LcUtils
+    final long runTimeoutMs;
+
+    static final RouteOut OUT = new RouteOut(), ERR = new RouteOut();
+    static final RouteIn IN = new RouteIn();
+
+    /** The request whose main() is running; the shutdown hook answers it if main() exits the JVM. */
+    volatile Reply current;
+
+    // build key → class bytes by binary name, least recently used dropped first
+    final Map<String, Map<String, byte[]>> cache = new LinkedHashMap<>(16, 0.75f, true) {
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<String, Map<String, byte[]>> eldest) {
+            return size() > MAX_CACHED;
+        }
+    };
+
+    GrindRunner(long runTimeoutMs) {
+        this.runTimeoutMs = runTimeoutMs;
+    }
+
+    // --- compile ---
+
+    /** Keeps the class files javac writes in memory. */
+    static class MemoryOutput extends ForwardingJavaFileManager<StandardJavaFileManager> {
+        final Map<String, byte[]> classes = new HashMap<>();
+
+        MemoryOutput(StandardJavaFileManager files) {
+            super(files);
+        }
+
+        @Override
+        public JavaFileObject getJavaFileForOutput(JavaFileManager.Location location, String className,
+                                                   JavaFileObject.Kind kind, FileObject sibling) {
+            URI uri = URI.create("mem:///" + className.replace('.', '/') + kind.extension);
+            return new SimpleJavaFileObject(uri, kind) {
+                @Override
+                public OutputStream openOutputStream() {
+                    return new ByteArrayOutputStream() {
+                        @Override
+                        public void close() {
+                            classes.put(className, toByteArray());
+                        }
+                    };
+                }
+            };
+        }
+    }
+
+    static class MemoryLoader extends ClassLoader {
+        final Map<String, byte[]> classes;
+
+        MemoryLoader(Map<String, byte[]> classes, ClassLoader parent) {
+            super(parent);
+            this.classes = classes;
+        }
+
+        @Override
+        protected Class<?> findClass(String name) throws ClassNotFoundException {
+            byte[] bytes = classes.get(name);
+            if (bytes == null) throw new ClassNotFoundException(name);
+            return defineClass(name, bytes, 0, bytes.length);
+        }
+    }
+
+    /** Compiled classes of one source file, or null with javac's diagnostics written to err. */
+    Map<String, byte[]> compile(Path source, StringWriter err) {
+        MemoryOutput out = new MemoryOutput(files);
+        Iterable<? extends JavaFileObject> units = files.getJavaFileObjects(source.toFile());
+        List<String> options = List.of("-classpath", classpath, "-proc:none");
+        boolean ok = compiler.getTask(err, out, null, options, null, units).call();
+        return ok ? out.classes : null;
+    }
+
+    // --- run ---
+
+    /** Installed as System.out/err for the life of the runner: writes go to target, or nowhere. */
+    static final class RouteOut extends OutputStream {
+        volatile OutputStream target;
+
+        @Override
+        public void write(int b) throws IOException {
+            OutputStream t = target;
+            if (t != null) t.write(b);
+        }
+
+        @Override
+        public void write(byte[] b, int off, int len) throws IOException {
+            OutputStream t = target;
+            if (t != null) t.write(b, off, len);
+        }
+    }
+
+    /** Installed as System.in: reads come from the running request's stdin. */
+    static final class RouteIn extends InputStream {
+        volatile InputStream source = InputStream.nullInputStream();
+
+        @Override
+        public int read() throws IOException {
+            return source.read();
+        }
+
+        @Override
+        public int read(byte[] b, int off, int len) throws IOException {
+            return source.read(b, off, len);
+        }
+
+        @Override
+        public int available() throws IOException {
+            return source.available();
+        }
+    }
+
+    /** Thrown into main() by the write that crosses the output limit. */
+    static final class OutputLimitExceeded extends Error {
+        OutputLimitExceeded() {
+            super("output limit exceeded", null, false, false);
+        }
+    }
+
+    /** One run's captured output and the connection it is answered on, at most once. */
+    static final class Reply {
+        final DataOutputStream out;
+        final boolean cached;
+        final long compileUs;
+        final long start = System.nanoTime();
+        final Capped stdout = new Capped(), stderr = new Capped();
+        final AtomicBoolean sent = new AtomicBoolean();
+        long remaining;                  // output bytes left; < 0 once crossed (ignored when unlimited)
+        final boolean limited;
+        volatile boolean overflowed;
+
+        Reply(DataOutputStream out, boolean cached, long compileUs, long outputLimit) {
+            this.out = out;
+            this.cached = cached;
+            this.compileUs = compileUs;
+            this.limited = outputLimit > 0;
+            this.remaining = outputLimit;
+        }
+
+        /** How many of len bytes still fit under the limit shared by stdout and stderr. */
+        synchronized int take(int len) {
+            if (!limited) return len;
+            int allowed = (int) Math.max(0, Math.min(len, remaining));
+            remaining -= len;
+            if (allowed < len) overflowed = true;
+            return allowed;
+        }
+
+        final class Capped extends OutputStream {
+            final ByteArrayOutputStream buf = new ByteArrayOutputStream();
+
+            @Override
+            public void write(int b) {
+                write(new byte[] {(byte) b}, 0, 1);
+            }
+
+            @Override
+            public void write(byte[] b, int off, int len) {
+                int allowed = take(len);
+                buf.write(b, off, allowed);
+                if (allowed < len) throw new OutputLimitExceeded();
+            }
+        }
+
+        void note(String message) {
+            byte[] b = message.getBytes(StandardCharsets.UTF_8);
+            stderr.buf.write(b, 0, b.length);
+        }
+
+        void send(int code) throws IOException {
+            if (!sent.compareAndSet(false, true)) return;
+            respond(out, code, true, cached, compileUs, (System.nanoTime() - start) / 1000,
+                    stdout.buf.toByteArray(), stderr.buf.toByteArray());
+        }
+    }
+
+    static void installRoutes() {
+        System.setIn(IN);
+        System.setOut(new PrintStream(OUT, true, StandardCharsets.UTF_8));
+        System.setErr(new PrintStream(ERR, true, StandardCharsets.UTF_8));
+    }
+
+    /**
+     * main() reading the request's stdin and writing into reply's buffers, for at most
+     * timeMs of wall time and cpuMs (0 = unlimited) of its thread's CPU time. Returns the exit code.
+     */
+    int run(Map<String, byte[]> classes, String className, byte[] stdin, Reply reply,
+            long timeMs, long cpuMs) throws InterruptedException {
+        int[] code = {0};
+        ClassLoader parent = GrindRunner.class.getClassLoader();
+        Thread main = new Thread(() -> {
+            try {
+                Method m = new MemoryLoader(classes, parent).loadClass(className).getMethod("main", String[].class);
+                m.invoke(null, (Object) new String[0]);
+            } catch (InvocationTargetException e) {
+                code[0] = 1;
+                if (e.getCause() instanceof OutputLimitExceeded) return;
+                try {
+                    System.err.print("Exception in thread \"main\" ");
+                    e.getCause().printStackTrace();
+                } catch (OutputLimitExceeded full) {
+                    // the trace itself crossed the limit
+                }
+            } catch (ReflectiveOperationException e) {
+                System.err.println("grind runner: cannot run " + className + ": " + e);
+                code[0] = 1;
+            }
+        }, "main");
+        main.setDaemon(true);
+        main.setUncaughtExceptionHandler((t, e) -> code[0] = 1);   // e.g. OutputLimitExceeded from a catch block
+
+        IN.source = new ByteArrayInputStream(stdin);
+        OUT.target = reply.stdout;
+        ERR.target = reply.stderr;
+        current = reply;
+        ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+        boolean cpuLimited = cpuMs > 0 && threads.isThreadCpuTimeSupported();
+        long deadline = System.nanoTime() + timeMs * 1_000_000;
+        try {
+            main.start();
+            while (main.isAlive()) {
+                long left = (deadline - System.nanoTime()) / 1_000_000;
+                if (left <= 0) break;
+                main.join(cpuLimited ? Math.min(left, 20) : left);
+                if (cpuLimited && threads.getThreadCpuTime(main.getId()) > cpuMs * 1_000_000) break;
+            }
+        } finally {
+            System.out.flush();
+            System.err.flush();
+            current = null;
+            OUT.target = null;
+            ERR.target = null;
+            IN.source = InputStream.nullInputStream();
+        }
+        if (main.isAlive()) return TIMED_OUT;
+        return reply.overflowed ? OUTPUT_LIMITED : code[0];
+    }
+
+    /** Answer the running request (if any) when main() exits the JVM under it. */
+    void onExit(Path socket) {
+        Reply reply = current;
+        if (reply != null) {
+            System.out.flush();
+            System.err.flush();
+            reply.note("grind runner: main() exited the JVM; the warm JVM stopped with it\n");
+            try {
+                reply.send(EXITED);
+            } catch (IOException e) {
+                // client already gone
+            }
+        }
+        try {
+            Files.deleteIfExists(socket);
+        } catch (IOException e) {
+            // nothing listens on it any more either way
+        }
+    }
+
+    // --- protocol ---
+
+    static String readString(DataInputStream in) throws IOException {
+        return new String(readBytes(in), StandardCharsets.UTF_8);
+    }
+
+    static byte[] readBytes(DataInputStream in) throws IOException {
+        byte[] b = new byte[in.readInt()];
+        in.readFully(b);
+        return b;
+    }
+
+    static void respond(DataOutputStream out, int code, boolean compiled, boolean cached,
+                        long compileUs, long runUs, byte[] stdout, byte[] stderr) throws IOException {
+        out.writeInt(code);
+        out.writeByte(compiled ? 1 : 0);
+        out.writeByte(cached ? 1 : 0);
+        out.writeLong(compileUs);
+        out.writeLong(runUs);
+        out.writeInt(stdout.length);
+        out.write(stdout);
+        out.writeInt(stderr.length);
+        out.write(stderr);
+        out.flush();
+    }
+
+    /** Answer one request. Returns false when the runner should exit. */
+    boolean handle(SocketChannel conn) throws IOException, InterruptedException {
+        DataInputStream in = new DataInputStream(new BufferedInputStream(Channels.newInputStream(conn)));
+        DataOutputStream out = new DataOutputStream(new BufferedOutputStream(Channels.newOutputStream(conn)));
+        byte[] none = new byte[0];
+        int op = in.readInt();
+        if (op != OP_RUN) {
+            respond(out, 0, false, false, 0, 0, none, none);
+            return op != OP_STOP;
+        }
+        String key = readString(in), className = readString(in);
+        Path source = Path.of(readString(in));
+        byte[] stdin = readBytes(in);
+        long timeMs = in.readLong(), cpuMs = in.readLong(), outputLimit = in.readLong();
+        if (timeMs <= 0) timeMs = runTimeoutMs;
+
+        long start = System.nanoTime();
+        Map<String, byte[]> classes = cache.get(key);
+        boolean cached = classes != null;
+        StringWriter diagnostics = new StringWriter();
+        if (!cached) {
+            classes = compile(source, diagnostics);
+            if (classes != null) cache.put(key, classes);
+        }
+        long compileUs = (System.nanoTime() - start) / 1000;
+        if (classes == null) {
+            respond(out, 1, false, false, compileUs, 0, none,
+                    diagnostics.toString().getBytes(StandardCharsets.UTF_8));
+            return true;
+        }
+
+        Reply reply = new Reply(out, cached, compileUs, outputLimit);
+        int code = run(classes, className, stdin, reply, timeMs, cpuMs);
+        if (code == TIMED_OUT) {
+            // The solution's thread cannot be stopped safely: answer, then let the runner exit.
+            reply.note("grind runner: main() still running past its time limit; stopping the warm JVM\n");
+        }
+        reply.send(code);
+        return code != TIMED_OUT;
+    }
+
+    /** Accept requests one at a time until stopped or idle for idleMs (0 = never). */
+    void serve(Path socket, long idleMs) throws IOException, InterruptedException {
+        Files.deleteIfExists(socket);
+        try (ServerSocketChannel server = ServerSocketChannel.open(StandardProtocolFamily.UNIX);
+             Selector selector = Selector.open()) {
+            server.bind(UnixDomainSocketAddress.of(socket));
+            Files.setPosixFilePermissions(socket, PosixFilePermissions.fromString("rw-------"));
+            server.configureBlocking(false);
+            server.register(selector, SelectionKey.OP_ACCEPT);
+            while (true) {
+                if (selector.select(idleMs) == 0) return;
+                selector.selectedKeys().clear();
+                SocketChannel conn = server.accept();
+                if (conn == null) continue;
+                conn.configureBlocking(true);
+                try (conn) {
+                    if (!handle(conn)) return;
+                } catch (IOException e) {
+                    // client went away mid-request; keep serving
+                }
+            }
+        } finally {
+            Files.deleteIfExists(socket);
+        }
+    }
+
+    public static void main(String[] args) throws Exception {
+        if (args.length < 1) {
+            System.err.println("usage: GrindRunner <socket> [idle-seconds] [run-timeout-seconds]");
+            System.exit(2);
+        }
+        if (ToolProvider.getSystemJavaCompiler() == null) {
+            System.err.println("grind runner: no system Java compiler (is this a JRE rather than a JDK?)");
+            System.exit(1);
+        }
+        long idleMs    = args.length > 1 ? Long.parseLong(args[1]) * 1000 : 0;
+        long timeoutMs = args.length > 2 ? Long.parseLong(args[2]) * 1000 : 60_000;
+        Path socket = Path.of(args[0]);
+        GrindRunner runner = new GrindRunner(timeoutMs);
+        Runtime.getRuntime().addShutdownHook(new Thread(() -> runner.onExit(socket), "grind-exit"));
+        installRoutes();
+        runner.serve(socket, idleMs);
+        System.exit(0);
+    }
+}